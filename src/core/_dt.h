@@ -41,6 +41,7 @@ class TemporaryFile;
 class WritableBuffer;
 
 struct CString;
+enum class JoinType : uint8_t;
 namespace dt {
   enum class LType : uint8_t;
   enum class SType : uint8_t;
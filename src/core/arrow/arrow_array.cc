@@ -0,0 +1,437 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>              // std::min
+#include <cstring>                // std::memset
+#include <memory>                 // std::unique_ptr
+#include <vector>                 // std::vector
+#include "arrow/arrow_array.h"
+#include "column/arrowmasked.h"
+#include "parallel/api.h"
+#include "utils/assert.h"
+#include "utils/exceptions.h"
+#include "buffer.h"
+#include "column.h"
+#include "datatable.h"
+#include "stype.h"
+namespace dt {
+
+
+
+//------------------------------------------------------------------------------
+// OArrowArray / OArrowSchema
+//------------------------------------------------------------------------------
+
+OArrowArray::OArrowArray() {
+  std::memset(&array_, 0, sizeof(ArrowArray));
+}
+
+OArrowArray::~OArrowArray() {
+  if (array_.release) array_.release(&array_);
+}
+
+ArrowArray* OArrowArray::get() noexcept {
+  return &array_;
+}
+
+const ArrowArray* OArrowArray::operator->() const noexcept {
+  return &array_;
+}
+
+size_t OArrowArray::intptr() const noexcept {
+  return reinterpret_cast<size_t>(&array_);
+}
+
+
+OArrowSchema::OArrowSchema() {
+  std::memset(&schema_, 0, sizeof(ArrowSchema));
+}
+
+OArrowSchema::~OArrowSchema() {
+  if (schema_.release) schema_.release(&schema_);
+}
+
+ArrowSchema* OArrowSchema::get() noexcept {
+  return &schema_;
+}
+
+const ArrowSchema* OArrowSchema::operator->() const noexcept {
+  return &schema_;
+}
+
+size_t OArrowSchema::intptr() const noexcept {
+  return reinterpret_cast<size_t>(&schema_);
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Import
+//------------------------------------------------------------------------------
+
+SType stype_from_arrow_schema(const ArrowSchema* schema) {
+  const char* format = schema->format;
+  if (schema->dictionary) return SType::INVALID;
+  if (!format || !format[0] || format[1]) return SType::INVALID;
+  switch (format[0]) {
+    case 'n': return SType::BOOL;  // same as Frame([None])
+    case 'b': return SType::BOOL;
+    case 'c': return SType::INT8;
+    case 's': return SType::INT16;
+    case 'i': return SType::INT32;
+    case 'l': return SType::INT64;
+    case 'f': return SType::FLOAT32;
+    case 'g': return SType::FLOAT64;
+    case 'u': return SType::STR32;
+    case 'U': return SType::STR64;
+    default:  return SType::INVALID;
+  }
+}
+
+
+static inline bool get_bit(const uint8_t* bits, size_t i) {
+  return (bits[i >> 3] >> (i & 7)) & 1;
+}
+
+
+// Arrow booleans are bit-packed, so they are converted into a regular
+// bool8 column, applying the validity bitmap at the same time.
+static Column bool_from_arrow(const ArrowArray* array) {
+  size_t n = static_cast<size_t>(array->length);
+  size_t offset = static_cast<size_t>(array->offset);
+  auto validity = static_cast<const uint8_t*>(array->buffers[0]);
+  auto values = static_cast<const uint8_t*>(array->buffers[1]);
+  if (array->null_count == 0) validity = nullptr;
+
+  Buffer databuf = Buffer::mem(n);
+  auto out = static_cast<int8_t*>(databuf.xptr());
+  parallel_for_static(n,
+    [=](size_t i) {
+      size_t j = i + offset;
+      out[i] = (validity && !get_bit(validity, j))
+                  ? GETNA<int8_t>()
+                  : static_cast<int8_t>(get_bit(values, j));
+    });
+  return Column::new_mbuf_column(n, SType::BOOL, std::move(databuf));
+}
+
+
+template <typename T>
+static Column str_from_arrow(const std::shared_ptr<OArrowArray>& owner,
+                             const ArrowArray* array)
+{
+  size_t n = static_cast<size_t>(array->length);
+  size_t offset = static_cast<size_t>(array->offset);
+  auto offsets = static_cast<const T*>(array->buffers[1]) + offset;
+  auto chars = static_cast<const char*>(array->buffers[2]);
+  T start = offsets[0];
+  size_t strsize = static_cast<size_t>(offsets[n] - start);
+
+  Buffer offbuf;
+  if (start == 0) {
+    offbuf = Buffer::arrow(offsets, sizeof(T) * (n + 1), owner);
+  }
+  else {
+    // In a sliced array the offsets do not start from 0, so they
+    // have to be rebased.
+    offbuf = Buffer::mem(sizeof(T) * (n + 1));
+    auto out = static_cast<T*>(offbuf.xptr());
+    parallel_for_static(n + 1,
+      [=](size_t i) {
+        out[i] = offsets[i] - start;
+      });
+  }
+  Buffer strbuf = strsize? Buffer::arrow(chars + start, strsize, owner)
+                         : Buffer::mem(size_t(0));
+  return Column::new_string_column(n, std::move(offbuf), std::move(strbuf));
+}
+
+
+Column column_from_arrow(std::shared_ptr<OArrowArray> owner,
+                         const ArrowArray* array, const ArrowSchema* schema)
+{
+  SType stype = stype_from_arrow_schema(schema);
+  xassert(stype != SType::INVALID);
+  size_t n = static_cast<size_t>(array->length);
+  size_t offset = static_cast<size_t>(array->offset);
+
+  if (schema->format[0] == 'n') {
+    return Column::new_na_column(n, SType::BOOL);
+  }
+  Column col;
+  switch (stype) {
+    case SType::BOOL: return bool_from_arrow(array);
+    case SType::STR32: col = str_from_arrow<uint32_t>(owner, array); break;
+    case SType::STR64: col = str_from_arrow<uint64_t>(owner, array); break;
+    default: {
+      size_t elemsize = stype_elemsize(stype);
+      auto data = static_cast<const char*>(array->buffers[1]);
+      Buffer databuf = n? Buffer::arrow(data + offset * elemsize,
+                                        n * elemsize, owner)
+                        : Buffer::mem(size_t(0));
+      col = Column::new_mbuf_column(n, stype, std::move(databuf));
+    }
+  }
+
+  // null_count of -1 means that the number of nulls is not known
+  if (array->null_count != 0 && array->buffers[0] && n) {
+    size_t nbytes = (offset + n + 7) / 8;
+    Buffer validity = Buffer::arrow(array->buffers[0], nbytes, owner);
+    col = Column(new ArrowMasked_ColumnImpl(
+                    std::move(col), std::move(validity), offset));
+  }
+  return col;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Export
+//------------------------------------------------------------------------------
+
+// Pointer used for the empty data buffers, which according to the
+// C Data Interface specification should not be null.
+static int64_t empty_buffer = 0;
+
+
+// Data held by the exported `ArrowArray`s. The buffers are owned by
+// this structure, so that they remain valid until the consumer
+// releases the array.
+struct ExportedArray {
+  std::vector<Buffer> buffers;
+  std::vector<const void*> bufptrs;
+  std::vector<ArrowArray> children;
+  std::vector<ArrowArray*> childptrs;
+};
+
+struct ExportedSchema {
+  std::string format;
+  std::string name;
+  std::vector<ArrowSchema> children;
+  std::vector<ArrowSchema*> childptrs;
+};
+
+
+static void release_array(ArrowArray* array) {
+  auto data = static_cast<ExportedArray*>(array->private_data);
+  for (ArrowArray& child : data->children) {
+    if (child.release) child.release(&child);
+  }
+  delete data;
+  array->release = nullptr;
+}
+
+static void release_schema(ArrowSchema* schema) {
+  auto data = static_cast<ExportedSchema*>(schema->private_data);
+  for (ArrowSchema& child : data->children) {
+    if (child.release) child.release(&child);
+  }
+  delete data;
+  schema->release = nullptr;
+}
+
+
+static void fill_array(ArrowArray* array, ExportedArray* data,
+                       size_t nrows, size_t nacount)
+{
+  for (const Buffer& buf : data->buffers) {
+    data->bufptrs.push_back(buf? buf.rptr() : nullptr);
+  }
+  for (size_t i = 1; i < data->bufptrs.size(); ++i) {
+    if (!data->bufptrs[i]) data->bufptrs[i] = &empty_buffer;
+  }
+  for (ArrowArray& child : data->children) {
+    data->childptrs.push_back(&child);
+  }
+  array->length = static_cast<int64_t>(nrows);
+  array->null_count = static_cast<int64_t>(nacount);
+  array->offset = 0;
+  array->n_buffers = static_cast<int64_t>(data->bufptrs.size());
+  array->n_children = static_cast<int64_t>(data->children.size());
+  array->buffers = data->bufptrs.data();
+  array->children = data->childptrs.data();
+  array->dictionary = nullptr;
+  array->release = release_array;
+  array->private_data = data;
+}
+
+static void fill_schema(ArrowSchema* schema, ExportedSchema* data) {
+  for (ArrowSchema& child : data->children) {
+    data->childptrs.push_back(&child);
+  }
+  schema->format = data->format.c_str();
+  schema->name = data->name.c_str();
+  schema->metadata = nullptr;
+  schema->flags = ARROW_FLAG_NULLABLE;
+  schema->n_children = static_cast<int64_t>(data->children.size());
+  schema->children = data->childptrs.data();
+  schema->dictionary = nullptr;
+  schema->release = release_schema;
+  schema->private_data = data;
+}
+
+
+// Create Arrow validity bitmap, where bit `i` is set iff `isvalid(i)`.
+template <typename F>
+static Buffer make_validity(size_t n, F isvalid) {
+  size_t nbytes = (n + 7) / 8;
+  Buffer buf = Buffer::mem(nbytes);
+  auto bits = static_cast<uint8_t*>(buf.xptr());
+  parallel_for_static(nbytes,
+    [=](size_t k) {
+      size_t i0 = k * 8;
+      size_t i1 = std::min(i0 + 8, n);
+      uint8_t byte = 0;
+      for (size_t i = i0; i < i1; ++i) {
+        byte |= static_cast<uint8_t>(isvalid(i) << (i - i0));
+      }
+      bits[k] = byte;
+    });
+  return buf;
+}
+
+
+template <typename T>
+static void export_fw(const Column& col, ExportedArray* data, bool hasnas) {
+  Buffer databuf = col.get_data_buffer(0);
+  if (hasnas) {
+    auto values = static_cast<const T*>(databuf.rptr());
+    data->buffers.push_back(make_validity(col.nrows(),
+        [=](size_t i) { return !ISNA<T>(values[i]); }));
+  } else {
+    data->buffers.push_back(Buffer());
+  }
+  data->buffers.push_back(std::move(databuf));
+}
+
+
+static void export_bool(const Column& col, ExportedArray* data, bool hasnas) {
+  auto values = static_cast<const int8_t*>(col.get_data_readonly(0));
+  size_t n = col.nrows();
+  if (hasnas) {
+    data->buffers.push_back(make_validity(n,
+        [=](size_t i) { return !ISNA<int8_t>(values[i]); }));
+  } else {
+    data->buffers.push_back(Buffer());
+  }
+  data->buffers.push_back(make_validity(n,
+      [=](size_t i) { return values[i] == 1; }));
+}
+
+
+template <typename T>
+static void export_str(const Column& col, ExportedArray* data, bool hasnas) {
+  Buffer offbuf = col.get_data_buffer(0);
+  Buffer strbuf = col.get_data_buffer(1);
+  size_t n = col.nrows();
+  if (hasnas) {
+    // The NAs are marked with the highest bit in the offsets, which
+    // has to be cleared for Arrow.
+    auto offsets = static_cast<const T*>(offbuf.rptr());
+    data->buffers.push_back(make_validity(n,
+        [=](size_t i) { return !(offsets[i + 1] & GETNA<T>()); }));
+    Buffer newoffbuf = Buffer::mem(sizeof(T) * (n + 1));
+    auto out = static_cast<T*>(newoffbuf.xptr());
+    parallel_for_static(n + 1,
+      [=](size_t i) {
+        out[i] = offsets[i] & ~GETNA<T>();
+      });
+    offbuf = std::move(newoffbuf);
+  } else {
+    data->buffers.push_back(Buffer());
+  }
+  data->buffers.push_back(std::move(offbuf));
+  data->buffers.push_back(std::move(strbuf));
+}
+
+
+static void column_to_arrow(const Column& column, const std::string& name,
+                            ArrowArray* array, ArrowSchema* schema)
+{
+  Column col(column);
+  col.materialize();
+  size_t nrows = col.nrows();
+  SType stype = col.stype();
+  size_t nacount = (stype == SType::VOID)? nrows : col.na_count();
+  bool hasnas = (nacount > 0);
+
+  std::unique_ptr<ExportedArray> adata(new ExportedArray);
+  std::unique_ptr<ExportedSchema> sdata(new ExportedSchema);
+  sdata->name = name;
+  switch (stype) {
+    case SType::VOID:    sdata->format = "n"; break;
+    case SType::BOOL:    sdata->format = "b"; export_bool(col, adata.get(), hasnas); break;
+    case SType::INT8:    sdata->format = "c"; export_fw<int8_t>(col, adata.get(), hasnas); break;
+    case SType::INT16:   sdata->format = "s"; export_fw<int16_t>(col, adata.get(), hasnas); break;
+    case SType::INT32:   sdata->format = "i"; export_fw<int32_t>(col, adata.get(), hasnas); break;
+    case SType::INT64:   sdata->format = "l"; export_fw<int64_t>(col, adata.get(), hasnas); break;
+    case SType::FLOAT32: sdata->format = "f"; export_fw<float>(col, adata.get(), hasnas); break;
+    case SType::FLOAT64: sdata->format = "g"; export_fw<double>(col, adata.get(), hasnas); break;
+    case SType::STR32:   sdata->format = "u"; export_str<uint32_t>(col, adata.get(), hasnas); break;
+    case SType::STR64:   sdata->format = "U"; export_str<uint64_t>(col, adata.get(), hasnas); break;
+    default:
+      throw TypeError() << "Column `" << name << "` of type `" << stype
+          << "` cannot be converted into an Arrow array";
+  }
+  fill_array(array, adata.release(), nrows, nacount);
+  fill_schema(schema, sdata.release());
+}
+
+
+void frame_to_arrow(const DataTable* dt, ArrowArray* array,
+                    ArrowSchema* schema)
+{
+  size_t ncols = dt->ncols();
+  const strvec& names = dt->get_names();
+  std::unique_ptr<ExportedArray> adata(new ExportedArray);
+  std::unique_ptr<ExportedSchema> sdata(new ExportedSchema);
+  adata->buffers.push_back(Buffer());
+  adata->children.resize(ncols);
+  sdata->format = "+s";
+  sdata->children.resize(ncols);
+  // Children are zero-initialized, i.e. marked as released: if an
+  // exception is thrown midway, only the children that were already
+  // exported need to be released.
+  std::memset(adata->children.data(), 0, ncols * sizeof(ArrowArray));
+  std::memset(sdata->children.data(), 0, ncols * sizeof(ArrowSchema));
+  try {
+    for (size_t i = 0; i < ncols; ++i) {
+      column_to_arrow(dt->get_column(i), names[i],
+                      &adata->children[i], &sdata->children[i]);
+    }
+  } catch (...) {
+    for (size_t i = 0; i < ncols; ++i) {
+      ArrowArray& achild = adata->children[i];
+      ArrowSchema& schild = sdata->children[i];
+      if (achild.release) achild.release(&achild);
+      if (schild.release) schild.release(&schild);
+    }
+    throw;
+  }
+  fill_array(array, adata.release(), dt->nrows(), 0);
+  fill_schema(schema, sdata.release());
+}
+
+
+
+}  // namespace dt
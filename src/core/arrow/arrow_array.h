@@ -0,0 +1,125 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_ARROW_ARROW_ARRAY_h
+#define dt_ARROW_ARROW_ARRAY_h
+#include <memory>                 // std::shared_ptr
+#include <string>                 // std::string
+#include "arrow/arrow_structs.h"
+#include "_dt.h"
+namespace dt {
+
+
+/**
+ * Owning wrappers around the Arrow C Data Interface structures.
+ *
+ * The structures are created empty (i.e. "released"), and then filled
+ * by the producer, which is either an external library (when importing
+ * data), or datatable itself (when exporting). When the wrapper is
+ * destroyed, the structure's `release` callback is invoked, unless the
+ * structure was moved to its consumer, which marks it as released.
+ *
+ * The `intptr()` method returns the address of the underlying structure
+ * as an integer, which is the form used by pyarrow's `_export_to_c()` /
+ * `_import_from_c()` methods.
+ */
+class OArrowArray {
+  private:
+    ArrowArray array_;
+
+  public:
+    OArrowArray();
+    OArrowArray(const OArrowArray&) = delete;
+    OArrowArray& operator=(const OArrowArray&) = delete;
+    ~OArrowArray();
+
+    ArrowArray* get() noexcept;
+    const ArrowArray* operator->() const noexcept;
+    size_t intptr() const noexcept;
+};
+
+
+class OArrowSchema {
+  private:
+    ArrowSchema schema_;
+
+  public:
+    OArrowSchema();
+    OArrowSchema(const OArrowSchema&) = delete;
+    OArrowSchema& operator=(const OArrowSchema&) = delete;
+    ~OArrowSchema();
+
+    ArrowSchema* get() noexcept;
+    const ArrowSchema* operator->() const noexcept;
+    size_t intptr() const noexcept;
+};
+
+
+
+/**
+ * Return the stype corresponding to the Arrow type described by
+ * `schema`, or `SType::INVALID` if such arrays cannot be imported
+ * without conversion. The supported types are: null, boolean,
+ * int8 - int64, float32, float64, utf8 and large utf8. Dictionary-
+ * encoded arrays are not supported. The null type is mapped into
+ * `SType::BOOL`, similarly to a python list of `None`s.
+ */
+SType stype_from_arrow_schema(const ArrowSchema* schema);
+
+
+/**
+ * Create a Column from the Arrow `array` with the type described by
+ * `schema`. The array must be either `owner` itself, or one of its
+ * (possibly nested) children.
+ *
+ * The data buffers of the array are not copied: the returned column
+ * refers to them directly, keeping the `owner` alive. NA values are
+ * not converted into datatable's sentinels eagerly: instead the
+ * column is wrapped into an `ArrowMasked_ColumnImpl`, which consults
+ * the array's validity bitmap on access. The only exception are
+ * boolean arrays, whose values are bit-packed in Arrow, and therefore
+ * have to be converted.
+ *
+ * The type of the array must be supported by `stype_from_arrow_schema()`.
+ */
+Column column_from_arrow(std::shared_ptr<OArrowArray> owner,
+                         const ArrowArray* array, const ArrowSchema* schema);
+
+
+/**
+ * Export the frame `dt` as an Arrow struct array, whose children are
+ * the columns of the frame. The structures `array` and `schema` must
+ * be empty, and they will be filled with the exported data, to be
+ * consumed by an Arrow library.
+ *
+ * Wherever possible, the data buffers are shared with the columns of
+ * the frame; they are kept alive until the consumer releases the
+ * array. New buffers are created for the validity bitmaps of columns
+ * with NAs, for the boolean columns, and for the offsets of string
+ * columns with NAs. Columns of type `obj64` cannot be exported.
+ */
+void frame_to_arrow(const DataTable* dt, ArrowArray* array,
+                    ArrowSchema* schema);
+
+
+
+}  // namespace dt
+#endif
@@ -20,6 +20,7 @@
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
 #include <algorithm>           // std::min
+#include <atomic>              // std::atomic
 #include <cerrno>              // errno
 #include <mutex>               // std::mutex, std::lock_guard
 #include "python/pybuffer.h"   // py::buffer
@@ -357,6 +358,43 @@ class External_BufferImpl : public BufferImpl
 
 
 
+//------------------------------------------------------------------------------
+// Arrow_BufferImpl
+//------------------------------------------------------------------------------
+
+/**
+  * Buffer pointing to the memory of an Arrow array imported via the
+  * C Data Interface. This memory is owned by the producer of the array,
+  * and remains valid until the array is released. Thus, the buffer
+  * holds a shared pointer to the imported array, which releases it
+  * once all the buffers referring to it are gone.
+  */
+class Arrow_BufferImpl : public BufferImpl
+{
+  private:
+    std::shared_ptr<dt::OArrowArray> owner_;
+
+  public:
+    Arrow_BufferImpl(const void* ptr, size_t n,
+                     std::shared_ptr<dt::OArrowArray>&& owner)
+      : owner_(std::move(owner))
+    {
+      XAssert(ptr || n == 0);
+      data_ = const_cast<void*>(ptr);
+      size_ = n;
+      resizable_ = false;
+      writable_ = false;
+    }
+
+    size_t memory_footprint() const noexcept override {
+      // The memory is owned by the Arrow array
+      return sizeof(Arrow_BufferImpl);
+    }
+};
+
+
+
+
 //------------------------------------------------------------------------------
 // View_BufferImpl
 //------------------------------------------------------------------------------
@@ -692,6 +730,167 @@ class Mmap_BufferImpl : public BufferImpl, MemoryMapWorker {
 
 
 
+//------------------------------------------------------------------------------
+// Paged_BufferImpl
+//------------------------------------------------------------------------------
+
+/**
+  * Read-only buffer backed by a range of bytes within a file, which
+  * participates in the page cache of the MemoryMapManager.
+  *
+  * The range is memory-mapped when the data is first requested, and
+  * the operating system then reads in only those pages that are
+  * actually touched. Once the data is accessed, the buffer adds itself
+  * to the page cache. If the cache needs to free up space, it will
+  * ask the buffer to release its pages: the mapping remains valid
+  * (so that the pointers previously returned by `data()` can still be
+  * used), but its pages are dropped from memory, and will be read
+  * from the file again when needed.
+  *
+  * Since the pages may be discarded at any time, the data must never
+  * be modified: the region is mapped as read-only, and the buffer is
+  * not writable (modifying it creates a copy in memory).
+  */
+class Paged_BufferImpl : public BufferImpl, MemoryMapWorker {
+  private:
+    const std::string filename_;
+    size_t offset_;
+    void*  map_data_;
+    size_t map_size_;
+    mutable std::atomic<bool> in_cache_;
+    mutable std::atomic<bool> accessed_;
+    std::atomic<bool> mapped_;
+    int : 24;
+
+  public:
+    Paged_BufferImpl(const std::string& path, size_t offset, size_t n)
+      : filename_(path),
+        offset_(offset),
+        map_data_(nullptr),
+        map_size_(0),
+        in_cache_(false),
+        accessed_(false),
+        mapped_(false)
+    {
+      data_ = nullptr;
+      size_ = n;
+      writable_ = false;
+      resizable_ = false;
+    }
+
+    ~Paged_BufferImpl() override {
+      if (in_cache_) MemoryMapManager::get()->cache_del(this);
+      if (map_data_) {
+        int ret = munmap(map_data_, map_size_);
+        if (ret) {
+          printf("Error unmapping the view of file: [errno %d] %s. "
+                 "Resources may have not been freed properly.",
+                 errno, std::strerror(errno));
+        }
+      }
+      data_ = nullptr;
+    }
+
+    void* data() const override {
+      if (!mapped_.load(std::memory_order_acquire)) {
+        const_cast<Paged_BufferImpl*>(this)->memmap();
+      }
+      if (!in_cache_.load(std::memory_order_acquire) &&
+          !in_cache_.exchange(true)) {
+        MemoryMapManager::get()->cache_add(
+            const_cast<Paged_BufferImpl*>(this), size_);
+      }
+      if (!accessed_.load(std::memory_order_relaxed)) {
+        accessed_.store(true, std::memory_order_relaxed);
+      }
+      return data_;
+    }
+
+    size_t memory_footprint() const noexcept override {
+      return sizeof(Paged_BufferImpl) + filename_.size() +
+             (in_cache_? size_ : 0);
+    }
+
+    void to_memory(Buffer& out) override {
+      out = Buffer::copy(data(), size_);
+    }
+
+    void verify_integrity() const override {
+      XAssert(!writable_ && !resizable_);
+      if (mapped_.load(std::memory_order_acquire)) {
+        XAssert(size_? (data_ && map_data_) : !data_);
+      }
+    }
+
+  //------------------------------------
+  // MemoryMapWorker interface
+  //------------------------------------
+  public:
+    void save_entry_index(size_t) override {}
+
+    void evict() override { evict_pages(); }
+
+    void evict_pages() override {
+      #if !DT_OS_WINDOWS
+        if (map_data_) madvise(map_data_, map_size_, MADV_DONTNEED);
+      #endif
+      in_cache_ = false;
+    }
+
+    bool check_accessed() override {
+      return accessed_.exchange(false);
+    }
+
+  private:
+    void memmap() {
+      static std::mutex mmp_mutex;
+      std::lock_guard<std::mutex> _(mmp_mutex);
+      if (mapped_.load(std::memory_order_relaxed)) return;
+      if (size_) {
+        File file(filename_, File::READ);
+        size_t filesize = file.size();
+        if (offset_ + size_ > filesize) {
+          throw IOError() << "File " << file.cname() << " is too short: "
+              << "expected at least " << offset_ + size_ << " bytes, "
+              << "but its size is " << filesize;
+        }
+        // The offset passed to `mmap()` must be a multiple of the page
+        // size (or of the allocation granularity on Windows).
+        size_t align = alignment();
+        size_t map_offset = offset_ - offset_ % align;
+        map_size_ = size_ + (offset_ - map_offset);
+        void* ptr = mmap(/* address = */ nullptr,
+                         /* length = */ map_size_,
+                         /* protection = */ PROT_READ,
+                         /* flags = */ MAP_PRIVATE|MAP_NORESERVE,
+                         /* fd = */ file.descriptor(),
+                         /* offset = */ static_cast<off_t>(map_offset));
+        if (ptr == MAP_FAILED) {
+          throw IOError() << "Memory-map failed for file " << file.cname()
+              << " at offset " << map_offset << " of size " << map_size_
+              << Errno;
+        }
+        map_data_ = ptr;
+        data_ = static_cast<char*>(ptr) + (offset_ - map_offset);
+      }
+      // Publish `data_` to the threads that check `mapped_` without
+      // holding the mutex.
+      mapped_.store(true, std::memory_order_release);
+    }
+
+    static size_t alignment() {
+      #if DT_OS_WINDOWS
+        SYSTEM_INFO sysInfo;
+        GetSystemInfo(&sysInfo);
+        return static_cast<size_t>(sysInfo.dwAllocationGranularity);
+      #else
+        return page_size_;
+      #endif
+    }
+};
+
+
+
 //==============================================================================
 // Buffer
 //==============================================================================
@@ -764,6 +963,11 @@ class Mmap_BufferImpl : public BufferImpl, MemoryMapWorker {
               ptr, n, std::make_unique<py::buffer>(std::move(pb))));
   }
 
+  Buffer Buffer::arrow(const void* ptr, size_t n,
+                       std::shared_ptr<dt::OArrowArray> owner) {
+    return Buffer(new Arrow_BufferImpl(ptr, n, std::move(owner)));
+  }
+
   Buffer Buffer::view(const Buffer& src, size_t n, size_t offset) {
     return Buffer(new View_BufferImpl(src.impl_, n, offset));
   }
@@ -776,6 +980,10 @@ class Mmap_BufferImpl : public BufferImpl, MemoryMapWorker {
     return Buffer(new Mmap_BufferImpl(path, n, fd, create));
   }
 
+  Buffer Buffer::paged(const std::string& path, size_t offset, size_t n) {
+    return Buffer(new Paged_BufferImpl(path, offset, n));
+  }
+
   Buffer Buffer::tmp(std::shared_ptr<TemporaryFile> tempfile,
                      size_t offset, size_t length) {
     return Buffer(new TemporaryFile_BufferImpl(std::move(tempfile),
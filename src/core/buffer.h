@@ -32,6 +32,7 @@
 
 class BufferImpl;
 namespace py { class buffer; }
+namespace dt { class OArrowArray; }
 
 
 //==============================================================================
@@ -133,6 +134,19 @@ class Buffer
     //   If `create` is `true` (default), create a file of size `n` at `path`,
     //   and then memory-map it. Otherwise, just memory-map the existing file.
     //
+    // Buffer::paged(path, offset, n)
+    //   Create a read-only Buffer for the `n` bytes at `offset` within the
+    //   file `path`. The data is memory-mapped lazily, and its pages are
+    //   managed by the page cache of the MemoryMapManager: they may be
+    //   released when the cache exceeds its memory limit, and then read
+    //   from the file again on the next access.
+    //
+    // Buffer::arrow(ptr, n, owner)
+    //   Create a read-only Buffer for the memory region `ptr` of size `n`
+    //   which belongs to an Arrow array imported via the C Data Interface.
+    //   The `owner` is the imported array: it will not be released while
+    //   this Buffer exists.
+    //
     static Buffer mem(size_t n);
     static Buffer mem(int64_t n);
     static Buffer copy(const void* ptr, size_t n);
@@ -144,8 +158,11 @@ class Buffer
     static Buffer mmap(const std::string& path);
     static Buffer mmap(const std::string& path, size_t n, int fd = -1,
                        bool create = true);
+    static Buffer paged(const std::string& path, size_t offset, size_t n);
     static Buffer tmp(std::shared_ptr<TemporaryFile> tempfile,
                       size_t offset, size_t length);
+    static Buffer arrow(const void* ptr, size_t n,
+                        std::shared_ptr<dt::OArrowArray> owner);
 
     // Basic properties of the Buffer:
     //
@@ -21,6 +21,7 @@
 //------------------------------------------------------------------------------
 #include <cstdlib>     // atoll
 #include "column/const.h"
+#include "column/rbound.h"
 #include "column/sentinel.h"
 #include "column/virtual.h"
 #include "python/_all.h"
@@ -33,6 +34,8 @@
 #include "rowindex.h"
 #include "sort.h"
 
+constexpr size_t Column::BATCH_SIZE;
+
 
 
 Column Column::new_data_column(size_t nrows, dt::SType stype) {
@@ -181,6 +184,16 @@ bool Column::is_constant() const noexcept {
   return bool(dynamic_cast<const dt::Const_ColumnImpl*>(impl_));
 }
 
+size_t Column::n_chunks() const noexcept {
+  auto rbound = dynamic_cast<const dt::Rbound_ColumnImpl*>(impl_);
+  return rbound? rbound->n_children() : 0;
+}
+
+const Column& Column::chunk(size_t i) const {
+  xassert(i < n_chunks());
+  return impl_->child(i);
+}
+
 size_t Column::elemsize() const noexcept {
   return stype_elemsize(impl_->stype_);
 }
@@ -240,6 +253,47 @@ bool Column::get_element(size_t i, py::robj* out) const {
 }
 
 
+void Column::get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, float* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, double* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, CString* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+void Column::get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const {
+  xassert(i0 + n <= nrows());
+  impl_->get_elements(i0, n, out, valid);
+}
+
+
 
 template <typename T>
 static inline py::oobj getelem(const Column& col, size_t i) {
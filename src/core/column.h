@@ -78,6 +78,11 @@ class Column
     // indices. This bound is inclusive.
     static constexpr size_t MAX_ARR32_SIZE = 0x7FFFFFFF;
 
+    // Recommended number of elements to request at once via the
+    // batched `get_elements()` API. Callers typically allocate the
+    // value and validity arrays of this size on the stack.
+    static constexpr size_t BATCH_SIZE = 256;
+
   //------------------------------------
   // Constructors
   //------------------------------------
@@ -125,6 +130,13 @@ class Column
     size_t memory_footprint() const noexcept;
     operator bool() const noexcept;
 
+    // If the column was formed by row-binding several columns (for
+    // example, the row groups of a Jay file), then these are its
+    // "chunks", which can be inspected individually. For all other
+    // columns `n_chunks()` returns 0.
+    size_t n_chunks() const noexcept;
+    const Column& chunk(size_t i) const;
+
     dt::ColumnImpl* release() &&;
 
   //------------------------------------
@@ -156,6 +168,28 @@ class Column
     bool get_element(size_t i, CString* out) const;
     bool get_element(size_t i, py::robj* out) const;
 
+    // Batched version of `get_element()`: retrieve `n` consecutive
+    // elements starting from index `i0`, storing the values into the
+    // array `out`, and their validity flags into the array `valid`.
+    // Both arrays must have space for at least `n` elements. As with
+    // `get_element()`, the values in `out` that correspond to NAs
+    // (i.e. where `valid[j]` is false) are unspecified.
+    //
+    // Virtual columns implement this method natively, which allows
+    // them to make only one virtual call per batch instead of one
+    // call per element.
+    //
+    // The function expects that `i0 + n <= nrows()`.
+    //
+    void get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, float* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, double* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, CString* out, bool* valid) const;
+    void get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const;
+
     // `get_element_as_pyobject(i)` returns the i-th element of the
     // column wrapped into a pyobject of the appropriate type.
     py::oobj get_element_as_pyobject(size_t i) const;
@@ -270,7 +304,8 @@ class Column
     flatbuffers::Offset<jay::Column> write_to_jay(
         const std::string& name,
         flatbuffers::FlatBufferBuilder&,
-        WritableBuffer*);
+        WritableBuffer*,
+        bool compress = false);
     void write_data_to_jay(jay::ColumnBuilder&, WritableBuffer*);
 
   private:
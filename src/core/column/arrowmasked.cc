@@ -0,0 +1,120 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include "column/arrowmasked.h"
+#include "parallel/api.h"
+#include "stype.h"
+namespace dt {
+
+
+
+ArrowMasked_ColumnImpl::ArrowMasked_ColumnImpl(
+    Column&& arg, Buffer&& validity, size_t offset)
+  : Virtual_ColumnImpl(arg.nrows(), arg.stype()),
+    arg_(std::move(arg)),
+    validity_(std::move(validity)),
+    offset_(offset)
+{
+  XAssert(validity_.size() * 8 >= offset_ + nrows_);
+}
+
+
+ColumnImpl* ArrowMasked_ColumnImpl::clone() const {
+  auto res = new ArrowMasked_ColumnImpl(Column(arg_), Buffer(validity_),
+                                        offset_);
+  res->nrows_ = nrows_;
+  return res;
+}
+
+
+// Convert the column into a regular column, replacing the values that
+// are masked out with NA sentinels.
+template <typename T>
+void ArrowMasked_ColumnImpl::_materialize_fw(Column& out) {
+  xassert(compatible_type<T>(arg_.stype()));
+  Buffer databuf = Buffer::mem(nrows_ * sizeof(T));
+  auto out_data = static_cast<T*>(databuf.xptr());
+  auto inp_data = static_cast<const T*>(arg_.get_data_readonly());
+  parallel_for_static(nrows_,
+    [=](size_t i) {
+      out_data[i] = _is_valid(i)? inp_data[i] : GETNA<T>();
+    });
+  out = Column::new_mbuf_column(nrows_, stype_, std::move(databuf));
+}
+
+void ArrowMasked_ColumnImpl::materialize(Column& out, bool to_memory) {
+  if (arg_.get_na_storage_method() == NaStorage::SENTINEL &&
+      arg_.is_fixedwidth() && !arg_.is_virtual())
+  {
+    switch (stype_) {
+      case SType::BOOL:
+      case SType::INT8:    return _materialize_fw<int8_t>(out);
+      case SType::INT16:   return _materialize_fw<int16_t>(out);
+      case SType::INT32:   return _materialize_fw<int32_t>(out);
+      case SType::INT64:   return _materialize_fw<int64_t>(out);
+      case SType::FLOAT32: return _materialize_fw<float>(out);
+      case SType::FLOAT64: return _materialize_fw<double>(out);
+      default: break;
+    }
+  }
+  ColumnImpl::materialize(out, to_memory);
+}
+
+
+size_t ArrowMasked_ColumnImpl::n_children() const noexcept {
+  return 1;
+}
+
+const Column& ArrowMasked_ColumnImpl::child(size_t i) const {
+  xassert(i == 0);  (void)i;
+  return arg_;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Element access
+//------------------------------------------------------------------------------
+
+inline bool ArrowMasked_ColumnImpl::_is_valid(size_t i) const {
+  size_t j = i + offset_;
+  auto bits = static_cast<const uint8_t*>(validity_.rptr());
+  return (bits[j >> 3] >> (j & 7)) & 1;
+}
+
+template <typename T>
+inline bool ArrowMasked_ColumnImpl::_get(size_t i, T* out) const {
+  return _is_valid(i) && arg_.get_element(i, out);
+}
+
+bool ArrowMasked_ColumnImpl::get_element(size_t i, int8_t* out)   const { return _get(i, out); }
+bool ArrowMasked_ColumnImpl::get_element(size_t i, int16_t* out)  const { return _get(i, out); }
+bool ArrowMasked_ColumnImpl::get_element(size_t i, int32_t* out)  const { return _get(i, out); }
+bool ArrowMasked_ColumnImpl::get_element(size_t i, int64_t* out)  const { return _get(i, out); }
+bool ArrowMasked_ColumnImpl::get_element(size_t i, float* out)    const { return _get(i, out); }
+bool ArrowMasked_ColumnImpl::get_element(size_t i, double* out)   const { return _get(i, out); }
+bool ArrowMasked_ColumnImpl::get_element(size_t i, CString* out)  const { return _get(i, out); }
+
+
+
+
+}  // namespace dt
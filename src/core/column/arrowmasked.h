@@ -0,0 +1,69 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_COLUMN_ARROWMASKED_h
+#define dt_COLUMN_ARROWMASKED_h
+#include "column/virtual.h"
+namespace dt {
+
+
+/**
+  * Virtual column that applies an arrow-style validity bitmap on
+  * top of another column. In this bitmap, bit `(offset + i)` (in
+  * the LSB order) corresponds to the row `i` of the column: bit `1`
+  * indicates a valid value, whereas bit `0` indicates an NA. Thus,
+  * the values of the underlying column in the NA rows are ignored.
+  *
+  * See also: NpMasked_ColumnImpl.
+  */
+class ArrowMasked_ColumnImpl : public Virtual_ColumnImpl {
+  private:
+    Column arg_;
+    Buffer validity_;
+    size_t offset_;
+
+  public:
+    ArrowMasked_ColumnImpl(Column&& arg, Buffer&& validity, size_t offset);
+
+    ColumnImpl* clone() const override;
+    void materialize(Column&, bool) override;
+    size_t n_children() const noexcept override;
+    const Column& child(size_t i) const override;
+
+    bool get_element(size_t, int8_t*)  const override;
+    bool get_element(size_t, int16_t*) const override;
+    bool get_element(size_t, int32_t*) const override;
+    bool get_element(size_t, int64_t*) const override;
+    bool get_element(size_t, float*)   const override;
+    bool get_element(size_t, double*)  const override;
+    bool get_element(size_t, CString*) const override;
+
+  private:
+    inline bool _is_valid(size_t i) const;
+    template <typename T> void _materialize_fw(Column& out);
+    template <typename T> inline bool _get(size_t, T*) const;
+};
+
+
+
+
+}  // namespace dt
+#endif
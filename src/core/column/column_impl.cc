@@ -61,6 +61,23 @@ bool ColumnImpl::get_element(size_t, CString*) const { err(stype_, "string"); }
 bool ColumnImpl::get_element(size_t, py::robj*)const { err(stype_, "object"); }
 
 
+template <typename T>
+void ColumnImpl::_get_elements(size_t i0, size_t n, T* out, bool* valid) const {
+  for (size_t j = 0; j < n; ++j) {
+    valid[j] = get_element(i0 + j, out + j);
+  }
+}
+
+void ColumnImpl::get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const   { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const  { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const  { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const  { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, float* out, bool* valid) const    { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, double* out, bool* valid) const   { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, CString* out, bool* valid) const  { _get_elements(i0, n, out, valid); }
+void ColumnImpl::get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const { _get_elements(i0, n, out, valid); }
+
+
 
 
 //------------------------------------------------------------------------------
@@ -70,25 +87,28 @@ bool ColumnImpl::get_element(size_t, py::robj*)const { err(stype_, "object"); }
 template <typename T>
 void ColumnImpl::_materialize_fw(Column& out) {
   xassert(compatible_type<T>(stype_));
+  constexpr size_t BATCH = Column::BATCH_SIZE;
   auto out_column = Sentinel_ColumnImpl::make_column(nrows_, stype_);
   auto out_data = static_cast<T*>(out_column.get_data_editable(0));
   auto nthreads = NThreads(this->allow_parallel_access());
-
+  size_t nbatches = (nrows_ + BATCH - 1) / BATCH;
+
+  // Each batch of values is written directly into the output buffer,
+  // after which the NA values get replaced with the proper sentinels.
+  auto fn = [=](size_t k) {
+    bool valid[BATCH];
+    size_t i0 = k * BATCH;
+    size_t n = std::min(BATCH, nrows_ - i0);
+    this->get_elements(i0, n, out_data + i0, valid);
+    for (size_t j = 0; j < n; ++j) {
+      if (!valid[j]) out_data[i0 + j] = GETNA<T>();
+    }
+  };
   if (computationally_expensive()) {
-    parallel_for_dynamic(nrows_, nthreads,
-      [=](size_t i) {
-        T value;
-        bool isvalid = this->get_element(i, &value);
-        out_data[i] = isvalid? value : GETNA<T>();
-      });
+    parallel_for_dynamic(nbatches, nthreads, fn);
   }
   else {
-    parallel_for_static(nrows_, nthreads,
-      [=](size_t i) {
-        T value;
-        bool isvalid = this->get_element(i, &value);
-        out_data[i] = isvalid? value : GETNA<T>();
-      });
+    parallel_for_static(nbatches, ChunkSize(4), nthreads, fn);
   }
   out = std::move(out_column);
 }
@@ -155,9 +175,15 @@ bool ColumnImpl::allow_parallel_access() const {
 
 template <typename T>
 void ColumnImpl::_fill_npmask(bool* outmask, size_t row0, size_t row1) const {
-  T value;
-  for (size_t i = row0; i < row1; ++i) {
-    outmask[i] = !get_element(i, &value);
+  constexpr size_t BATCH = Column::BATCH_SIZE;
+  T values[BATCH];
+  bool valid[BATCH];
+  for (size_t i0 = row0; i0 < row1; i0 += BATCH) {
+    size_t n = std::min(BATCH, row1 - i0);
+    get_elements(i0, n, values, valid);
+    for (size_t j = 0; j < n; ++j) {
+      outmask[i0 + j] = !valid[j];
+    }
   }
 }
 
@@ -86,6 +86,19 @@ class ColumnImpl
     virtual bool get_element(size_t i, CString* out) const;
     virtual bool get_element(size_t i, py::robj* out) const;
 
+    // Batched element access, see `Column::get_elements()`. The
+    // default implementation falls back to calling `get_element()`
+    // for each index in the range; the derived classes are expected
+    // to override the variants for the stypes that they support.
+    virtual void get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, float* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, double* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, CString* out, bool* valid) const;
+    virtual void get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const;
+
 
   //------------------------------------
   // Properties
@@ -142,6 +155,9 @@ class ColumnImpl
     virtual void rbind_impl(colvec& columns, size_t nrows, bool isempty,
                             SType& cast_stype);
 
+    template <typename T>
+    void _get_elements(size_t i0, size_t n, T* out, bool* valid) const;
+
     template <typename T> void _materialize_fw(Column&);
     void _materialize_str(Column&);
     void _materialize_obj(Column&);
@@ -150,6 +166,7 @@ class ColumnImpl
     void _fill_npmask(bool* outmask, size_t row0, size_t row1) const;
 
     friend class ::Column;
+    friend class Latent_ColumnImpl;
 };
 
 
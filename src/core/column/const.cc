@@ -19,12 +19,20 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>      // std::fill
 #include "column/const.h"
 #include "python/obj.h"
 #include "utils/macros.h"
 namespace dt {
 
 
+template <typename T>
+static inline void _fill(size_t n, T value, T* out, bool* valid) {
+  std::fill(out, out + n, value);
+  std::fill(valid, valid + n, true);
+}
+
+
 
 //------------------------------------------------------------------------------
 // ConstInt_ColumnImpl
@@ -85,6 +93,30 @@ class ConstInt_ColumnImpl : public Const_ColumnImpl {
       return true;
     }
 
+    void get_elements(size_t, size_t n, int8_t* out, bool* valid) const override {
+      _fill(n, static_cast<int8_t>(value), out, valid);
+    }
+
+    void get_elements(size_t, size_t n, int16_t* out, bool* valid) const override {
+      _fill(n, static_cast<int16_t>(value), out, valid);
+    }
+
+    void get_elements(size_t, size_t n, int32_t* out, bool* valid) const override {
+      _fill(n, static_cast<int32_t>(value), out, valid);
+    }
+
+    void get_elements(size_t, size_t n, int64_t* out, bool* valid) const override {
+      _fill(n, value, out, valid);
+    }
+
+    void get_elements(size_t, size_t n, float* out, bool* valid) const override {
+      _fill(n, static_cast<float>(value), out, valid);
+    }
+
+    void get_elements(size_t, size_t n, double* out, bool* valid) const override {
+      _fill(n, static_cast<double>(value), out, valid);
+    }
+
 
   private:
     static SType normalize_stype(SType stype0, int64_t x) {
@@ -145,6 +177,14 @@ class ConstFloat_ColumnImpl : public Const_ColumnImpl {
       return true;
     }
 
+    void get_elements(size_t, size_t n, float* out, bool* valid) const override {
+      _fill(n, static_cast<float>(value), out, valid);
+    }
+
+    void get_elements(size_t, size_t n, double* out, bool* valid) const override {
+      _fill(n, value, out, valid);
+    }
+
 
   private:
     static SType normalize_stype(SType stype0, double x) {
@@ -201,6 +241,10 @@ class ConstString_ColumnImpl : public Const_ColumnImpl {
       out->size = static_cast<int64_t>(value.size());
       return true;
     }
+
+    void get_elements(size_t, size_t n, CString* out, bool* valid) const override {
+      _fill(n, CString(value), out, valid);
+    }
 };
 
 
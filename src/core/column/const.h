@@ -60,6 +60,15 @@ class ConstNa_ColumnImpl : public Const_ColumnImpl {
     bool get_element(size_t, CString*)  const override;
     bool get_element(size_t, py::robj*) const override;
 
+    void get_elements(size_t, size_t n, int8_t*, bool* valid)   const override;
+    void get_elements(size_t, size_t n, int16_t*, bool* valid)  const override;
+    void get_elements(size_t, size_t n, int32_t*, bool* valid)  const override;
+    void get_elements(size_t, size_t n, int64_t*, bool* valid)  const override;
+    void get_elements(size_t, size_t n, float*, bool* valid)    const override;
+    void get_elements(size_t, size_t n, double*, bool* valid)   const override;
+    void get_elements(size_t, size_t n, CString*, bool* valid)  const override;
+    void get_elements(size_t, size_t n, py::robj*, bool* valid) const override;
+
     ColumnImpl* clone() const override;
     void materialize(Column&, bool) override;
     void na_pad(size_t nrows, Column&) override;
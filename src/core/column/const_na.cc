@@ -42,6 +42,15 @@ bool ConstNa_ColumnImpl::get_element(size_t, double*)   const { return false; }
 bool ConstNa_ColumnImpl::get_element(size_t, CString*)  const { return false; }
 bool ConstNa_ColumnImpl::get_element(size_t, py::robj*) const { return false; }
 
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, int8_t*, bool* valid)   const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, int16_t*, bool* valid)  const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, int32_t*, bool* valid)  const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, int64_t*, bool* valid)  const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, float*, bool* valid)    const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, double*, bool* valid)   const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, CString*, bool* valid)  const { std::fill(valid, valid + n, false); }
+void ConstNa_ColumnImpl::get_elements(size_t, size_t n, py::robj*, bool* valid) const { std::fill(valid, valid + n, false); }
+
 
 ColumnImpl* ConstNa_ColumnImpl::clone() const {
   return new ConstNa_ColumnImpl(nrows_, stype_);
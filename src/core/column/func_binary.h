@@ -21,6 +21,7 @@
 //------------------------------------------------------------------------------
 #ifndef dt_COLUMN_FUNC_BINARY_h
 #define dt_COLUMN_FUNC_BINARY_h
+#include <algorithm>    // std::min
 #include "column.h"
 #include "column/virtual.h"
 #include "models/utils.h"
@@ -60,6 +61,7 @@ class FuncBinary1_ColumnImpl : public Virtual_ColumnImpl {
     const Column& child(size_t i) const override;
 
     bool get_element(size_t i, TO* out) const override;
+    void get_elements(size_t i0, size_t n, TO* out, bool* valid) const override;
 };
 
 
@@ -91,6 +93,7 @@ class FuncBinary2_ColumnImpl : public Virtual_ColumnImpl {
     const Column& child(size_t i) const override;
 
     bool get_element(size_t i, TO* out) const override;
+    void get_elements(size_t i0, size_t n, TO* out, bool* valid) const override;
 };
 
 
@@ -133,6 +136,32 @@ bool FuncBinary1_ColumnImpl<T1, T2, TO>::get_element(size_t i, TO* out) const {
 }
 
 
+template <typename T1, typename T2, typename TO>
+void FuncBinary1_ColumnImpl<T1, T2, TO>::get_elements(
+    size_t i0, size_t n, TO* out, bool* valid) const
+{
+  constexpr size_t BATCH = Column::BATCH_SIZE;
+  T1 x1s[BATCH];
+  T2 x2s[BATCH];
+  bool x2valid[BATCH];
+  for (size_t j0 = 0; j0 < n; j0 += BATCH) {
+    size_t m = std::min(BATCH, n - j0);
+    bool* xvalid = valid + j0;
+    arg1_.get_elements(i0 + j0, m, x1s, xvalid);
+    arg2_.get_elements(i0 + j0, m, x2s, x2valid);
+    for (size_t j = 0; j < m; ++j) {
+      if (!(xvalid[j] && x2valid[j])) {
+        xvalid[j] = false;
+        continue;
+      }
+      TO value = func_(x1s[j], x2s[j]);
+      out[j0 + j] = value;
+      xvalid[j] = _notnan(value);
+    }
+  }
+}
+
+
 template <typename T1, typename T2, typename TO>
 void FuncBinary1_ColumnImpl<T1, T2, TO>::verify_integrity() const {
   arg1_.verify_integrity();
@@ -193,6 +222,26 @@ bool FuncBinary2_ColumnImpl<T1, T2, TO>::get_element(size_t i, TO* out) const {
 }
 
 
+template <typename T1, typename T2, typename TO>
+void FuncBinary2_ColumnImpl<T1, T2, TO>::get_elements(
+    size_t i0, size_t n, TO* out, bool* valid) const
+{
+  constexpr size_t BATCH = Column::BATCH_SIZE;
+  T1 x1s[BATCH];
+  T2 x2s[BATCH];
+  bool x2valid[BATCH];
+  for (size_t j0 = 0; j0 < n; j0 += BATCH) {
+    size_t m = std::min(BATCH, n - j0);
+    bool* xvalid = valid + j0;
+    arg1_.get_elements(i0 + j0, m, x1s, xvalid);
+    arg2_.get_elements(i0 + j0, m, x2s, x2valid);
+    for (size_t j = 0; j < m; ++j) {
+      xvalid[j] = func_(x1s[j], xvalid[j], x2s[j], x2valid[j], out + j0 + j);
+    }
+  }
+}
+
+
 template <typename T1, typename T2, typename TO>
 void FuncBinary2_ColumnImpl<T1, T2, TO>::verify_integrity() const {
   arg1_.verify_integrity();
@@ -21,6 +21,7 @@
 //------------------------------------------------------------------------------
 #ifndef dt_COLUMN_FUNC_UNARY_h
 #define dt_COLUMN_FUNC_UNARY_h
+#include <algorithm>    // std::min
 #include "column/virtual.h"
 #include "models/utils.h"
 #include "column.h"
@@ -57,6 +58,7 @@ class FuncUnary1_ColumnImpl : public Virtual_ColumnImpl {
     const Column& child(size_t i) const override;
 
     bool get_element(size_t i, TO* out) const override;
+    void get_elements(size_t i0, size_t n, TO* out, bool* valid) const override;
 };
 
 
@@ -85,6 +87,7 @@ class FuncUnary2_ColumnImpl : public Virtual_ColumnImpl {
     const Column& child(size_t i) const override;
 
     bool get_element(size_t i, TO* out) const override;
+    void get_elements(size_t i0, size_t n, TO* out, bool* valid) const override;
 };
 
 
@@ -124,6 +127,26 @@ bool FuncUnary1_ColumnImpl<TI, TO>::get_element(size_t i, TO* out) const {
 }
 
 
+template <typename TI, typename TO>
+void FuncUnary1_ColumnImpl<TI, TO>::get_elements(
+    size_t i0, size_t n, TO* out, bool* valid) const
+{
+  constexpr size_t BATCH = Column::BATCH_SIZE;
+  TI xs[BATCH];
+  for (size_t j0 = 0; j0 < n; j0 += BATCH) {
+    size_t m = std::min(BATCH, n - j0);
+    bool* xvalid = valid + j0;
+    arg_.get_elements(i0 + j0, m, xs, xvalid);
+    for (size_t j = 0; j < m; ++j) {
+      if (!xvalid[j]) continue;
+      TO value = func_(xs[j]);
+      out[j0 + j] = value;
+      xvalid[j] = _notnan(value);
+    }
+  }
+}
+
+
 template <typename TI, typename TO>
 void FuncUnary1_ColumnImpl<TI, TO>::verify_integrity() const {
   arg_.verify_integrity();
@@ -179,6 +202,23 @@ bool FuncUnary2_ColumnImpl<TI, TO>::get_element(size_t i, TO* out) const {
 }
 
 
+template <typename TI, typename TO>
+void FuncUnary2_ColumnImpl<TI, TO>::get_elements(
+    size_t i0, size_t n, TO* out, bool* valid) const
+{
+  constexpr size_t BATCH = Column::BATCH_SIZE;
+  TI xs[BATCH];
+  for (size_t j0 = 0; j0 < n; j0 += BATCH) {
+    size_t m = std::min(BATCH, n - j0);
+    bool* xvalid = valid + j0;
+    arg_.get_elements(i0 + j0, m, xs, xvalid);
+    for (size_t j = 0; j < m; ++j) {
+      xvalid[j] = func_(xs[j], xvalid[j], out + j0 + j);
+    }
+  }
+}
+
+
 template <typename TI, typename TO>
 void FuncUnary2_ColumnImpl<TI, TO>::verify_integrity() const {
   arg_.verify_integrity();
@@ -107,6 +107,11 @@ ColumnImpl* Latent_ColumnImpl::vivify(bool to_memory) const {
   // This will work, provided that `sizeof(*this)` is >= the size
   // of the class of the materialized column.
   auto ptr = const_cast<void*>(static_cast<const void*>(this));
+  // The new object will be constructed with a fresh refcount and no
+  // stats; however, this column may be shared by multiple `Column`
+  // instances, so both must be carried over.
+  uint32_t refcount = refcount_;
+  std::unique_ptr<Stats> stats = std::move(stats_);
   column_.materialize(to_memory);
   ColumnImpl* new_pcol = std::move(column_).release();
   SType stype = new_pcol->stype();
@@ -122,7 +127,10 @@ ColumnImpl* Latent_ColumnImpl::vivify(bool to_memory) const {
     default:
       throw NotImplError() << "Cannot vivify column of type " << stype;
   }
-  return static_cast<ColumnImpl*>(ptr);
+  auto res = static_cast<ColumnImpl*>(ptr);
+  res->refcount_ = refcount;
+  res->stats_ = std::move(stats);
+  return res;
 }
 
 
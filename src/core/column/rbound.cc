@@ -19,6 +19,7 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>           // std::upper_bound
 #include "column/rbound.h"
 #include "ltype.h"
 #include "stype.h"
@@ -52,13 +53,17 @@ Rbound_ColumnImpl::Rbound_ColumnImpl(const colvec& columns)
     chunks_(columns)
 {
   xassert(!chunks_.empty());
+  offsets_.reserve(chunks_.size() + 1);
+  offsets_.push_back(0);
   for (auto& col : chunks_) {
     col.cast_inplace(stype_);  // noop if stypes are the same
+    offsets_.push_back(offsets_.back() + col.nrows());
   }
   calculate_nacount();
   switch (stype_to_ltype(stype_)) {
     case LType::BOOL: calculate_boolean_stats(); break;
     case LType::INT:  calculate_integer_stats(); break;
+    case LType::REAL: calculate_float_stats(); break;
     default: break;
   }
 }
@@ -70,12 +75,17 @@ Rbound_ColumnImpl::Rbound_ColumnImpl(const colvec& columns)
 // Stats
 //------------------------------------------------------------------------------
 
+// The stats of the combined column are derived from the stats of the
+// chunks, but only if those are already computed: computing them here
+// would require reading the data of all chunks, which is exactly what
+// we want to avoid for the columns opened from a file.
+
 void Rbound_ColumnImpl::calculate_nacount() {
   bool is_valid = true;
   size_t na_count = 0;
   for (const auto& col : chunks_) {
     auto chunk_stats = col.get_stats_if_exist();
-    if (!chunk_stats) return;
+    if (!chunk_stats || !chunk_stats->is_computed(Stat::NaCount)) return;
     na_count += chunk_stats->nacount(&is_valid);
     if (!is_valid) return;
   }
@@ -89,12 +99,13 @@ void Rbound_ColumnImpl::calculate_boolean_stats() {
   size_t count1 = 0;
   for (const auto& col : chunks_) {
     auto chunk_stats = dynamic_cast<BooleanStats*>(col.get_stats_if_exist());
-    if (!chunk_stats) return;
+    if (!chunk_stats || !chunk_stats->is_computed(Stat::Sum)) return;
     double sum = chunk_stats->sum(&is_valid);
     xassert(sum == static_cast<size_t>(sum));
     count1 += static_cast<size_t>(sum);
     if (!is_valid) return;
   }
+  if (!stats()->is_computed(Stat::NaCount)) return;
   size_t count0 = nrows_ - count1 - stats()->nacount(&is_valid);
   auto bstats = dynamic_cast<BooleanStats*>(stats());
   xassert(is_valid && bstats);
@@ -110,7 +121,8 @@ void Rbound_ColumnImpl::calculate_integer_stats() {
   bool valid = false;
   for (const auto& col : chunks_) {
     auto stats = col.get_stats_if_exist();
-    if (!stats) return;
+    if (!stats || !stats->is_computed(Stat::Min) ||
+        !stats->is_computed(Stat::Max)) return;
     bool cvalid;
     int64_t cmin = stats->min_int(&cvalid);
     int64_t cmax = stats->max_int(&cvalid);
@@ -132,7 +144,8 @@ void Rbound_ColumnImpl::calculate_float_stats() {
   bool valid = false;
   for (const auto& col : chunks_) {
     auto stats = col.get_stats_if_exist();
-    if (!stats) return;
+    if (!stats || !stats->is_computed(Stat::Min) ||
+        !stats->is_computed(Stat::Max)) return;
     bool cvalid;
     double cmin = stats->min_double(&cvalid);
     double cmax = stats->max_double(&cvalid);
@@ -160,6 +173,15 @@ ColumnImpl* Rbound_ColumnImpl::clone() const {
 }
 
 
+size_t Rbound_ColumnImpl::memory_footprint() const noexcept {
+  size_t size = sizeof(*this) + offsets_.capacity() * sizeof(size_t);
+  for (const Column& col : chunks_) {
+    size += col.memory_footprint();
+  }
+  return size;
+}
+
+
 size_t Rbound_ColumnImpl::n_children() const noexcept {
   return chunks_.size();
 }
@@ -177,25 +199,63 @@ const Column& Rbound_ColumnImpl::child(size_t i) const {
 // Data access
 //------------------------------------------------------------------------------
 
+// Find the chunk containing row `i`
+static inline size_t _find_chunk(const std::vector<size_t>& offsets, size_t i) {
+  auto it = std::upper_bound(offsets.begin(), offsets.end(), i);
+  if (it == offsets.end()) {
+    throw ValueError() << "Index " << i << " is out of range";
+  }
+  return static_cast<size_t>(it - offsets.begin()) - 1;
+}
+
 template <typename T>
-static inline bool _get(const colvec& columns, size_t i, T* out) {
-  for (const auto& col : columns) {
-    if (i < col.nrows()) {
-      return col.get_element(i, out);
-    }
-    i -= col.nrows();
+static inline bool _get(const colvec& columns,
+                        const std::vector<size_t>& offsets, size_t i, T* out)
+{
+  size_t k = _find_chunk(offsets, i);
+  return columns[k].get_element(i - offsets[k], out);
+}
+
+bool Rbound_ColumnImpl::get_element(size_t i, int8_t* out)   const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, int16_t* out)  const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, int32_t* out)  const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, int64_t* out)  const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, float* out)    const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, double* out)   const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, CString* out)  const { return _get(chunks_, offsets_, i, out); }
+bool Rbound_ColumnImpl::get_element(size_t i, py::robj* out) const { return _get(chunks_, offsets_, i, out); }
+
+
+// The requested range may span several chunks, in which case it is
+// split into sub-ranges, each forwarded to its chunk as one batch.
+template <typename T>
+static inline void _get_batch(const colvec& columns,
+                              const std::vector<size_t>& offsets,
+                              size_t i0, size_t n, T* out, bool* valid)
+{
+  if (n == 0) return;
+  size_t k = _find_chunk(offsets, i0);
+  for (; k < columns.size(); ++k) {
+    size_t j0 = i0 - offsets[k];
+    size_t m = std::min(n, offsets[k + 1] - i0);
+    columns[k].get_elements(j0, m, out, valid);
+    n -= m;
+    if (n == 0) return;
+    out += m;
+    valid += m;
+    i0 += m;
   }
-  throw ValueError() << "Index " << i << " is out of range";
+  throw ValueError() << "Index " << i0 << " is out of range";
 }
 
-bool Rbound_ColumnImpl::get_element(size_t i, int8_t* out)   const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, int16_t* out)  const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, int32_t* out)  const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, int64_t* out)  const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, float* out)    const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, double* out)   const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, CString* out)  const { return _get(chunks_, i, out); }
-bool Rbound_ColumnImpl::get_element(size_t i, py::robj* out) const { return _get(chunks_, i, out); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, int8_t* out, bool* valid)   const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, int16_t* out, bool* valid)  const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, int32_t* out, bool* valid)  const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, int64_t* out, bool* valid)  const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, float* out, bool* valid)    const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, double* out, bool* valid)   const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, CString* out, bool* valid)  const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
+void Rbound_ColumnImpl::get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const { _get_batch(chunks_, offsets_, i0, n, out, valid); }
 
 
 
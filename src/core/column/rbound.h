@@ -26,17 +26,21 @@ namespace dt {
 
 
 /**
-  *
+  * Column formed by row-binding several columns ("chunks") together.
+  * The chunks are not copied: an element with index `i` is looked up
+  * in the chunk `k` such that `offsets_[k] <= i < offsets_[k + 1]`.
   */
 class Rbound_ColumnImpl : public Virtual_ColumnImpl {
   private:
     std::vector<Column> chunks_;
+    std::vector<size_t> offsets_;
 
   public:
     Rbound_ColumnImpl(const colvec& columns);
 
     ColumnImpl* clone() const override;
     // ColumnImpl* materialize() override;
+    size_t memory_footprint() const noexcept override;
     size_t n_children() const noexcept override;
     const Column& child(size_t i) const override;
 
@@ -49,6 +53,15 @@ class Rbound_ColumnImpl : public Virtual_ColumnImpl {
     bool get_element(size_t i, CString* out)  const override;
     bool get_element(size_t i, py::robj* out) const override;
 
+    void get_elements(size_t i0, size_t n, int8_t* out, bool* valid)   const override;
+    void get_elements(size_t i0, size_t n, int16_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, int32_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, int64_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, float* out, bool* valid)    const override;
+    void get_elements(size_t i0, size_t n, double* out, bool* valid)   const override;
+    void get_elements(size_t i0, size_t n, CString* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const override;
+
     void write_data_to_jay(Column&, jay::ColumnBuilder&,
                            WritableBuffer*) const override;
 
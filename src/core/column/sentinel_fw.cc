@@ -200,6 +200,50 @@ bool SentinelObj_ColumnImpl::get_element(size_t i, py::robj* out) const {
 }
 
 
+template <typename T>
+template <typename U>
+void SentinelFw_ColumnImpl<T>::_get_elements(
+    size_t i0, size_t n, U* out, bool* valid) const
+{
+  auto data = static_cast<const T*>(mbuf_.rptr()) + i0;
+  for (size_t j = 0; j < n; ++j) {
+    T x = data[j];
+    out[j] = static_cast<U>(x);
+    valid[j] = !ISNA<T>(x);
+  }
+}
+
+template <typename T>
+void SentinelFw_ColumnImpl<T>::get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void SentinelFw_ColumnImpl<T>::get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void SentinelFw_ColumnImpl<T>::get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void SentinelFw_ColumnImpl<T>::get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void SentinelFw_ColumnImpl<T>::get_elements(size_t i0, size_t n, float* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void SentinelFw_ColumnImpl<T>::get_elements(size_t i0, size_t n, double* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+
 RESTORE_MSVC_WARNING(4702)
 
 
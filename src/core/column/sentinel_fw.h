@@ -54,6 +54,13 @@ class SentinelFw_ColumnImpl : public Sentinel_ColumnImpl
     virtual bool get_element(size_t i, double* out) const override;
     virtual bool get_element(size_t i, py::robj* out) const override;
 
+    void get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const override;
+    void get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const override;
+    void get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const override;
+    void get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const override;
+    void get_elements(size_t i0, size_t n, float* out, bool* valid) const override;
+    void get_elements(size_t i0, size_t n, double* out, bool* valid) const override;
+
     size_t      get_num_data_buffers() const noexcept override;
     bool        is_data_editable(size_t k) const override;
     size_t      get_data_size(size_t k) const override;
@@ -66,6 +73,10 @@ class SentinelFw_ColumnImpl : public Sentinel_ColumnImpl
 
   protected:
     void rbind_impl(colvec& columns, size_t nrows, bool isempty, SType&) override;
+
+  private:
+    template <typename U>
+    void _get_elements(size_t i0, size_t n, U* out, bool* valid) const;
 };
 
 
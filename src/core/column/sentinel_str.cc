@@ -142,6 +142,27 @@ bool SentinelStr_ColumnImpl<T>::get_element(size_t i, CString* out) const {
 }
 
 
+template <typename T>
+void SentinelStr_ColumnImpl<T>::get_elements(
+    size_t i0, size_t n, CString* out, bool* valid) const
+{
+  auto offsets = static_cast<const T*>(offbuf_.rptr()) + i0;
+  auto strdata = static_cast<const char*>(strbuf_.rptr());
+  T off_beg = offsets[0] & ~GETNA<T>();
+  for (size_t j = 0; j < n; ++j) {
+    T off_end = offsets[j + 1];
+    valid[j] = !ISNA<T>(off_end);
+    if (valid[j]) {
+      out[j].ch = strdata + off_beg;
+      out[j].size = static_cast<int64_t>(off_end - off_beg);
+      off_beg = off_end;
+    } else {
+      off_beg = off_end & ~GETNA<T>();
+    }
+  }
+}
+
+
 
 
 //------------------------------------------------------------------------------
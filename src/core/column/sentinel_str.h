@@ -43,6 +43,7 @@ class SentinelStr_ColumnImpl : public Sentinel_ColumnImpl
     size_t memory_footprint() const noexcept override;
 
     bool get_element(size_t i, CString* out) const override;
+    void get_elements(size_t i0, size_t n, CString* out, bool* valid) const override;
 
     size_t      get_num_data_buffers() const noexcept override;
     bool        is_data_editable(size_t k) const override;
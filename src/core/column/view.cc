@@ -20,6 +20,7 @@
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
 #include "column/view.h"
+#include "stype.h"
 namespace dt {
 
 
@@ -69,6 +70,33 @@ bool SliceView_ColumnImpl::get_element(size_t i, CString* out)  const { return a
 bool SliceView_ColumnImpl::get_element(size_t i, py::robj* out) const { return arg.get_element(start + i*step, out); }
 
 
+// A contiguous slice is forwarded to the parent column as a single
+// batch; strided slices have to be gathered element-by-element.
+template <typename U>
+void SliceView_ColumnImpl::_get_elements(
+    size_t i0, size_t n, U* out, bool* valid) const
+{
+  if (step == 1) {
+    arg.get_elements(start + i0, n, out, valid);
+  }
+  else {
+    size_t k = start + i0 * step;
+    for (size_t j = 0; j < n; ++j, k += step) {
+      valid[j] = arg.get_element(k, out + j);
+    }
+  }
+}
+
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, int8_t* out, bool* valid)   const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, int16_t* out, bool* valid)  const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, int32_t* out, bool* valid)  const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, int64_t* out, bool* valid)  const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, float* out, bool* valid)    const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, double* out, bool* valid)   const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, CString* out, bool* valid)  const { _get_elements(i0, n, out, valid); }
+void SliceView_ColumnImpl::get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const { _get_elements(i0, n, out, valid); }
+
+
 
 
 //------------------------------------------------------------------------------
@@ -189,6 +217,91 @@ bool ArrayView_ColumnImpl<T>::get_element(size_t i, py::robj* out) const {
 }
 
 
+
+// When the parent column is a plain data column of the requested
+// type, the values are gathered directly from its data buffer;
+// otherwise each index is resolved via the parent's `get_element()`.
+template <typename U>
+static inline bool _is_gatherable(const Column& col) {
+  return !col.is_virtual() && col.is_fixedwidth() &&
+         col.elemsize() == sizeof(U) && compatible_type<U>(col.stype());
+}
+
+template <typename T>
+template <typename U>
+void ArrayView_ColumnImpl<T>::_get_elements(
+    size_t i0, size_t n, U* out, bool* valid) const
+{
+  xassert(i0 + n <= nrows_);
+  const T* ind = indices + i0;
+  if (_is_gatherable<U>(arg)) {
+    auto data = static_cast<const U*>(arg.get_data_readonly());
+    for (size_t j = 0; j < n; ++j) {
+      T k = ind[j];
+      if (k < 0) {
+        valid[j] = false;
+      } else {
+        U x = data[k];
+        out[j] = x;
+        valid[j] = !ISNA<U>(x);
+      }
+    }
+  }
+  else {
+    for (size_t j = 0; j < n; ++j) {
+      T k = ind[j];
+      valid[j] = (k >= 0) && arg.get_element(static_cast<size_t>(k), out + j);
+    }
+  }
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, int8_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, int16_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, int32_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, int64_t* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, float* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, double* out, bool* valid) const {
+  _get_elements(i0, n, out, valid);
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, CString* out, bool* valid) const {
+  for (size_t j = 0; j < n; ++j) {
+    T k = indices[i0 + j];
+    valid[j] = (k >= 0) && arg.get_element(static_cast<size_t>(k), out + j);
+  }
+}
+
+template <typename T>
+void ArrayView_ColumnImpl<T>::get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const {
+  for (size_t j = 0; j < n; ++j) {
+    T k = indices[i0 + j];
+    valid[j] = (k >= 0) && arg.get_element(static_cast<size_t>(k), out + j);
+  }
+}
+
+
 template class ArrayView_ColumnImpl<int32_t>;
 template class ArrayView_ColumnImpl<int64_t>;
 
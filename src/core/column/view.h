@@ -51,6 +51,19 @@ class SliceView_ColumnImpl : public Virtual_ColumnImpl {
     bool get_element(size_t i, double* out)   const override;
     bool get_element(size_t i, CString* out)  const override;
     bool get_element(size_t i, py::robj* out) const override;
+
+    void get_elements(size_t i0, size_t n, int8_t* out, bool* valid)   const override;
+    void get_elements(size_t i0, size_t n, int16_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, int32_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, int64_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, float* out, bool* valid)    const override;
+    void get_elements(size_t i0, size_t n, double* out, bool* valid)   const override;
+    void get_elements(size_t i0, size_t n, CString* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const override;
+
+  private:
+    template <typename U>
+    void _get_elements(size_t i0, size_t n, U* out, bool* valid) const;
 };
 
 
@@ -87,8 +100,20 @@ class ArrayView_ColumnImpl : public Virtual_ColumnImpl {
     bool get_element(size_t i, CString* out)  const override;
     bool get_element(size_t i, py::robj* out) const override;
 
+    void get_elements(size_t i0, size_t n, int8_t* out, bool* valid)   const override;
+    void get_elements(size_t i0, size_t n, int16_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, int32_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, int64_t* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, float* out, bool* valid)    const override;
+    void get_elements(size_t i0, size_t n, double* out, bool* valid)   const override;
+    void get_elements(size_t i0, size_t n, CString* out, bool* valid)  const override;
+    void get_elements(size_t i0, size_t n, py::robj* out, bool* valid) const override;
+
   private:
     void set_rowindex(const RowIndex&);
+
+    template <typename U>
+    void _get_elements(size_t i0, size_t n, U* out, bool* valid) const;
 };
 
 
@@ -10,6 +10,9 @@
 
 #define D() if (verbose) logger_.info()
 
+// Initial number of rows to allocate when the rows are being filtered
+static constexpr size_t FILTER_ALLOC_NROWS = 1024;
+
 
 
 //==============================================================================
@@ -20,6 +23,10 @@
 //==============================================================================
 std::unique_ptr<DataTable> FreadReader::read_all()
 {
+  if (batch_rows) {
+    nrows_left = max_nrows;
+    max_nrows = std::min(max_nrows, batch_rows);
+  }
   job->add_work_amount(WORK_PREPARE);
   detect_lf();
   skip_preamble();
@@ -77,6 +84,13 @@ std::unique_ptr<DataTable> FreadReader::read_all()
       nUserBumped += (col.get_ptype() != oldtypes[i]);
     }
 
+    compile_row_filter();
+    if (row_filter && allocnrow > FILTER_ALLOC_NROWS) {
+      // The number of rows that pass the filter is unknown, so we start
+      // with a small allocation and let it grow as the data is read.
+      allocnrow = FILTER_ALLOC_NROWS;
+    }
+
     if (verbose) {
       if (nUserBumped || ndropped) {
         D() << "After " << nUserBumped << " type and " << ndropped
@@ -95,12 +109,71 @@ std::unique_ptr<DataTable> FreadReader::read_all()
     }
   }
   job->add_done_amount(WORK_PREPARE);
+  return read_data();
+}
+
+
+
+/**
+ * Read the next batch of rows from the input (only when `batch_rows`
+ * parameter is given). The column names and types that were detected
+ * when reading the first batch are reused; however, it is possible
+ * that some column types will be bumped while reading this batch.
+ */
+std::unique_ptr<DataTable> FreadReader::read_next_batch()
+{
+  xassert(has_next_batch());
+  job = std::make_shared<dt::progress::work>(WORK_READ);
+  if (verbose) {
+    fo.t_start = fo.t_initialized = fo.t_parse_parameters_detected =
+                 fo.t_column_types_detected = wallclock();
+    fo.time_read_data = 0.0;
+    fo.time_push_data = 0.0;
+    fo.n_cols_reread = 0;
+    fo.messages.clear();
+    t_open_input = 0;
+  }
+  max_nrows = std::min(nrows_left, batch_rows);
+  auto est_nrows = static_cast<size_t>(1.1 * (eof - sof) / meanLineLen) + 1;
+  allocnrow = std::min(max_nrows, est_nrows);
+  if (row_filter) allocnrow = std::min(allocnrow, FILTER_ALLOC_NROWS);
+  D() << "Reading the next batch of at most " << dt::log::plural(max_nrows, "row")
+      << ", starting at line " << line;
+
+  preframe.prepare_for_rereading(true);
+  preframe.preallocate(allocnrow);
+  if (verbose) {
+    fo.t_frame_allocated = wallclock();
+    fo.n_rows_allocated = allocnrow;
+    fo.allocation_size = preframe.total_allocsize();
+  }
+  try {
+    auto res = read_data();
+    job->done();
+    return res;
+  } catch (...) {
+    // The position within the input is unknown after a failure, so
+    // no more batches can be read.
+    nrows_left = 0;
+    throw;
+  }
+}
+
+
+bool FreadReader::has_next_batch() const {
+  return batch_rows && nrows_left && sof < eof;
+}
+
 
 
+std::unique_ptr<DataTable> FreadReader::read_data()
+{
   //****************************************************************************
   // [6] Read the data
   //****************************************************************************
   bool firstTime = true;
+  const char* input_end = eof;
+  const char* data_end = eof;
 
   auto typesPtr = preframe.get_ptypes();
   dt::read::PT* types = typesPtr.data();  // This pointer is valid until `typesPtr` goes out of scope
@@ -112,6 +185,7 @@ std::unique_ptr<DataTable> FreadReader::read_all()
     dt::progress::subtask subwork(*job, firstTime? WORK_READ : WORK_REREAD);
     dt::read::FreadParallelReader scr(*this, types);
     scr.read_all();
+    data_end = scr.get_end_of_data_read();
     subwork.done();
 
     if (firstTime) {
@@ -122,21 +196,45 @@ std::unique_ptr<DataTable> FreadReader::read_all()
     size_t ncols_to_reread = preframe.n_columns_to_reread();
     xassert((ncols_to_reread > 0) == reread_scheduled);
     if (ncols_to_reread) {
-      fo.n_cols_reread += ncols_to_reread;
       D() << dt::log::plural(ncols_to_reread, "column")
           << " need to be re-read because their types have changed";
-      preframe.prepare_for_rereading();
+      // When the filter is used, the set of rows in the output may
+      // have been computed from the values of type-bumped columns,
+      // so all columns have to be re-read.
+      if (row_filter) {
+        ncols_to_reread = preframe.n_columns_in_output();
+        D() << "All " << ncols_to_reread << " columns will be re-read "
+               "because a filter is applied";
+      }
+      fo.n_cols_reread += ncols_to_reread;
+      preframe.prepare_for_rereading(row_filter != nullptr);
+      // The re-read has to produce the same rows as the first pass, so
+      // there is no need to look past the point where it has stopped
+      // (this may happen because of `max_nrows`). The exception is when
+      // the rows are filtered, since the filter values could have
+      // changed as a result of a type bump.
+      if (!row_filter) eof = data_end;
       firstTime = false;
       reread_scheduled = false;
       goto read;
     }
+    eof = input_end;
 
+    if (row_filter) row_filter->check_types();
     fo.n_rows_read = preframe.nrows_written();
     fo.n_cols_read = preframe.n_columns_in_output();
   }
 
 
   auto _ = logger_.section("[7] Finalizing the frame");
+  if (batch_rows) {
+    size_t nrows = preframe.nrows_written();
+    xassert(nrows <= nrows_left);
+    nrows_left -= nrows;
+    line += nrows;
+    sof = data_end;
+    D() << dt::log::plural(nrows, "row") << " were read in this batch";
+  }
   std::unique_ptr<DataTable> res = std::move(preframe).to_datatable();
   if (verbose) fo.report();
   return res;
@@ -97,6 +97,7 @@ GenericReader::GenericReader()
   multisource_strategy = FreadMultiSourceStrategy::Warn;
   errors_strategy = IreadErrorHandlingStrategy::Error;
   memory_limit = size_t(-1);
+  batch_rows = 0;
 }
 
 
@@ -111,6 +112,7 @@ GenericReader::GenericReader(const GenericReader& g)
   dec              = g.dec;
   quote            = g.quote;
   max_nrows        = g.max_nrows;
+  batch_rows       = g.batch_rows;
   multisource_strategy = g.multisource_strategy;
   errors_strategy  = g.errors_strategy;
   skip_to_line     = g.skip_to_line;
@@ -124,12 +126,14 @@ GenericReader::GenericReader(const GenericReader& g)
   blank_is_na      = g.blank_is_na;
   number_is_na     = g.number_is_na;
   columns_arg      = g.columns_arg;
+  filter_arg       = g.filter_arg;
   t_open_input     = g.t_open_input;
   memory_limit     = g.memory_limit;
   encoding_        = g.encoding_;
   // Runtime parameters
   job     = g.job;
   input_mbuf = g.input_mbuf;
+  tempstr = g.tempstr;
   sof     = g.sof;
   eof     = g.eof;
   line    = g.line;
@@ -175,6 +179,17 @@ void GenericReader::init_fill(const py::Arg& arg) {
   }
 }
 
+void GenericReader::init_filter(const py::Arg& arg) {
+  if (arg.is_none_or_undefined()) return;
+  py::oobj value = arg.to_oobj();
+  if (!value.is_dtexpr()) {
+    throw TypeError() << arg.name() << " should be an f-expression, "
+        "instead got " << value.typeobj();
+  }
+  filter_arg = std::move(value);
+  D() << "filter = " << filter_arg;
+}
+
 void GenericReader::init_maxnrows(const py::Arg& arg) {
   int64_t n = arg.to<int64_t>(-1);
   if (n < 0) {
@@ -185,6 +200,17 @@ void GenericReader::init_maxnrows(const py::Arg& arg) {
   }
 }
 
+void GenericReader::init_batchrows(const py::Arg& arg) {
+  if (arg.is_none_or_undefined()) return;
+  int64_t n = arg.to_int64_strict();
+  if (n <= 0) {
+    throw ValueError() << arg.name() << " should be positive, "
+        "instead got " << n;
+  }
+  batch_rows = static_cast<size_t>(n);
+  D() << "batch_rows = " << batch_rows;
+}
+
 void GenericReader::init_skiptoline(const py::Arg& arg) {
   int64_t n = arg.to<int64_t>(-1);
   skip_to_line = (n < 0)? 0 : static_cast<size_t>(n);
@@ -834,7 +860,7 @@ bool GenericReader::read_jay() {
     input_mbuf.resize(datasize());
     DataTable* dt = open_jay_from_mbuf(input_mbuf);
     job->add_done_amount(WORK_READ);
-    output_ = py::Frame::oframe(dt);
+    output_ = apply_filter(py::Frame::oframe(dt));
     return true;
   }
   return false;
@@ -842,9 +868,14 @@ bool GenericReader::read_jay() {
 
 
 bool GenericReader::read_csv() {
-  auto dt = FreadReader(*this).read_all();
+  auto freader = std::make_unique<FreadReader>(*this);
+  auto dt = freader->read_all();
   if (dt) {
     output_ = py::Frame::oframe(dt.release());
+    if (!freader->row_filter) output_ = apply_filter(std::move(output_));
+    if (freader->has_next_batch()) {
+      batch_reader = std::move(freader);
+    }
     return true;
   }
   return false;
@@ -912,4 +943,43 @@ void GenericReader::report_columns_to_python() {
 
 
 
+
+/**
+  * Create the `row_filter` from the `filter=` parameter, so that the
+  * rows could be filtered while the data is being read. If the filter
+  * expression is too complicated for this, then `row_filter` will
+  * remain empty, and the filter will be applied to the frame after
+  * reading (see `apply_filter()`).
+  *
+  * This method should be called after `report_columns_to_python()`,
+  * since the filter refers to the columns by their final names.
+  */
+void GenericReader::compile_row_filter() {
+  if (!filter_arg) return;
+  row_filter = RowFilter::compile(filter_arg, preframe);
+  if (row_filter) {
+    D() << "Filter will be applied while reading the data";
+  }
+}
+
+
+/**
+  * Apply the `filter=` parameter to the `frame` that was already read,
+  * and return the filtered frame. This is used when the input is not
+  * in a format that supports filtering during reading (such as Jay),
+  * or when the filter cannot be compiled into a RowFilter.
+  */
+py::oobj GenericReader::apply_filter(py::oobj frame) const {
+  if (!filter_arg || !frame.is_frame()) return frame;
+  // The frame with no columns is returned for an empty input
+  if (frame.to_datatable()->ncols() == 0) return frame;
+  D() << "Applying the filter to the frame after it was read";
+  return frame.get_item(
+      py::otuple{filter_arg, py::oslice(py::oslice::NA, py::oslice::NA,
+                                        py::oslice::NA)});
+}
+
+
+
+
 }}  // namespace dt::read
@@ -27,7 +27,9 @@
 #include "python/obj.h"     // py::robj, py::oobj
 #include "python/list.h"    // py::olist
 #include "read/preframe.h"  // dt::read::PreFrame
+#include "read/row_filter.h"  // dt::read::RowFilter
 #include "utils/logger.h"
+class FreadReader;
 namespace dt {
 namespace read {
 
@@ -91,6 +93,9 @@ class GenericReader
   // header:
   //   Is the header present? Possible values are 0 (no), 1 (yes), and -128
   //   (auto-detect, default).
+  // batch_rows:
+  //   If non-zero, then the input will be read in batches of this many
+  //   rows each (see `batch_reader` below). Only used by iread().
   //
   public:
     int32_t nthreads;
@@ -99,6 +104,7 @@ class GenericReader
     char    dec;
     char    quote;
     size_t  max_nrows;
+    size_t  batch_rows;
     size_t  skip_to_line;
     int8_t  header;
     bool    strip_whitespace;
@@ -118,6 +124,10 @@ class GenericReader
   //---- Runtime parameters ----
   // line:
   //   Line number (within the original input) of the `offset` pointer.
+  // batch_reader:
+  //   In batch mode, this is the reader that was used to read the first
+  //   batch of rows, and that can be used to read the remaining batches.
+  //   This field remains empty if the input was read completely.
   //
   public:
     static constexpr size_t WORK_PREPARE = 2;
@@ -138,6 +148,8 @@ class GenericReader
     log::Logger logger_;
     py::oobj output_;
     const std::string* source_name;
+    std::unique_ptr<RowFilter> row_filter;
+    std::unique_ptr<FreadReader> batch_reader;
 
   private:
     py::oobj src_arg;
@@ -145,6 +157,7 @@ class GenericReader
     py::oobj text_arg;
     py::oobj tempstr;
     py::oobj columns_arg;
+    py::oobj filter_arg;
     py::oobj tempfiles;
 
     // If `trace()` cannot display a message immediately (because it was not
@@ -166,6 +179,7 @@ class GenericReader
 
     bool has_next() const;
     py::oobj read_next();
+    py::oobj apply_filter(py::oobj frame) const;
 
     /**
      * Return the pointer to the input data buffer and its size. The method
@@ -201,10 +215,12 @@ class GenericReader
 
   // Helper functions
   public:
+    void init_batchrows  (const py::Arg&);
     void init_columns    (const py::Arg&);
     void init_dec        (const py::Arg&);
     void init_errors     (const py::Arg&);
     void init_fill       (const py::Arg&);
+    void init_filter     (const py::Arg&);
     void init_header     (const py::Arg&);
     void init_logger     (const py::Arg& arg_logger, const py::Arg& arg_verbose);
     void init_maxnrows   (const py::Arg&);
@@ -232,6 +248,7 @@ class GenericReader
     void skip_to_line_with_string();
     void decode_utf16();
     void report_columns_to_python();
+    void compile_row_filter();
 
     bool read_csv();
     bool read_empty_input();
@@ -97,6 +97,9 @@ class FreadReader : public dt::read::GenericReader
   //     Number of rows in the allocated DataTable
   // meanLineLen:
   //     Average length (in bytes) of a single line in the input file
+  // nrows_left:
+  //     (only in batch mode) The number of rows that may still be read
+  //     from the input, according to the `max_nrows` parameter.
   ParserLibrary parserlib;
   const ParserFnPtr* parsers;
   FreadObserver fo;
@@ -105,6 +108,7 @@ class FreadReader : public dt::read::GenericReader
   double meanLineLen;
   size_t first_jump_size;
   size_t n_sample_lines;
+  size_t nrows_left;
   bool reread_scheduled;
 
   //----- Parse parameters -----------------------------------------------------
@@ -132,6 +136,8 @@ public:
   virtual ~FreadReader() override;
 
   std::unique_ptr<DataTable> read_all();
+  std::unique_ptr<DataTable> read_next_batch();
+  bool has_next_batch() const;
 
   // Simple getters
   double get_mean_line_len() const { return meanLineLen; }
@@ -149,6 +155,7 @@ private:
   void detect_column_types();
   void detect_header();
   int64_t parse_single_line(dt::read::ParseContext&);
+  std::unique_ptr<DataTable> read_data();
 
   friend dt::read::FreadThreadContext;
   friend dt::read::FreadParallelReader;
@@ -44,6 +44,7 @@ namespace dt {
 namespace read {
 
   void parse_string(const dt::read::ParseContext&);
+  void skip_string(const dt::read::ParseContext&);
 
 }}
 
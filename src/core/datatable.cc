@@ -35,6 +35,9 @@ DataTable::DataTable(const DataTable& other)
 {
   if (other.py_names_)  py_names_ = other.py_names_;
   if (other.py_inames_) py_inames_ = other.py_inames_.copy();
+  if (other.has_indexes()) {
+    get_group_cache()->copy_indexes_from(*other.group_cache_);
+  }
 }
 
 
@@ -106,18 +109,40 @@ const Column& DataTable::get_column(size_t i) const {
   return columns_[i];
 }
 
+// The caller may modify the returned column, so the cached groupings
+// that depend on it can no longer be trusted.
 Column& DataTable::get_column(size_t i) {
   xassert(i < columns_.size());
+  _invalidate_group_cache(i);
   return columns_[i];
 }
 
 void DataTable::set_column(size_t i, Column&& newcol) {
   xassert(i < columns_.size());
   xassert(newcol.nrows() == nrows_);
+  _invalidate_group_cache(i);
   columns_[i] = std::move(newcol);
 }
 
 
+dt::GroupCache* DataTable::get_group_cache() const {
+  if (!group_cache_) group_cache_.reset(new dt::GroupCache());
+  return group_cache_.get();
+}
+
+void DataTable::_invalidate_group_cache(size_t i) {
+  if (group_cache_) group_cache_->invalidate_column(i);
+}
+
+void DataTable::_clear_group_cache() {
+  if (group_cache_) group_cache_->clear();
+}
+
+void DataTable::_remap_group_cache(const sztvec& new_positions) {
+  if (group_cache_) group_cache_->remap_columns(new_positions);
+}
+
+
 size_t DataTable::xcolindex(int64_t index) const {
   int64_t incols = static_cast<int64_t>(ncols_);
   if (index < -incols || index >= incols) {
@@ -173,6 +198,7 @@ void DataTable::delete_columns(sztvec& cols_to_remove) {
   nkeys_ -= nkeys_remove;
 
   j = 0;
+  sztvec new_positions(ncols_, size_t(-1));
   for (size_t i = 0, k = 0; i < ncols_; ++i) {
     if (i == cols_to_remove[k]) {
       // cols_to_remove[] array may contain duplicate values of `i`, so we
@@ -187,8 +213,10 @@ void DataTable::delete_columns(sztvec& cols_to_remove) {
       std::swap(columns_[j], columns_[i]);
       std::swap(names_[j], names_[i]);
     }
+    new_positions[i] = j;
     ++j;
   }
+  _remap_group_cache(new_positions);
   ncols_ = j;
   columns_.resize(j);
   names_.resize(j);
@@ -198,6 +226,7 @@ void DataTable::delete_columns(sztvec& cols_to_remove) {
 
 
 void DataTable::delete_all() {
+  _remap_group_cache(sztvec());  // all columns are removed
   ncols_ = 0;
   nrows_ = 0;
   nkeys_ = 0;
@@ -213,6 +242,7 @@ void DataTable::resize_rows(size_t new_nrows) {
   if (new_nrows > nrows_ && nkeys_ > 0) {
     throw ValueError() << "Cannot increase the number of rows in a keyed frame";
   }
+  _clear_group_cache();
   for (Column& col : columns_) {
     col.resize(new_nrows);
   }
@@ -221,6 +251,11 @@ void DataTable::resize_rows(size_t new_nrows) {
 
 
 void DataTable::resize_columns(const strvec& new_names) {
+  sztvec new_positions(ncols_);
+  for (size_t i = 0; i < ncols_; ++i) {
+    new_positions[i] = (i < new_names.size())? i : size_t(-1);
+  }
+  _remap_group_cache(new_positions);
   ncols_ = new_names.size();
   columns_.resize(ncols_);
   set_names(new_names);
@@ -235,6 +270,7 @@ void DataTable::apply_rowindex(const RowIndex& rowindex) {
   // If RowIndex is empty, no need to do anything. Also, the expression
   // `rowindex.size()` cannot be computed.
   if (!rowindex) return;
+  _clear_group_cache();
   for (Column& col : columns_) {
     col.apply_rowindex(rowindex);
   }
@@ -9,8 +9,10 @@
 #define dt_DATATABLE_h
 #include <memory>         // std::unique_ptr
 #include <string>         // std::string
+#include <utility>        // std::pair
 #include <vector>         // std::vector
 #include "python/_all.h"
+#include "group_cache.h"
 #include "groupby.h"
 #include "rowindex.h"
 #include "types.h"
@@ -43,6 +45,12 @@ class NameProvider;
   * columns_
   *     The array of columns within the datatable. This array contains `ncols_`
   *     elements, and each column has the same number of rows: `nrows_`.
+  *
+  * group_cache_
+  *     Cache of the groupings / sort orders computed for the columns of this
+  *     DataTable (see "group_cache.h"), which also holds the column indexes.
+  *     This object is created on demand. When the DataTable is copied, only
+  *     the indexes are copied, but not the cached groupings.
   */
 class DataTable {
   private:
@@ -53,6 +61,7 @@ class DataTable {
     strvec  names_;
     mutable py::otuple py_names_;   // memoized tuple of column names
     mutable py::odict  py_inames_;  // memoized dict of {column name: index}
+    mutable std::unique_ptr<dt::GroupCache> group_cache_;
 
   public:
     static struct DefaultNamesTag {} default_names;
@@ -86,6 +95,7 @@ class DataTable {
     const Column& get_column(size_t i) const;
     Column& get_column(size_t i);
     void set_column(size_t i, Column&& newcol);
+    dt::GroupCache* get_group_cache() const;
 
     // Names
     const strvec& get_names() const;
@@ -100,6 +110,14 @@ class DataTable {
     void replace_names(py::odict replacements, bool warn = true);
     void reorder_names(const sztvec& col_indices);
 
+    // Indexes
+    void create_index(size_t i);
+    void drop_index(size_t i);
+    bool has_index(size_t i) const;
+    bool has_indexes() const;
+    sztvec get_indexed_columns() const;
+    const RiGb& get_index(size_t i) const;
+
     // Key
     void set_key(sztvec& col_indices);
     void clear_key();
@@ -107,18 +125,24 @@ class DataTable {
 
     void verify_integrity() const;
 
-    Buffer save_jay();
-    void save_jay(const std::string& path, WritableBuffer::Strategy);
+    Buffer save_jay(bool compress = false, size_t rowgroup_size = 0);
+    void save_jay(const std::string& path, WritableBuffer::Strategy,
+                  bool compress = false, size_t rowgroup_size = 0);
+    void append_jay(const std::string& path, WritableBuffer::Strategy,
+                    bool compress = false, size_t rowgroup_size = 0);
 
   private:
     DataTable(colvec&& cols);
 
     void _init_pynames() const;
+    void _invalidate_group_cache(size_t i);
+    void _clear_group_cache();
+    void _remap_group_cache(const sztvec& new_positions);
     void _set_names_impl(NameProvider*, bool warn);
     void _integrity_check_names() const;
     void _integrity_check_pynames() const;
 
-    void save_jay_impl(WritableBuffer*);
+    void save_jay_impl(WritableBuffer*, bool compress, size_t rowgroup_size);
 
     #ifdef DTTEST
       friend void dttest::cover_names_integrity_checks();
@@ -130,8 +154,20 @@ class DataTable {
 DataTable* open_jay_from_file(const std::string& path);
 DataTable* open_jay_from_bytes(const char* ptr, size_t len);
 DataTable* open_jay_from_mbuf(const Buffer&);
+const jay::Frame* open_jay_meta(const Buffer&, size_t* meta_start);
+void jay_init_options();
+
+// Join modes supported by the `join()` clause
+enum class JoinType : uint8_t {
+  LEFT  = 0,
+  INNER = 1,
+  OUTER = 2,
+};
 
 RowIndex natural_join(const DataTable& xdt, const DataTable& jdt);
+std::pair<RowIndex, RowIndex> join_rowindices(
+    const DataTable& xdt, const RowIndex& xri, const sztvec& xcols,
+    const DataTable& jdt, const sztvec& jcols, JoinType how);
 
 
 #endif
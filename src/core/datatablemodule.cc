@@ -38,6 +38,7 @@
 #include "expr/py_update.h"          // py::oupdate
 #include "frame/py_frame.h"
 #include "frame/repr/html_widget.h"
+#include "group_cache.h"
 #include "ltype.h"
 #include "models/aggregator.h"
 #include "models/py_ftrl.h"
@@ -153,6 +154,21 @@ static py::oobj in_debug_mode(const py::PKArgs&) {
 
 
 
+static py::PKArgs args_group_cache_stats(
+    0, 0, 0, false, false, {}, "group_cache_stats",
+R"(Return a tuple (hits, misses, size) describing the usage of the
+cache of groupings: the number of lookups that found a cached entry,
+the number of lookups that did not, and the total size in bytes of
+all entries currently held in the cache.)");
+
+static py::oobj group_cache_stats(const py::PKArgs&) {
+  return py::otuple({py::oint(dt::GroupCache::nhits()),
+                     py::oint(dt::GroupCache::nmisses()),
+                     py::oint(dt::GroupCache::total_size())});
+}
+
+
+
 static py::PKArgs args_get_thread_ids(
     0, 0, 0, false, false, {}, "get_thread_ids",
 R"(Return system ids of all threads used internally by datatable)");
@@ -295,8 +311,12 @@ static void initialize_options(const py::PKArgs& args) {
   dt::progress::init_options();
   py::Frame::init_names_options();
   py::Frame::init_display_options();
+  py::Frame::init_tocsv_options();
   dt::read::GenericReader::init_options();
   sort_init_options();
+  groupby_init_options();
+  dt::group_cache_init_options();
+  jay_init_options();
   dt::CallLogger::init_options();
 }
 
@@ -314,6 +334,7 @@ void py::DatatableModule::init_methods() {
   ADD_FN(&frame_column_data_r, args_frame_column_data_r);
   ADD_FN(&frame_integrity_check, args_frame_integrity_check);
   ADD_FN(&get_thread_ids, args_get_thread_ids);
+  ADD_FN(&group_cache_stats, args_group_cache_stats);
   ADD_FN(&initialize_options, args_initialize_options);
   ADD_FN(&compiler_version, args_compiler_version);
   ADD_FN(&regex_supported, args_regex_supported);
@@ -39,6 +39,9 @@ namespace expr {
   using ptrHead = std::unique_ptr<Head>;
   using vecExpr = std::vector<Expr>;
 
+  // List of half-open row ranges `[first, second)`
+  using RowRanges = std::vector<std::pair<size_t, size_t>>;
+
 
   // Evaluation mode, this distinguishes between expressions of the
   // form
@@ -19,6 +19,7 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include "column/ifelse.h"
 #include "expr/expr.h"
 #include "expr/eval_context.h"
 #include "expr/py_by.h"
@@ -27,7 +28,10 @@
 #include "expr/py_update.h"
 #include "expr/workframe.h"
 #include "frame/py_frame.h"
+#include "python/string.h"
+#include "group_cache.h"
 #include "ltype.h"
+#include "parallel/api.h"
 #include "sort.h"
 #include "stype.h"
 namespace dt {
@@ -49,9 +53,32 @@ EvalContext::EvalContext(DataTable* dt, EvalMode evalmode)
 
 
 
+// A join is "natural" if it is a left join on the key columns of the
+// join frame. Such joins do not change the rows of the root frame, and
+// are computed via `natural_join()`. All other joins are computed with
+// `join_rowindices()`, which may both remove and duplicate the rows of
+// the root frame.
+//
 void EvalContext::add_join(py::ojoin oj) {
   DataTable* dt = oj.get_datatable();
-  frames_.emplace_back(dt, RowIndex(), /* natural_join= */ true);
+  JoinType how = oj.get_join_type();
+  strvec on = oj.get_on_names();
+  sztvec join_cols;
+  if (on.empty()) {
+    for (size_t i = 0; i < dt->nkeys(); ++i) join_cols.push_back(i);
+  } else {
+    for (const auto& name : on) {
+      join_cols.push_back(dt->xcolindex(py::ostring(name)));
+    }
+  }
+  bool natural = (how == JoinType::LEFT) && dt->nkeys() &&
+                 (join_cols.size() == dt->nkeys());
+  for (size_t i = 0; i < join_cols.size() && natural; ++i) {
+    natural = (join_cols[i] == i);
+  }
+  frames_.emplace_back(dt, RowIndex(), natural);
+  frames_.back().join_cols_ = std::move(join_cols);
+  frames_.back().how_ = how;
 }
 
 
@@ -140,26 +167,34 @@ const RowIndex& EvalContext::get_group_rowindex() {
 //------------------------------------------------------------------------------
 
 py::oobj EvalContext::evaluate() {
-  // Compute joins
-  DataTable* xdt = get_datatable(0);
-  for (size_t i = 1; i < nframes(); ++i) {
-    DataTable* jdt = get_datatable(i);
-    frames_[i].ri_ = natural_join(*xdt, *jdt);
+  compute_joins();
+  if (!(byexpr_ || sortexpr_)) {
+    compute_groupby_and_sort();
+    RowIndex rowindex = iexpr_.evaluate_i(*this);
+    apply_rowindex(std::move(rowindex));
+    replace_groupby(Groupby::single_group(nrows()));
   }
-
-  compute_groupby_and_sort();
-  xassert(groupby_);
-
-  // Compute i filter
-  if (byexpr_ || sortexpr_) {
+  else if (can_filter_before_groupby()) {
+    // The filter selects rows independently of the groups, so we
+    // apply it first, and then group only the rows that remain.
+    groupby_ = Groupby::single_group(nrows());
+    RowIndex rowindex = iexpr_.evaluate_i(*this);
+    apply_rowindex(std::move(rowindex));
+    groupby_ = Groupby();
+    compute_groupby_and_sort();
+  }
+  else {
+    // The filter such as `DT[0, :, by(...)]` selects rows within each
+    // group, so it can only be computed after the groupby.
+    compute_groupby_and_sort();
     auto rigb = iexpr_.evaluate_iby(*this);
     apply_rowindex(std::move(rigb.first));
     replace_groupby(std::move(rigb.second));
-  } else {
-    RowIndex rowindex = iexpr_.evaluate_i(*this);
-    apply_rowindex(std::move(rowindex));
-    replace_groupby(Groupby::single_group(nrows()));
   }
+  xassert(groupby_);
+
+  jexpr_.count_subexprs(subexpr_counts_);
+  rexpr_.count_subexprs(subexpr_counts_);
 
   switch (eval_mode_) {
     case EvalMode::SELECT: return evaluate_select();
@@ -233,6 +268,51 @@ void EvalContext::create_placeholder_columns() {
 // single group that encompasses the entire frame. Note that this
 // single group might be empty if the frame has 0 rows.
 //
+void EvalContext::compute_joins() {
+  DataTable* xdt = get_datatable(0);
+  for (size_t i = 1; i < nframes(); ++i) {
+    DataTable* jdt = get_datatable(i);
+    if (frames_[i].natural_) {
+      frames_[i].ri_ = get_rowindex(0) * natural_join(*xdt, *jdt);
+      continue;
+    }
+    if (eval_mode_ != EvalMode::SELECT) {
+      throw ValueError() << "Only a left join on the key columns of the "
+          "join frame can be used when updating or deleting values";
+    }
+    const sztvec& jcols = frames_[i].join_cols_;
+    sztvec xcols;
+    for (size_t j : jcols) {
+      const std::string& name = jdt->get_names()[j];
+      int64_t index = xdt->colindex(py::ostring(name));
+      if (index == -1) {
+        throw ValueError() << "Join column `" << name << "` does not exist "
+            "in the left Frame";
+      }
+      xcols.push_back(static_cast<size_t>(index));
+    }
+    auto rr = join_rowindices(*xdt, get_rowindex(0), xcols,
+                              *jdt, jcols, frames_[i].how_);
+    frames_[i].xcols_ = std::move(xcols);
+    for (size_t k = 0; k < i; ++k) {
+      frames_[k].ri_ = rr.first * frames_[k].ri_;
+    }
+    frames_[i].ri_ = std::move(rr.second);
+  }
+}
+
+
+// The i filter can be evaluated before the groupby if it is a boolean
+// expression (or a Frame), whose value in each row does not depend on
+// the other rows of the same group.
+//
+bool EvalContext::can_filter_before_groupby() const {
+  Kind ikind = iexpr_.get_expr_kind();
+  return (ikind == Kind::Func && !iexpr_.is_groupwise()) ||
+         (ikind == Kind::Frame);
+}
+
+
 void EvalContext::compute_groupby_and_sort() {
   size_t nr = nrows();
   if (byexpr_ || sortexpr_) {
@@ -257,10 +337,32 @@ void EvalContext::compute_groupby_and_sort() {
           flags[i] = flags[i] | SortFlag::SORT_ONLY;
         }
       }
+      // If all key columns are columns of the source frame, the
+      // grouping can be taken from (or saved into) the frame's cache.
+      dt::GroupCache* cache = nullptr;
+      dt::GroupCache::Key cache_key;
+      if (!get_rowindex(0)) {
+        sztvec col_ids(ncols);
+        bool cacheable = true;
+        for (size_t i = 0; i < ncols && cacheable; ++i) {
+          size_t frame_id;
+          cacheable = wf.is_reference_column(i, &frame_id, &col_ids[i]) &&
+                      frame_id == 0;
+        }
+        if (cacheable) {
+          cache = get_datatable(0)->get_group_cache();
+          cache_key = dt::GroupCache::make_key(bool(byexpr_), col_ids, flags);
+        }
+      }
       wf.truncate_columns(n_group_cols);
       set_groupby_columns(std::move(wf));
 
-      auto rigb = group(cols, flags);
+      RiGb rigb;
+      if (!(cache && cache->lookup(cache_key, &rigb))) {
+        rigb = byexpr_? group_by_keys(cols, flags)
+                      : group(cols, flags);
+        if (cache) cache->store(cache_key, rigb);
+      }
       apply_rowindex(std::move(rigb.first));
       groupby_ = std::move(rigb.second);
     }
@@ -455,7 +557,7 @@ void EvalContext::typecheck_for_update(
 //------------------------------------------------------------------------------
 
 void EvalContext::update_groupby_columns(Grouping gmode) {
-  auto ri0 = get_rowindex(0);
+  auto ri0 = groupby_columns_ri_;
   if (gmode == Grouping::GtoONE) {
     ri0 = get_group_rowindex() * ri0;
   }
@@ -541,10 +643,55 @@ const Groupby& EvalContext::get_groupby() {
 }
 
 
-bool EvalContext::is_naturally_joined(size_t i) const {
-  return frames_[i].natural_;
+bool EvalContext::is_join_column(size_t frame_index, size_t col_index) const
+{
+  if (frame_index == 0) return false;
+  for (size_t j : frames_[frame_index].join_cols_) {
+    if (j == col_index) return true;
+  }
+  return false;
+}
+
+/**
+  * In an outer join the rows that exist only in a joined frame have
+  * NA values in all columns of frame 0, including the key columns.
+  * For such key column `col_index` of frame 0, this method returns
+  * the column where those NAs are replaced with the key values from
+  * the joined frame. If the column is not a key of any outer join,
+  * an empty Column is returned.
+  */
+Column EvalContext::get_join_key_column(size_t col_index) const {
+  const RowIndex& xri = frames_[0].ri_;
+  if (!xri) return Column();
+  for (size_t i = 1; i < frames_.size(); ++i) {
+    const subframe& sf = frames_[i];
+    if (sf.natural_ || sf.how_ != JoinType::OUTER) continue;
+    for (size_t k = 0; k < sf.xcols_.size(); ++k) {
+      if (sf.xcols_[k] != col_index) continue;
+      Column xcol = frames_[0].dt_->get_column(col_index);
+      Column jcol = sf.dt_->get_column(sf.join_cols_[k]);
+      xcol.apply_rowindex(xri);
+      jcol.apply_rowindex(sf.ri_);
+      SType out_stype = common_stype(xcol.stype(), jcol.stype());
+      xcol.cast_inplace(out_stype);
+      jcol.cast_inplace(out_stype);
+
+      size_t n = xri.size();
+      Column cond = Column::new_data_column(n, SType::BOOL);
+      auto cond_data = static_cast<int8_t*>(cond.get_data_editable());
+      dt::parallel_for_static(n,
+        [&](size_t j) {
+          size_t irow;
+          cond_data[j] = xri.get_element(j, &irow);
+        });
+      return Column(new IfElse_ColumnImpl(
+                        std::move(cond), std::move(xcol), std::move(jcol)));
+    }
+  }
+  return Column();
 }
 
+
 bool EvalContext::has_groupby() const {
   return bool(byexpr_);
 }
@@ -579,6 +726,7 @@ void EvalContext::apply_rowindex(const RowIndex& ri) {
   for (size_t i = 0; i < nframes(); ++i) {
     frames_[i].ri_ = ri * get_rowindex(i);
   }
+  groupby_columns_ri_ = ri * groupby_columns_ri_;
 }
 
 
@@ -590,8 +738,49 @@ void EvalContext::replace_groupby(Groupby&& gb) {
 }
 
 
+// A subexpression is "common" if it occurs more than once in the
+// `j` / replacement nodes.
+//
+bool EvalContext::is_common_subexpr(const std::string& signature) const {
+  auto it = subexpr_counts_.find(signature);
+  return it != subexpr_counts_.end() && it->second > 1;
+}
+
+
+const Workframe* EvalContext::find_common_subexpr(
+    const std::string& signature) const
+{
+  auto it = subexpr_cache_.find(signature);
+  return it == subexpr_cache_.end()? nullptr : &it->second;
+}
+
+
+// Save the result `wf` of evaluating a common subexpression, so that
+// it can be reused by its other occurrences. The columns of `wf` are
+// materialized, so that the virtual columns are computed only once,
+// instead of once per each occurrence of the subexpression. Only
+// the Workframes that contain computed columns can be saved: the
+// reference columns must retain their "address" within the frame.
+//
+void EvalContext::add_common_subexpr(
+    const std::string& signature, Workframe& wf)
+{
+  size_t n = wf.ncols();
+  for (size_t i = 0; i < n; ++i) {
+    if (!wf.is_computed_column(i)) return;
+  }
+  for (size_t i = 0; i < n; ++i) {
+    Column col = wf.retrieve_column(i);
+    col.materialize();
+    wf.replace_column(i, std::move(col));
+  }
+  subexpr_cache_.emplace(signature, wf.clone());
+}
+
+
 void EvalContext::set_groupby_columns(Workframe&& wf) {
   groupby_columns_.cbind(std::move(wf));
+  groupby_columns_ri_ = RowIndex();
 }
 
 
@@ -21,6 +21,8 @@
 //------------------------------------------------------------------------------
 #ifndef dt_EXPR_EVAL_CONTEXT_h
 #define dt_EXPR_EVAL_CONTEXT_h
+#include <string>            // std::string
+#include <unordered_map>     // std::unordered_map
 #include <vector>            // std::vector
 #include "expr/declarations.h"
 #include "expr/expr.h"
@@ -74,10 +76,24 @@ namespace expr {
   *   column is "group" column, and (2) in order to add the group
   *   columns at the beginning of the result frame.
   *
+  * groupby_columns_ri_
+  *   The RowIndex that must be applied to `groupby_columns_` in order
+  *   to bring them in sync with the current rows of the frame. This
+  *   accumulates all rowindices applied after the groupby columns were
+  *   computed.
+  *
   * newnames_
   *   When a frame is updated, this vector will temporarily hold the
   *   names of the columns being created.
   *
+  * subexpr_counts_, subexpr_cache_
+  *   The number of occurrences of each shareable subexpression in
+  *   the `j` and replacement nodes (keyed by the subexpression's
+  *   signature), and the results of those subexpressions that occur
+  *   more than once. These are filled only after the filter and the
+  *   groupby were applied, so that the cached results remain valid
+  *   until the end of the evaluation.
+  *
   * eval_mode_
   *   Three conceptual operations are supported: SELECT, UPDATE and
   *   DELETE.
@@ -92,11 +108,14 @@ class EvalContext
   struct subframe {
     DataTable* dt_;
     RowIndex   ri_;
+    sztvec     join_cols_;  // columns on which this frame was joined
+    sztvec     xcols_;      // matching columns in the frame 0
+    JoinType   how_;
     bool       natural_;  // was this frame joined naturally?
-    size_t : 56;
+    size_t : 48;
 
     subframe(DataTable* dt, const RowIndex& ri, bool n)
-      : dt_(dt), ri_(ri), natural_(n) {}
+      : dt_(dt), ri_(ri), how_(JoinType::LEFT), natural_(n) {}
   };
   using frameVec = std::vector<subframe>;
 
@@ -114,7 +133,10 @@ class EvalContext
     RowIndex   ungroup_rowindex_;
     RowIndex   group_rowindex_;
     Workframe  groupby_columns_;
+    RowIndex   groupby_columns_ri_;
     strvec     newnames_;
+    std::unordered_map<std::string, size_t>     subexpr_counts_;
+    std::unordered_map<std::string, Workframe>  subexpr_cache_;
     EvalMode   eval_mode_;
     bool       add_groupby_columns_;
     size_t : 48;
@@ -140,7 +162,8 @@ class EvalContext
     const Groupby& get_groupby();
     const RowIndex& get_ungroup_rowindex();
     const RowIndex& get_group_rowindex();
-    bool is_naturally_joined(size_t i) const;
+    bool is_join_column(size_t frame_index, size_t column_index) const;
+    Column get_join_key_column(size_t column_index) const;
     bool has_groupby() const;
     bool has_group_column(size_t frame_index, size_t column_index) const;
     size_t nframes() const;
@@ -150,8 +173,14 @@ class EvalContext
     void replace_groupby(Groupby&& gb_);
     void set_groupby_columns(Workframe&&);
 
+    bool is_common_subexpr(const std::string& signature) const;
+    const Workframe* find_common_subexpr(const std::string& signature) const;
+    void add_common_subexpr(const std::string& signature, Workframe& wf);
+
   private:
+    void compute_joins();
     void compute_groupby_and_sort();
+    bool can_filter_before_groupby() const;
 
     py::oobj evaluate_delete();
     py::oobj evaluate_select();
@@ -27,6 +27,7 @@
 #include "expr/head_literal.h"
 #include "expr/workframe.h"
 #include "expr/eval_context.h"
+#include "python/string.h"
 #include "datatable.h"
 #include "datatablemodule.h"
 namespace dt {
@@ -62,6 +63,20 @@ Expr::Expr(py::robj src) {
     throw TypeError() << "An object of type " << src.typeobj()
                       << " cannot be used in an Expr";
   }
+  if (_is_simple_literal(src)) {
+    signature = src.repr().to_string();
+  }
+}
+
+
+// A "simple" literal is a python object whose repr() fully describes
+// its value, so that it can be used as the object's signature.
+//
+bool Expr::_is_simple_literal(py::robj src) {
+  return src.is_none() || src.is_bool() || src.is_int() ||
+         src.is_float() || src.is_string() || src.is_slice() ||
+         src.is_range() || src.is_ellipsis() || src.is_anytype() ||
+         src.is_stype();
 }
 
 
@@ -93,6 +108,19 @@ void Expr::_init_from_dtexpr(py::robj src) {
     inputs.emplace_back(args[i]);
   }
   head = Head_Func::from_op(static_cast<Op>(op), params);
+
+  // The signature has the form `#op(param,...|arg,...)`
+  std::string sig = "#" + std::to_string(op) + "(";
+  for (size_t i = 0; i < params.size(); ++i) {
+    if (!_is_simple_literal(params[i])) return;
+    if (i) sig += ',';
+    sig += params[i].repr().to_string();
+  }
+  sig += '|';
+  if (!_append_input_signatures(sig)) return;
+  sig += ')';
+  signature = std::move(sig);
+  shareable = (static_cast<Op>(op) != Op::COL);
 }
 
 
@@ -142,6 +170,25 @@ void Expr::_init_from_list(py::robj src) {
     inputs.emplace_back(srclist[i]);
   }
   head = ptrHead(new Head_List);
+
+  std::string sig = "[";
+  if (!_append_input_signatures(sig)) return;
+  sig += ']';
+  signature = std::move(sig);
+}
+
+
+// Append signatures of all `inputs` to `sig`, separated by commas.
+// Returns false if any of the inputs has no signature.
+//
+bool Expr::_append_input_signatures(std::string& sig) const {
+  for (size_t i = 0; i < inputs.size(); ++i) {
+    const std::string& isig = inputs[i].signature;
+    if (isig.empty()) return false;
+    if (i) sig += ',';
+    sig += isig;
+  }
+  return true;
 }
 
 
@@ -209,17 +256,35 @@ Expr::operator bool() const noexcept {
 
 
 Workframe Expr::evaluate_n(EvalContext& ctx, bool allow_new) const {
+  if (shareable && ctx.is_common_subexpr(signature)) {
+    const Workframe* cached = ctx.find_common_subexpr(signature);
+    if (cached) return cached->clone();
+    Workframe res = head->evaluate_n(inputs, ctx, allow_new);
+    ctx.add_common_subexpr(signature, res);
+    return res;
+  }
   return head->evaluate_n(inputs, ctx, allow_new);
 }
 
 
+// For function expressions (which are the only shareable ones),
+// evaluation in "j" and "r" modes is the same as in the natural
+// mode. Thus, a common subexpression is routed through
+// `evaluate_n()`, where its result is cached.
+//
 Workframe Expr::evaluate_j(EvalContext& ctx, bool allow_new) const
 {
+  if (shareable && ctx.is_common_subexpr(signature)) {
+    return evaluate_n(ctx, allow_new);
+  }
   return head->evaluate_j(inputs, ctx, allow_new);
 }
 
 Workframe Expr::evaluate_r(EvalContext& ctx, const sztvec& indices) const
 {
+  if (shareable && ctx.is_common_subexpr(signature)) {
+    return evaluate_n(ctx, false);
+  }
   return head->evaluate_r(inputs, ctx, indices);
 }
 
@@ -243,6 +308,36 @@ void Expr::prepare_by(EvalContext& ctx, Workframe& wf,
 }
 
 
+void Expr::exclude_rows(EvalContext& ctx, RowRanges& out) const {
+  head->exclude_rows(inputs, ctx, out);
+}
+
+
+bool Expr::select_by_index(EvalContext& ctx, size_t* icol,
+                           RowRanges& out) const
+{
+  return head->select_by_index(inputs, ctx, icol, out);
+}
+
+
+bool Expr::is_groupwise() const {
+  return head->is_groupwise(inputs);
+}
+
+
+void Expr::count_subexprs(std::unordered_map<std::string, size_t>& counts)
+    const
+{
+  if (shareable) {
+    size_t n = ++counts[signature];
+    if (n > 1) return;
+  }
+  for (const Expr& arg : inputs) {
+    arg.count_subexprs(counts);
+  }
+}
+
+
 RiGb Expr::evaluate_iby(EvalContext& ctx) const {
   return head->evaluate_iby(inputs, ctx);
 }
@@ -23,6 +23,7 @@
 #define dt_EXPR_EXPR_h
 #include <memory>
 #include <string>
+#include <unordered_map>
 #include <vector>
 #include "expr/head.h"
 #include "expr/op.h"
@@ -74,18 +75,34 @@ namespace expr {
   *
   * evaluate_i()
   *   The expression is used as the root i node: `DT[<Expr>, :]`.
-  *   This function will only be called if there is no `by` node.
+  *   This function will only be called if there is no `by` node,
+  *   or if the expression can be applied before the groupby (see
+  *   `is_groupwise()`).
   *
   * evaluate_bool()
   *   This is not a "proper" evaluation mode: it is only applied to
   *   boolean expressions (i.e. an expression with `get_expr_kind()`
   *   equal to `Bool`).
   *
+  *
+  * Each Expr also carries a `signature`: a string that describes
+  * the structure of the expression tree, such that two Exprs with
+  * the same signature are guaranteed to produce the same result when
+  * evaluated within the same context. The signature is empty if the
+  * Expr contains objects (such as Frames) that cannot be compared
+  * this way. Signatures are used to detect common subexpressions in
+  * the `j` node: a function expression that occurs there more than
+  * once is evaluated only once, and its result is then shared (see
+  * `EvalContext::find_common_subexpr()`).
+  *
   */
 class Expr {
   private:
-    ptrHead  head;
-    vecExpr  inputs;
+    ptrHead      head;
+    vecExpr      inputs;
+    std::string  signature;
+    bool         shareable = false;  // can be a common subexpression?
+    size_t : 56;
 
   public:
     explicit Expr(py::robj src);
@@ -112,6 +129,23 @@ class Expr {
     //
     void prepare_by(EvalContext&, Workframe&, std::vector<SortFlag>&) const;
 
+    // See `Head::exclude_rows()`
+    void exclude_rows(EvalContext&, RowRanges&) const;
+
+    // See `Head::select_by_index()`
+    bool select_by_index(EvalContext&, size_t* icol, RowRanges&) const;
+
+    // See `Head::is_groupwise()`
+    bool is_groupwise() const;
+
+    // Count the occurrences of all shareable subexpressions within
+    // this Expr, adding them into the `counts` map (keyed by their
+    // signatures). The subexpressions of an Expr that was already
+    // seen before are not counted again, since they will not be
+    // evaluated a second time.
+    //
+    void count_subexprs(std::unordered_map<std::string, size_t>& counts) const;
+
     bool evaluate_bool() const;
     bool is_negated_column(EvalContext&, size_t* iframe, size_t* icol) const;
     int64_t evaluate_int() const;
@@ -134,6 +168,9 @@ class Expr {
     void _init_from_slice(py::robj);
     void _init_from_string(py::robj);
     void _init_from_type(py::robj);
+
+    static bool _is_simple_literal(py::robj);
+    bool _append_input_signatures(std::string&) const;
 };
 
 
@@ -19,6 +19,7 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include "expr/expr.h"
 #include "expr/head.h"
 #include "expr/workframe.h"
 #include "groupby.h"
@@ -41,6 +42,24 @@ void Head::prepare_by(const vecExpr&, EvalContext&, Workframe&,
 }                                                                 // LCOV_EXCL_LINE
 
 
+void Head::exclude_rows(const vecExpr&, EvalContext&, RowRanges&) const {}
+
+
+bool Head::select_by_index(const vecExpr&, EvalContext&, size_t*,
+                           RowRanges&) const
+{
+  return false;
+}
+
+
+bool Head::is_groupwise(const vecExpr& args) const {
+  for (const Expr& arg : args) {
+    if (arg.is_groupwise()) return true;
+  }
+  return false;
+}
+
+
 
 
 
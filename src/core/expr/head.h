@@ -71,6 +71,15 @@ namespace expr {
   *
   * - evaluate_iby()
   *
+  * - exclude_rows() is an optional method that may help evaluate_i()
+  *     to skip the parts of the frame that cannot match the filter.
+  *
+  * - select_by_index() is an optional method that allows evaluate_i()
+  *     to find the matching rows via an index on a column.
+  *
+  * - is_groupwise() tells whether the value of the expression in each
+  *     row depends on the other rows of the same group.
+  *
   *
   * The hierarchy of Head subclasses is the following:
   *
@@ -134,6 +143,34 @@ class Head {
     virtual RiGb evaluate_iby(const vecExpr& args,
                               EvalContext& ctx) const = 0;
 
+    // When the expression is used as an i-filter, find the ranges of
+    // rows which are known not to satisfy the filter, judging only by
+    // the stats of the columns' chunks (such as the row groups of a
+    // Jay file), and append them to `out`. The ranges appended may
+    // overlap. The default implementation does nothing.
+    //
+    virtual void exclude_rows(const vecExpr& args, EvalContext& ctx,
+                              RowRanges& out) const;
+
+    // When the expression is used as an i-filter, try to find the rows
+    // that satisfy the filter using an index on column `icol` of the
+    // frame (see `DataTable::create_index()`). On success, `out` will
+    // contain the sorted non-overlapping ranges of positions within
+    // the index's sort order, and the method returns true. If the
+    // index cannot be used, the method returns false. The default
+    // implementation always returns false.
+    //
+    virtual bool select_by_index(const vecExpr& args, EvalContext& ctx,
+                                 size_t* icol, RowRanges& out) const;
+
+    // Return true if the value of the expression in each row depends
+    // on the other rows within the same group, as is the case for the
+    // reducers or `shift()`. An i-filter which is not groupwise can be
+    // applied before the groupby is computed. The default
+    // implementation returns true if any of the `args` is groupwise.
+    //
+    virtual bool is_groupwise(const vecExpr& args) const;
+
     virtual Kind get_expr_kind() const = 0;
 };
 
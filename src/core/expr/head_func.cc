@@ -19,12 +19,15 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>           // std::sort
+#include <cstring>             // std::memcpy
 #include "expr/eval_context.h"
 #include "expr/expr.h"
 #include "expr/head_func.h"
 #include "expr/head_func_other.h"
 #include "expr/head_reduce.h"
 #include "expr/workframe.h"
+#include "parallel/api.h"
 #include "utils/assert.h"
 #include "utils/exceptions.h"
 #include "stype.h"
@@ -76,7 +79,138 @@ Workframe Head_Func::evaluate_r(
 
 
 
+// Create a RowIndex from the boolean column `col`, examining only the
+// rows within the `included` ranges (sorted and non-overlapping). The
+// ranges are split into pieces that are scanned in parallel.
+//
+template <typename T>
+static RowIndex _rowindex_from_ranges(const Column& col,
+                                      const RowRanges& included, int flags)
+{
+  constexpr size_t CHUNK_SIZE = 1 << 16;
+  RowRanges pieces;
+  for (const auto& range : included) {
+    for (size_t i = range.first; i < range.second; i += CHUNK_SIZE) {
+      pieces.emplace_back(i, std::min(i + CHUNK_SIZE, range.second));
+    }
+  }
+  std::vector<std::vector<T>> indices(pieces.size());
+  dt::parallel_for_dynamic(pieces.size(),
+    dt::NThreads(col.allow_parallel_access()),
+    [&](size_t k) {
+      int8_t values[Column::BATCH_SIZE];
+      bool valid[Column::BATCH_SIZE];
+      auto& out = indices[k];
+      size_t end = pieces[k].second;
+      for (size_t i0 = pieces[k].first; i0 < end; i0 += Column::BATCH_SIZE) {
+        size_t n = std::min(Column::BATCH_SIZE, end - i0);
+        col.get_elements(i0, n, values, valid);
+        for (size_t j = 0; j < n; ++j) {
+          if (valid[j] && values[j]) out.push_back(static_cast<T>(i0 + j));
+        }
+      }
+    });
+
+  size_t total = 0;
+  for (const auto& piece : indices) total += piece.size();
+  Buffer buf = Buffer::mem(total * sizeof(T));
+  auto dest = static_cast<T*>(buf.xptr());
+  for (const auto& piece : indices) {
+    if (piece.empty()) continue;
+    std::memcpy(dest, piece.data(), piece.size() * sizeof(T));
+    dest += piece.size();
+  }
+  return RowIndex(std::move(buf), flags | RowIndex::SORTED);
+}
+
+
+// Create a RowIndex from the boolean column `col`, knowing that none
+// of the rows in the `excluded` ranges are true.
+//
+static RowIndex rowindex_excluding(const Column& col, RowRanges& excluded) {
+  std::sort(excluded.begin(), excluded.end());
+  RowRanges included;
+  size_t nrows = col.nrows();
+  size_t pos = 0;
+  for (const auto& range : excluded) {
+    if (range.first > pos) included.emplace_back(pos, range.first);
+    pos = std::max(pos, range.second);
+  }
+  if (pos < nrows) included.emplace_back(pos, nrows);
+
+  if (nrows <= Column::MAX_ARR32_SIZE) {
+    return _rowindex_from_ranges<int32_t>(col, included, RowIndex::ARR32);
+  } else {
+    return _rowindex_from_ranges<int64_t>(col, included, RowIndex::ARR64);
+  }
+}
+
+
+// Create a RowIndex from the ranges of `positions` within the sort
+// order of an index (see `DataTable::create_index()`). The selected
+// rows are returned in their original order.
+//
+template <typename T>
+static RowIndex _rowindex_from_index(const RowIndex& order,
+                                     const RowRanges& positions,
+                                     size_t nselected, int flags)
+{
+  Buffer buf = Buffer::mem(nselected * sizeof(T));
+  T* data = static_cast<T*>(buf.xptr());
+  T* dest = data;
+  const int32_t* indices32 = order.indices32();
+  const int64_t* indices64 = order.indices64();
+  for (const auto& range : positions) {
+    for (size_t i = range.first; i < range.second; ++i) {
+      size_t j;
+      if (indices32) j = static_cast<size_t>(indices32[i]);
+      else if (indices64) j = static_cast<size_t>(indices64[i]);
+      else order.get_element(i, &j);
+      *dest++ = static_cast<T>(j);
+    }
+  }
+  std::sort(data, dest);
+  return RowIndex(std::move(buf), flags | RowIndex::SORTED);
+}
+
+
+static bool _has_chunked_columns(const DataTable* dt) {
+  for (size_t i = 0; i < dt->ncols(); ++i) {
+    if (dt->get_column(i).n_chunks()) return true;
+  }
+  return false;
+}
+
+
 RowIndex Head_Func::evaluate_i(const vecExpr& args, EvalContext& ctx) const {
+  size_t icol;
+  RowRanges positions;
+  if (select_by_index(args, ctx, &icol, positions)) {
+    size_t nrows = ctx.nrows();
+    size_t nselected = 0;
+    for (const auto& range : positions) {
+      nselected += range.second - range.first;
+    }
+    // When a large portion of the frame is selected, the parallel
+    // scan below is faster than gathering the rows from the index.
+    if (nselected <= nrows / 16) {
+      const RowIndex& order = ctx.get_datatable(0)->get_index(icol).first;
+      if (nrows <= Column::MAX_ARR32_SIZE) {
+        return _rowindex_from_index<int32_t>(order, positions, nselected,
+                                             RowIndex::ARR32);
+      } else {
+        return _rowindex_from_index<int64_t>(order, positions, nselected,
+                                             RowIndex::ARR64);
+      }
+    }
+  }
+  // Row groups can only be skipped in chunked (i.e. rbound) columns,
+  // so that for regular frames the filter's operands are not evaluated
+  // an extra time.
+  RowRanges excluded;
+  if (_has_chunked_columns(ctx.get_datatable(0))) {
+    exclude_rows(args, ctx, excluded);
+  }
   Workframe wf = evaluate_n(args, ctx, false);
   if (wf.ncols() != 1) {
     throw TypeError() << "i-expression evaluated into " << wf.ncols()
@@ -87,6 +221,9 @@ RowIndex Head_Func::evaluate_i(const vecExpr& args, EvalContext& ctx) const {
     throw TypeError() << "Filter expression must be boolean, instead it "
         "was of type " << col.stype();
   }
+  if (!excluded.empty()) {
+    return rowindex_excluding(col, excluded);
+  }
   return RowIndex(std::move(col));
 }
 
@@ -181,6 +318,8 @@ void Head_Func::init() {
   factory[static_cast<size_t>(Op::COUNT0)]     = make_reduce0;
   factory[static_cast<size_t>(Op::COV)]        = make_reduce2;
   factory[static_cast<size_t>(Op::CORR)]       = make_reduce2;
+  factory[static_cast<size_t>(Op::NUNIQUE_APPROX)]  = &Head_Reduce_Approx::make;
+  factory[static_cast<size_t>(Op::QUANTILE_APPROX)] = &Head_Reduce_Approx::make;
   factory[static_cast<size_t>(Op::RE_MATCH)]   = &Head_Func_Re_Match::make;
   factory[static_cast<size_t>(Op::LEN)]        = make_unop;
   factory[static_cast<size_t>(Op::ARCTAN2)]    = make_binop;
@@ -110,6 +110,9 @@ class Head_Func_Binary : public Head_Func {
   public:
     explicit Head_Func_Binary(Op);
     Workframe evaluate_n(const vecExpr&, EvalContext&, bool) const override;
+    void exclude_rows(const vecExpr&, EvalContext&, RowRanges&) const override;
+    bool select_by_index(const vecExpr&, EvalContext&, size_t*,
+                         RowRanges&) const override;
 };
 
 
@@ -135,6 +138,7 @@ class Head_Func_Shift : public Head_Func {
 
     explicit Head_Func_Shift(int shift);
     Workframe evaluate_n(const vecExpr&, EvalContext&, bool) const override;
+    bool is_groupwise(const vecExpr&) const override;
 };
 
 
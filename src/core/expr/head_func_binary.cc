@@ -19,13 +19,19 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>   // std::max, std::min, std::sort
 #include <string>
+#include "column/const.h"
 #include "expr/fbinary/bimaker.h"
+#include "expr/eval_context.h"
 #include "expr/expr.h"
 #include "expr/head_func.h"
 #include "expr/workframe.h"
 #include "utils/assert.h"
 #include "utils/exceptions.h"
+#include "datatable.h"
+#include "ltype.h"
+#include "stats.h"
 namespace dt {
 namespace expr {
 
@@ -61,4 +67,293 @@ Workframe Head_Func_Binary::evaluate_n(
 
 
 
+//------------------------------------------------------------------------------
+// Skipping chunks by their stats
+//------------------------------------------------------------------------------
+
+static bool is_numeric(const Column& col) {
+  LType lt = col.ltype();
+  return (lt == LType::BOOL || lt == LType::INT || lt == LType::REAL);
+}
+
+
+// Evaluate `x <op> y` for 1-row columns `x` and `y`
+static bool compare(Op op, const Column& x, const Column& y) {
+  Column res = binaryop(op, Column(x), Column(y));
+  int8_t value;
+  bool isvalid = res.get_element(0, &value);
+  return isvalid && value;
+}
+
+
+// Comparison `y <op'> x` equivalent to `x <op> y`
+static Op flip_comparison(Op op) {
+  return (op == Op::LT)? Op::GT :
+         (op == Op::LE)? Op::GE :
+         (op == Op::GT)? Op::LT :
+         (op == Op::GE)? Op::LE : op;
+}
+
+
+/**
+  * Check whether `chunk <op> value` may be true for any row of the
+  * chunk, judging by the chunk's min/max stats. The chunk's min and
+  * max are compared with the `value` using the same `binaryop()` as
+  * the original expression, so that the type promotion rules are
+  * exactly the same.
+  *
+  * Comparisons with a non-NA value are always false for the NA rows,
+  * thus a chunk consisting only of NAs cannot match.
+  */
+static bool chunk_may_match(const Column& chunk, Op op, const Column& value) {
+  Stats* stats = chunk.get_stats_if_exist();
+  if (!stats || !stats->is_computed(Stat::Min) ||
+      !stats->is_computed(Stat::Max)) return true;
+  SType stype = chunk.stype();
+  Column min, max;
+  bool isvalid;
+  if (chunk.ltype() == LType::REAL) {
+    double dmin, dmax;
+    isvalid = stats->get_stat(Stat::Min, &dmin) &&
+              stats->get_stat(Stat::Max, &dmax);
+    if (!isvalid) return false;
+    min = Const_ColumnImpl::make_float_column(1, dmin, stype);
+    max = Const_ColumnImpl::make_float_column(1, dmax, stype);
+  }
+  else {
+    int64_t imin, imax;
+    isvalid = stats->get_stat(Stat::Min, &imin) &&
+              stats->get_stat(Stat::Max, &imax);
+    if (!isvalid) return false;
+    if (stype == SType::BOOL) {
+      min = Const_ColumnImpl::make_bool_column(1, imin != 0);
+      max = Const_ColumnImpl::make_bool_column(1, imax != 0);
+    } else {
+      min = Const_ColumnImpl::make_int_column(1, imin, stype);
+      max = Const_ColumnImpl::make_int_column(1, imax, stype);
+    }
+  }
+  switch (op) {
+    case Op::LT:
+    case Op::LE: return compare(op, min, value);
+    case Op::GT:
+    case Op::GE: return compare(op, max, value);
+    case Op::EQ: return compare(Op::LE, min, value) &&
+                        compare(Op::GE, max, value);
+    default: return true;
+  }
+}
+
+
+/**
+  * Exclude row chunks for the filters of the form `col <op> value`
+  * or `value <op> col`, where `value` is a scalar, and `col` is a
+  * column consisting of several chunks (see `Column::n_chunks()`).
+  * For the filters of the form `A & B` the rows excluded by either
+  * `A` or `B` are excluded.
+  */
+void Head_Func_Binary::exclude_rows(
+    const vecExpr& args, EvalContext& ctx, RowRanges& out) const
+{
+  xassert(args.size() == 2);
+  if (op == Op::AND) {
+    args[0].exclude_rows(ctx, out);
+    args[1].exclude_rows(ctx, out);
+    return;
+  }
+  if (!(op == Op::LT || op == Op::LE || op == Op::GT || op == Op::GE ||
+        op == Op::EQ)) return;
+  Op cmp = op;         // comparison op, when the column is on the left
+
+  Workframe lhs = args[0].evaluate_n(ctx);
+  Workframe rhs = args[1].evaluate_n(ctx);
+  if (lhs.ncols() != 1 || rhs.ncols() != 1) return;
+  bool lscalar = (lhs.get_grouping_mode() == Grouping::SCALAR);
+  bool rscalar = (rhs.get_grouping_mode() == Grouping::SCALAR);
+  Column col, value;
+  if (rscalar && !lscalar) {
+    col = lhs.retrieve_column(0);
+    value = rhs.retrieve_column(0);
+  }
+  else if (lscalar && !rscalar) {
+    col = rhs.retrieve_column(0);
+    value = lhs.retrieve_column(0);
+    cmp = flip_comparison(op);
+  }
+  else return;
+
+  size_t nchunks = col.n_chunks();
+  if (nchunks == 0 || value.nrows() != 1 || !is_numeric(col) ||
+      !is_numeric(value) || value.na_count()) return;
+
+  size_t row0 = 0;
+  for (size_t k = 0; k < nchunks; ++k) {
+    const Column& chunk = col.chunk(k);
+    size_t row1 = row0 + chunk.nrows();
+    if (!chunk_may_match(chunk, cmp, value)) {
+      out.emplace_back(row0, row1);
+    }
+    row0 = row1;
+  }
+}
+
+
+
+
+
+//------------------------------------------------------------------------------
+// Lookups via an index
+//------------------------------------------------------------------------------
+
+static RowRanges intersect_ranges(const RowRanges& a, const RowRanges& b) {
+  RowRanges res;
+  size_t i = 0, j = 0;
+  while (i < a.size() && j < b.size()) {
+    size_t start = std::max(a[i].first, b[j].first);
+    size_t end = std::min(a[i].second, b[j].second);
+    if (start < end) res.emplace_back(start, end);
+    if (a[i].second < b[j].second) ++i;
+    else ++j;
+  }
+  return res;
+}
+
+
+static RowRanges union_ranges(const RowRanges& a, const RowRanges& b) {
+  RowRanges all(a);
+  all.insert(all.end(), b.begin(), b.end());
+  std::sort(all.begin(), all.end());
+  RowRanges res;
+  for (const auto& range : all) {
+    if (range.first == range.second) continue;
+    if (!res.empty() && range.first <= res.back().second) {
+      res.back().second = std::max(res.back().second, range.second);
+    } else {
+      res.push_back(range);
+    }
+  }
+  return res;
+}
+
+
+/**
+  * Find the rows that satisfy `col <cmp> value`, where `col` has an
+  * index. The index orders the rows by their values (NAs first), and
+  * splits them into groups of equal values; thus the rows satisfying
+  * the condition form a contiguous range of groups, which can be
+  * found by binary search. Each group is compared with the `value`
+  * using the same `binaryop()` as the original expression, so that
+  * the type promotion rules are exactly the same.
+  */
+static RowRanges index_lookup(const Column& col, const RiGb& index,
+                              Op cmp, const Column& value)
+{
+  const RowIndex& order = index.first;
+  const Groupby& groups = index.second;
+  // This throws an exception if `col` and `value` cannot be compared,
+  // even if the frame is empty
+  compare(cmp, Column::new_na_column(1, col.stype()), value);
+  if (groups.last_offset() == 0) return RowRanges();
+  const int32_t* offsets = groups.offsets_r();
+  size_t ngroups = groups.size();
+
+  // 1-row column with the value of the `k`-th group
+  auto group_value = [&](size_t k) {
+    size_t row;
+    order.get_element(static_cast<size_t>(offsets[k]), &row);
+    Column res(col);
+    res.apply_rowindex(RowIndex(row, 1, 1));
+    return res;
+  };
+  // Index of the first group among [k0, ngroups) for which `pred`
+  // is true, assuming that `pred` is monotonic
+  auto find_first = [&](size_t k0, Op pred) {
+    size_t lo = k0, hi = ngroups;
+    while (lo < hi) {
+      size_t mid = (lo + hi) / 2;
+      if (compare(pred, group_value(mid), value)) hi = mid;
+      else lo = mid + 1;
+    }
+    return lo;
+  };
+
+  // The NA values (if any) form the first group, and they never
+  // satisfy a comparison with a non-NA value
+  size_t k0 = group_value(0).na_count()? 1 : 0;
+  size_t kstart = k0, kend = ngroups;
+  switch (cmp) {
+    case Op::EQ: kstart = find_first(k0, Op::GE);
+                 kend = find_first(kstart, Op::GT); break;
+    case Op::LT: kend = find_first(k0, Op::GE); break;
+    case Op::LE: kend = find_first(k0, Op::GT); break;
+    case Op::GT: kstart = find_first(k0, Op::GT); break;
+    case Op::GE: kstart = find_first(k0, Op::GE); break;
+    default: xassert(false);
+  }
+  RowRanges res;
+  if (kstart < kend) {
+    res.emplace_back(static_cast<size_t>(offsets[kstart]),
+                     static_cast<size_t>(offsets[kend]));
+  }
+  return res;
+}
+
+
+/**
+  * Resolve the filters of the form `col <op> value` or `value <op> col`,
+  * where `value` is a scalar, and `col` is a column of the frame that
+  * has an index. The filters `A & B` and `A | B` are resolved when both
+  * `A` and `B` can be resolved via the index on the same column; this
+  * covers range conditions like `(f.A >= x) & (f.A < y)`, and the
+  * membership tests like `(f.A == x) | (f.A == y) | (f.A == z)`.
+  */
+bool Head_Func_Binary::select_by_index(
+    const vecExpr& args, EvalContext& ctx, size_t* icol, RowRanges& out) const
+{
+  xassert(args.size() == 2);
+  if (op == Op::AND || op == Op::OR) {
+    size_t icol0, icol1;
+    RowRanges out0, out1;
+    if (!args[0].select_by_index(ctx, &icol0, out0) ||
+        !args[1].select_by_index(ctx, &icol1, out1) ||
+        icol0 != icol1) return false;
+    *icol = icol0;
+    out = (op == Op::AND)? intersect_ranges(out0, out1)
+                         : union_ranges(out0, out1);
+    return true;
+  }
+  if (!(op == Op::LT || op == Op::LE || op == Op::GT || op == Op::GE ||
+        op == Op::EQ)) return false;
+  const DataTable* dt0 = ctx.get_datatable(0);
+  if (!dt0->has_indexes() || ctx.get_rowindex(0)) return false;
+
+  Workframe lhs = args[0].evaluate_n(ctx);
+  Workframe rhs = args[1].evaluate_n(ctx);
+  if (lhs.ncols() != 1 || rhs.ncols() != 1) return false;
+  size_t frame_id, col_id;
+  Op cmp = op;         // comparison op, when the column is on the left
+  Column value;
+  if (rhs.get_grouping_mode() == Grouping::SCALAR &&
+      lhs.is_reference_column(0, &frame_id, &col_id)) {
+    value = rhs.retrieve_column(0);
+  }
+  else if (lhs.get_grouping_mode() == Grouping::SCALAR &&
+           rhs.is_reference_column(0, &frame_id, &col_id)) {
+    value = lhs.retrieve_column(0);
+    cmp = flip_comparison(op);
+  }
+  else return false;
+  if (frame_id != 0 || !dt0->has_index(col_id) || value.nrows() != 1 ||
+      value.stype() == SType::VOID || value.na_count() ||
+      dt0->get_column(col_id).stype() == SType::VOID) return false;
+
+  *icol = col_id;
+  out = index_lookup(dt0->get_column(col_id), dt0->get_index(col_id),
+                     cmp, value);
+  return true;
+}
+
+
+
+
 }}  // namespace dt::expr
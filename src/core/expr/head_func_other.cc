@@ -41,10 +41,10 @@ namespace expr {
 class re_match_vcol : public Virtual_ColumnImpl {
   private:
     Column arg;
-    std::regex regex;
+    std::shared_ptr<const Regex> regex;
 
   public:
-    re_match_vcol(Column&& col, const std::regex& rx)
+    re_match_vcol(Column&& col, const std::shared_ptr<const Regex>& rx)
       : Virtual_ColumnImpl(col.nrows(), SType::BOOL),
         arg(std::move(col)),
         regex(rx) {}
@@ -67,7 +67,7 @@ class re_match_vcol : public Virtual_ColumnImpl {
       CString x;
       bool isvalid = arg.get_element(i, &x);
       if (isvalid) {
-        *out = std::regex_match(x.ch, x.ch + x.size, regex);
+        *out = regex->match(x.ch, static_cast<size_t>(x.size));
       }
       return isvalid;
     }
@@ -76,7 +76,7 @@ class re_match_vcol : public Virtual_ColumnImpl {
       CString x;
       bool isvalid = arg.get_element(i, &x);
       if (isvalid) {
-        *out = std::regex_match(x.ch, x.ch + x.size, regex);
+        *out = regex->match(x.ch, static_cast<size_t>(x.size));
       }
       return isvalid;
     }
@@ -117,7 +117,7 @@ Head_Func_Re_Match::Head_Func_Re_Match(py::robj arg_pattern, py::robj arg_flags)
     }
 
     try {
-      regex = std::regex(pattern, std::regex::nosubs);
+      regex = Regex::compile(pattern);
     } catch (const std::regex_error& e) {
       throw translate_exception(e);
     }
@@ -21,11 +21,12 @@
 //------------------------------------------------------------------------------
 #ifndef dt_EXPR_HEAD_FUNC_OTHER_h
 #define dt_EXPR_HEAD_FUNC_OTHER_h
+#include <memory>
 #include <string>
-#include <regex>
 #include "expr/head.h"
 #include "expr/head_func.h"
 #include "python/tuple.h"
+#include "str/regex.h"
 namespace dt {
 namespace expr {
 
@@ -34,7 +35,7 @@ namespace expr {
 class Head_Func_Re_Match : public Head_Func {
   private:
     std::string pattern;
-    std::regex regex;
+    std::shared_ptr<const Regex> regex;
 
   public:
     static ptrHead make(Op, const py::otuple& params);
@@ -121,6 +121,11 @@ Workframe Head_Func_Shift::evaluate_n(
 }
 
 
+bool Head_Func_Shift::is_groupwise(const vecExpr&) const {
+  return true;
+}
+
+
 
 
 }}  // dt::expr
@@ -57,7 +57,7 @@ Workframe Head_Literal_SliceAll::evaluate_f(
 // including the joined frames". There are 2 exceptions though:
 //   - any groupby columns are not added (since they should be added at the
 //     front by the groupby operation itself);
-//   - key columns in naturally joined frames are skipped, to avoid duplication.
+//   - join columns in the joined frames are skipped, to avoid duplication.
 //
 Workframe Head_Literal_SliceAll::evaluate_j(
     const vecExpr&, EvalContext& ctx, bool) const
@@ -65,9 +65,18 @@ Workframe Head_Literal_SliceAll::evaluate_j(
   Workframe outputs(ctx);
   for (size_t i = 0; i < ctx.nframes(); ++i) {
     const DataTable* dti = ctx.get_datatable(i);
-    size_t j0 = ctx.is_naturally_joined(i)? dti->nkeys() : 0;
-    for (size_t j = j0; j < dti->ncols(); ++j) {
+    for (size_t j = 0; j < dti->ncols(); ++j) {
       if (ctx.has_group_column(i, j)) continue;
+      if (ctx.is_join_column(i, j)) continue;
+      if (i == 0) {
+        Column keycol = ctx.get_join_key_column(j);
+        if (keycol) {
+          outputs.add_column(std::move(keycol),
+                             std::string(dti->get_names()[j]),
+                             Grouping::GtoALL);
+          continue;
+        }
+      }
       outputs.add_ref_column(i, j);
     }
   }
@@ -36,4 +36,9 @@ Kind Head_Reduce::get_expr_kind() const {
 }
 
 
+bool Head_Reduce::is_groupwise(const vecExpr&) const {
+  return true;
+}
+
+
 }}  // namespace dt::expr
@@ -39,6 +39,9 @@ namespace expr {
   *   - Head_Reduce_Nullary: no arguments, e.g. `count()`
   *   - Head_Reduce_Unary:   single argument, e.g. `mean(X)`
   *   - Head_Reduce_Binary:  two arguments, e.g. `corr(X, Y)`
+  *   - Head_Reduce_Approx:  single argument, approximate reducers
+  *                          computed via sketches, e.g.
+  *                          `nunique_approx(X)`
   *
   * Most reducers fall into the "unary" category.
   */
@@ -49,6 +52,7 @@ class Head_Reduce : public Head_Func {
   public:
     explicit Head_Reduce(Op);
     Kind get_expr_kind() const override;
+    bool is_groupwise(const vecExpr&) const override;
 };
 
 
@@ -81,6 +85,19 @@ class Head_Reduce_Binary : public Head_Reduce {
 
 
 
+class Head_Reduce_Approx : public Head_Reduce {
+  private:
+    double param_;  // quantile for QUANTILE_APPROX
+
+  public:
+    static ptrHead make(Op, const py::otuple& params);
+
+    Head_Reduce_Approx(Op, double param);
+    Workframe evaluate_n(const vecExpr&, EvalContext&, bool) const override;
+};
+
+
+
 
 }}  // namespace dt::expr
 #endif
@@ -0,0 +1,355 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <cstring>               // std::memcpy
+#include <memory>                // std::unique_ptr
+#include <type_traits>           // std::conditional, std::is_same
+#include <vector>                // std::vector
+#include "column/latent.h"
+#include "column/virtual.h"
+#include "expr/eval_context.h"
+#include "expr/expr.h"
+#include "expr/head_reduce.h"
+#include "expr/workframe.h"
+#include "models/murmurhash.h"
+#include "parallel/api.h"
+#include "python/obj.h"
+#include "sketch/hyperloglog.h"
+#include "sketch/tdigest.h"
+#include "utils/assert.h"
+#include "utils/exceptions.h"
+#include "column.h"
+#include "stype.h"
+namespace dt {
+namespace expr {
+
+
+// Reducers read their input in batches of this size
+static constexpr size_t BATCH = Column::BATCH_SIZE;
+
+// A single group with at least this many rows is processed in parallel,
+// provided that the groups are not already being computed in parallel.
+static constexpr size_t PARALLEL_GROUP_SIZE = 100000;
+
+static const char* _name(Op op) {
+  return (op == Op::NUNIQUE_APPROX)? "nunique_approx" :
+         (op == Op::QUANTILE_APPROX)? "quantile_approx" :
+         "??";
+}
+
+
+
+//------------------------------------------------------------------------------
+// Sketches
+//------------------------------------------------------------------------------
+
+// Each sketch class `S<T>` used by `Sketched_ColumnImpl` has:
+//   - type `U` of the value produced by the sketch;
+//   - constructor `S(n, param)`, where `n` is the maximum number of
+//     values that will be added to the sketch;
+//   - method `add(T value)`, for each valid value in the group;
+//   - method `merge(S& other)`;
+//   - method `bool get(U* out)`, which returns the result of the
+//     reducer, or false if the result is NA.
+
+template <typename T>
+static uint64_t value_hash(T value) {
+  uint64_t bits = 0;
+  std::memcpy(&bits, &value, sizeof(T));
+  return hash_bits(bits);
+}
+
+template <>
+uint64_t value_hash(CString value) {
+  return hash_murmur2(value.ch, static_cast<uint64_t>(value.size));
+}
+
+
+template <typename T>
+class NUniqueSketch {
+  private:
+    HyperLogLog hll_;
+
+  public:
+    using U = int64_t;
+
+    NUniqueSketch(size_t n, double) : hll_(n) {}
+
+    void add(T value) {
+      hll_.add(value_hash<T>(value));
+    }
+
+    void merge(NUniqueSketch& other) {
+      hll_.merge(other.hll_);
+    }
+
+    bool get(U* out) {
+      *out = static_cast<U>(hll_.estimate());
+      return true;
+    }
+};
+
+
+template <typename T>
+class QuantileSketch {
+  private:
+    TDigest tdigest_;
+    double q_;
+
+  public:
+    using U = typename std::conditional<std::is_same<T, float>::value,
+                                        float, double>::type;
+
+    QuantileSketch(size_t, double q) : q_(q) {}
+
+    void add(T value) {
+      tdigest_.add(static_cast<double>(value));
+    }
+
+    void merge(QuantileSketch& other) {
+      tdigest_.merge(other.tdigest_);
+    }
+
+    bool get(U* out) {
+      if (tdigest_.empty()) return false;
+      *out = static_cast<U>(tdigest_.quantile(q_));
+      return true;
+    }
+};
+
+
+
+
+//------------------------------------------------------------------------------
+// Sketched_ColumnImpl
+//------------------------------------------------------------------------------
+
+/**
+  * Virtual column whose i-th element is the result of sketch `S`
+  * computed over the i-th group of the `arg` column.
+  *
+  * When there are many groups, they are computed in parallel by the
+  * column's materialization. However, if there is only one (or a few)
+  * large groups, then each of them is processed in parallel instead:
+  * every thread creates its own sketch for the part of the group, and
+  * then all these sketches are merged together.
+  */
+template <typename T, typename S>
+class Sketched_ColumnImpl : public Virtual_ColumnImpl {
+  private:
+    using U = typename S::U;
+    Column arg_;
+    Groupby groupby_;
+    double param_;
+
+  public:
+    Sketched_ColumnImpl(Column&& col, const Groupby& grpby, double param)
+      : Virtual_ColumnImpl(grpby.size(), stype_from<U>),
+        arg_(std::move(col)),
+        groupby_(grpby),
+        param_(param)
+    {
+      xassert(compatible_type<T>(arg_.stype()));
+    }
+
+    ColumnImpl* clone() const override {
+      return new Sketched_ColumnImpl<T, S>(Column(arg_), groupby_, param_);
+    }
+
+    size_t n_children() const noexcept override {
+      return 1;
+    }
+
+    const Column& child(size_t i) const override {
+      xassert(i == 0);  (void)i;
+      return arg_;
+    }
+
+    bool computationally_expensive() const override {
+      return true;
+    }
+
+    bool get_element(size_t i, U* out) const override {
+      size_t i0, i1;
+      groupby_.get_group(i, &i0, &i1);
+      size_t n = i1 - i0;
+      if (n >= PARALLEL_GROUP_SIZE && num_threads_in_team() == 0 &&
+          arg_.allow_parallel_access())
+      {
+        return _compute_parallel(i0, i1, out);
+      }
+      S sketch(n, param_);
+      _fill_sketch(sketch, i0, i1);
+      return sketch.get(out);
+    }
+
+  private:
+    void _fill_sketch(S& sketch, size_t i0, size_t i1) const {
+      T values[BATCH];
+      bool valid[BATCH];
+      for (size_t i = i0; i < i1; i += BATCH) {
+        size_t n = std::min(BATCH, i1 - i);
+        arg_.get_elements(i, n, values, valid);
+        for (size_t j = 0; j < n; ++j) {
+          if (valid[j]) sketch.add(values[j]);
+        }
+      }
+    }
+
+    bool _compute_parallel(size_t i0, size_t i1, U* out) const {
+      size_t n = i1 - i0;
+      size_t nbatches = (n + BATCH - 1) / BATCH;
+      std::vector<std::unique_ptr<S>> sketches(num_threads_in_pool());
+      parallel_region(
+        [&] {
+          auto sketch = new S(n, param_);
+          sketches[this_thread_index()] = std::unique_ptr<S>(sketch);
+          nested_for_static(nbatches,
+            [&](size_t k) {
+              size_t j0 = i0 + k * BATCH;
+              _fill_sketch(*sketch, j0, std::min(j0 + BATCH, i1));
+            });
+        });
+      S* result = nullptr;
+      for (auto& sketch : sketches) {
+        if (!sketch) continue;
+        if (result) result->merge(*sketch);
+        else result = sketch.get();
+      }
+      xassert(result);
+      return result->get(out);
+    }
+};
+
+
+template <typename T, template <typename> class S>
+static Column _make_sketched(Column&& arg, const Groupby& gby, double param) {
+  return Column(
+          new Latent_ColumnImpl(
+            new Sketched_ColumnImpl<T, S<T>>(std::move(arg), gby, param)
+          ));
+}
+
+
+static Column compute_nunique_approx(Column&& arg, const Groupby& gby,
+                                     double)
+{
+  switch (arg.stype()) {
+    case SType::BOOL:
+    case SType::INT8:    return _make_sketched<int8_t, NUniqueSketch>(std::move(arg), gby, 0);
+    case SType::INT16:   return _make_sketched<int16_t, NUniqueSketch>(std::move(arg), gby, 0);
+    case SType::INT32:   return _make_sketched<int32_t, NUniqueSketch>(std::move(arg), gby, 0);
+    case SType::INT64:   return _make_sketched<int64_t, NUniqueSketch>(std::move(arg), gby, 0);
+    case SType::FLOAT32: return _make_sketched<float, NUniqueSketch>(std::move(arg), gby, 0);
+    case SType::FLOAT64: return _make_sketched<double, NUniqueSketch>(std::move(arg), gby, 0);
+    case SType::STR32:
+    case SType::STR64:   return _make_sketched<CString, NUniqueSketch>(std::move(arg), gby, 0);
+    default: throw TypeError() << "Unable to apply reduce function "
+                  "`nunique_approx()` to a column of type `" << arg.stype() << "`";
+  }
+}
+
+
+static Column compute_quantile_approx(Column&& arg, const Groupby& gby,
+                                      double q)
+{
+  switch (arg.stype()) {
+    case SType::BOOL:
+    case SType::INT8:    return _make_sketched<int8_t, QuantileSketch>(std::move(arg), gby, q);
+    case SType::INT16:   return _make_sketched<int16_t, QuantileSketch>(std::move(arg), gby, q);
+    case SType::INT32:   return _make_sketched<int32_t, QuantileSketch>(std::move(arg), gby, q);
+    case SType::INT64:   return _make_sketched<int64_t, QuantileSketch>(std::move(arg), gby, q);
+    case SType::FLOAT32: return _make_sketched<float, QuantileSketch>(std::move(arg), gby, q);
+    case SType::FLOAT64: return _make_sketched<double, QuantileSketch>(std::move(arg), gby, q);
+    default: throw TypeError() << "Unable to apply reduce function "
+                  "`quantile_approx()` to a column of type `" << arg.stype() << "`";
+  }
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Head_Reduce_Approx
+//------------------------------------------------------------------------------
+
+ptrHead Head_Reduce_Approx::make(Op op, const py::otuple& params) {
+  double param = 0.0;
+  if (op == Op::QUANTILE_APPROX) {
+    xassert(params.size() == 1);
+    param = params[0].to_double();
+    if (!(param >= 0.0 && param <= 1.0)) {
+      throw ValueError() << "Parameter `q` in `quantile_approx()` should be "
+          "a number between 0 and 1, instead got " << params[0];
+    }
+  } else {
+    xassert(params.size() == 0);
+  }
+  return ptrHead(new Head_Reduce_Approx(op, param));
+}
+
+
+Head_Reduce_Approx::Head_Reduce_Approx(Op op_, double param)
+  : Head_Reduce(op_), param_(param) {}
+
+
+// Groupby where each of the `n` rows forms its own group
+static Groupby unit_groups(size_t n) {
+  Buffer offsets = Buffer::mem((n + 1) * sizeof(int32_t));
+  auto data = static_cast<int32_t*>(offsets.xptr());
+  for (size_t i = 0; i <= n; ++i) data[i] = static_cast<int32_t>(i);
+  return Groupby(n, std::move(offsets));
+}
+
+
+Workframe Head_Reduce_Approx::evaluate_n(
+    const vecExpr& args, EvalContext& ctx, bool) const
+{
+  xassert(args.size() == 1);
+  Workframe inputs = args[0].evaluate_n(ctx);
+  Groupby gby = ctx.get_groupby();
+  if (!gby) gby = Groupby::single_group(ctx.nrows());
+  if (inputs.get_grouping_mode() != Grouping::GtoALL) {
+    // The input already has one value per group
+    gby = unit_groups(gby.size());
+  }
+
+  using fn_t = Column(*)(Column&&, const Groupby&, double);
+  fn_t fn = (op == Op::NUNIQUE_APPROX)? compute_nunique_approx :
+            (op == Op::QUANTILE_APPROX)? compute_quantile_approx : nullptr;
+  if (!fn) {
+    throw TypeError() << "Unknown reducer function: " << _name(op);
+  }
+
+  Workframe outputs(ctx);
+  for (size_t i = 0; i < inputs.ncols(); ++i) {
+    outputs.add_column(
+        fn(inputs.retrieve_column(i), gby, param_),
+        inputs.retrieve_name(i),
+        Grouping::GtoONE);
+  }
+  return outputs;
+}
+
+
+
+
+}}  // namespace dt::expr
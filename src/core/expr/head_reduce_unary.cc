@@ -19,6 +19,7 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>       // std::min
 #include <unordered_map>
 #include "column/latent.h"
 #include "column/virtual.h"
@@ -43,6 +44,9 @@ static Error _error(const char* name, SType stype) {
 template <typename U>
 using reducer_fn = bool(*)(const Column&, size_t, size_t, U*);
 
+// Reducers read their input in batches of this size
+static constexpr size_t BATCH = Column::BATCH_SIZE;
+
 using maker_fn = Column(*)(Column&&, const Groupby&);
 
 
@@ -188,11 +192,15 @@ static Column compute_gfirstlast(Column&& arg, const Groupby&) {
 template <typename T, typename U>
 bool sum_reducer(const Column& col, size_t i0, size_t i1, U* out) {
   U sum = 0;
-  for (size_t i = i0; i < i1; ++i) {
-    T value;
-    bool isvalid = col.get_element(i, &value);
-    if (isvalid) {
-      sum += static_cast<U>(value);
+  T values[BATCH];
+  bool valid[BATCH];
+  for (size_t i = i0; i < i1; i += BATCH) {
+    size_t n = std::min(BATCH, i1 - i);
+    col.get_elements(i, n, values, valid);
+    for (size_t j = 0; j < n; ++j) {
+      if (valid[j]) {
+        sum += static_cast<U>(values[j]);
+      }
     }
   }
   *out = sum;
@@ -273,12 +281,16 @@ template <typename T, typename U>
 bool mean_reducer(const Column& col, size_t i0, size_t i1, U* out) {
   U sum = 0;
   int64_t count = 0;
-  for (size_t i = i0; i < i1; ++i) {
-    T value;
-    bool isvalid = col.get_element(i, &value);
-    if (isvalid) {
-      sum += static_cast<U>(value);
-      count++;
+  T values[BATCH];
+  bool valid[BATCH];
+  for (size_t i = i0; i < i1; i += BATCH) {
+    size_t n = std::min(BATCH, i1 - i);
+    col.get_elements(i, n, values, valid);
+    for (size_t j = 0; j < n; ++j) {
+      if (valid[j]) {
+        sum += static_cast<U>(values[j]);
+        count++;
+      }
     }
   }
   if (!count) return false;
@@ -337,16 +349,20 @@ template <typename T, typename U>
 bool sd_reducer(const Column& col, size_t i0, size_t i1, U* out) {
   U mean = 0;
   U m2 = 0;
-  T value;
   int64_t count = 0;
-  for (size_t i = i0; i < i1; ++i) {
-    bool isvalid = col.get_element(i, &value);
-    if (isvalid) {
-      count++;
-      U tmp1 = static_cast<U>(value) - mean;
-      mean += tmp1 / count;
-      U tmp2 = static_cast<U>(value) - mean;
-      m2 += tmp1 * tmp2;
+  T values[BATCH];
+  bool valid[BATCH];
+  for (size_t i = i0; i < i1; i += BATCH) {
+    size_t n = std::min(BATCH, i1 - i);
+    col.get_elements(i, n, values, valid);
+    for (size_t j = 0; j < n; ++j) {
+      if (valid[j]) {
+        count++;
+        U tmp1 = static_cast<U>(values[j]) - mean;
+        mean += tmp1 / count;
+        U tmp2 = static_cast<U>(values[j]) - mean;
+        m2 += tmp1 * tmp2;
+      }
     }
   }
   if (count <= 1) return false;
@@ -453,10 +469,14 @@ static Column compute_gsd(Column&& arg, const Groupby& gby) {
 template <typename T>
 bool count_reducer(const Column& col, size_t i0, size_t i1, int64_t* out) {
   int64_t count = 0;
-  for (size_t i = i0; i < i1; ++i) {
-    T value;
-    bool isvalid = col.get_element(i, &value);
-    count += isvalid;
+  T values[BATCH];
+  bool valid[BATCH];
+  for (size_t i = i0; i < i1; i += BATCH) {
+    size_t n = std::min(BATCH, i1 - i);
+    col.get_elements(i, n, values, valid);
+    for (size_t j = 0; j < n; ++j) {
+      count += valid[j];
+    }
   }
   *out = count;
   return true;  // *out is not NA
@@ -569,13 +589,18 @@ template <typename T, bool MIN>
 bool minmax_reducer(const Column& col, size_t i0, size_t i1, T* out) {
   T minmax = 0;
   bool minmax_isna = true;
-  for (size_t i = i0; i < i1; ++i) {
-    T value;
-    bool isvalid = col.get_element(i, &value);
-    if (!isvalid) continue;
-    if ((MIN? (value < minmax) : (value > minmax)) || minmax_isna) {
-      minmax = value;
-      minmax_isna = false;
+  T values[BATCH];
+  bool valid[BATCH];
+  for (size_t i = i0; i < i1; i += BATCH) {
+    size_t n = std::min(BATCH, i1 - i);
+    col.get_elements(i, n, values, valid);
+    for (size_t j = 0; j < n; ++j) {
+      if (!valid[j]) continue;
+      T value = values[j];
+      if ((MIN? (value < minmax) : (value > minmax)) || minmax_isna) {
+        minmax = value;
+        minmax_isna = false;
+      }
     }
   }
   *out = minmax;
@@ -33,7 +33,7 @@ static constexpr size_t BINOP_FIRST   = 201;
 static constexpr size_t BINOP_LAST    = 218;
 static constexpr size_t STRING_FIRST  = 301;
 static constexpr size_t REDUCER_FIRST = 401;
-static constexpr size_t REDUCER_LAST  = 412;
+static constexpr size_t REDUCER_LAST  = 414;
 static constexpr size_t MATH_FIRST    = 501;
 static constexpr size_t MATH_LAST     = 554;
 static constexpr size_t ROWFNS_FIRST  = 601;
@@ -96,7 +96,9 @@ enum class Op : size_t {
   COUNT0,                   // head_reduce_nullary.cc
   MEDIAN,                   // head_reduce_unary.cc
   COV,                      // head_reduce_binary.cc
-  CORR = REDUCER_LAST,      // head_reduce_binary.cc
+  CORR,                     // head_reduce_binary.cc
+  NUNIQUE_APPROX,           // head_reduce_approx.cc
+  QUANTILE_APPROX = REDUCER_LAST,  // head_reduce_approx.cc
 
   // Math: trigonometric
   SIN = MATH_FIRST,         // funary/trigonometric.cc
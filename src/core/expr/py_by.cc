@@ -21,6 +21,7 @@
 //------------------------------------------------------------------------------
 #include "expr/expr.h"
 #include "expr/py_by.h"
+#include "python/bool.h"
 namespace py {
 
 
@@ -134,14 +135,23 @@ bool oby::oby_pyobject::get_add_columns() const {
   return add_columns_;
 }
 
+oobj oby::oby_pyobject::get_add_columns_obj() const {
+  return obool(add_columns_);
+}
+
 
 void oby::oby_pyobject::impl_init_type(XTypeMaker& xt) {
   xt.set_class_name("datatable.by");
   xt.set_class_doc(by_help);
   xt.set_subclassable(false);
 
+  static GSArgs args_cols("cols", "List of columns to group by");
+  static GSArgs args_add_columns("add_columns",
+    "Whether the group columns are added to the resulting frame");
   xt.add(CONSTRUCTOR(&oby::oby_pyobject::m__init__, args___init__));
   xt.add(DESTRUCTOR(&oby::oby_pyobject::m__dealloc__));
+  xt.add(GETTER(&oby::oby_pyobject::get_cols, args_cols));
+  xt.add(GETTER(&oby::oby_pyobject::get_add_columns_obj, args_add_columns));
 }
 
 
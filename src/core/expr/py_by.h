@@ -40,6 +40,7 @@ class oby : public oobj
       void m__dealloc__();
       oobj get_cols() const;
       bool get_add_columns() const;
+      oobj get_add_columns_obj() const;
 
       static void impl_init_type(XTypeMaker& xt);
   };
@@ -22,6 +22,8 @@
 #include "expr/py_join.h"
 #include "datatable.h"
 #include "python/arg.h"
+#include "python/list.h"
+#include "python/string.h"
 namespace py {
 
 
@@ -30,26 +32,113 @@ namespace py {
 // ojoin::pyobj
 //------------------------------------------------------------------------------
 
+static const char* join_help =
+R"(join(frame, on=None, how="left")
+--
+
+Join clause for use in Frame's square-bracket selector.
+
+The ``join()`` object allows to join columns of ``frame`` to the frame
+being selected from, matching the rows by the values in the "join"
+columns. Within the ``DT[i, j, ...]`` expression, the columns of the
+joined frame can be accessed via the ``g.`` namespace.
+
+Parameters
+----------
+frame: Frame
+    The frame to join. If the ``on`` parameter is not given, this
+    frame must be keyed, and the join will be performed on its key
+    columns.
+
+on: str | List[str]
+    The names of the columns to join on. These columns must be
+    present in both frames. If this parameter is given, then the
+    ``frame`` does not have to be keyed, and its values in the
+    ``on`` columns are not required to be unique.
+
+how: "left" | "inner" | "outer"
+    The type of the join:
+
+    - ``"left"`` (default): all rows of ``DT`` are retained, and
+      for the rows without a match in ``frame`` the joined columns
+      will be NA;
+
+    - ``"inner"``: only the rows that have a match in ``frame`` are
+      retained;
+
+    - ``"outer"``: all rows from both frames are retained. The rows
+      of ``frame`` that didn't match any row in ``DT`` are appended
+      at the end, with NAs in the columns of ``DT``. The join columns
+      are the exception: when all columns are selected with ``:``,
+      the join columns of these rows are filled with the key values
+      from ``frame``.
+
+    If a row in ``DT`` matches several rows in ``frame``, then it
+    will be repeated for each match (a "many-to-many" join).
+
+    Only the left join on key columns is supported when updating or
+    deleting values in ``DT``.
+)";
+
 static PKArgs args___init__(
-    1, 0, 0, false, false, {"frame"}, "__init__", nullptr);
+    1, 0, 2, false, false, {"frame", "on", "how"}, "__init__", nullptr);
 
 void ojoin::pyobj::m__init__(const PKArgs& args) {
-  if (!args[0]) {
+  const Arg& arg_frame = args[0];
+  const Arg& arg_on = args[1];
+  const Arg& arg_how = args[2];
+  if (!arg_frame) {
     throw TypeError() << "join() is missing the required parameter `frame`";
   }
-  join_frame = args[0].to_oobj();
+  join_frame = arg_frame.to_oobj();
   if (!join_frame.is_frame()) {
     throw TypeError() << "The argument to join() must be a Frame";
   }
   DataTable* jdt = join_frame.to_datatable();
-  if (jdt->nkeys() == 0) {
-    throw ValueError() << "The join frame is not keyed";
+
+  if (arg_on.is_none_or_undefined()) {
+    if (jdt->nkeys() == 0) {
+      throw ValueError() << "The join frame is not keyed";
+    }
+    on = py::None();
+  } else {
+    py::olist onlist(0);
+    if (arg_on.is_string()) {
+      onlist.append(arg_on.to_oobj());
+    } else if (arg_on.is_list_or_tuple()) {
+      for (const auto& name : arg_on.to_stringlist()) {
+        onlist.append(py::ostring(name));
+      }
+    } else {
+      throw TypeError() << arg_on.name() << " should be a string or a list "
+          "of strings, instead got " << arg_on.typeobj();
+    }
+    if (onlist.size() == 0) {
+      throw ValueError() << arg_on.name() << " cannot be an empty list";
+    }
+    for (size_t i = 0; i < onlist.size(); ++i) {
+      if (jdt->colindex(onlist[i]) == -1) {
+        throw ValueError() << "Column `" << onlist[i].to_string()
+            << "` does not exist in the join frame";
+      }
+    }
+    on = std::move(onlist);
+  }
+
+  std::string how_str = arg_how.to<std::string>("left");
+  if (how_str == "left") how = JoinType::LEFT;
+  else if (how_str == "inner") how = JoinType::INNER;
+  else if (how_str == "outer") how = JoinType::OUTER;
+  else {
+    throw ValueError() << "Parameter `how` in join() should be one of "
+        "'left', 'inner' or 'outer', instead got '" << how_str << "'";
   }
 }
 
 
 void ojoin::pyobj::m__dealloc__() {
   join_frame = nullptr;  // Releases the stored oobj
+  on = nullptr;
 }
 
 
@@ -57,15 +146,28 @@ oobj ojoin::pyobj::get_joinframe() const {
   return join_frame;
 }
 
+oobj ojoin::pyobj::get_on() const {
+  return on;
+}
+
+oobj ojoin::pyobj::get_how() const {
+  return py::ostring(how == JoinType::INNER? "inner" :
+                     how == JoinType::OUTER? "outer" : "left");
+}
+
 void ojoin::pyobj::impl_init_type(XTypeMaker& xt) {
   xt.set_class_name("datatable.join");
-  xt.set_class_doc("join() clause for use in DT[i, j, ...]");
+  xt.set_class_doc(join_help);
   xt.set_subclassable(true);
 
   static GSArgs args_joinframe("joinframe");
+  static GSArgs args_on("on");
+  static GSArgs args_how("how");
   xt.add(CONSTRUCTOR(&pyobj::m__init__, args___init__));
   xt.add(DESTRUCTOR(&pyobj::m__dealloc__));
   xt.add(GETTER(&pyobj::get_joinframe, args_joinframe));
+  xt.add(GETTER(&pyobj::get_on, args_on));
+  xt.add(GETTER(&pyobj::get_how, args_how));
 }
 
 
@@ -83,6 +185,27 @@ DataTable* ojoin::get_datatable() const {
 }
 
 
+// Names of the columns to join on, or an empty list if the join should
+// be performed on the key columns of the join frame.
+strvec ojoin::get_on_names() const {
+  auto w = static_cast<pyobj*>(v);
+  strvec names;
+  if (!w->on.is_none()) {
+    py::olist onlist = w->on.to_pylist();
+    for (size_t i = 0; i < onlist.size(); ++i) {
+      names.push_back(onlist[i].to_string());
+    }
+  }
+  return names;
+}
+
+
+JoinType ojoin::get_join_type() const {
+  auto w = static_cast<pyobj*>(v);
+  return w->how;
+}
+
+
 bool ojoin::check(PyObject* val) {
   return pyobj::check(val);
 }
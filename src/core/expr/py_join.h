@@ -32,10 +32,15 @@ class ojoin : public oobj
   class pyobj : public XObject<pyobj> {
     public:
       oobj join_frame;
+      oobj on;
+      JoinType how;
+      size_t : 56;
 
       void m__init__(const PKArgs&);
       void m__dealloc__();
       oobj get_joinframe() const;
+      oobj get_on() const;
+      oobj get_how() const;
 
       static void impl_init_type(XTypeMaker& xt);
 
@@ -54,6 +59,8 @@ class ojoin : public oobj
     ojoin& operator=(ojoin&&) = default;
 
     DataTable* get_datatable() const;
+    strvec get_on_names() const;
+    JoinType get_join_type() const;
 
     static bool check(PyObject* v);
     static void init(PyObject* m);
@@ -114,13 +114,27 @@ const std::vector<bool>& osort::osort_pyobject::get_reverse() const {
   return *reverse_;
 }
 
+oobj osort::osort_pyobject::get_reverse_obj() const {
+  if (reverse_->empty()) return None();
+  olist res(static_cast<int>(reverse_->size()));
+  for (size_t i = 0; i < reverse_->size(); ++i) {
+    res.set(i, obool((*reverse_)[i]));
+  }
+  return std::move(res);
+}
+
 
 void osort::osort_pyobject::impl_init_type(XTypeMaker& xt) {
   xt.set_class_name("datatable.sort");
   xt.set_class_doc(sort_help);
 
+  static GSArgs args_cols("cols", "List of columns to sort by");
+  static GSArgs args_reverse("reverse",
+    "List of sort directions for each column, or None");
   xt.add(CONSTRUCTOR(&osort::osort_pyobject::m__init__, args___init__));
   xt.add(DESTRUCTOR(&osort::osort_pyobject::m__dealloc__));
+  xt.add(GETTER(&osort::osort_pyobject::get_cols, args_cols));
+  xt.add(GETTER(&osort::osort_pyobject::get_reverse_obj, args_reverse));
 }
 
 
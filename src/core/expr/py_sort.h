@@ -40,6 +40,7 @@ class osort : public oobj
       void m__dealloc__();
       oobj get_cols() const;
       const std::vector<bool>& get_reverse() const;
+      oobj get_reverse_obj() const;
 
       static void impl_init_type(XTypeMaker&);
   };
@@ -88,6 +88,14 @@ void Workframe::add_placeholder(const std::string& name, size_t ifr) {
 }
 
 
+Workframe Workframe::clone() const {
+  Workframe res(ctx_);
+  res.entries_ = entries_;
+  res.grouping_mode_ = grouping_mode_;
+  return res;
+}
+
+
 void Workframe::cbind(Workframe&& other, bool at_end) {
   sync_grouping_mode(other);
   if (at_end && !entries_.empty()) {
@@ -99,6 +99,10 @@ class Workframe {
     void remove(const Workframe&);
     void rename(const std::string& name);
 
+    // Create a shallow copy of this Workframe: the columns in the
+    // copy share their data with the columns of the original.
+    Workframe clone() const;
+
     size_t ncols() const noexcept;
     size_t nrows() const noexcept;
     EvalContext& get_context() const noexcept;
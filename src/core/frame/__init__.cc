@@ -23,7 +23,9 @@
 #include <iostream>
 #include <string>
 #include <vector>
+#include "arrow/arrow_array.h"
 #include "column/npmasked.h"
+#include "column/rbound.h"
 #include "python/_all.h"
 #include "python/list.h"
 #include "python/oset.h"
@@ -138,6 +140,9 @@ class FrameInitializationManager {
       if (src.is_numpy_array()) {
         return init_from_numpy();
       }
+      if (src.is_arrow_table() || src.is_arrow_batch()) {
+        return init_from_arrow();
+      }
       if (src.is_ellipsis() &&
                !defined_names && !defined_stypes && !defined_stype) {
         return init_mystery_frame();
@@ -476,6 +481,74 @@ class FrameInitializationManager {
       make_datatable(names_arg);
     }
 
+    /**
+     * Create a Frame from a pyarrow Table or RecordBatch. The data is
+     * imported via the Arrow C Data Interface, without copying. Each
+     * record batch is imported as a single struct array, whose children
+     * are the columns. If the table consists of several batches, then
+     * the chunks of each column are row-bound.
+     *
+     * Columns whose types are not supported natively are converted
+     * via python lists.
+     */
+    void init_from_arrow() {
+      if (stypes_arg || stype_arg) {
+        throw TypeError() << "Argument `stypes` is not supported in Frame() "
+            "constructor when creating a Frame from an arrow Table";
+      }
+      py::robj pasrc = src.to_robj();
+      dt::OArrowSchema schema;
+      pasrc.get_attr("schema").invoke("_export_to_c",
+                                      py::oint(schema.intptr()));
+      size_t ncols = static_cast<size_t>(schema->n_children);
+      check_names_count(ncols);
+
+      py::olist batches(0);
+      if (src.is_arrow_table()) {
+        batches = pasrc.invoke("to_batches").to_pylist();
+      } else {
+        batches.append(pasrc);
+      }
+      std::vector<colvec> chunks(ncols);
+      for (size_t k = 0; k < batches.size(); ++k) {
+        auto array = std::make_shared<dt::OArrowArray>();
+        batches[k].invoke("_export_to_c", py::oint(array->intptr()));
+        xassert(static_cast<size_t>((*array)->n_children) == ncols);
+        for (size_t j = 0; j < ncols; ++j) {
+          const ArrowSchema* colschema = schema->children[j];
+          if (dt::stype_from_arrow_schema(colschema) == dt::SType::INVALID) {
+            continue;
+          }
+          chunks[j].push_back(
+              dt::column_from_arrow(array, (*array)->children[j], colschema));
+        }
+      }
+
+      py::olist colnames(0);
+      for (size_t j = 0; j < ncols; ++j) {
+        const ArrowSchema* colschema = schema->children[j];
+        dt::SType stype = dt::stype_from_arrow_schema(colschema);
+        if (stype == dt::SType::INVALID) {
+          py::oobj colsrc = pasrc.invoke("column", py::oint(j));
+          make_column(colsrc.invoke("to_pylist"), dt::SType::VOID);
+        } else {
+          Column col = chunks[j].empty()? Column::new_na_column(0, stype) :
+                       chunks[j].size() == 1? std::move(chunks[j][0]) :
+                       Column(new dt::Rbound_ColumnImpl(chunks[j]));
+          check_nrows(col.nrows());
+          cols.push_back(std::move(col));
+        }
+        if (!names_arg) {
+          colnames.append(py::ostring(colschema->name? colschema->name : ""));
+        }
+      }
+      if (names_arg) {
+        make_datatable(names_arg);
+      } else {
+        make_datatable(colnames);
+      }
+    }
+
 
 
   //----------------------------------------------------------------------------
@@ -122,16 +122,28 @@ static void cast_fw0(const Column& col, size_t start, void* out_data)
 }
 
 
+// Generic iterator for virtual columns: the values are retrieved in
+// batches via `get_elements()`, which avoids a virtual call per row.
+//
 template <typename T, typename U, U(*CAST_OP)(T)>
 static void cast_fw2(const Column& col, void* out_data)
 {
+  constexpr size_t BATCH = Column::BATCH_SIZE;
   auto out = static_cast<U*>(out_data);
-  dt::parallel_for_static(col.nrows(),
+  size_t nrows = col.nrows();
+  size_t nbatches = (nrows + BATCH - 1) / BATCH;
+  dt::parallel_for_static(nbatches,
+    dt::ChunkSize(4),
     dt::NThreads(col.allow_parallel_access()),
-    [=](size_t i) {
-      T value;
-      bool isvalid = col.get_element(i, &value);
-      out[i] = isvalid? CAST_OP(value) : dt::GETNA<U>();
+    [=](size_t k) {
+      T values[BATCH];
+      bool valid[BATCH];
+      size_t i0 = k * BATCH;
+      size_t n = std::min(BATCH, nrows - i0);
+      col.get_elements(i0, n, values, valid);
+      for (size_t j = 0; j < n; ++j) {
+        out[i0 + j] = valid[j]? CAST_OP(values[j]) : dt::GETNA<U>();
+      }
     });
 }
 
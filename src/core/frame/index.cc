@@ -0,0 +1,260 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include "frame/py_frame.h"
+#include "python/list.h"
+#include "python/string.h"
+#include "python/tuple.h"
+#include "group_cache.h"
+
+
+
+//------------------------------------------------------------------------------
+// py::Frame API
+//------------------------------------------------------------------------------
+namespace py {
+
+
+// Convert the argument `cols` of `.create_index()` / `.drop_index()`
+// into a list of column indices.
+static sztvec _resolve_columns(const DataTable* dt, const Arg& cols) {
+  sztvec indices;
+  auto resolve = [&](robj item) -> size_t {
+    if (item.is_string()) return dt->xcolindex(item);
+    if (item.is_int()) return dt->xcolindex(item.to_int64_strict());
+    throw TypeError() << cols.name() << " should be a column name or "
+        "index, or a list of those; instead it contained a " << item.typeobj();
+  };
+  if (cols.is_list_or_tuple()) {
+    olist collist = cols.to_pylist();
+    for (size_t i = 0; i < collist.size(); ++i) {
+      indices.push_back(resolve(collist[i]));
+    }
+  } else {
+    indices.push_back(resolve(cols.to_robj()));
+  }
+  return indices;
+}
+
+
+
+//------------------------------------------------------------------------------
+// .create_index()
+//------------------------------------------------------------------------------
+
+static const char* doc_create_index =
+R"(create_index(self, cols)
+--
+
+Create an index on each of the columns `cols`.
+
+An index is the sorted order of the rows of a column, which is stored
+alongside the frame. The filters in ``DT[i, ...]`` that compare an
+indexed column with a scalar value, such as ``f.A == value`` or
+``f.A >= value``, or combine several such comparisons on the same
+column with ``&`` and ``|``, are then resolved via a binary search in
+the index instead of scanning every row of the frame. This makes
+repeated single-key lookups into a large frame very fast.
+
+The index is kept up-to-date automatically: when the column is
+modified, or the rows of the frame change, the index is rebuilt the
+next time it is used. Indexes are preserved by :meth:`.copy()`, and
+survive the removal of other columns.
+
+Unlike :attr:`.key`, an index does not change the order of rows in
+the frame, and the values in the column need not be unique.
+
+
+Parameters
+----------
+cols: str | int | List[str | int]
+    The name or index of the column to be indexed, or a list of such
+    columns. A separate index is created for each column.
+
+(return): None
+
+(except): KeyError | IndexError
+    Raised when `cols` contains a column that does not exist in the
+    frame.
+
+
+Examples
+--------
+>>> DT = dt.Frame(A=[5, 3, 8, 3, 1], B=range(5))
+>>> DT.create_index("A")
+>>> DT.indexes
+('A',)
+>>> DT[f.A == 3, :]
+   |  A   B
+-- + --  --
+ 0 |  3   1
+ 1 |  3   3
+--
+[2 rows x 2 columns]
+
+
+See also
+--------
+- :meth:`.drop_index()` -- remove the indexes.
+)";
+
+static PKArgs args_create_index(
+    1, 0, 0, false, false, {"cols"}, "create_index", doc_create_index);
+
+
+void Frame::create_index(const PKArgs& args) {
+  if (!args[0]) {
+    throw TypeError() << "Frame.create_index() is missing the required "
+                         "positional argument `cols`";
+  }
+  sztvec indices = _resolve_columns(dt, args[0]);
+  for (size_t i : indices) {
+    dt->create_index(i);
+  }
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// .drop_index()
+//------------------------------------------------------------------------------
+
+static const char* doc_drop_index =
+R"(drop_index(self, cols=None)
+--
+
+Remove the indexes on the columns `cols`, or all indexes in the frame
+if `cols` is not given.
+
+Parameters
+----------
+cols: str | int | List[str | int] | None
+    The column(s) whose indexes should be removed. It is not an error
+    if some of these columns are not indexed.
+
+(return): None
+
+
+See also
+--------
+- :meth:`.create_index()` -- create an index on a column.
+)";
+
+static PKArgs args_drop_index(
+    0, 1, 0, false, false, {"cols"}, "drop_index", doc_drop_index);
+
+
+void Frame::drop_index(const PKArgs& args) {
+  sztvec indices = args[0].is_none_or_undefined()
+                      ? dt->get_indexed_columns()
+                      : _resolve_columns(dt, args[0]);
+  for (size_t i : indices) {
+    dt->drop_index(i);
+  }
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// .indexes
+//------------------------------------------------------------------------------
+
+static const char* doc_indexes =
+R"(
+The tuple of names of the columns that have an index.
+
+The indexes are created with :meth:`.create_index()`, and removed
+with :meth:`.drop_index()`.
+
+Parameters
+----------
+(return): Tuple[str, ...]
+    The names of the indexed columns, in the order in which these
+    columns appear in the frame.
+)";
+
+static GSArgs args_indexes("indexes", doc_indexes);
+
+
+oobj Frame::get_indexes() const {
+  sztvec indices = dt->get_indexed_columns();
+  const strvec& names = dt->get_names();
+  otuple res(indices.size());
+  for (size_t i = 0; i < indices.size(); ++i) {
+    res.set(i, ostring(names[indices[i]]));
+  }
+  return std::move(res);
+}
+
+
+
+void Frame::_init_index(XTypeMaker& xt) {
+  xt.add(METHOD(&Frame::create_index, args_create_index));
+  xt.add(METHOD(&Frame::drop_index, args_drop_index));
+  xt.add(GETTER(&Frame::get_indexes, args_indexes));
+}
+
+
+}  // namespace py
+
+
+
+
+//------------------------------------------------------------------------------
+// DataTable API
+//------------------------------------------------------------------------------
+
+// Create an index on column `i`, and build it right away.
+void DataTable::create_index(size_t i) {
+  xassert(i < ncols_);
+  get_group_cache()->add_index(i);
+  get_index(i);
+}
+
+
+void DataTable::drop_index(size_t i) {
+  if (group_cache_) group_cache_->remove_index(i);
+}
+
+
+bool DataTable::has_index(size_t i) const {
+  return group_cache_ && group_cache_->has_index(i);
+}
+
+
+bool DataTable::has_indexes() const {
+  return group_cache_ && group_cache_->has_indexes();
+}
+
+
+sztvec DataTable::get_indexed_columns() const {
+  return group_cache_? group_cache_->indexed_columns() : sztvec();
+}
+
+
+// Return the index of column `i` (which must exist), rebuilding it
+// if necessary.
+const RiGb& DataTable::get_index(size_t i) const {
+  xassert(has_index(i));
+  return group_cache_->get_index(i, columns_[i]);
+}
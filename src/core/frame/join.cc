@@ -19,15 +19,18 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <cstring>      // std::memcpy
 #include <limits>       // std::numeric_limits
 #include <memory>       // std::unique_ptr
 #include <type_traits>  // std::is_integral
 #include <vector>       // std::vector
+#include "models/murmurhash.h"
 #include "parallel/api.h"
 #include "python/args.h"
 #include "python/obj.h"
 #include "python/tuple.h"
 #include "utils/assert.h"
+#include "utils/hash.h"
 #include "column.h"
 #include "datatable.h"
 #include "datatablemodule.h"
@@ -98,19 +101,45 @@ static cmpptr _make_comparator(const DataTable& Xdt, const DataTable& Jdt,
  *     or 0 depending if the row-value is greater than, less than, or equal
  *     to the value stored.
  *
+ *   hash_xrow() -> uint64_t
+ *     Return the hash of the value from the X frame stored during the
+ *     previous `set_xrow()` call.
+ *
+ *   hash_jrow(size_t row) -> uint64_t
+ *     Return the hash of the `row`th value in the J frame. The hashes are
+ *     consistent with `cmp_jrow()`: if `cmp_jrow(row)` returns 0, then
+ *     `hash_jrow(row) == hash_xrow()`.
+ *
  * This comparison function is then used as the basis for the binary search
- * algorithm to perform a join between two tables.
+ * algorithm to perform a join between two tables. The hash functions are
+ * used by the hash join algorithm.
  */
 class Cmp {
   public:
     virtual ~Cmp();
     virtual int cmp_jrow(size_t row) const = 0;
     virtual int set_xrow(size_t row) = 0;
+    virtual uint64_t hash_xrow() const = 0;
+    virtual uint64_t hash_jrow(size_t row) const = 0;
 };
 
 Cmp::~Cmp() {}
 
 
+using dt::NA_HASH;
+using dt::mix_hash;
+
+// Hash of a fixed-width value. Floating-point zeros are normalized, since
+// `0.0` and `-0.0` compare equal.
+template <typename T>
+static inline uint64_t _hash_value(T value) {
+  if (value == 0) return mix_hash(0);
+  uint64_t bits = 0;
+  std::memcpy(&bits, &value, sizeof(T));
+  return mix_hash(bits);
+}
+
+
 
 //------------------------------------------------------------------------------
 // MultiCmp
@@ -125,6 +154,8 @@ class MultiCmp : public Cmp {
              const sztvec& Xindices, const sztvec& Jindices);
     int set_xrow(size_t row) override;
     int cmp_jrow(size_t row) const override;
+    uint64_t hash_xrow() const override;
+    uint64_t hash_jrow(size_t row) const override;
 };
 
 static cmpptr _make_comparatorM(const DataTable& Xdt, const DataTable& Jdt,
@@ -160,6 +191,22 @@ int MultiCmp::cmp_jrow(size_t row) const {
   return 0;
 }
 
+uint64_t MultiCmp::hash_xrow() const {
+  uint64_t h = 0;
+  for (const cmpptr& ch : col_cmps) {
+    h = mix_hash(h ^ ch->hash_xrow());
+  }
+  return h;
+}
+
+uint64_t MultiCmp::hash_jrow(size_t row) const {
+  uint64_t h = 0;
+  for (const cmpptr& ch : col_cmps) {
+    h = mix_hash(h ^ ch->hash_jrow(row));
+  }
+  return h;
+}
+
 
 
 //------------------------------------------------------------------------------
@@ -181,6 +228,8 @@ class FwCmp : public Cmp {
 
     int cmp_jrow(size_t row) const override;
     int set_xrow(size_t row) override;
+    uint64_t hash_xrow() const override;
+    uint64_t hash_jrow(size_t row) const override;
 };
 
 
@@ -235,6 +284,20 @@ int FwCmp<TX, TJ>::set_xrow(size_t row) {
 }
 
 
+template <typename TX, typename TJ>
+uint64_t FwCmp<TX, TJ>::hash_xrow() const {
+  return x_valid? _hash_value<TJ>(x_value) : NA_HASH;
+}
+
+
+template <typename TX, typename TJ>
+uint64_t FwCmp<TX, TJ>::hash_jrow(size_t row) const {
+  TJ j_value;
+  bool j_valid = colJ.get_element(row, &j_value);
+  return j_valid? _hash_value<TJ>(j_value) : NA_HASH;
+}
+
+
 
 //------------------------------------------------------------------------------
 // String Cmp
@@ -252,6 +315,8 @@ class StringCmp : public Cmp {
 
     int cmp_jrow(size_t row) const override;
     int set_xrow(size_t row) override;
+    uint64_t hash_xrow() const override;
+    uint64_t hash_jrow(size_t row) const override;
 };
 
 
@@ -292,6 +357,20 @@ int StringCmp::set_xrow(size_t row) {
 }
 
 
+uint64_t StringCmp::hash_xrow() const {
+  if (x_value.isna()) return NA_HASH;
+  return hash_murmur2(x_value.ch, static_cast<uint64_t>(x_value.size));
+}
+
+
+uint64_t StringCmp::hash_jrow(size_t row) const {
+  CString j_value;
+  bool j_valid = colJ.get_element(row, &j_value);
+  if (!j_valid) return NA_HASH;
+  return hash_murmur2(j_value.ch, static_cast<uint64_t>(j_value.size));
+}
+
+
 
 //------------------------------------------------------------------------------
 // Comparators for different stypes
@@ -392,6 +471,65 @@ static size_t binsearch(Cmp* cmp, size_t nrows) {
 }
 
 
+/**
+ * Hash table over the rows of the J frame, used for the hash join. The
+ * table uses open addressing with linear probing; each slot contains
+ * either a row index in J, or -1 if the slot is empty. Since the J frame
+ * is keyed, all of its rows are distinct, and there is no need to
+ * check for duplicates when building the table.
+ *
+ * Once built, the table is read-only and can be probed from multiple
+ * threads simultaneously, each using its own comparator.
+ */
+class JoinHashTable {
+  private:
+    std::vector<int32_t> slots_;
+    std::vector<uint64_t> jhashes_;
+    size_t mask_;
+
+  public:
+    JoinHashTable(Cmp* cmp, size_t jnrows) {
+      size_t nslots = 16;
+      while (nslots < 2 * jnrows) nslots *= 2;
+      mask_ = nslots - 1;
+      slots_.resize(nslots, -1);
+      jhashes_.resize(jnrows);
+      // `cmp` is not thread-safe, however `hash_jrow()` is a const method
+      // that does not touch the comparator's state.
+      dt::parallel_for_static(jnrows,
+        [&](size_t j) {
+          jhashes_[j] = cmp->hash_jrow(j);
+        });
+      for (size_t j = 0; j < jnrows; ++j) {
+        size_t k = jhashes_[j] & mask_;
+        while (slots_[k] >= 0) k = (k + 1) & mask_;
+        slots_[k] = static_cast<int32_t>(j);
+      }
+    }
+
+    // Find the row in J matching the row in X that was selected in `cmp`
+    // via `set_xrow()`. Returns NA if there is no such row.
+    int32_t probe(const Cmp* cmp) const {
+      uint64_t h = cmp->hash_xrow();
+      size_t k = h & mask_;
+      while (true) {
+        int32_t j = slots_[k];
+        if (j < 0) return RowIndex::NA<int32_t>;
+        if (jhashes_[static_cast<size_t>(j)] == h &&
+            cmp->cmp_jrow(static_cast<size_t>(j)) == 0) return j;
+        k = (k + 1) & mask_;
+      }
+    }
+};
+
+
+// The hash join is used when the X frame has at least this many times
+// more rows than the J frame. Otherwise the cost of building the hash
+// table is not offset by the cheaper lookups, compared to the binary
+// search in the (already sorted) J frame.
+static constexpr size_t HASH_JOIN_RATIO = 4;
+
+
 
 // declared in datatable.h
 RowIndex natural_join(const DataTable& xdt, const DataTable& jdt) {
@@ -424,6 +562,23 @@ RowIndex natural_join(const DataTable& xdt, const DataTable& jdt) {
           result_indices[i] = RowIndex::NA<int32_t>;
         });
     }
+    else if (xdt.nrows() >= HASH_JOIN_RATIO * jdt.nrows()) {
+      // Creating the comparator may fail if xcols and jcols are incompatible
+      cmpptr jcomparator = _make_comparator(xdt, jdt, xcols, jcols);
+      JoinHashTable table(jcomparator.get(), jdt.nrows());
+
+      dt::parallel_region(dt::NThreads(nchunks),
+        [&] {
+          cmpptr comparator = _make_comparator(xdt, jdt, xcols, jcols);
+
+          dt::nested_for_static(xdt.nrows(),
+            [&](size_t i) {
+              int r = comparator->set_xrow(i);
+              result_indices[i] = (r == 0)? table.probe(comparator.get())
+                                          : RowIndex::NA<int32_t>;
+            });
+        });
+    }
     else {
       dt::parallel_region(dt::NThreads(nchunks),
         [&] {
@@ -449,6 +604,203 @@ RowIndex natural_join(const DataTable& xdt, const DataTable& jdt) {
 
 
 
+
+/**
+ * General join between frames X and J on columns `xcols` (in X) and
+ * `jcols` (in J). Unlike `natural_join()`, frame J does not have to be
+ * keyed, and a row in X may match any number of rows in J. The frame X
+ * is viewed through the rowindex `xri` (which may be empty).
+ *
+ * The function returns a pair of rowindices (RX, RJ) of the same length,
+ * so that row `i` of the result is composed from row `RX[i]` of X (as
+ * viewed through `xri`) and row `RJ[i]` of J. The rows are ordered by their index in X, and the
+ * matching rows of J follow in their natural order. Depending on the
+ * join type `how`:
+ *
+ *   LEFT:  the rows of X without a match are retained, with RJ = NA;
+ *   INNER: the rows of X without a match are dropped;
+ *   OUTER: same as LEFT, and additionally the rows of J that did not
+ *          match any row in X are appended at the end, with RX = NA.
+ *
+ * The algorithm first groups the rows of J by their keys using a hash
+ * table, then probes the table for every row of X in parallel. Finally,
+ * the output rowindices are filled in parallel too, using the per-chunk
+ * output offsets computed from the group sizes.
+ */
+std::pair<RowIndex, RowIndex> join_rowindices(
+    const DataTable& xdt, const RowIndex& xri, const sztvec& xcols,
+    const DataTable& jdt, const sztvec& jcols, JoinType how)
+{
+  xassert(xcols.size() == jcols.size() && !xcols.empty());
+  // The frame containing only the key columns of X, viewed through `xri`
+  colvec xkeycols;
+  strvec xkeynames;
+  sztvec xkeyindices;
+  for (size_t i = 0; i < xcols.size(); ++i) {
+    xkeycols.push_back(xdt.get_column(xcols[i]));
+    xkeycols.back().apply_rowindex(xri);
+    xkeynames.push_back(xdt.get_names()[xcols[i]]);
+    xkeyindices.push_back(i);
+  }
+  DataTable xkeys(std::move(xkeycols), xkeynames, false);
+  size_t xnrows = xkeys.nrows();
+  size_t jnrows = jdt.nrows();
+  if (jnrows > size_t(INT32_MAX) || xnrows > size_t(INT32_MAX)) {
+    throw NotImplError() << "Joining frames with more than " << INT32_MAX
+        << " rows is not supported";
+  }
+
+  // Creating the comparator may fail if xcols and jcols are incompatible
+  cmpptr xjcmp = _make_comparator(xkeys, jdt, xkeyindices, jcols);
+  cmpptr jjcmp = _make_comparator(jdt, jdt, jcols, jcols);
+
+  // Step 1: group the rows of J by their keys. Each slot in the hash table
+  // refers to one group, represented by its first row. Within a group, the
+  // rows are chained via `jnext` in increasing order.
+  std::vector<uint64_t> jhashes(jnrows);
+  dt::parallel_for_static(jnrows,
+    [&](size_t j) {
+      jhashes[j] = xjcmp->hash_jrow(j);
+    });
+  size_t nslots = 16;
+  while (nslots < 2 * jnrows) nslots *= 2;
+  size_t mask = nslots - 1;
+  std::vector<int32_t> slots(nslots, -1);
+  std::vector<int32_t> jgroup(jnrows);   // group id of each row in J
+  std::vector<int32_t> jnext(jnrows, -1);
+  std::vector<int32_t> glast;            // last row in each group
+  std::vector<int32_t> gfirst;           // first row in each group
+  std::vector<int32_t> gsize;            // number of rows in each group
+  for (size_t j = 0; j < jnrows; ++j) {
+    uint64_t h = jhashes[j];
+    size_t k = h & mask;
+    jjcmp->set_xrow(j);
+    while (true) {
+      int32_t g = slots[k];
+      if (g < 0) {
+        g = static_cast<int32_t>(gfirst.size());
+        slots[k] = g;
+        gfirst.push_back(static_cast<int32_t>(j));
+        glast.push_back(static_cast<int32_t>(j));
+        gsize.push_back(1);
+        jgroup[j] = g;
+        break;
+      }
+      size_t r = static_cast<size_t>(gfirst[static_cast<size_t>(g)]);
+      if (jhashes[r] == h && jjcmp->cmp_jrow(r) == 0) {
+        size_t gg = static_cast<size_t>(g);
+        jnext[static_cast<size_t>(glast[gg])] = static_cast<int32_t>(j);
+        glast[gg] = static_cast<int32_t>(j);
+        gsize[gg]++;
+        jgroup[j] = g;
+        break;
+      }
+      k = (k + 1) & mask;
+    }
+  }
+
+  // Step 2: for each row in X find the matching group in J, and count the
+  // number of output rows produced by each chunk of X.
+  std::vector<int32_t> xgroup(xnrows, -1);
+  size_t nthreads = dt::num_threads_in_pool();
+  size_t nchunks = std::max(std::min(nthreads, xnrows / 1000), size_t(1));
+  size_t chunk_size = (xnrows + nchunks - 1) / nchunks;
+  std::vector<size_t> chunk_offsets(nchunks + 1, 0);
+  bool keep_unmatched = (how != JoinType::INNER);
+  dt::parallel_region(dt::NThreads(nchunks),
+    [&] {
+      cmpptr cmp = _make_comparator(xkeys, jdt, xkeyindices, jcols);
+      dt::nested_for_static(nchunks, dt::ChunkSize(1),
+        [&](size_t c) {
+          size_t i0 = c * chunk_size;
+          size_t i1 = std::min(i0 + chunk_size, xnrows);
+          size_t count = 0;
+          for (size_t i = i0; i < i1; ++i) {
+            int32_t g = -1;
+            if (jnrows && cmp->set_xrow(i) == 0) {
+              uint64_t h = cmp->hash_xrow();
+              for (size_t k = h & mask; slots[k] >= 0; k = (k + 1) & mask) {
+                size_t r = static_cast<size_t>(gfirst[static_cast<size_t>(slots[k])]);
+                if (jhashes[r] == h && cmp->cmp_jrow(r) == 0) {
+                  g = slots[k];
+                  break;
+                }
+              }
+            }
+            xgroup[i] = g;
+            count += (g >= 0)? static_cast<size_t>(gsize[static_cast<size_t>(g)])
+                             : keep_unmatched;
+          }
+          chunk_offsets[c + 1] = count;
+        });
+    });
+  for (size_t c = 0; c < nchunks; ++c) {
+    chunk_offsets[c + 1] += chunk_offsets[c];
+  }
+
+  // Rows of J that were not matched by any row of X (OUTER join only)
+  std::vector<int32_t> junmatched;
+  if (how == JoinType::OUTER) {
+    std::vector<int8_t> gmatched(gfirst.size(), 0);
+    for (size_t i = 0; i < xnrows; ++i) {
+      if (xgroup[i] >= 0) gmatched[static_cast<size_t>(xgroup[i])] = 1;
+    }
+    for (size_t j = 0; j < jnrows; ++j) {
+      if (!gmatched[static_cast<size_t>(jgroup[j])]) {
+        junmatched.push_back(static_cast<int32_t>(j));
+      }
+    }
+  }
+
+  size_t nout = chunk_offsets[nchunks] + junmatched.size();
+  if (nout > size_t(INT32_MAX)) {
+    throw NotImplError() << "The result of a join would have " << nout
+        << " rows, which is more than the supported maximum of "
+        << INT32_MAX;
+  }
+
+  // Step 3: fill the output rowindices
+  Buffer xbuf = Buffer::mem(nout * sizeof(int32_t));
+  Buffer jbuf = Buffer::mem(nout * sizeof(int32_t));
+  int32_t* xout = static_cast<int32_t*>(xbuf.xptr());
+  int32_t* jout = static_cast<int32_t*>(jbuf.xptr());
+  dt::parallel_for_static(nchunks, dt::ChunkSize(1),
+    [&](size_t c) {
+      size_t i0 = c * chunk_size;
+      size_t i1 = std::min(i0 + chunk_size, xnrows);
+      size_t pos = chunk_offsets[c];
+      for (size_t i = i0; i < i1; ++i) {
+        int32_t g = xgroup[i];
+        if (g >= 0) {
+          int32_t j = gfirst[static_cast<size_t>(g)];
+          while (j >= 0) {
+            xout[pos] = static_cast<int32_t>(i);
+            jout[pos] = j;
+            pos++;
+            j = jnext[static_cast<size_t>(j)];
+          }
+        } else if (keep_unmatched) {
+          xout[pos] = static_cast<int32_t>(i);
+          jout[pos] = RowIndex::NA<int32_t>;
+          pos++;
+        }
+      }
+      xassert(pos == chunk_offsets[c + 1]);
+    });
+  size_t pos = chunk_offsets[nchunks];
+  for (int32_t j : junmatched) {
+    xout[pos] = RowIndex::NA<int32_t>;
+    jout[pos] = j;
+    pos++;
+  }
+
+  RowIndex rx(std::move(xbuf), RowIndex::ARR32);
+  RowIndex rj(std::move(jbuf), RowIndex::ARR32);
+  return std::make_pair(std::move(rx), std::move(rj));
+}
+
+
+
 void py::DatatableModule::init_methods_join() {
   _init_comparators();
 }
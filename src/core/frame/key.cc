@@ -193,6 +193,12 @@ void DataTable::set_key(std::vector<size_t>& col_indices) {
   xassert(col_indices.size() == ncols_);
 
   // Reorder the columns
+  sztvec new_positions(ncols_);
+  for (size_t i = 0; i < ncols_; ++i) {
+    new_positions[col_indices[i]] = i;
+  }
+  _remap_group_cache(new_positions);
+  _clear_group_cache();
   colvec new_columns;
   new_columns.reserve(ncols_);
   for (size_t i = 0; i < ncols_; ++i) {
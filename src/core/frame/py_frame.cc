@@ -448,6 +448,52 @@ void Frame::materialize(const PKArgs& args) {
 
 
 
+//------------------------------------------------------------------------------
+// Lazy
+//------------------------------------------------------------------------------
+
+static const char* doc_lazy =
+R"(lazy(self)
+--
+
+Return a lazy view of this Frame, which records the ``[]`` selectors
+applied to it instead of evaluating them immediately.
+
+Each ``DT[i, j, ...]`` call creates a new Frame, so that a chain of
+such calls materializes all the intermediate frames, even though
+only the last one is needed. The ``LazyFrame`` returned by this method
+accumulates the chain of ``[i, j, by(), join(), sort()]`` calls, and
+only evaluates it when ``.collect()`` is called. Before evaluation the
+chain is optimized: consecutive filters are merged, the columns
+computed in one step are substituted into the next step, and columns
+that are not used by the subsequent steps are not computed (or joined).
+
+The result of ``.collect()`` is always the same as if the chain of
+selectors was applied to the Frame directly.
+
+
+Parameters
+----------
+(return): LazyFrame
+    A lazy view of the current frame, with no selectors applied yet.
+
+Examples
+--------
+>>> DT = dt.Frame(A=range(10), B=[i % 3 for i in range(10)])
+>>> LF = DT.lazy()[f.A > 2, :][:, {"X": f.A * 2, "B": f.B}]
+>>> LF[:, sum(f.X), by(f.B)].collect().to_list()
+[[0, 1, 2], [36, 22, 26]]
+)";
+
+static PKArgs args_lazy(0, 0, 0, false, false, {}, "lazy", doc_lazy);
+
+oobj Frame::lazy(const PKArgs&) {
+  return oobj::import("datatable.lazy", "LazyFrame").call({oobj(this)});
+}
+
+
+
+
 //------------------------------------------------------------------------------
 // .ncols
 //------------------------------------------------------------------------------
@@ -665,6 +711,7 @@ void Frame::impl_init_type(XTypeMaker& xt) {
 
   _init_cbind(xt);
   _init_key(xt);
+  _init_index(xt);
   _init_init(xt);
   _init_iter(xt);
   _init_jay(xt);
@@ -676,6 +723,7 @@ void Frame::impl_init_type(XTypeMaker& xt) {
   _init_stats(xt);
   _init_sort(xt);
   _init_newsort(xt);
+  _init_toarrow(xt);
   _init_tocsv(xt);
   _init_tonumpy(xt);
   _init_topython(xt);
@@ -692,6 +740,7 @@ void Frame::impl_init_type(XTypeMaker& xt) {
   xt.add(METHOD(&Frame::head, args_head));
   xt.add(METHOD(&Frame::tail, args_tail));
   xt.add(METHOD(&Frame::copy, args_copy));
+  xt.add(METHOD(&Frame::lazy, args_lazy));
   xt.add(METHOD(&Frame::materialize, args_materialize));
   xt.add(METHOD(&Frame::export_names, args_export_names));
   xt.add(METHOD0(&Frame::get_names, "keys"));
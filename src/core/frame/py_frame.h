@@ -44,6 +44,7 @@ class Frame : public XObject<Frame> {
   public:
     static void impl_init_type(XTypeMaker&);
     static void _init_cbind(XTypeMaker&);
+    static void _init_index(XTypeMaker&);
     static void _init_init(XTypeMaker&);
     static void _init_iter(XTypeMaker&);
     static void _init_jay(XTypeMaker&);
@@ -56,6 +57,7 @@ class Frame : public XObject<Frame> {
     static void _init_sort(XTypeMaker&);
     static void _init_newsort(XTypeMaker&);
     static void _init_stats(XTypeMaker&);
+    static void _init_toarrow(XTypeMaker&);
     static void _init_tocsv(XTypeMaker&);
     static void _init_tonumpy(XTypeMaker&);
     static void _init_topython(XTypeMaker&);
@@ -95,6 +97,7 @@ class Frame : public XObject<Frame> {
     oobj newview(const PKArgs&);
 
     // Getters/setters
+    oobj get_indexes() const;
     oobj get_key() const;
     oobj get_ltypes() const;
     oobj get_names() const;
@@ -113,7 +116,10 @@ class Frame : public XObject<Frame> {
     void cbind(const PKArgs&);
     oobj colindex(const PKArgs&);
     oobj copy(const PKArgs&);
+    void create_index(const PKArgs&);
+    void drop_index(const PKArgs&);
     oobj head(const PKArgs&);
+    oobj lazy(const PKArgs&);
     void materialize(const PKArgs&);
     void rbind(const PKArgs&);
     void repeat(const PKArgs&);
@@ -124,6 +130,7 @@ class Frame : public XObject<Frame> {
     oobj export_names(const PKArgs&);
 
     // Conversion methods
+    oobj to_arrow(const PKArgs&);
     oobj to_csv(const PKArgs&);
     oobj to_dict(const PKArgs&);
     oobj to_jay(const PKArgs&);  // See jay/save_jay.cc
@@ -142,6 +149,7 @@ class Frame : public XObject<Frame> {
     // Called once during module start-up
     static void init_names_options();
     static void init_display_options();
+    static void init_tocsv_options();
 
   private:
     static bool internal_construction;
@@ -314,6 +314,7 @@ void DataTable::rbind(
   size_t new_ncols = col_indices.size();
   xassert(new_ncols >= ncols_);
   xassert(nkeys_ == 0);
+  _clear_group_cache();
 
   columns_.reserve(new_ncols);
   for (size_t i = ncols_; i < new_ncols; ++i) {
@@ -0,0 +1,89 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include "arrow/arrow_array.h"
+#include "frame/py_frame.h"
+#include "python/_all.h"
+#include "python/args.h"
+namespace py {
+
+
+//------------------------------------------------------------------------------
+// to_arrow()
+//------------------------------------------------------------------------------
+
+static PKArgs args_to_arrow(
+    0, 0, 0, false, false, {}, "to_arrow",
+
+R"(to_arrow(self)
+--
+
+Convert this frame into a pyarrow Table.
+
+The `pyarrow` module is required to run this function.
+
+The data is passed to pyarrow via the Arrow C Data Interface, and
+wherever possible the buffers are shared between the frame and the
+Table, without copying. New buffers are only created for the NA
+bitmaps, for the boolean columns, and for the string columns that
+contain NAs. The shared data remains valid even if this frame is
+modified or deleted later.
+
+Columns of type `obj64` cannot be converted.
+)");
+
+
+oobj Frame::to_arrow(const PKArgs&) {
+  // ```
+  // import pyarrow
+  // ```
+  oobj pyarrow = oobj::import("pyarrow");
+
+  dt::OArrowArray array;
+  dt::OArrowSchema schema;
+  dt::frame_to_arrow(dt, array.get(), schema.get());
+
+  // ```
+  // batch = pyarrow.RecordBatch._import_from_c(array, schema)
+  // return pyarrow.Table.from_batches([batch])
+  // ```
+  // After the import, the structures `array` and `schema` are marked as
+  // released, and pyarrow becomes responsible for releasing their data.
+  oobj batch = pyarrow.get_attr("RecordBatch").invoke("_import_from_c",
+      otuple{oint(array.intptr()), oint(schema.intptr())});
+  olist batches(1);
+  batches.set(0, batch);
+  return pyarrow.get_attr("Table").invoke("from_batches", batches);
+}
+
+
+
+//------------------------------------------------------------------------------
+// Declare Frame methods
+//------------------------------------------------------------------------------
+
+void Frame::_init_toarrow(XTypeMaker& xt) {
+  xt.add(METHOD(&Frame::to_arrow, args_to_arrow));
+}
+
+
+
+}  // namespace py
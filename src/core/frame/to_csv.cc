@@ -36,6 +36,33 @@ static void change_to_lowercase(std::string& str) {
 
 
 
+//------------------------------------------------------------------------------
+// Options
+//------------------------------------------------------------------------------
+
+static int compression_level = 6;
+
+void Frame::init_tocsv_options() {
+  dt::register_option(
+    "to_csv.compression_level",
+    []{ return py::oint(compression_level); },
+    [](const py::Arg& value) {
+      int32_t level = value.to_int32_strict();
+      if (level < 0 || level > 9) {
+        throw ValueError() << "Invalid value for option "
+            "`to_csv.compression_level`: " << level << "; the value must "
+            "be an integer from 0 to 9";
+      }
+      compression_level = level;
+    },
+    "The level of gzip compression used by Frame.to_csv(), from 0 (no\n"
+    "compression) to 9 (the best compression). Lower levels are faster\n"
+    "to write, but produce larger files. The default level is 6.");
+}
+
+
+
+
 //------------------------------------------------------------------------------
 // Frame::to_csv()
 //------------------------------------------------------------------------------
@@ -117,7 +144,13 @@ compression: None | "gzip" | "auto"
     Which compression method to use for the output stream. The default
     is "auto", which tries to infer the compression method from the
     output file's name. The only compression format currently supported
-    is "gzip". Compression may not be used when `append` is True.
+    is "gzip".
+
+    The data is split into chunks, which are compressed in parallel
+    and written as separate gzip "members" one after another. When
+    appending to an existing file, the new members are simply added
+    at the end of that file. The compression level can be changed
+    via the option ``dt.options.to_csv.compression_level``.
 
 verbose: bool
     If True, some extra information will be printed to the console,
@@ -217,14 +250,11 @@ oobj Frame::to_csv(const PKArgs& args)
   bool compress = false;  // eventually this will be an Enum
   if (compress_str == "auto" || compress_str == "infer") {
     size_t n = filename.size();
-    compress = !append && (n > 3 && filename[n-3] == '.' &&
-                                    filename[n-2] == 'g' &&
-                                    filename[n-1] == 'z');
+    compress = (n > 3 && filename[n-3] == '.' &&
+                         filename[n-2] == 'g' &&
+                         filename[n-1] == 'z');
   } else if (compress_str == "gzip") {
     compress = true;
-    if (append) {
-      throw ValueError() << "Compression cannot be used in the 'append' mode";
-    }
   } else {
     throw ValueError() << "Unsupported compression method '"
         << compress_str << "' in Frame.to_csv()";
@@ -248,6 +278,7 @@ oobj Frame::to_csv(const PKArgs& args)
   writer.set_verbose(verbose);
   writer.set_quoting(quoting);
   writer.set_compression(compress);
+  writer.set_compression_level(compression_level);
   writer.write_main();
   return writer.get_result();
 }
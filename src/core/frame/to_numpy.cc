@@ -75,17 +75,11 @@ R"(to_numpy(self, stype=None)
 Convert frame into a 2D numpy array, optionally forcing it into the
 specified stype/dtype.
 
-In a limited set of circumstances the returned numpy array will be
-created as a data view, avoiding copying the data. This happens if
-all of these conditions are met:
-
-  - the frame is not a view;
-  - the frame has only 1 column;
-  - the column's type is not string;
-  - the `stype` argument was not used.
-
-In all other cases the returned numpy array will have a copy of the
-frame's data. If the frame has multiple columns of different stypes,
+The returned numpy array always has its own copy of the frame's data.
+The data is written directly into the memory of the resulting array
+(in Fortran order, i.e. column after column), so the peak memory usage
+of this method is approximately the size of the frame plus the size
+of the output. If the frame has multiple columns of different stypes,
 then the values will be upcasted into the smallest common stype.
 
 If the frame has any NA values, then the returned numpy array will
@@ -103,16 +97,31 @@ column: int
 )");
 
 
-oobj Frame::to_numpy(const PKArgs& args) {
+/**
+ * Convert the frame (or its column `force_col`) into a numpy array.
+ *
+ * The array is created via `numpy.asarray()`, so that whenever the data
+ * has to be converted, the buffer produced by `Frame::m__getbuffer__()`
+ * becomes the memory of the resulting array without any additional
+ * copying. However, when the frame consists of a single column that
+ * doesn't need conversion, the buffer is a read-only view onto the
+ * column's data (which is kept alive by the numpy array). Such view is
+ * returned only if `copy` is false, otherwise it is copied.
+ */
+static oobj frame_to_numpy(Frame* frame, dt::SType stype, size_t force_col,
+                           bool copy)
+{
+  DataTable* dt = frame->get_datatable();
   oobj numpy = oobj::import("numpy");
-  oobj nparray = numpy.get_attr("array");
-  dt::SType stype      = args.get<dt::SType>(0, dt::SType::VOID);
-  size_t force_col = args.get<size_t>(1, size_t(-1));
+  oobj nparray = numpy.get_attr("asarray");
 
   oobj res;
   {
     pybuffers_context ctx(stype, force_col);
-    res = nparray.call({oobj(this)});
+    res = nparray.call({oobj(frame)});
+  }
+  if (copy && !res.get_attr("flags").get_attr("writeable").to_bool_strict()) {
+    res = res.invoke("copy");
   }
 
   // If there are any columns with NAs, replace the numpy.array with
@@ -146,7 +155,14 @@ oobj Frame::to_numpy(const PKArgs& args) {
     DataTable* mask_dt = new DataTable({std::move(mask_col)},
                                        DataTable::default_names);
     oobj mask_frame = Frame::oframe(mask_dt);
+    // The mask is a read-only view onto `mask_col`, kept alive by the
+    // numpy array. Same as with the data, it has to be copied in order
+    // to make the returned masked array writable.
     oobj mask_array = nparray.call({mask_frame});
+    if (copy && !mask_array.get_attr("flags").get_attr("writeable")
+                           .to_bool_strict()) {
+      mask_array = mask_array.invoke("copy");
+    }
 
     mask_array = mask_array.invoke("reshape", {oint(ncols), oint(dt->nrows())})
                  .get_attr("T");
@@ -159,24 +175,47 @@ oobj Frame::to_numpy(const PKArgs& args) {
 }
 
 
+oobj Frame::to_numpy(const PKArgs& args) {
+  dt::SType stype  = args.get<dt::SType>(0, dt::SType::VOID);
+  size_t force_col = args.get<size_t>(1, size_t(-1));
+  return frame_to_numpy(this, stype, force_col, /* copy = */ true);
+}
+
+
 
 //------------------------------------------------------------------------------
 // to_pandas()
 //------------------------------------------------------------------------------
 
 static PKArgs args_to_pandas(
-    0, 0, 0, false, false, {}, "to_pandas",
+    0, 0, 1, false, false, {"copy"}, "to_pandas",
 
-R"(to_pandas(self)
+R"(to_pandas(self, *, copy=True)
 --
 
 Convert this frame to a pandas DataFrame.
 
 The `pandas` module is required to run this function.
+
+Parameters
+----------
+copy: bool
+    If True (default), the DataFrame will have its own copy of the
+    data. If False, then the columns that can be shared with pandas
+    will be passed to it as read-only views onto this frame's data,
+    without copying. This is possible for the numeric and boolean
+    columns without NAs, provided that they are not views themselves.
+    The other columns are copied.
+
+    Note that the shared columns cannot be modified in-place in the
+    resulting DataFrame. The data remains valid even if this frame
+    is modified or deleted later.
 )");
 
 
-oobj Frame::to_pandas(const PKArgs&) {
+oobj Frame::to_pandas(const PKArgs& args) {
+  bool copy = args[0].to<bool>(true);
+
   // ```
   // from pandas import DataFrame
   // names = self.names
@@ -190,19 +229,18 @@ oobj Frame::to_pandas(const PKArgs&) {
   //         for i in range(self.ncols)}
   // ```
   odict cols;
-  otuple np_call_args(2);
-  np_call_args.set(0, py::None());
   for (size_t i = 0; i < dt->ncols(); ++i) {
-    np_call_args.replace(1, oint(i));
-    args_to_numpy.bind(np_call_args.to_borrowed_ref(), nullptr);
     cols.set(names[i],
-             to_numpy(args_to_numpy));
+             frame_to_numpy(this, dt::SType::VOID, i, copy));
   }
   // ```
-  // return DataFrame(cols, columns=names)
+  // return DataFrame(cols, columns=names, copy=False)
   // ```
+  // All arrays in `cols` are either fresh copies, or the views that
+  // should not be copied; thus pandas doesn't need to copy them again.
   odict pd_call_kws;
   pd_call_kws.set(ostring("columns"), names);
+  pd_call_kws.set(ostring("copy"), py::False());
   return dataframe.call(otuple(cols), pd_call_kws);
 }
 
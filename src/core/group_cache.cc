@@ -0,0 +1,302 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>       // std::find
+#include "python/arg.h"
+#include "python/int.h"
+#include "utils/assert.h"
+#include "utils/exceptions.h"
+#include "group_cache.h"
+#include "options.h"
+namespace dt {
+
+
+// All GroupCache objects that currently exist. This is needed in order
+// to evict the least recently used entries across all frames.
+static std::vector<GroupCache*> all_caches;
+
+static size_t cache_size = 0;
+static size_t cache_limit = size_t(1) << 29;
+static size_t cache_clock = 0;
+static size_t cache_hits = 0;
+static size_t cache_misses = 0;
+
+
+
+//------------------------------------------------------------------------------
+// GroupCache
+//------------------------------------------------------------------------------
+
+GroupCache::GroupCache() {
+  all_caches.push_back(this);
+}
+
+GroupCache::~GroupCache() {
+  _clear_entries();
+  auto it = std::find(all_caches.begin(), all_caches.end(), this);
+  xassert(it != all_caches.end());
+  all_caches.erase(it);
+}
+
+
+// The key is a flat list `[by_keys, col0, flags0, col1, flags1, ...]`.
+GroupCache::Key GroupCache::make_key(
+    bool by_keys, const sztvec& cols, const std::vector<SortFlag>& flags)
+{
+  xassert(cols.size() == flags.size());
+  Key key;
+  key.reserve(1 + 2 * cols.size());
+  key.push_back(by_keys);
+  for (size_t i = 0; i < cols.size(); ++i) {
+    key.push_back(cols[i]);
+    key.push_back(static_cast<size_t>(flags[i]));
+  }
+  return key;
+}
+
+
+bool GroupCache::lookup(const Key& key, RiGb* out) {
+  auto it = entries_.find(key);
+  if (it == entries_.end()) {
+    cache_misses++;
+    return false;
+  }
+  cache_hits++;
+  it->second.last_used = ++cache_clock;
+  *out = it->second.rigb;
+  return true;
+}
+
+
+void GroupCache::store(const Key& key, const RiGb& rigb) {
+  const RowIndex& ri = rigb.first;
+  size_t elemsize = ri.isarr32()? sizeof(int32_t) :
+                    ri.isarr64()? sizeof(int64_t) : 0;
+  size_t size = ri.size() * elemsize +
+                (rigb.second.size() + 1) * sizeof(int32_t);
+  if (size > cache_limit) return;
+
+  auto it = entries_.find(key);
+  if (it != entries_.end()) _erase(it);
+  evict_until(cache_limit - size);
+  entries_[key] = Entry { rigb, size, ++cache_clock };
+  cache_size += size;
+}
+
+
+// Remove all entries where `i` is one of the key columns
+void GroupCache::invalidate_column(size_t i) {
+  for (auto it = entries_.begin(); it != entries_.end(); ) {
+    const Key& key = it->first;
+    bool found = false;
+    for (size_t k = 1; k < key.size(); k += 2) {
+      found |= (key[k] == i);
+    }
+    if (found) _erase(it++);
+    else ++it;
+  }
+  auto jt = indexes_.find(i);
+  if (jt != indexes_.end()) jt->second = RiGb();
+}
+
+
+// The column at position `i` has moved to position `new_positions[i]`,
+// or was removed if that value is `size_t(-1)`. Entries that depend
+// on the removed columns are dropped, the rest are re-keyed.
+void GroupCache::remap_columns(const sztvec& new_positions) {
+  constexpr size_t REMOVED = size_t(-1);
+  auto new_position = [&](size_t i) {
+    return i < new_positions.size()? new_positions[i] : REMOVED;
+  };
+  std::map<Key, Entry> new_entries;
+  for (auto it = entries_.begin(); it != entries_.end(); ) {
+    Key key = it->first;
+    bool removed = false;
+    for (size_t k = 1; k < key.size(); k += 2) {
+      key[k] = new_position(key[k]);
+      removed |= (key[k] == REMOVED);
+    }
+    if (removed) {
+      _erase(it++);
+    } else {
+      new_entries.emplace(std::move(key), std::move(it->second));
+      ++it;
+    }
+  }
+  entries_ = std::move(new_entries);
+
+  std::map<size_t, RiGb> new_indexes;
+  for (auto& kv : indexes_) {
+    size_t j = new_position(kv.first);
+    if (j != REMOVED) new_indexes.emplace(j, std::move(kv.second));
+  }
+  indexes_ = std::move(new_indexes);
+}
+
+
+// Called when the rows of the frame change: all entries are removed,
+// and all indexes become stale.
+void GroupCache::clear() {
+  _clear_entries();
+  for (auto& kv : indexes_) {
+    kv.second = RiGb();
+  }
+}
+
+
+void GroupCache::_erase(std::map<Key, Entry>::iterator it) {
+  xassert(cache_size >= it->second.size);
+  cache_size -= it->second.size;
+  entries_.erase(it);
+}
+
+
+void GroupCache::_clear_entries() {
+  while (!entries_.empty()) {
+    _erase(entries_.begin());
+  }
+}
+
+
+// Evict the least recently used entries (across all caches) until
+// the total size of the cached data is no more than `target_size`.
+void GroupCache::evict_until(size_t target_size) {
+  while (cache_size > target_size) {
+    GroupCache* lru_cache = nullptr;
+    std::map<Key, Entry>::iterator lru_entry;
+    for (GroupCache* gc : all_caches) {
+      for (auto it = gc->entries_.begin(); it != gc->entries_.end(); ++it) {
+        if (!lru_cache || it->second.last_used < lru_entry->second.last_used) {
+          lru_cache = gc;
+          lru_entry = it;
+        }
+      }
+    }
+    xassert(lru_cache);
+    lru_cache->_erase(lru_entry);
+  }
+}
+
+
+// The indexes are not affected, since they do not depend on the
+// grouping method.
+void GroupCache::clear_all() {
+  for (GroupCache* gc : all_caches) {
+    gc->_clear_entries();
+  }
+}
+
+
+size_t GroupCache::total_size() {
+  return cache_size;
+}
+
+size_t GroupCache::nhits() {
+  return cache_hits;
+}
+
+size_t GroupCache::nmisses() {
+  return cache_misses;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Indexes
+//------------------------------------------------------------------------------
+
+void GroupCache::add_index(size_t i) {
+  indexes_[i];  // creates a stale index, if it doesn't exist yet
+}
+
+void GroupCache::remove_index(size_t i) {
+  indexes_.erase(i);
+}
+
+bool GroupCache::has_index(size_t i) const {
+  return indexes_.count(i) > 0;
+}
+
+bool GroupCache::has_indexes() const {
+  return !indexes_.empty();
+}
+
+sztvec GroupCache::indexed_columns() const {
+  sztvec res;
+  for (const auto& kv : indexes_) {
+    res.push_back(kv.first);
+  }
+  return res;
+}
+
+
+// Return the index for column `i`, rebuilding it from `col` if it is
+// stale. The index is the result of sorting the column with NAs first,
+// i.e. a RowIndex that orders the rows by their values, and a Groupby
+// where each group contains the rows with the same value.
+const RiGb& GroupCache::get_index(size_t i, const Column& col) {
+  auto it = indexes_.find(i);
+  xassert(it != indexes_.end());
+  if (!it->second.second) {
+    it->second = group({col}, {SortFlag::NONE});
+  }
+  return it->second;
+}
+
+
+void GroupCache::copy_indexes_from(const GroupCache& other) {
+  indexes_ = other.indexes_;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Options
+//------------------------------------------------------------------------------
+
+void group_cache_init_options() {
+  register_option(
+    "groupby.cache_size",
+    []{ return py::oint(cache_limit); },
+    [](const py::Arg& value) {
+      int64_t n = value.to_int64_strict();
+      if (n < 0) {
+        throw ValueError() << "Option `groupby.cache_size` cannot be "
+            "negative: " << n;
+      }
+      cache_limit = static_cast<size_t>(n);
+      GroupCache::evict_until(cache_limit);
+    },
+    "The maximum amount of memory (in bytes) used for caching the\n"
+    "groupings and sort orders computed in `DT[i, j, by(...)]` and\n"
+    "`DT[i, j, sort(...)]`. When a frame is grouped by the same\n"
+    "columns again, the cached grouping is reused, provided that\n"
+    "those columns were not modified in the meanwhile. When the\n"
+    "total size of the cache exceeds this limit, the least recently\n"
+    "used groupings are discarded. Set this option to 0 in order to\n"
+    "disable the cache.");
+}
+
+
+
+}  // namespace dt
@@ -0,0 +1,117 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_GROUP_CACHE_h
+#define dt_GROUP_CACHE_h
+#include <map>
+#include <vector>
+#include "_dt.h"
+#include "column.h"
+#include "groupby.h"
+#include "rowindex.h"
+#include "sort.h"
+namespace dt {
+
+
+/**
+ * Cache of the groupings and sort orders computed for the columns of
+ * a DataTable.
+ *
+ * Computing `DT[:, j, by(...)]` or `DT[:, j, sort(...)]` requires
+ * sorting (or hashing) the key columns, producing a RowIndex that
+ * orders the rows, and a Groupby with the offsets of the groups. When
+ * the same frame is repeatedly grouped by the same columns, these
+ * objects can be reused, provided that the key columns did not change.
+ *
+ * Each entry in the cache is keyed by the indices of the key columns
+ * together with their sort flags. Whenever a column of the DataTable
+ * may have been modified, all entries that use that column are
+ * removed; operations that change the rows of the frame clear the
+ * cache entirely. When the columns of the frame are moved around,
+ * the entries are re-keyed (see `remap_columns()`).
+ *
+ * The total size of all cached entries across all frames is limited
+ * by the option `groupby.cache_size`. When this limit is exceeded,
+ * the least recently used entries are evicted.
+ *
+ * In addition, the cache holds the indexes created explicitly by the
+ * user (see `DataTable::create_index()`). An index is the sort order
+ * of a single column, and it is neither evicted nor counted towards
+ * the cache size limit. When the column is modified, the index
+ * becomes stale, and it is rebuilt the next time it is needed.
+ *
+ * The cache is only used from the main thread, while holding the GIL.
+ */
+class GroupCache {
+  public:
+    using Key = sztvec;
+
+  private:
+    struct Entry {
+      RiGb   rigb;
+      size_t size;
+      size_t last_used;
+    };
+    std::map<Key, Entry> entries_;
+    std::map<size_t, RiGb> indexes_;  // an empty RiGb is a stale index
+
+  public:
+    GroupCache();
+    GroupCache(const GroupCache&) = delete;
+    GroupCache& operator=(const GroupCache&) = delete;
+    ~GroupCache();
+
+    static Key make_key(bool by_keys, const sztvec& cols,
+                        const std::vector<SortFlag>& flags);
+
+    bool lookup(const Key& key, RiGb* out);
+    void store(const Key& key, const RiGb& rigb);
+    void invalidate_column(size_t i);
+    void remap_columns(const sztvec& new_positions);
+    void clear();
+
+    void add_index(size_t i);
+    void remove_index(size_t i);
+    bool has_index(size_t i) const;
+    bool has_indexes() const;
+    sztvec indexed_columns() const;
+    const RiGb& get_index(size_t i, const Column& col);
+    void copy_indexes_from(const GroupCache& other);
+
+    static void clear_all();
+    static size_t total_size();
+    static size_t nhits();
+    static size_t nmisses();
+    static void evict_until(size_t target_size);
+
+  private:
+    void _erase(std::map<Key, Entry>::iterator it);
+    void _clear_entries();
+};
+
+
+// Called during module initialization
+void group_cache_init_options();
+
+
+
+}  // namespace dt
+#endif
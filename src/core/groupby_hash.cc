@@ -0,0 +1,640 @@
+//------------------------------------------------------------------------------
+// Copyright 2018-2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+//
+// Hash-based grouping
+// -------------------
+//
+// This is an alternative to the radix-sort based `group()` function,
+// used for the `by()` clause when the user does not need the rows to
+// be sorted, or when the number of distinct keys is much smaller than
+// the number of rows. The algorithm is the following:
+//
+//   1. Compute a 64-bit hash of the key columns for every row
+//      (in parallel, reading the data in batches);
+//
+//   2. Partition the rows into `nshards` shards according to the
+//      top bits of their hashes. The partitioning is stable, so that
+//      within each shard the rows remain in increasing order;
+//
+//   3. Process all shards in parallel, each with its own hash set.
+//      For each row we find the "representative" row, i.e. the first
+//      row in the frame with the same key;
+//
+//   4. Enumerate the representative rows, giving the group ids in the
+//      order of first appearance. Optionally, the groups are reordered
+//      so that their keys become sorted: this requires sorting only
+//      `ngroups` rows instead of `nrows`;
+//
+//   5. Compute the Groupby offsets, and scatter the row indices into
+//      the final RowIndex. This is done in parallel as well.
+//
+// The rows within each group are always listed in increasing order.
+//
+//------------------------------------------------------------------------------
+#include <algorithm>  // std::min, std::sort
+#include <atomic>     // std::atomic
+#include <cstring>    // std::memcmp, std::memcpy
+#include <memory>     // std::unique_ptr
+#include <type_traits>
+#include <vector>     // std::vector
+#include "lib/parallel_hashmap/phmap.h"
+#include "models/murmurhash.h"
+#include "parallel/api.h"
+#include "python/args.h"
+#include "python/string.h"
+#include "utils/assert.h"
+#include "utils/exceptions.h"
+#include "utils/hash.h"
+#include "column.h"
+#include "group_cache.h"
+#include "groupby.h"
+#include "options.h"
+#include "rowindex.h"
+#include "sort.h"
+#include "stype.h"
+
+
+
+//------------------------------------------------------------------------------
+// Options
+//------------------------------------------------------------------------------
+
+enum class GroupbyMethod : int {
+  AUTO = 0,
+  SORT = 1,
+  HASH = 2,
+};
+
+static GroupbyMethod groupby_method = GroupbyMethod::AUTO;
+
+// In the "auto" mode, the hash-based grouping is used for frames with
+// at least this many rows, provided that some of the key columns are
+// strings. For numeric keys the radix sort is fast enough already.
+static constexpr size_t AUTO_HASH_MIN_NROWS = 1 << 16;
+
+
+void groupby_init_options() {
+  dt::register_option(
+    "groupby.method",
+    []{
+      return py::ostring(groupby_method == GroupbyMethod::SORT? "sort" :
+                         groupby_method == GroupbyMethod::HASH? "hash" :
+                                                                "auto");
+    },
+    [](const py::Arg& value) {
+      std::string method = value.to_string();
+      if (method == "auto") groupby_method = GroupbyMethod::AUTO;
+      else if (method == "sort") groupby_method = GroupbyMethod::SORT;
+      else if (method == "hash") groupby_method = GroupbyMethod::HASH;
+      else {
+        throw ValueError() << "Invalid value for option `groupby.method`: '"
+            << method << "'; expected one of 'auto', 'sort' or 'hash'";
+      }
+      // The cached groupings may have their groups in a different order
+      dt::GroupCache::clear_all();
+    },
+    "The algorithm used for grouping rows in the `by()` clause:\n"
+    "\n"
+    "'sort'\n"
+    "    the rows are radix-sorted by the key columns. The groups\n"
+    "    are listed in the sorted order of their keys;\n"
+    "\n"
+    "'hash'\n"
+    "    the rows are grouped using a hash table, without sorting.\n"
+    "    The groups are listed in the order of their first\n"
+    "    appearance in the frame;\n"
+    "\n"
+    "'auto'\n"
+    "    the hash table is used for large frames with string keys,\n"
+    "    after which only the distinct keys are sorted. The groups\n"
+    "    are listed in the sorted order, same as with 'sort'.\n"
+  );
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Key hashers
+//------------------------------------------------------------------------------
+namespace dt {
+
+/**
+ * Helper class that knows how to hash and compare the values of a
+ * single key column. Two NA values are considered equal; floating
+ * point values are compared by their bit patterns, which is
+ * consistent with how the sort-based grouping treats them.
+ */
+class KeyHasher {
+  public:
+    virtual ~KeyHasher() = default;
+
+    // Combine the hashes of values in rows [i0; i0 + n) into `out`.
+    virtual void hash(size_t i0, size_t n, uint64_t* out) const = 0;
+
+    // Return true if the keys in rows `i` and `j` are equal.
+    virtual bool equal(size_t i, size_t j) const = 0;
+};
+
+
+template <typename T>
+class FwKeyHasher : public KeyHasher {
+  using U = typename std::conditional<sizeof(T) == 8, uint64_t,
+            typename std::conditional<sizeof(T) == 4, uint32_t,
+            typename std::conditional<sizeof(T) == 2, uint16_t,
+                                      uint8_t>::type>::type>::type;
+  private:
+    const Column& column_;
+
+  public:
+    explicit FwKeyHasher(const Column& col) : column_(col) {}
+
+    void hash(size_t i0, size_t n, uint64_t* out) const override {
+      T values[Column::BATCH_SIZE];
+      bool valid[Column::BATCH_SIZE];
+      xassert(n <= Column::BATCH_SIZE);
+      column_.get_elements(i0, n, values, valid);
+      for (size_t k = 0; k < n; ++k) {
+        uint64_t h = valid[k]? static_cast<uint64_t>(bits(values[k]))
+                             : NA_HASH;
+        out[k] = mix_hash(out[k] ^ h);
+      }
+    }
+
+    bool equal(size_t i, size_t j) const override {
+      T x, y;
+      bool xvalid = column_.get_element(i, &x);
+      bool yvalid = column_.get_element(j, &y);
+      return (xvalid == yvalid) && (!xvalid || bits(x) == bits(y));
+    }
+
+  private:
+    static U bits(T value) {
+      U res;
+      std::memcpy(&res, &value, sizeof(T));
+      return res;
+    }
+};
+
+
+class StrKeyHasher : public KeyHasher {
+  private:
+    const Column& column_;
+
+  public:
+    explicit StrKeyHasher(const Column& col) : column_(col) {}
+
+    void hash(size_t i0, size_t n, uint64_t* out) const override {
+      CString values[Column::BATCH_SIZE];
+      bool valid[Column::BATCH_SIZE];
+      xassert(n <= Column::BATCH_SIZE);
+      column_.get_elements(i0, n, values, valid);
+      for (size_t k = 0; k < n; ++k) {
+        uint64_t h = valid[k]? hash_murmur2(values[k].ch,
+                                            static_cast<uint64_t>(values[k].size))
+                             : NA_HASH;
+        out[k] = mix_hash(out[k] ^ h);
+      }
+    }
+
+    bool equal(size_t i, size_t j) const override {
+      CString x, y;
+      bool xvalid = column_.get_element(i, &x);
+      bool yvalid = column_.get_element(j, &y);
+      if (xvalid != yvalid) return false;
+      if (!xvalid) return true;
+      return (x.size == y.size) &&
+             (x.ch == y.ch ||
+              std::memcmp(x.ch, y.ch, static_cast<size_t>(x.size)) == 0);
+    }
+};
+
+
+// Returns nullptr if the column's stype is not supported.
+static std::unique_ptr<KeyHasher> make_key_hasher(const Column& col) {
+  using KHPtr = std::unique_ptr<KeyHasher>;
+  switch (col.stype()) {
+    case SType::BOOL:
+    case SType::INT8:    return KHPtr(new FwKeyHasher<int8_t>(col));
+    case SType::INT16:   return KHPtr(new FwKeyHasher<int16_t>(col));
+    case SType::INT32:   return KHPtr(new FwKeyHasher<int32_t>(col));
+    case SType::INT64:   return KHPtr(new FwKeyHasher<int64_t>(col));
+    case SType::FLOAT32: return KHPtr(new FwKeyHasher<float>(col));
+    case SType::FLOAT64: return KHPtr(new FwKeyHasher<double>(col));
+    case SType::STR32:
+    case SType::STR64:   return KHPtr(new StrKeyHasher(col));
+    default:             return nullptr;
+  }
+}
+
+
+using KeyHasherVec = std::vector<std::unique_ptr<KeyHasher>>;
+
+struct RowHash {
+  const uint64_t* hashes;
+  RowHash() : hashes(nullptr) {}
+  explicit RowHash(const uint64_t* h) : hashes(h) {}
+  size_t operator()(int32_t i) const {
+    return static_cast<size_t>(hashes[i]);
+  }
+};
+
+struct RowEqual {
+  const uint64_t* hashes;
+  const KeyHasherVec* hashers;
+  RowEqual() : hashes(nullptr), hashers(nullptr) {}
+  RowEqual(const uint64_t* h, const KeyHasherVec* kh)
+    : hashes(h), hashers(kh) {}
+  bool operator()(int32_t i, int32_t j) const {
+    if (hashes[i] != hashes[j]) return false;
+    for (const auto& kh : *hashers) {
+      if (!kh->equal(static_cast<size_t>(i), static_cast<size_t>(j))) {
+        return false;
+      }
+    }
+    return true;
+  }
+};
+
+
+
+
+//------------------------------------------------------------------------------
+// Hash grouping
+//------------------------------------------------------------------------------
+
+/**
+ * Fill the array `offsets` (of size `ngroups + 1`) with the cumulative
+ * sums of the group `sizes`, where the groups are listed in the order
+ * `group_order` (or in their natural order if `group_order` is null).
+ * The sums are computed in parallel: first within each chunk of groups,
+ * and then the chunks are shifted by the totals of the preceding chunks.
+ */
+static void compute_group_offsets(size_t ngroups, const int32_t* sizes,
+                                  const int32_t* group_order,
+                                  int32_t* offsets)
+{
+  constexpr size_t MIN_CHUNK = 1024;
+  size_t nchunks = std::max(size_t(1),
+                     std::min(dt::num_threads_in_pool(), ngroups / MIN_CHUNK));
+  size_t chunk_size = (ngroups + nchunks - 1) / nchunks;
+  std::vector<int32_t> chunk_starts(nchunks + 1, 0);
+  auto size_of = [&](size_t k) {
+    return sizes[group_order? static_cast<size_t>(group_order[k]) : k];
+  };
+  dt::parallel_for_static(nchunks, ChunkSize(1),
+    [&](size_t c) {
+      size_t k1 = std::min(ngroups, (c + 1) * chunk_size);
+      int32_t total = 0;
+      for (size_t k = c * chunk_size; k < k1; ++k) total += size_of(k);
+      chunk_starts[c + 1] = total;
+    });
+  for (size_t c = 0; c < nchunks; ++c) {
+    chunk_starts[c + 1] += chunk_starts[c];
+  }
+  dt::parallel_for_static(nchunks, ChunkSize(1),
+    [&](size_t c) {
+      size_t k1 = std::min(ngroups, (c + 1) * chunk_size);
+      int32_t pos = chunk_starts[c];
+      for (size_t k = c * chunk_size; k < k1; ++k) {
+        offsets[k] = pos;
+        pos += size_of(k);
+      }
+    });
+  offsets[ngroups] = chunk_starts[nchunks];
+}
+
+
+static RiGb group_hash(const std::vector<Column>& columns,
+                       const std::vector<SortFlag>& flags,
+                       bool sort_groups)
+{
+  size_t nrows = columns[0].nrows();
+  xassert(nrows > 1 && nrows <= size_t(INT32_MAX));
+
+  KeyHasherVec hashers;
+  for (const Column& col : columns) {
+    hashers.push_back(make_key_hasher(col));
+    xassert(hashers.back());
+  }
+
+  // Step 1: compute row hashes
+  std::unique_ptr<uint64_t[]> hashes(new uint64_t[nrows]);
+  {
+    constexpr size_t BATCH = Column::BATCH_SIZE;
+    size_t nbatches = (nrows + BATCH - 1) / BATCH;
+    uint64_t* hh = hashes.get();
+    dt::parallel_for_static(nbatches, ChunkSize(4),
+      [&](size_t b) {
+        size_t i0 = b * BATCH;
+        size_t n = std::min(BATCH, nrows - i0);
+        for (size_t k = 0; k < n; ++k) hh[i0 + k] = 0;
+        for (const auto& kh : hashers) {
+          kh->hash(i0, n, hh + i0);
+        }
+      });
+  }
+
+  // Step 2: stable partitioning of rows into shards. Each chunk of
+  // rows counts how many of its rows fall into each shard; then the
+  // rows are scattered so that within each shard they appear in the
+  // increasing order.
+  size_t nthreads = dt::num_threads_in_pool();
+  size_t shard_bits = (nthreads == 1 || nrows < 10000)? 0 : 8;
+  size_t nshards = size_t(1) << shard_bits;
+  size_t shift = 64 - shard_bits;
+  auto shard_of = [&](size_t i) -> size_t {
+    return shard_bits? static_cast<size_t>(hashes[i] >> shift) : 0;
+  };
+  size_t nchunks = std::min(nthreads, nrows);
+  size_t chunk_size = (nrows + nchunks - 1) / nchunks;
+  nchunks = (nrows + chunk_size - 1) / chunk_size;
+
+  std::vector<size_t> shard_offsets(nshards + 1, 0);
+  std::unique_ptr<int32_t[]> shard_rows(new int32_t[nrows]);
+  {
+    std::vector<size_t> counts(nchunks * nshards, 0);
+    dt::parallel_for_static(nchunks, ChunkSize(1),
+      [&](size_t c) {
+        size_t* cnt = counts.data() + c * nshards;
+        size_t i1 = std::min(nrows, (c + 1) * chunk_size);
+        for (size_t i = c * chunk_size; i < i1; ++i) {
+          cnt[shard_of(i)]++;
+        }
+      });
+    size_t cumsum = 0;
+    for (size_t s = 0; s < nshards; ++s) {
+      shard_offsets[s] = cumsum;
+      for (size_t c = 0; c < nchunks; ++c) {
+        size_t cnt = counts[c * nshards + s];
+        counts[c * nshards + s] = cumsum;
+        cumsum += cnt;
+      }
+    }
+    shard_offsets[nshards] = cumsum;
+    xassert(cumsum == nrows);
+    int32_t* rows = shard_rows.get();
+    dt::parallel_for_static(nchunks, ChunkSize(1),
+      [&](size_t c) {
+        size_t* pos = counts.data() + c * nshards;
+        size_t i1 = std::min(nrows, (c + 1) * chunk_size);
+        for (size_t i = c * chunk_size; i < i1; ++i) {
+          rows[pos[shard_of(i)]++] = static_cast<int32_t>(i);
+        }
+      });
+  }
+
+  // Step 3: find the representative (first) row for each row.
+  std::unique_ptr<int32_t[]> reps(new int32_t[nrows]);
+  {
+    const int32_t* rows = shard_rows.get();
+    int32_t* rr = reps.get();
+    RowHash hasher(hashes.get());
+    RowEqual equal(hashes.get(), &hashers);
+    dt::parallel_for_dynamic(nshards,
+      [&](size_t s) {
+        phmap::flat_hash_set<int32_t, RowHash, RowEqual> seen(0, hasher, equal);
+        for (size_t k = shard_offsets[s]; k < shard_offsets[s + 1]; ++k) {
+          int32_t i = rows[k];
+          auto res = seen.insert(i);
+          rr[i] = *res.first;
+        }
+      });
+  }
+  shard_rows.reset();
+  hashes.reset();
+
+  // Step 4: enumerate the groups in the order of their first appearance.
+  std::unique_ptr<int32_t[]> gids(new int32_t[nrows]);
+  std::vector<size_t> chunk_ngroups(nchunks + 1, 0);
+  {
+    const int32_t* rr = reps.get();
+    int32_t* gg = gids.get();
+    dt::parallel_for_static(nchunks, ChunkSize(1),
+      [&](size_t c) {
+        size_t cnt = 0;
+        size_t i1 = std::min(nrows, (c + 1) * chunk_size);
+        for (size_t i = c * chunk_size; i < i1; ++i) {
+          cnt += (rr[i] == static_cast<int32_t>(i));
+        }
+        chunk_ngroups[c + 1] = cnt;
+      });
+    for (size_t c = 0; c < nchunks; ++c) {
+      chunk_ngroups[c + 1] += chunk_ngroups[c];
+    }
+    dt::parallel_for_static(nchunks, ChunkSize(1),
+      [&](size_t c) {
+        int32_t g = static_cast<int32_t>(chunk_ngroups[c]);
+        size_t i1 = std::min(nrows, (c + 1) * chunk_size);
+        for (size_t i = c * chunk_size; i < i1; ++i) {
+          if (rr[i] == static_cast<int32_t>(i)) gg[i] = g++;
+        }
+      });
+    // representative rows always precede the rows that refer to them,
+    // and their group ids were assigned in the previous loop
+    dt::parallel_for_static(nrows,
+      [&](size_t i) {
+        int32_t r = rr[i];
+        if (r != static_cast<int32_t>(i)) gg[i] = gg[r];
+      });
+  }
+  size_t ngroups = chunk_ngroups[nchunks];
+
+  // In the "auto" mode, if most keys are distinct, then sorting the
+  // distinct keys is not much cheaper than sorting the whole frame.
+  if (sort_groups && ngroups * 2 > nrows) {
+    return group(columns, flags);
+  }
+
+  // Step 5: determine the order in which the groups will be listed.
+  std::unique_ptr<int32_t[]> group_order;
+  if (sort_groups && ngroups > 1) {
+    Buffer firstbuf = Buffer::mem(ngroups * sizeof(int32_t));
+    int32_t* first = static_cast<int32_t*>(firstbuf.xptr());
+    const int32_t* rr = reps.get();
+    const int32_t* gg = gids.get();
+    dt::parallel_for_static(nrows,
+      [&](size_t i) {
+        if (rr[i] == static_cast<int32_t>(i)) first[gg[i]] = rr[i];
+      });
+    RowIndex ri_first(std::move(firstbuf), RowIndex::ARR32|RowIndex::SORTED);
+    std::vector<Column> keys;
+    for (const Column& col : columns) {
+      keys.push_back(col);
+      keys.back().apply_rowindex(ri_first);
+    }
+    RiGb sorted = group(keys, flags);
+    xassert(sorted.first.size() == ngroups);
+    xassert(sorted.second.size() == ngroups);
+    group_order.reset(new int32_t[ngroups]);
+    for (size_t k = 0; k < ngroups; ++k) {
+      size_t j;
+      sorted.first.get_element(k, &j);
+      group_order[k] = static_cast<int32_t>(j);
+    }
+  }
+  reps.reset();
+
+  // Step 6: compute group sizes and offsets, then scatter the rows
+  // into their groups. When there are few groups, each chunk of rows
+  // counts the group sizes separately, so that the chunks can then be
+  // scattered in parallel with the rows remaining in increasing order
+  // within each group. With many groups the per-chunk counts would
+  // take too much memory; instead, the rows are scattered using atomic
+  // counters, after which each group (which is small on average) is
+  // sorted.
+  Buffer offsets_buf = Buffer::mem((ngroups + 1) * sizeof(int32_t));
+  Buffer rowindex_buf = Buffer::mem(nrows * sizeof(int32_t));
+  int32_t* offsets = static_cast<int32_t*>(offsets_buf.xptr());
+  int32_t* out = static_cast<int32_t*>(rowindex_buf.xptr());
+  const int32_t* gg = gids.get();
+  const int32_t* order = group_order.get();
+  if (nchunks * ngroups <= nrows) {
+    // counts[c * ngroups + g] is the number of rows in group `g` within
+    // chunk `c`; later it becomes the position where chunk `c` will
+    // write its first row from group `g`.
+    std::vector<int32_t> counts(nchunks * ngroups, 0);
+    dt::parallel_for_static(nchunks, ChunkSize(1),
+      [&](size_t c) {
+        int32_t* cnt = counts.data() + c * ngroups;
+        size_t i1 = std::min(nrows, (c + 1) * chunk_size);
+        for (size_t i = c * chunk_size; i < i1; ++i) {
+          cnt[static_cast<size_t>(gg[i])]++;
+        }
+      });
+    std::vector<int32_t> sizes(ngroups);
+    dt::parallel_for_static(ngroups,
+      [&](size_t g) {
+        int32_t size = 0;
+        for (size_t c = 0; c < nchunks; ++c) {
+          size += counts[c * ngroups + g];
+        }
+        sizes[g] = size;
+      });
+    compute_group_offsets(ngroups, sizes.data(), order, offsets);
+    dt::parallel_for_static(ngroups,
+      [&](size_t k) {
+        size_t g = order? static_cast<size_t>(order[k]) : k;
+        int32_t pos = offsets[k];
+        for (size_t c = 0; c < nchunks; ++c) {
+          int32_t cnt = counts[c * ngroups + g];
+          counts[c * ngroups + g] = pos;
+          pos += cnt;
+        }
+      });
+    dt::parallel_for_static(nchunks, ChunkSize(1),
+      [&](size_t c) {
+        int32_t* pos = counts.data() + c * ngroups;
+        size_t i1 = std::min(nrows, (c + 1) * chunk_size);
+        for (size_t i = c * chunk_size; i < i1; ++i) {
+          out[pos[static_cast<size_t>(gg[i])]++] = static_cast<int32_t>(i);
+        }
+      });
+  }
+  else {
+    std::unique_ptr<std::atomic<int32_t>[]> counts(
+        new std::atomic<int32_t>[ngroups]);
+    dt::parallel_for_static(ngroups,
+      [&](size_t g) {
+        counts[g].store(0, std::memory_order_relaxed);
+      });
+    dt::parallel_for_static(nrows,
+      [&](size_t i) {
+        counts[static_cast<size_t>(gg[i])].fetch_add(
+            1, std::memory_order_relaxed);
+      });
+    std::vector<int32_t> sizes(ngroups);
+    dt::parallel_for_static(ngroups,
+      [&](size_t g) {
+        sizes[g] = counts[g].load(std::memory_order_relaxed);
+      });
+    compute_group_offsets(ngroups, sizes.data(), order, offsets);
+    dt::parallel_for_static(ngroups,
+      [&](size_t k) {
+        size_t g = order? static_cast<size_t>(order[k]) : k;
+        counts[g].store(offsets[k], std::memory_order_relaxed);
+      });
+    dt::parallel_for_static(nrows,
+      [&](size_t i) {
+        int32_t pos = counts[static_cast<size_t>(gg[i])].fetch_add(
+                          1, std::memory_order_relaxed);
+        out[pos] = static_cast<int32_t>(i);
+      });
+    dt::parallel_for_dynamic(ngroups,
+      [&](size_t k) {
+        std::sort(out + offsets[k], out + offsets[k + 1]);
+      });
+  }
+
+  RiGb result;
+  result.first = RowIndex(std::move(rowindex_buf), RowIndex::ARR32);
+  result.second = Groupby(ngroups, std::move(offsets_buf));
+  return result;
+}
+
+
+}  // namespace dt
+
+
+
+
+//------------------------------------------------------------------------------
+// Main entry point
+//------------------------------------------------------------------------------
+
+RiGb group_by_keys(const std::vector<Column>& columns,
+                   const std::vector<SortFlag>& flags)
+{
+  xassert(!columns.empty());
+  xassert(columns.size() == flags.size());
+  if (groupby_method == GroupbyMethod::SORT) {
+    return group(columns, flags);
+  }
+  size_t nrows = columns[0].nrows();
+  if (nrows <= 1 || nrows > size_t(INT32_MAX)) {
+    return group(columns, flags);
+  }
+  bool has_strings = false;
+  for (size_t i = 0; i < columns.size(); ++i) {
+    // Explicit sort() columns require the sort-based grouping
+    if (flags[i] & SortFlag::SORT_ONLY) return group(columns, flags);
+    switch (columns[i].stype()) {
+      case dt::SType::BOOL:
+      case dt::SType::INT8:
+      case dt::SType::INT16:
+      case dt::SType::INT32:
+      case dt::SType::INT64:
+      case dt::SType::FLOAT32:
+      case dt::SType::FLOAT64: break;
+      case dt::SType::STR32:
+      case dt::SType::STR64: has_strings = true; break;
+      default: return group(columns, flags);
+    }
+  }
+  if (groupby_method == GroupbyMethod::HASH) {
+    return dt::group_hash(columns, flags, false);
+  }
+  if (has_strings && nrows >= AUTO_HASH_MIN_NROWS) {
+    return dt::group_hash(columns, flags, true);
+  }
+  return group(columns, flags);
+}
@@ -0,0 +1,98 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_JAY_COMPRESSION_h
+#define dt_JAY_COMPRESSION_h
+#include <vector>
+#include "jay/jay_generated.h"
+#include "buffer.h"
+namespace dt {
+
+
+/**
+ * Compressed Jay buffers are stored as a sequence of independent blocks,
+ * each block holding (at most) `JAY_BLOCK_SIZE` bytes of the original
+ * data. A block consists of the 8-byte header
+ *
+ *     uint32_t  zsize;     // size of the compressed data that follows
+ *     uint32_t  rawsize;   // size of the data once uncompressed
+ *
+ * followed by `zsize` bytes of data in zlib format (RFC-1950). If the
+ * data could not be compressed, then it is stored verbatim, and
+ * `zsize == rawsize`.
+ *
+ * Before compression, each block is transformed according to its
+ * `jay::Encoding`, which makes the data more compressible:
+ *
+ *   - Plain: data is compressed as-is;
+ *   - Shuffle: the bytes of fixed-width elements are transposed, so that
+ *     the first bytes of all elements come first, then the second bytes,
+ *     etc. This groups together the bytes that are likely to be similar
+ *     (such as high bytes of integers, or the exponents of floats);
+ *   - Delta: each element is replaced with its difference from the
+ *     previous element (modulo 2^bits), and the result is shuffled. This
+ *     is beneficial for sorted or slowly-changing integers, including
+ *     the offsets of a string column;
+ *   - Dictionary: used for string columns with few distinct values. The
+ *     `data` buffer contains the int32 indices into the dictionary
+ *     (shuffled, -1 for NAs), and the `strdata` buffer contains the
+ *     dictionary itself: the `(dict_size + 1)` offsets, followed by the
+ *     character data.
+ *
+ * Since the blocks are independent, they can be compressed and
+ * decompressed in parallel.
+ */
+static constexpr size_t JAY_BLOCK_SIZE = 1 << 20;
+
+struct JayBlock {
+  const uint8_t* src;
+  size_t zsize;
+  size_t rawsize;
+  size_t offset;     // offset of this block within the uncompressed data
+};
+
+
+/**
+ * Compress `size` bytes of `data` consisting of the elements of
+ * `elemsize` bytes each, using the encoding `enc` for the data within
+ * each block. The blocks are compressed in parallel.
+ */
+Buffer jay_compress(const void* data, size_t size, size_t elemsize,
+                    jay::Encoding enc);
+
+/**
+ * Split compressed buffer `src` into individual blocks, appending them
+ * to the vector `blocks`. Returns the total size of the uncompressed
+ * data. An `IOError` is thrown if the buffer is malformed.
+ */
+size_t jay_scan_blocks(const Buffer& src, std::vector<JayBlock>& blocks);
+
+/**
+ * Uncompress a single block into `dest`, which must have room for
+ * `block.rawsize` bytes. This function is thread-safe.
+ */
+void jay_decompress_block(const JayBlock& block, void* dest,
+                          size_t elemsize, jay::Encoding enc);
+
+
+
+}  // namespace dt
+#endif
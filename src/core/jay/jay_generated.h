@@ -78,6 +78,70 @@ inline const char *EnumNameType(Type e) {
   return EnumNamesType()[index];
 }
 
+enum Codec {
+  Codec_None = 0,
+  Codec_Zlib = 1,
+  Codec_MIN = Codec_None,
+  Codec_MAX = Codec_Zlib
+};
+
+inline const Codec (&EnumValuesCodec())[2] {
+  static const Codec values[] = {
+    Codec_None,
+    Codec_Zlib
+  };
+  return values;
+}
+
+inline const char * const *EnumNamesCodec() {
+  static const char * const names[] = {
+    "None",
+    "Zlib",
+    nullptr
+  };
+  return names;
+}
+
+inline const char *EnumNameCodec(Codec e) {
+  const size_t index = static_cast<size_t>(e);
+  return EnumNamesCodec()[index];
+}
+
+enum Encoding {
+  Encoding_Plain = 0,
+  Encoding_Shuffle = 1,
+  Encoding_Delta = 2,
+  Encoding_Dictionary = 3,
+  Encoding_MIN = Encoding_Plain,
+  Encoding_MAX = Encoding_Dictionary
+};
+
+inline const Encoding (&EnumValuesEncoding())[4] {
+  static const Encoding values[] = {
+    Encoding_Plain,
+    Encoding_Shuffle,
+    Encoding_Delta,
+    Encoding_Dictionary
+  };
+  return values;
+}
+
+inline const char * const *EnumNamesEncoding() {
+  static const char * const names[] = {
+    "Plain",
+    "Shuffle",
+    "Delta",
+    "Dictionary",
+    nullptr
+  };
+  return names;
+}
+
+inline const char *EnumNameEncoding(Encoding e) {
+  const size_t index = static_cast<size_t>(e);
+  return EnumNamesEncoding()[index];
+}
+
 enum Stats {
   Stats_NONE = 0,
   Stats_Bool = 1,
@@ -309,7 +373,8 @@ struct Frame FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
     VT_NROWS = 4,
     VT_NCOLS = 6,
     VT_NKEYS = 8,
-    VT_COLUMNS = 10
+    VT_COLUMNS = 10,
+    VT_ROWGROUPS = 12
   };
   uint64_t nrows() const {
     return GetField<uint64_t>(VT_NROWS, 0);
@@ -323,6 +388,9 @@ struct Frame FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
   const flatbuffers::Vector<flatbuffers::Offset<Column>> *columns() const {
     return GetPointer<const flatbuffers::Vector<flatbuffers::Offset<Column>> *>(VT_COLUMNS);
   }
+  const flatbuffers::Vector<uint64_t> *rowgroups() const {
+    return GetPointer<const flatbuffers::Vector<uint64_t> *>(VT_ROWGROUPS);
+  }
   bool Verify(flatbuffers::Verifier &verifier) const {
     return VerifyTableStart(verifier) &&
            VerifyField<uint64_t>(verifier, VT_NROWS) &&
@@ -331,6 +399,8 @@ struct Frame FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
            VerifyOffset(verifier, VT_COLUMNS) &&
            verifier.Verify(columns()) &&
            verifier.VerifyVectorOfTables(columns()) &&
+           VerifyOffset(verifier, VT_ROWGROUPS) &&
+           verifier.Verify(rowgroups()) &&
            verifier.EndTable();
   }
 };
@@ -351,6 +421,9 @@ struct FrameBuilder {
   void add_columns(flatbuffers::Offset<flatbuffers::Vector<flatbuffers::Offset<Column>>> columns) {
     fbb_.AddOffset(Frame::VT_COLUMNS, columns);
   }
+  void add_rowgroups(flatbuffers::Offset<flatbuffers::Vector<uint64_t>> rowgroups) {
+    fbb_.AddOffset(Frame::VT_ROWGROUPS, rowgroups);
+  }
   explicit FrameBuilder(flatbuffers::FlatBufferBuilder &_fbb)
         : fbb_(_fbb) {
     start_ = fbb_.StartTable();
@@ -368,10 +441,12 @@ inline flatbuffers::Offset<Frame> CreateFrame(
     uint64_t nrows = 0,
     uint64_t ncols = 0,
     int32_t nkeys = 0,
-    flatbuffers::Offset<flatbuffers::Vector<flatbuffers::Offset<Column>>> columns = 0) {
+    flatbuffers::Offset<flatbuffers::Vector<flatbuffers::Offset<Column>>> columns = 0,
+    flatbuffers::Offset<flatbuffers::Vector<uint64_t>> rowgroups = 0) {
   FrameBuilder builder_(_fbb);
   builder_.add_ncols(ncols);
   builder_.add_nrows(nrows);
+  builder_.add_rowgroups(rowgroups);
   builder_.add_columns(columns);
   builder_.add_nkeys(nkeys);
   return builder_.Finish();
@@ -382,13 +457,15 @@ inline flatbuffers::Offset<Frame> CreateFrameDirect(
     uint64_t nrows = 0,
     uint64_t ncols = 0,
     int32_t nkeys = 0,
-    const std::vector<flatbuffers::Offset<Column>> *columns = nullptr) {
+    const std::vector<flatbuffers::Offset<Column>> *columns = nullptr,
+    const std::vector<uint64_t> *rowgroups = nullptr) {
   return jay::CreateFrame(
       _fbb,
       nrows,
       ncols,
       nkeys,
-      columns ? _fbb.CreateVector<flatbuffers::Offset<Column>>(*columns) : 0);
+      columns ? _fbb.CreateVector<flatbuffers::Offset<Column>>(*columns) : 0,
+      rowgroups ? _fbb.CreateVector<uint64_t>(*rowgroups) : 0);
 }
 
 struct Column FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
@@ -399,7 +476,11 @@ struct Column FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
     VT_NAME = 10,
     VT_NULLCOUNT = 12,
     VT_STATS_TYPE = 14,
-    VT_STATS = 16
+    VT_STATS = 16,
+    VT_CODEC = 18,
+    VT_ENCODING = 20,
+    VT_DICT_SIZE = 22,
+    VT_CHUNKS = 24
   };
   Type type() const {
     return static_cast<Type>(GetField<uint8_t>(VT_TYPE, 0));
@@ -422,6 +503,18 @@ struct Column FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
   const void *stats() const {
     return GetPointer<const void *>(VT_STATS);
   }
+  Codec codec() const {
+    return static_cast<Codec>(GetField<uint8_t>(VT_CODEC, 0));
+  }
+  Encoding encoding() const {
+    return static_cast<Encoding>(GetField<uint8_t>(VT_ENCODING, 0));
+  }
+  uint64_t dict_size() const {
+    return GetField<uint64_t>(VT_DICT_SIZE, 0);
+  }
+  const flatbuffers::Vector<flatbuffers::Offset<Column>> *chunks() const {
+    return GetPointer<const flatbuffers::Vector<flatbuffers::Offset<Column>> *>(VT_CHUNKS);
+  }
   template<typename T> const T *stats_as() const;
   const StatsBool *stats_as_Bool() const {
     return stats_type() == Stats_Bool ? static_cast<const StatsBool *>(stats()) : nullptr;
@@ -455,6 +548,12 @@ struct Column FLATBUFFERS_FINAL_CLASS : private flatbuffers::Table {
            VerifyField<uint8_t>(verifier, VT_STATS_TYPE) &&
            VerifyOffset(verifier, VT_STATS) &&
            VerifyStats(verifier, stats(), stats_type()) &&
+           VerifyField<uint8_t>(verifier, VT_CODEC) &&
+           VerifyField<uint8_t>(verifier, VT_ENCODING) &&
+           VerifyField<uint64_t>(verifier, VT_DICT_SIZE) &&
+           VerifyOffset(verifier, VT_CHUNKS) &&
+           verifier.Verify(chunks()) &&
+           verifier.VerifyVectorOfTables(chunks()) &&
            verifier.EndTable();
   }
 };
@@ -484,6 +583,18 @@ struct ColumnBuilder {
   void add_stats(flatbuffers::Offset<void> stats) {
     fbb_.AddOffset(Column::VT_STATS, stats);
   }
+  void add_codec(Codec codec) {
+    fbb_.AddElement<uint8_t>(Column::VT_CODEC, static_cast<uint8_t>(codec), 0);
+  }
+  void add_encoding(Encoding encoding) {
+    fbb_.AddElement<uint8_t>(Column::VT_ENCODING, static_cast<uint8_t>(encoding), 0);
+  }
+  void add_dict_size(uint64_t dict_size) {
+    fbb_.AddElement<uint64_t>(Column::VT_DICT_SIZE, dict_size, 0);
+  }
+  void add_chunks(flatbuffers::Offset<flatbuffers::Vector<flatbuffers::Offset<Column>>> chunks) {
+    fbb_.AddOffset(Column::VT_CHUNKS, chunks);
+  }
   explicit ColumnBuilder(flatbuffers::FlatBufferBuilder &_fbb)
         : fbb_(_fbb) {
     start_ = fbb_.StartTable();
@@ -504,13 +615,21 @@ inline flatbuffers::Offset<Column> CreateColumn(
     flatbuffers::Offset<flatbuffers::String> name = 0,
     uint64_t nullcount = 0,
     Stats stats_type = Stats_NONE,
-    flatbuffers::Offset<void> stats = 0) {
+    flatbuffers::Offset<void> stats = 0,
+    Codec codec = Codec_None,
+    Encoding encoding = Encoding_Plain,
+    uint64_t dict_size = 0,
+    flatbuffers::Offset<flatbuffers::Vector<flatbuffers::Offset<Column>>> chunks = 0) {
   ColumnBuilder builder_(_fbb);
+  builder_.add_dict_size(dict_size);
   builder_.add_nullcount(nullcount);
+  builder_.add_chunks(chunks);
   builder_.add_stats(stats);
   builder_.add_name(name);
   builder_.add_strdata(strdata);
   builder_.add_data(data);
+  builder_.add_encoding(encoding);
+  builder_.add_codec(codec);
   builder_.add_stats_type(stats_type);
   builder_.add_type(type);
   return builder_.Finish();
@@ -524,7 +643,11 @@ inline flatbuffers::Offset<Column> CreateColumnDirect(
     const char *name = nullptr,
     uint64_t nullcount = 0,
     Stats stats_type = Stats_NONE,
-    flatbuffers::Offset<void> stats = 0) {
+    flatbuffers::Offset<void> stats = 0,
+    Codec codec = Codec_None,
+    Encoding encoding = Encoding_Plain,
+    uint64_t dict_size = 0,
+    const std::vector<flatbuffers::Offset<Column>> *chunks = nullptr) {
   return jay::CreateColumn(
       _fbb,
       type,
@@ -533,7 +656,11 @@ inline flatbuffers::Offset<Column> CreateColumnDirect(
       name ? _fbb.CreateString(name) : 0,
       nullcount,
       stats_type,
-      stats);
+      stats,
+      codec,
+      encoding,
+      dict_size,
+      chunks ? _fbb.CreateVector<flatbuffers::Offset<Column>>(*chunks) : 0);
 }
 
 inline bool VerifyStats(flatbuffers::Verifier &, const void *, Stats type) {
@@ -22,16 +22,39 @@
 #include <string>
 #include <cstring>              // std::memcmp
 #include "frame/py_frame.h"
+#include "column/rbound.h"
+#include "jay/compression.h"
 #include "jay/jay_generated.h"
 #include "datatable.h"
 #include "datatablemodule.h"
+#include "mmm.h"
+#include "options.h"
+#include "parallel/api.h"
 #include "stype.h"
 
 
+// Compressed column (or its chunk), see `decompress_columns()`
+struct CompressedColumn {
+  size_t index;               // column's index within the Frame
+  size_t chunk;               // index of the row group
+  size_t nrows;
+  const jay::Column* jcol;
+  Buffer data;                // uncompressed data buffers
+  Buffer strdata;
+};
+
+
 // Helper functions
 static Column column_from_jay(size_t nrows,
                               const jay::Column* jaycol,
-                              const Buffer& jaybuf);
+                              Buffer&& databuf,
+                              Buffer&& strbuf);
+static Buffer extract_buffer(const Buffer& src,
+                             const jay::Buffer* jbuf,
+                             const std::string* path);
+static void decompress_columns(std::vector<CompressedColumn>& zcols,
+                               const Buffer& jaybuf);
+static DataTable* open_jay_impl(const Buffer& mbuf, const std::string* path);
 
 static void check_jay_signature(const uint8_t* ptr, size_t size);
 
@@ -40,9 +63,15 @@ static void check_jay_signature(const uint8_t* ptr, size_t size);
 // Open DataTable
 //------------------------------------------------------------------------------
 
+// If the page cache is limited (option `jay.memory_limit`), then the
+// columns are opened in "out-of-core" mode: each column's data is mapped
+// separately, so that it can be evicted from memory when not in use.
+// The whole-file mapping is then only used to read the meta information.
 DataTable* open_jay_from_file(const std::string& path) {
   Buffer mbuf = Buffer::mmap(path);
-  return open_jay_from_mbuf(mbuf);
+  bool paged = (MemoryMapManager::get()->get_cache_limit() !=
+                MemoryMapManager::NO_LIMIT);
+  return open_jay_impl(mbuf, paged? &path : nullptr);
 }
 
 DataTable* open_jay_from_bytes(const char* ptr, size_t len) {
@@ -55,10 +84,18 @@ DataTable* open_jay_from_bytes(const char* ptr, size_t len) {
 }
 
 
-DataTable* open_jay_from_mbuf(const Buffer& mbuf)
-{
-  std::vector<std::string> colnames;
+DataTable* open_jay_from_mbuf(const Buffer& mbuf) {
+  return open_jay_impl(mbuf, nullptr);
+}
 
+
+/**
+ * Read and verify the meta record of a Jay file contained in `mbuf`.
+ * The returned object points into `mbuf`. On output, `meta_start` is
+ * the offset of the meta section within the file, i.e. the end of its
+ * data section.
+ */
+const jay::Frame* open_jay_meta(const Buffer& mbuf, size_t* meta_start) {
   const uint8_t* ptr = static_cast<const uint8_t*>(mbuf.rptr());
   const size_t len = mbuf.size();
   check_jay_signature(ptr, len);
@@ -69,30 +106,108 @@ DataTable* open_jay_from_mbuf(const Buffer& mbuf)
         << meta_size << " bytes, however file size is only " << len;
   }
 
-  auto meta_ptr = ptr + len - 16 - meta_size;
+  *meta_start = len - 16 - meta_size;
+  auto meta_ptr = ptr + *meta_start;
   auto frame = jay::GetFrame(meta_ptr);
   flatbuffers::Verifier verifier(meta_ptr, meta_size);
   if (!frame->Verify(verifier)) {
     throw IOError() << "Invalid meta record in a Jay file";
   }
+  return frame;
+}
+
+
+static DataTable* open_jay_impl(const Buffer& mbuf, const std::string* path)
+{
+  std::vector<std::string> colnames;
+
+  size_t meta_start;
+  auto frame = open_jay_meta(mbuf, &meta_start);
 
   size_t ncols = frame->ncols();
   size_t nrows = frame->nrows();
   auto msg_columns = frame->columns();
 
-  colvec columns;
-  columns.reserve(ncols);
+  // When the Frame has row groups, each column is stored as a sequence
+  // of chunks, one per row group.
+  std::vector<size_t> rowgroups;
+  if (frame->rowgroups()) {
+    size_t total = 0;
+    for (uint64_t n : *frame->rowgroups()) {
+      rowgroups.push_back(static_cast<size_t>(n));
+      total += n;
+    }
+    if (rowgroups.empty() || total != nrows) {
+      throw IOError() << "Invalid Jay file: row groups contain " << total
+          << " rows, however the Frame contains " << nrows << " rows";
+    }
+  } else {
+    rowgroups.push_back(nrows);
+  }
+  size_t ngroups = rowgroups.size();
+
+  std::vector<colvec> chunks;
+  chunks.reserve(ncols);
+  std::vector<CompressedColumn> zcols;
   size_t i = 0;
   for (const jay::Column* jcol : *msg_columns) {
-    Column col = column_from_jay(nrows, jcol, mbuf);
-    if (col.nrows() != nrows) {
-      throw IOError() << "Length of column " << i << " is " << col.nrows()
-          << ", however the Frame contains " << nrows << " rows";
+    chunks.push_back(colvec(ngroups));
+    for (size_t g = 0; g < ngroups; ++g) {
+      const jay::Column* jchunk = jcol;
+      if (frame->rowgroups()) {
+        auto jchunks = jcol->chunks();
+        size_t n = jchunks? jchunks->size() : 0;
+        if (n != ngroups) {
+          throw IOError() << "Invalid Jay file: column " << i << " has "
+              << n << " chunks, whereas the Frame has " << ngroups
+              << " row groups";
+        }
+        jchunk = jchunks->Get(static_cast<flatbuffers::uoffset_t>(g));
+        if (jchunk->type() != jcol->type()) {
+          throw IOError() << "Invalid Jay file: chunk " << g << " of "
+              "column " << i << " has a different type than the column";
+        }
+      }
+      if (jchunk->codec() == jay::Codec_None) {
+        bool isstr = (jchunk->type() == jay::Type_Str32 ||
+                      jchunk->type() == jay::Type_Str64);
+        Buffer databuf = extract_buffer(mbuf, jchunk->data(), path);
+        Buffer strbuf = isstr? extract_buffer(mbuf, jchunk->strdata(), path)
+                             : Buffer();
+        chunks[i][g] = column_from_jay(rowgroups[g], jchunk,
+                                       std::move(databuf), std::move(strbuf));
+      } else {
+        // Compressed columns will be filled in all at once below
+        zcols.push_back(CompressedColumn { i, g, rowgroups[g], jchunk,
+                                           Buffer(), Buffer() });
+      }
     }
-    columns.push_back(std::move(col));
     colnames.push_back(jcol->name()->str());
     ++i;
   }
+  if (!zcols.empty()) {
+    decompress_columns(zcols, mbuf);
+    for (auto& zcol : zcols) {
+      chunks[zcol.index][zcol.chunk] =
+          column_from_jay(zcol.nrows, zcol.jcol,
+                          std::move(zcol.data), std::move(zcol.strdata));
+    }
+  }
+
+  colvec columns;
+  columns.reserve(ncols);
+  for (i = 0; i < chunks.size(); ++i) {
+    if (ngroups == 1) {
+      columns.push_back(std::move(chunks[i][0]));
+    } else {
+      columns.push_back(Column(new dt::Rbound_ColumnImpl(chunks[i])));
+    }
+    if (columns[i].nrows() != nrows) {
+      throw IOError() << "Length of column " << i << " is "
+          << columns[i].nrows() << ", however the Frame contains "
+          << nrows << " rows";
+    }
+  }
 
   auto dt = new DataTable(std::move(columns), colnames);
   dt->set_nkeys_unsafe(static_cast<size_t>(frame->nkeys()));
@@ -124,7 +239,9 @@ static void check_jay_signature(const uint8_t* sof, size_t size) {
         << static_cast<char>(eof[-1]) << "`";
   }
 
-  if (std::memcmp(sof, "JAY1\0\0\0\0", 8) != 0) {
+  // Version 2 is used by the files with compressed columns
+  if (std::memcmp(sof, "JAY1\0\0\0\0", 8) != 0 &&
+      std::memcmp(sof, "JAY2\0\0\0\0", 8) != 0) {
     std::string version(reinterpret_cast<const char*>(sof) + 3, 5);
     throw IOError() << "Unsupported Jay file version: " << version;
   }
@@ -138,11 +255,16 @@ static void check_jay_signature(const uint8_t* sof, size_t size) {
 //------------------------------------------------------------------------------
 
 static Buffer extract_buffer(
-    const Buffer& src, const jay::Buffer* jbuf)
+    const Buffer& src, const jay::Buffer* jbuf, const std::string* path)
 {
   size_t offset = jbuf->offset();
   size_t length = jbuf->length();
-  return Buffer::view(src, length, offset + 8);
+  if (offset + length + 8 > src.size()) {
+    throw IOError() << "Invalid Jay file: buffer at offset " << offset
+        << " of length " << length << " is outside of the file";
+  }
+  return path? Buffer::paged(*path, offset + 8, length)
+             : Buffer::view(src, length, offset + 8);
 }
 
 
@@ -162,7 +284,7 @@ static void initStats(Stats* stats, const jay::Column* jcol) {
 
 
 static Column column_from_jay(
-    size_t nrows, const jay::Column* jcol, const Buffer& jaybuf)
+    size_t nrows, const jay::Column* jcol, Buffer&& databuf, Buffer&& strbuf)
 {
   jay::Type jtype = jcol->type();
 
@@ -180,9 +302,7 @@ static Column column_from_jay(
   }
 
   Column col;
-  Buffer databuf = extract_buffer(jaybuf, jcol->data());
   if (stype == dt::SType::STR32 || stype == dt::SType::STR64) {
-    Buffer strbuf = extract_buffer(jaybuf, jcol->strdata());
     col = Column::new_string_column(nrows, std::move(databuf), std::move(strbuf));
   } else {
     col = Column::new_mbuf_column(nrows, stype, std::move(databuf));
@@ -205,6 +325,203 @@ static Column column_from_jay(
 
 
 
+//------------------------------------------------------------------------------
+// Decompress columns
+//------------------------------------------------------------------------------
+
+/**
+ * Expand a dictionary-encoded string column: `zcol.data` contains the
+ * int32 indices into the dictionary, and `zcol.strdata` the dictionary
+ * itself (see jay/compression.h). On return these buffers are replaced
+ * with the regular offsets and character data of the string column.
+ */
+template <typename T>
+static void expand_dictionary(CompressedColumn& zcol, size_t nrows) {
+  size_t K = zcol.jcol->dict_size();
+  const Buffer& codesbuf = zcol.data;
+  const Buffer& dictbuf = zcol.strdata;
+  if (codesbuf.size() != nrows * sizeof(int32_t) ||
+      K >= size_t(std::numeric_limits<int32_t>::max()) ||
+      dictbuf.size() < (K + 1) * sizeof(T))
+  {
+    throw IOError() << "Invalid Jay file: dictionary of column "
+        << zcol.index << " is corrupted";
+  }
+  auto codes = static_cast<const int32_t*>(codesbuf.rptr());
+  auto dict_offsets = static_cast<const T*>(dictbuf.rptr());
+  auto dict_chars = static_cast<const char*>(dictbuf.rptr())
+                    + (K + 1) * sizeof(T);
+  size_t dict_nchars = dictbuf.size() - (K + 1) * sizeof(T);
+  bool valid = (dict_offsets[0] == 0);
+  for (size_t k = 0; k < K && valid; ++k) {
+    valid = (dict_offsets[k] <= dict_offsets[k + 1]);
+  }
+  valid = valid && (dict_offsets[K] <= dict_nchars);
+
+  size_t nchars = 0;
+  for (size_t i = 0; i < nrows && valid; ++i) {
+    int32_t code = codes[i];
+    if (code < 0) {
+      valid = (code == -1);
+    } else {
+      auto k = static_cast<size_t>(code);
+      valid = (k < K);
+      if (valid) nchars += dict_offsets[k + 1] - dict_offsets[k];
+    }
+  }
+  if (!valid) {
+    throw IOError() << "Invalid Jay file: dictionary of column "
+        << zcol.index << " is corrupted";
+  }
+
+  Buffer offbuf = Buffer::mem((nrows + 1) * sizeof(T));
+  Buffer strbuf = Buffer::mem(nchars);
+  auto offsets = static_cast<T*>(offbuf.xptr());
+  auto chars = static_cast<char*>(strbuf.xptr());
+  T pos = 0;
+  offsets[0] = 0;
+  for (size_t i = 0; i < nrows; ++i) {
+    int32_t code = codes[i];
+    if (code < 0) {
+      offsets[i + 1] = pos | dt::GETNA<T>();
+    } else {
+      auto k = static_cast<size_t>(code);
+      T len = dict_offsets[k + 1] - dict_offsets[k];
+      std::memcpy(chars + pos, dict_chars + dict_offsets[k], len);
+      pos += len;
+      offsets[i + 1] = pos;
+    }
+  }
+  zcol.data = std::move(offbuf);
+  zcol.strdata = std::move(strbuf);
+}
+
+
+/**
+ * Uncompress the data buffers of all compressed columns. The individual
+ * blocks of all buffers are uncompressed in parallel, after which the
+ * dictionary-encoded columns are expanded (also in parallel).
+ */
+static void decompress_columns(std::vector<CompressedColumn>& zcols,
+                               const Buffer& jaybuf)
+{
+  struct Task {
+    dt::JayBlock block;
+    void* dest;
+    size_t elemsize;
+    jay::Encoding encoding;
+  };
+  std::vector<Task> tasks;
+  std::vector<dt::JayBlock> blocks;
+  for (auto& zcol : zcols) {
+    const jay::Column* jcol = zcol.jcol;
+    size_t nrows = zcol.nrows;
+    jay::Type jtype = jcol->type();
+    jay::Encoding encoding = jcol->encoding();
+    bool isstr = (jtype == jay::Type_Str32 || jtype == jay::Type_Str64);
+    if (jcol->codec() != jay::Codec_Zlib ||
+        encoding > jay::Encoding_MAX || jtype > jay::Type_MAX ||
+        (encoding == jay::Encoding_Dictionary && !isstr))
+    {
+      throw IOError() << "Invalid Jay file: column " << zcol.index
+          << " has unsupported compression method";
+    }
+    size_t elemsize = (jtype == jay::Type_Int16)? 2 :
+                      (jtype == jay::Type_Int32 || jtype == jay::Type_Float32 ||
+                       jtype == jay::Type_Str32)? 4 :
+                      (jtype == jay::Type_Int64 || jtype == jay::Type_Float64 ||
+                       jtype == jay::Type_Str64)? 8 : 1;
+
+    for (size_t k = 0; k < (isstr? 2 : 1); ++k) {
+      Buffer zbuf = extract_buffer(jaybuf, k? jcol->strdata() : jcol->data(),
+                                   nullptr);
+      blocks.clear();
+      size_t size = dt::jay_scan_blocks(zbuf, blocks);
+      if (k == 0 && encoding != jay::Encoding_Dictionary &&
+          size < (nrows + isstr) * elemsize) {
+        throw IOError() << "Invalid Jay file: column " << zcol.index
+            << " contains less data than expected";
+      }
+      Buffer out = Buffer::mem(size);
+      for (const auto& block : blocks) {
+        Task task { block, out.xptr(block.offset), elemsize, encoding };
+        if (k == 1) {
+          task.elemsize = 1;
+          task.encoding = jay::Encoding_Plain;
+        }
+        else if (encoding == jay::Encoding_Dictionary) {
+          task.elemsize = sizeof(int32_t);
+          task.encoding = jay::Encoding_Shuffle;
+        }
+        tasks.push_back(task);
+      }
+      (k? zcol.strdata : zcol.data) = std::move(out);
+    }
+  }
+
+  dt::parallel_for_dynamic(tasks.size(),
+    [&](size_t i) {
+      const Task& task = tasks[i];
+      dt::jay_decompress_block(task.block, task.dest, task.elemsize,
+                               task.encoding);
+    });
+
+  dt::parallel_for_dynamic(zcols.size(),
+    [&](size_t i) {
+      CompressedColumn& zcol = zcols[i];
+      if (zcol.jcol->encoding() != jay::Encoding_Dictionary) return;
+      if (zcol.jcol->type() == jay::Type_Str32) {
+        expand_dictionary<uint32_t>(zcol, zcol.nrows);
+      } else {
+        expand_dictionary<uint64_t>(zcol, zcol.nrows);
+      }
+    });
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Options
+//------------------------------------------------------------------------------
+
+void jay_init_options() {
+  dt::register_option(
+    "jay.memory_limit",
+    []{
+      size_t limit = MemoryMapManager::get()->get_cache_limit();
+      if (limit == MemoryMapManager::NO_LIMIT) return py::None();
+      return py::oobj(py::oint(limit));
+    },
+    [](const py::Arg& value) {
+      size_t limit = MemoryMapManager::NO_LIMIT;
+      if (!value.is_none()) {
+        int64_t n = value.to_int64_strict();
+        if (n < 0) {
+          throw ValueError() << "Option `jay.memory_limit` cannot be "
+              "negative: " << n;
+        }
+        limit = static_cast<size_t>(n);
+      }
+      MemoryMapManager::get()->set_cache_limit(limit);
+    },
+    "The maximum amount of memory (in bytes) that the data of Jay files\n"
+    "opened from disk may occupy. When this option is set, the Jay files\n"
+    "are opened in the out-of-core mode: each column is memory-mapped\n"
+    "separately, and only those parts of the columns that are actually\n"
+    "accessed are read into memory. When the total size of the columns\n"
+    "that were accessed exceeds the limit, the least recently used\n"
+    "columns are released from memory (they will be re-read from the\n"
+    "file if needed again).\n"
+    "\n"
+    "This setting only affects the files opened after it was changed.\n"
+    "The default value None means that there is no limit, and each Jay\n"
+    "file is memory-mapped as a whole.");
+}
+
+
+
+
 //------------------------------------------------------------------------------
 // Python open_jay()
 //------------------------------------------------------------------------------
@@ -19,23 +19,50 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <cstdio>
+#include <memory>
+#include <string>
+#include <unordered_map>
 #include "column/column_impl.h"
 #include "column/rbound.h"
 #include "column/sentinel.h"
 #include "column/virtual.h"
 #include "frame/py_frame.h"
+#include "jay/compression.h"
 #include "jay/jay_generated.h"
 #include "python/_all.h"
 #include "python/args.h"
 #include "python/string.h"
 #include "utils/assert.h"
+#include "utils/file.h"
 #include "datatable.h"
+#include "ltype.h"
+#include "rowindex.h"
+#include "sort.h"
 #include "stype.h"
 #include "writebuf.h"
 
 using WritableBufferPtr = std::unique_ptr<WritableBuffer>;
 static jay::Type stype_to_jaytype[dt::STYPES_COUNT];
 static jay::Buffer saveMemoryRange(const void*, size_t, WritableBuffer*);
+static bool write_compressed_data_to_jay(
+    Column&, jay::ColumnBuilder&, WritableBuffer*);
+using ColumnOffsets = std::vector<flatbuffers::Offset<jay::Column>>;
+static void write_chunks_to_jay(
+    Column&, const std::vector<uint64_t>&, flatbuffers::FlatBufferBuilder&,
+    WritableBuffer*, bool, ColumnOffsets&);
+static flatbuffers::Offset<jay::Column> create_chunked_column(
+    flatbuffers::FlatBufferBuilder&, const Column&, const std::string&,
+    size_t, const ColumnOffsets&, bool);
+static void write_jay_meta(flatbuffers::FlatBufferBuilder&, WritableBuffer*,
+                           bool);
+static void write_jay_header(const std::string&, bool);
+static bool rows_follow_key(const DataTable&, const colvec&, size_t);
+static flatbuffers::Offset<jay::Column> copy_jay_chunk(
+    flatbuffers::FlatBufferBuilder&, const jay::Column*);
+static dt::SType jaytype_to_stype(jay::Type);
+static flatbuffers::Offset<void> saveColumnStats(
+    const Column&, flatbuffers::FlatBufferBuilder&, jay::Stats*);
 template <typename T, typename StatBuilder>
 static flatbuffers::Offset<void> saveStats(
     Stats* stats, flatbuffers::FlatBufferBuilder& fbb);
@@ -49,31 +76,51 @@ static flatbuffers::Offset<void> saveStats(
  * Save Frame in Jay format to the provided file.
  */
 void DataTable::save_jay(const std::string& path,
-                         WritableBuffer::Strategy wstrategy)
+                         WritableBuffer::Strategy wstrategy,
+                         bool compress, size_t rowgroup_size)
 {
   size_t sizehint = (wstrategy == WritableBuffer::Strategy::Auto)
                     ? memory_footprint() : 0;
   auto wb = WritableBuffer::create_target(path, sizehint, wstrategy);
-  save_jay_impl(wb.get());
+  save_jay_impl(wb.get(), compress, rowgroup_size);
 }
 
 
 /**
  * Save Frame in Jay format to memory,
  */
-Buffer DataTable::save_jay() {
+Buffer DataTable::save_jay(bool compress, size_t rowgroup_size) {
   auto wb = std::unique_ptr<MemoryWritableBuffer>(
                 new MemoryWritableBuffer(memory_footprint()));
-  save_jay_impl(wb.get());
+  save_jay_impl(wb.get(), compress, rowgroup_size);
   return wb->get_mbuf();
 }
 
 
-void DataTable::save_jay_impl(WritableBuffer* wb) {
-  wb->write(8, "JAY1\0\0\0\0");
+/**
+ * If `rowgroup_size` is non-zero, and the Frame has more rows than
+ * that, then the rows are split into groups of `rowgroup_size` rows
+ * each (the last group may be smaller), and every column is saved as
+ * a sequence of chunks, one per row group. Each chunk carries its own
+ * stats, allowing the reader to skip the row groups that do not match
+ * a filter.
+ */
+void DataTable::save_jay_impl(WritableBuffer* wb, bool compress,
+                              size_t rowgroup_size)
+{
+  // Files with compressed columns use a different signature, so that
+  // the older versions of datatable would refuse to open them
+  wb->write(8, compress? "JAY2\0\0\0\0" : "JAY1\0\0\0\0");
 
   flatbuffers::FlatBufferBuilder fbb(1024);
 
+  std::vector<uint64_t> rowgroups;
+  if (rowgroup_size && nrows_ > rowgroup_size) {
+    for (size_t row0 = 0; row0 < nrows_; row0 += rowgroup_size) {
+      rowgroups.push_back(std::min(rowgroup_size, nrows_ - row0));
+    }
+  }
+
   std::vector<flatbuffers::Offset<jay::Column>> msg_columns;
   for (size_t i = 0; i < ncols_; ++i) {
     Column& col = get_column(i);
@@ -81,9 +128,14 @@ void DataTable::save_jay_impl(WritableBuffer* wb) {
       auto w = DatatableWarning();
       w << "Column `" << names_[i] << "` of type obj64 was not saved";
       w.emit();
+    } else if (rowgroups.empty()) {
+      msg_columns.push_back(col.write_to_jay(names_[i], fbb, wb, compress));
     } else {
-      auto saved_col = col.write_to_jay(names_[i], fbb, wb);
-      msg_columns.push_back(saved_col);
+      ColumnOffsets chunks;
+      write_chunks_to_jay(col, rowgroups, fbb, wb, compress, chunks);
+      msg_columns.push_back(
+          create_chunked_column(fbb, col, names_[i], col.na_count(), chunks,
+                                /* with_stats = */ true));
     }
   }
   xassert((wb->size() & 7) == 0);
@@ -92,9 +144,227 @@ void DataTable::save_jay_impl(WritableBuffer* wb) {
                   nrows_,
                   msg_columns.size(),
                   static_cast<int>(nkeys_),
-                  &msg_columns);
+                  &msg_columns,
+                  rowgroups.empty()? nullptr : &rowgroups);
   fbb.Finish(frame);
+  write_jay_meta(fbb, wb, compress);
+}
+
+
+/**
+ * Append the rows of this Frame to an existing Jay file. The data of
+ * the existing rows is not rewritten: the new data is written after
+ * the end of the file, as one or more new row groups (the rows of a
+ * file without row groups become its first row group), followed by
+ * the new meta section listing both the old and the new chunks of
+ * every column. The old meta section stays in the file, but is no
+ * longer referenced once the new footer is written. If an error
+ * occurs while writing, the file is truncated back to its original
+ * size, so that the previous content remains intact.
+ *
+ * The columns of this Frame must have the same names and types as the
+ * columns in the file. If the file is keyed, then the Frame must have
+ * the same key, and its rows must come after the rows of the file in
+ * the key order. If the file does not exist (or is empty), it is
+ * created.
+ */
+void DataTable::append_jay(const std::string& path,
+                           WritableBuffer::Strategy wstrategy,
+                           bool compress, size_t rowgroup_size)
+{
+  if (!File::nonempty(path)) {
+    save_jay(path, wstrategy, compress, rowgroup_size);
+    return;
+  }
+  std::vector<size_t> saved;  // indices of the columns that will be saved
+  for (size_t i = 0; i < ncols_; ++i) {
+    if (get_column(i).stype() == dt::SType::OBJ) {
+      auto w = DatatableWarning();
+      w << "Column `" << names_[i] << "` of type obj64 was not saved";
+      w.emit();
+    } else {
+      saved.push_back(i);
+    }
+  }
+
+  flatbuffers::FlatBufferBuilder fbb(1024);
+  std::vector<ColumnOffsets> chunks(saved.size());
+  std::vector<uint64_t> rowgroups;
+  std::vector<size_t> nullcounts(saved.size());
+  colvec columns;
+  size_t old_nrows = 0;
+  size_t old_size = 0;
+  bool old_v2 = false;
+  size_t nkeys = 0;
+  {
+    Buffer mbuf = Buffer::mmap(path);
+    size_t meta_start;
+    const jay::Frame* frame = open_jay_meta(mbuf, &meta_start);
+    old_size = mbuf.size();
+    old_v2 = (static_cast<const char*>(mbuf.rptr())[3] == '2');
+    auto jcols = frame->columns();
+    size_t old_ncols = jcols? jcols->size() : 0;
+    if (old_ncols != saved.size()) {
+      throw ValueError() << "Cannot append to Jay file " << path << ": the "
+          "file has " << old_ncols << " columns, whereas the frame has "
+          << saved.size();
+    }
+    old_nrows = frame->nrows();
+    auto old_rowgroups = frame->rowgroups();
+    if (old_rowgroups) {
+      rowgroups.assign(old_rowgroups->begin(), old_rowgroups->end());
+    } else if (old_nrows) {
+      rowgroups.push_back(old_nrows);
+    }
+    for (size_t j = 0; j < saved.size(); ++j) {
+      const jay::Column* jcol = jcols->Get(static_cast<flatbuffers::uoffset_t>(j));
+      const std::string& name = names_[saved[j]];
+      Column col = get_column(saved[j]);
+      jay::Type jtype = stype_to_jaytype[int(col.stype())];
+      if (!jcol->name() || jcol->name()->str() != name) {
+        throw ValueError() << "Cannot append to Jay file " << path << ": "
+            "column " << j << " is named `"
+            << (jcol->name()? jcol->name()->str() : std::string())
+            << "` in the file, but `" << name << "` in the frame";
+      }
+      if (jcol->type() != jtype) {
+        // The column can be upcast to the type stored in the file
+        dt::SType file_stype = jaytype_to_stype(jcol->type());
+        if (dt::common_stype(col.stype(), file_stype) != file_stype) {
+          throw ValueError() << "Cannot append to Jay file " << path << ": "
+              "column `" << name << "` has type "
+              << jay::EnumNameType(jcol->type()) << " in the file, but "
+              << jay::EnumNameType(jtype) << " in the frame";
+        }
+        col.cast_inplace(file_stype);
+      }
+      columns.push_back(std::move(col));
+      nullcounts[j] = jcol->nullcount();
+      if (old_rowgroups) {
+        auto jchunks = jcol->chunks();
+        if (!jchunks || jchunks->size() != old_rowgroups->size()) {
+          throw IOError() << "Invalid Jay file: column " << j << " has "
+              << (jchunks? jchunks->size() : 0) << " chunks, whereas the "
+              "Frame has " << old_rowgroups->size() << " row groups";
+        }
+        for (const jay::Column* jchunk : *jchunks) {
+          chunks[j].push_back(copy_jay_chunk(fbb, jchunk));
+        }
+      } else if (old_nrows) {
+        chunks[j].push_back(copy_jay_chunk(fbb, jcol));
+      }
+    }
+    if (nrows_ == 0) return;
+
+    // The key of the file is kept, provided that the frame has the same
+    // key, and its rows continue the key order of the file's rows.
+    size_t file_nkeys = static_cast<size_t>(frame->nkeys());
+    nkeys = (old_nrows == 0 && file_nkeys == 0)? nkeys_ : file_nkeys;
+    if (file_nkeys) {
+      if (nkeys_ != file_nkeys || saved[nkeys_ - 1] != nkeys_ - 1) {
+        throw ValueError() << "Cannot append to Jay file " << path << ": "
+            "the file is keyed by " << file_nkeys << " column"
+            << (file_nkeys == 1? "" : "s") << ", whereas the frame is keyed "
+            "by " << nkeys_;
+      }
+      if (old_nrows) {
+        std::unique_ptr<DataTable> olddt(open_jay_from_mbuf(mbuf));
+        if (!rows_follow_key(*olddt, columns, nkeys)) {
+          throw ValueError() << "Cannot append to Jay file " << path << ": "
+              "the rows of the frame do not come after the rows of the "
+              "file in the order of the key";
+        }
+      }
+    }
+  }
+
+  // Nothing is written over the existing content of the file: the new
+  // chunks and the new meta section go after the old footer, and the new
+  // footer is written last. If anything fails, the file is truncated back
+  // to its original size. The only exception is the file's signature,
+  // which is upgraded before anything else if compressed chunks are
+  // going to be added to a file that had none.
+  bool v2 = old_v2 || compress;
+  bool upgraded = false;
+  WritableBufferPtr wb;
+  try {
+    if (v2 && !old_v2) {
+      write_jay_header(path, true);
+      upgraded = true;
+    }
+    size_t sizehint = (wstrategy == WritableBuffer::Strategy::Auto)
+                      ? memory_footprint() : 0;
+    wb = WritableBuffer::create_target(path, sizehint, wstrategy,
+                                       /* append = */ true);
+    if (old_size & 7) {
+      wb->write(8 - (old_size & 7), "\0\0\0\0\0\0\0");
+    }
 
+    std::vector<uint64_t> new_rowgroups;
+    size_t groupsize = rowgroup_size? rowgroup_size : nrows_;
+    for (size_t row0 = 0; row0 < nrows_; row0 += groupsize) {
+      new_rowgroups.push_back(std::min(groupsize, nrows_ - row0));
+    }
+    std::vector<flatbuffers::Offset<jay::Column>> msg_columns;
+    for (size_t j = 0; j < saved.size(); ++j) {
+      Column& col = columns[j];
+      write_chunks_to_jay(col, new_rowgroups, fbb, wb.get(), compress,
+                          chunks[j]);
+      msg_columns.push_back(
+          create_chunked_column(fbb, col, names_[saved[j]],
+                                nullcounts[j] + col.na_count(), chunks[j],
+                                /* with_stats = */ false));
+    }
+    rowgroups.insert(rowgroups.end(), new_rowgroups.begin(),
+                     new_rowgroups.end());
+    xassert((wb->size() & 7) == 0);
+
+    auto frame = jay::CreateFrameDirect(fbb,
+                    old_nrows + nrows_,
+                    msg_columns.size(),
+                    static_cast<int>(nkeys),
+                    &msg_columns,
+                    &rowgroups);
+    fbb.Finish(frame);
+    write_jay_meta(fbb, wb.get(), v2);
+  }
+  catch (...) {
+    wb = nullptr;
+    File file(path, File::READWRITE);
+    file.resize(old_size);
+    if (upgraded) write_jay_header(path, false);
+    throw;
+  }
+}
+
+
+// Check whether the first row of `columns` comes strictly after the last
+// row of `olddt` in the order of their first `nkeys` columns.
+//
+static bool rows_follow_key(const DataTable& olddt, const colvec& columns,
+                            size_t nkeys)
+{
+  size_t last = olddt.nrows() - 1;
+  std::vector<Column> keycols;
+  for (size_t k = 0; k < nkeys; ++k) {
+    Column col = olddt.get_column(k);
+    col.apply_rowindex(RowIndex(last, 1, 1));
+    Column first = columns[k];
+    first.apply_rowindex(RowIndex(0, 1, 1));
+    colvec tail { std::move(first) };
+    col.rbind(tail);
+    keycols.push_back(std::move(col));
+  }
+  auto res = group(keycols, std::vector<SortFlag>(nkeys, SortFlag::NONE));
+  size_t irow0;
+  res.first.get_element(0, &irow0);
+  return res.second.size() == 2 && irow0 == 0;
+}
+
+
+static void write_jay_meta(flatbuffers::FlatBufferBuilder& fbb,
+                           WritableBuffer* wb, bool v2)
+{
   uint8_t* metaBytes = fbb.GetBufferPointer();
   size_t   metaSize = fbb.GetSize();
   wb->write(metaSize, metaBytes);
@@ -104,11 +374,24 @@ void DataTable::save_jay_impl(WritableBuffer* wb) {
   }
 
   wb->write(8, &metaSize);
-  wb->write(8, "\0\0\0\0" "1JAY");
+  wb->write(8, v2? "\0\0\0\0" "2JAY" : "\0\0\0\0" "1JAY");
   wb->finalize();
 }
 
 
+// Overwrite the initial signature of an existing Jay file
+static void write_jay_header(const std::string& path, bool v2) {
+  std::FILE* fp = std::fopen(path.c_str(), "r+b");
+  if (!fp) {
+    throw IOError() << "Cannot open file " << path << Errno;
+  }
+  size_t n = std::fwrite(v2? "JAY2" : "JAY1", 1, 4, fp);
+  if (std::fclose(fp) != 0 || n != 4) {
+    throw IOError() << "Cannot write to file " << path << Errno;
+  }
+}
+
+
 
 //------------------------------------------------------------------------------
 // Save a column
@@ -117,56 +400,134 @@ void DataTable::save_jay_impl(WritableBuffer* wb) {
 flatbuffers::Offset<jay::Column> Column::write_to_jay(
         const std::string& name,
         flatbuffers::FlatBufferBuilder& fbb,
-        WritableBuffer* wb)
+        WritableBuffer* wb,
+        bool compress)
 {
   jay::Stats jsttype = jay::Stats_NONE;
-  flatbuffers::Offset<void> jsto;
-  Stats* colstats = get_stats_if_exist();
-  switch (stype()) {
-    case dt::SType::BOOL:
-      jsto = saveStats<int8_t,  jay::StatsBool>(colstats, fbb);
-      jsttype = jay::Stats_Bool;
-      break;
-    case dt::SType::INT8:
-      jsto = saveStats<int8_t,  jay::StatsInt8>(colstats, fbb);
-      jsttype = jay::Stats_Int8;
-      break;
-    case dt::SType::INT16:
-      jsto = saveStats<int16_t, jay::StatsInt16>(colstats, fbb);
-      jsttype = jay::Stats_Int16;
-      break;
-    case dt::SType::INT32:
-      jsto = saveStats<int32_t, jay::StatsInt32>(colstats, fbb);
-      jsttype = jay::Stats_Int32;
-      break;
-    case dt::SType::INT64:
-      jsto = saveStats<int64_t, jay::StatsInt64>(colstats, fbb);
-      jsttype = jay::Stats_Int64;
-      break;
-    case dt::SType::FLOAT32:
-      jsto = saveStats<float,   jay::StatsFloat32>(colstats, fbb);
-      jsttype = jay::Stats_Float32;
-      break;
-    case dt::SType::FLOAT64:
-      jsto = saveStats<double,  jay::StatsFloat64>(colstats, fbb);
-      jsttype = jay::Stats_Float64;
-      break;
-    default: break;
+  flatbuffers::Offset<void> jsto = saveColumnStats(*this, fbb, &jsttype);
+  flatbuffers::Offset<flatbuffers::String> sname;
+  if (!name.empty()) sname = fbb.CreateString(name.c_str());
+
+  jay::ColumnBuilder cbb(fbb);
+  cbb.add_type(stype_to_jaytype[static_cast<int>(stype())]);
+  if (!name.empty()) cbb.add_name(sname);
+  cbb.add_nullcount(na_count());
+  if (!(compress && write_compressed_data_to_jay(*this, cbb, wb))) {
+    write_data_to_jay(cbb, wb);
   }
 
+  if (jsttype != jay::Stats_NONE) {
+    cbb.add_stats_type(jsttype);
+    cbb.add_stats(jsto);
+  }
+
+  return cbb.Finish();
+}
+
+
+/**
+ * Save column `col` as a sequence of chunks, one per each row group,
+ * appending their descriptors to `chunks`. The min/max stats are always
+ * computed for the chunks, since they are used by the reader to skip
+ * the row groups that cannot match a filter.
+ */
+static void write_chunks_to_jay(
+    Column& col, const std::vector<uint64_t>& rowgroups,
+    flatbuffers::FlatBufferBuilder& fbb, WritableBuffer* wb, bool compress,
+    ColumnOffsets& chunks)
+{
+  size_t row0 = 0;
+  for (uint64_t n : rowgroups) {
+    Column chunk(col);
+    chunk.apply_rowindex(RowIndex(row0, n, 1));
+    chunk.materialize();
+    switch (chunk.ltype()) {
+      case dt::LType::BOOL:
+      case dt::LType::INT:
+        chunk.stats()->min_int();
+        chunk.stats()->max_int();
+        break;
+      case dt::LType::REAL:
+        chunk.stats()->min_double();
+        chunk.stats()->max_double();
+        break;
+      default: break;
+    }
+    chunks.push_back(chunk.write_to_jay(std::string(), fbb, wb, compress));
+    row0 += n;
+  }
+}
+
+
+/**
+ * Create the descriptor of a column stored as a sequence of `chunks`.
+ * Such a column has no data of its own. If `with_stats` is true, then
+ * the stats of `col` (if computed) are saved as the stats of the whole
+ * column.
+ */
+static flatbuffers::Offset<jay::Column> create_chunked_column(
+    flatbuffers::FlatBufferBuilder& fbb, const Column& col,
+    const std::string& name, size_t nullcount, const ColumnOffsets& chunks,
+    bool with_stats)
+{
+  auto jchunks = fbb.CreateVector(chunks);
+  jay::Stats jsttype = jay::Stats_NONE;
+  flatbuffers::Offset<void> jsto;
+  if (with_stats) jsto = saveColumnStats(col, fbb, &jsttype);
   auto sname = fbb.CreateString(name.c_str());
 
   jay::ColumnBuilder cbb(fbb);
-  cbb.add_type(stype_to_jaytype[static_cast<int>(stype())]);
+  cbb.add_type(stype_to_jaytype[static_cast<int>(col.stype())]);
   cbb.add_name(sname);
-  cbb.add_nullcount(na_count());
-  write_data_to_jay(cbb, wb);
-
+  cbb.add_nullcount(nullcount);
+  cbb.add_chunks(jchunks);
   if (jsttype != jay::Stats_NONE) {
     cbb.add_stats_type(jsttype);
     cbb.add_stats(jsto);
   }
+  return cbb.Finish();
+}
+
 
+/**
+ * Copy the descriptor of a chunk from an existing Jay file. The name
+ * of the column (if any) is not copied.
+ */
+template <typename T>
+static flatbuffers::Offset<void> copyStats(
+    flatbuffers::FlatBufferBuilder& fbb, const T* stats)
+{
+  if (!stats) return 0;
+  return fbb.CreateStruct(*stats).Union();
+}
+
+static flatbuffers::Offset<jay::Column> copy_jay_chunk(
+    flatbuffers::FlatBufferBuilder& fbb, const jay::Column* jcol)
+{
+  flatbuffers::Offset<void> jsto;
+  switch (jcol->stats_type()) {
+    case jay::Stats_Bool:    jsto = copyStats(fbb, jcol->stats_as_Bool()); break;
+    case jay::Stats_Int8:    jsto = copyStats(fbb, jcol->stats_as_Int8()); break;
+    case jay::Stats_Int16:   jsto = copyStats(fbb, jcol->stats_as_Int16()); break;
+    case jay::Stats_Int32:   jsto = copyStats(fbb, jcol->stats_as_Int32()); break;
+    case jay::Stats_Int64:   jsto = copyStats(fbb, jcol->stats_as_Int64()); break;
+    case jay::Stats_Float32: jsto = copyStats(fbb, jcol->stats_as_Float32()); break;
+    case jay::Stats_Float64: jsto = copyStats(fbb, jcol->stats_as_Float64()); break;
+    default: break;
+  }
+
+  jay::ColumnBuilder cbb(fbb);
+  cbb.add_type(jcol->type());
+  if (jcol->data()) cbb.add_data(jcol->data());
+  if (jcol->strdata()) cbb.add_strdata(jcol->strdata());
+  cbb.add_nullcount(jcol->nullcount());
+  if (!jsto.IsNull()) {
+    cbb.add_stats_type(jcol->stats_type());
+    cbb.add_stats(jsto);
+  }
+  cbb.add_codec(jcol->codec());
+  cbb.add_encoding(jcol->encoding());
+  cbb.add_dict_size(jcol->dict_size());
   return cbb.Finish();
 }
 
@@ -229,10 +590,194 @@ void dt::Rbound_ColumnImpl::write_data_to_jay(
 
 
 
+//------------------------------------------------------------------------------
+// Save a compressed column
+//------------------------------------------------------------------------------
+
+// Size of the data sample used to select the best encoding of an integer
+// column.
+static constexpr size_t ENCODING_SAMPLE_SIZE = 1 << 16;
+
+// The dictionary encoding is used only if a string column has no more
+// than `nrows / DICTIONARY_MIN_RATIO` distinct values.
+static constexpr size_t DICTIONARY_MIN_RATIO = 4;
+
+
+/**
+ * For integer columns, either of the Shuffle and Delta encodings could
+ * be better, depending on the data. Select the one which compresses a
+ * sample from the beginning of the column better.
+ */
+static jay::Encoding choose_int_encoding(
+    const void* data, size_t size, size_t elemsize)
+{
+  size_t sample_size = std::min(size, ENCODING_SAMPLE_SIZE);
+  size_t shuffle_size =
+      dt::jay_compress(data, sample_size, elemsize, jay::Encoding_Shuffle).size();
+  size_t delta_size =
+      dt::jay_compress(data, sample_size, elemsize, jay::Encoding_Delta).size();
+  return (delta_size < shuffle_size)? jay::Encoding_Delta
+                                    : jay::Encoding_Shuffle;
+}
+
+
+/**
+ * Attempt to encode a string column as a dictionary of its distinct values
+ * plus an array of int32 indices into this dictionary. Returns false if
+ * the column has too many distinct values for such encoding to be useful.
+ */
+template <typename T>
+static bool compress_dictionary(const Column& col, Buffer* data,
+                                Buffer* strdata, size_t* dict_size)
+{
+  size_t nrows = col.nrows();
+  size_t max_dict_size = std::min(nrows / DICTIONARY_MIN_RATIO,
+                                  size_t(std::numeric_limits<int32_t>::max()));
+  if (max_dict_size == 0) return false;
+
+  std::unordered_map<std::string, int32_t> index;
+  std::vector<const std::string*> values;
+  Buffer codes = Buffer::mem(nrows * sizeof(int32_t));
+  auto codes_ptr = static_cast<int32_t*>(codes.xptr());
+  size_t nchars = 0;
+  CString str;
+  for (size_t i = 0; i < nrows; ++i) {
+    // Give up early if the beginning of the column has too many distinct
+    // values already
+    if (i == ENCODING_SAMPLE_SIZE &&
+        values.size() > i / DICTIONARY_MIN_RATIO) return false;
+    bool isvalid = col.get_element(i, &str);
+    if (!isvalid) {
+      codes_ptr[i] = -1;
+      continue;
+    }
+    auto res = index.emplace(std::string(str.ch, static_cast<size_t>(str.size)),
+                             static_cast<int32_t>(values.size()));
+    if (res.second) {
+      if (values.size() == max_dict_size) return false;
+      values.push_back(&res.first->first);
+      nchars += res.first->first.size();
+    }
+    codes_ptr[i] = res.first->second;
+  }
+
+  size_t K = values.size();
+  Buffer dict = Buffer::mem((K + 1) * sizeof(T) + nchars);
+  auto offsets = static_cast<T*>(dict.xptr());
+  auto chars = static_cast<char*>(dict.xptr()) + (K + 1) * sizeof(T);
+  offsets[0] = 0;
+  size_t pos = 0;
+  for (size_t k = 0; k < K; ++k) {
+    const std::string& value = *values[k];
+    std::memcpy(chars + pos, value.data(), value.size());
+    pos += value.size();
+    offsets[k + 1] = static_cast<T>(pos);
+  }
+
+  *data = dt::jay_compress(codes_ptr, codes.size(), sizeof(int32_t),
+                           jay::Encoding_Shuffle);
+  *strdata = dt::jay_compress(dict.rptr(), dict.size(), 1, jay::Encoding_Plain);
+  *dict_size = K;
+  return true;
+}
+
+
+/**
+ * Write column's data in compressed form. The encoding is selected
+ * based on the column's type and its data. If compression does not
+ * reduce the size of the data, then nothing is written, and the
+ * function returns false: the column should be saved uncompressed.
+ */
+static bool write_compressed_data_to_jay(
+    Column& col, jay::ColumnBuilder& cbb, WritableBuffer* wb)
+{
+  col.materialize();
+  size_t nbufs = col.get_num_data_buffers();
+  xassert(nbufs == 1 || nbufs == 2);
+  const void* data = col.get_data_readonly(0);
+  size_t data_size = col.get_data_size(0);
+  size_t raw_size = data_size + (nbufs == 2? col.get_data_size(1) : 0);
+
+  jay::Encoding encoding = jay::Encoding_Plain;
+  Buffer zdata, zstrdata;
+  size_t dict_size = 0;
+  switch (col.stype()) {
+    case dt::SType::BOOL:
+      zdata = dt::jay_compress(data, data_size, 1, encoding);
+      break;
+    case dt::SType::INT8:
+    case dt::SType::INT16:
+    case dt::SType::INT32:
+    case dt::SType::INT64: {
+      size_t elemsize = col.elemsize();
+      encoding = choose_int_encoding(data, data_size, elemsize);
+      zdata = dt::jay_compress(data, data_size, elemsize, encoding);
+      break;
+    }
+    case dt::SType::FLOAT32:
+    case dt::SType::FLOAT64:
+      encoding = jay::Encoding_Shuffle;
+      zdata = dt::jay_compress(data, data_size, col.elemsize(), encoding);
+      break;
+    case dt::SType::STR32:
+    case dt::SType::STR64: {
+      bool str32 = (col.stype() == dt::SType::STR32);
+      bool dict = str32? compress_dictionary<uint32_t>(col, &zdata, &zstrdata, &dict_size)
+                       : compress_dictionary<uint64_t>(col, &zdata, &zstrdata, &dict_size);
+      if (dict) {
+        encoding = jay::Encoding_Dictionary;
+      } else {
+        // String offsets are non-decreasing (apart from the NA flags),
+        // and their deltas are the lengths of the strings.
+        encoding = jay::Encoding_Delta;
+        zdata = dt::jay_compress(data, data_size, col.elemsize(), encoding);
+        zstrdata = dt::jay_compress(col.get_data_readonly(1),
+                                    col.get_data_size(1), 1,
+                                    jay::Encoding_Plain);
+      }
+      break;
+    }
+    default:
+      return false;
+  }
+  if (zdata.size() + zstrdata.size() >= raw_size) return false;
+
+  jay::Buffer saved_data = saveMemoryRange(zdata.rptr(), zdata.size(), wb);
+  cbb.add_data(&saved_data);
+  if (nbufs == 2) {
+    jay::Buffer saved_strdata =
+        saveMemoryRange(zstrdata.rptr(), zstrdata.size(), wb);
+    cbb.add_strdata(&saved_strdata);
+  }
+  cbb.add_codec(jay::Codec_Zlib);
+  cbb.add_encoding(encoding);
+  if (dict_size) cbb.add_dict_size(dict_size);
+  return true;
+}
+
+
+
+
 //------------------------------------------------------------------------------
 // Helpers
 //------------------------------------------------------------------------------
 
+static dt::SType jaytype_to_stype(jay::Type jtype) {
+  switch (jtype) {
+    case jay::Type_Bool8:   return dt::SType::BOOL;
+    case jay::Type_Int8:    return dt::SType::INT8;
+    case jay::Type_Int16:   return dt::SType::INT16;
+    case jay::Type_Int32:   return dt::SType::INT32;
+    case jay::Type_Int64:   return dt::SType::INT64;
+    case jay::Type_Float32: return dt::SType::FLOAT32;
+    case jay::Type_Float64: return dt::SType::FLOAT64;
+    case jay::Type_Str32:   return dt::SType::STR32;
+    case jay::Type_Str64:   return dt::SType::STR64;
+  }
+  return dt::SType::VOID;
+}
+
+
 static jay::Buffer saveMemoryRange(
     const void* data, size_t len, WritableBuffer* wb)
 {
@@ -248,6 +793,39 @@ static jay::Buffer saveMemoryRange(
 
 
 
+static flatbuffers::Offset<void> saveColumnStats(
+    const Column& col, flatbuffers::FlatBufferBuilder& fbb,
+    jay::Stats* jsttype)
+{
+  Stats* colstats = col.get_stats_if_exist();
+  switch (col.stype()) {
+    case dt::SType::BOOL:
+      *jsttype = jay::Stats_Bool;
+      return saveStats<int8_t,  jay::StatsBool>(colstats, fbb);
+    case dt::SType::INT8:
+      *jsttype = jay::Stats_Int8;
+      return saveStats<int8_t,  jay::StatsInt8>(colstats, fbb);
+    case dt::SType::INT16:
+      *jsttype = jay::Stats_Int16;
+      return saveStats<int16_t, jay::StatsInt16>(colstats, fbb);
+    case dt::SType::INT32:
+      *jsttype = jay::Stats_Int32;
+      return saveStats<int32_t, jay::StatsInt32>(colstats, fbb);
+    case dt::SType::INT64:
+      *jsttype = jay::Stats_Int64;
+      return saveStats<int64_t, jay::StatsInt64>(colstats, fbb);
+    case dt::SType::FLOAT32:
+      *jsttype = jay::Stats_Float32;
+      return saveStats<float,   jay::StatsFloat32>(colstats, fbb);
+    case dt::SType::FLOAT64:
+      *jsttype = jay::Stats_Float64;
+      return saveStats<double,  jay::StatsFloat64>(colstats, fbb);
+    default:
+      return 0;
+  }
+}
+
+
 template <typename T, typename StatBuilder>
 static flatbuffers::Offset<void> saveStats(
     Stats* stats, flatbuffers::FlatBufferBuilder& fbb)
@@ -277,9 +855,11 @@ namespace py {
 
 
 static PKArgs args_to_jay(
-  1, 0, 1, false, false, {"path", "method"}, "to_jay",
+  1, 0, 4, false, false,
+  {"path", "method", "compression", "rowgroup_size", "append"}, "to_jay",
 
-R"(to_jay(self, path, method='auto')
+R"(to_jay(self, path, method='auto', compression=None, rowgroup_size=None,
+       append=False)
 --
 
 Save this frame to a binary file on disk, in .jay format.
@@ -298,6 +878,37 @@ method: 'mmap' | 'write' | 'auto'
     method is more portable across different operating systems, but
     may be slower. This parameter has no effect when `path` is
     omitted.
+
+compression: None | "zlib"
+    Which compression method to use for the data of the columns.
+    By default the data is stored uncompressed, which allows the file
+    to be memory-mapped when it is opened. With "zlib" compression,
+    each column is compressed separately, after being transformed with
+    an encoding best suited for the column's type: byte-shuffling for
+    floats, delta-encoding for integers and string offsets, or
+    dictionary-encoding for strings with few distinct values. Columns
+    that cannot be compressed are stored as-is. The compressed columns
+    are decompressed (in parallel) when the file is opened.
+
+rowgroup_size: int
+    If given, the rows of the frame will be split into groups of this
+    many rows, and the data of each column will be stored separately
+    for each row group, together with the group's min/max stats. When
+    the saved file is opened, a filter such as ``DT[f.A > x, :]`` will
+    skip the row groups which cannot contain any matching rows, without
+    reading their data. This is useful for large files that are sorted
+    (or approximately sorted) by some column, such as a timestamp.
+
+append: bool
+    If True, and the file `path` already exists, then the rows of this
+    frame will be appended to that file: the new data is written as
+    additional row group(s) at the end of the file, without reading or
+    rewriting the data that is already there. The file's columns must
+    have the same names and types as the columns of this frame. If
+    the file is keyed, then this frame must have the same key, and
+    its rows must come after the rows already in the file in the
+    order of the key. When such file is opened, each column is a lazy
+    concatenation of its row groups.
 )");
 
 
@@ -322,14 +933,46 @@ oobj Frame::to_jay(const PKArgs& args) {
         "one of 'mmap', 'write' or 'auto'; instead got '" << str_method << "'";
   }
 
+  // compression
+  auto str_compression = args[2].to<std::string>("none");
+  bool compress = false;
+  if (str_compression == "zlib") {
+    compress = true;
+  } else if (str_compression != "none") {
+    throw ValueError() << "Unsupported compression method '"
+        << str_compression << "' in Frame.to_jay()";
+  }
+
+  // rowgroup_size
+  size_t rowgroup_size = 0;
+  if (!args[3].is_none_or_undefined()) {
+    int64_t n = args[3].to_int64_strict();
+    if (n <= 0) {
+      throw ValueError() << args[3].name() << " should be positive, "
+          "instead got " << n;
+    }
+    rowgroup_size = static_cast<size_t>(n);
+  }
+
+  // append
+  bool append = args[4].to<bool>(false);
+
   if (filename.empty()) {
-    Buffer mr = dt->save_jay();
+    if (append) {
+      throw ValueError() << "Parameter `append` in Frame.to_jay() cannot "
+          "be used without the `path`";
+    }
+    Buffer mr = dt->save_jay(compress, rowgroup_size);
     auto data = static_cast<const char*>(mr.xptr());
     auto size = static_cast<Py_ssize_t>(mr.size());
     return oobj::from_new_reference(PyBytes_FromStringAndSize(data, size));
   }
   else {
-    dt->save_jay(filename, method);
+    if (append) {
+      dt->append_jay(filename, method, compress, rowgroup_size);
+    } else {
+      dt->save_jay(filename, method, compress, rowgroup_size);
+    }
     return None();
   }
 }
@@ -12,7 +12,11 @@
 
 
 
-MemoryMapManager::MemoryMapManager(size_t nelems) {
+MemoryMapManager::MemoryMapManager(size_t nelems)
+  : cache_hand(0),
+    cache_size(0),
+    cache_limit(NO_LIMIT)
+{
   entries.reserve(nelems);
   entries.push_back(MmmEntry());
 }
@@ -69,4 +73,81 @@ void MemoryMapManager::sort_entries() {
 }
 
 
+
+
+//------------------------------------------------------------------------------
+// Page cache
+//------------------------------------------------------------------------------
+
+// Add worker `obj` of the given `size` to the page cache, evicting
+// other workers if necessary in order to stay within the limit. The
+// worker must not already be in the cache.
+void MemoryMapManager::cache_add(MemoryMapWorker* obj, size_t size) {
+  std::lock_guard<std::mutex> lock(cache_mutex);
+  if (cache_limit != NO_LIMIT) {
+    cache_shrink(size <= cache_limit? cache_limit - size : 0);
+  }
+  cache.push_back(MmmEntry(size, obj));
+  cache_size += size;
+}
+
+
+// Careful not to throw any exceptions here: this method is called from
+// the destructors of the workers.
+void MemoryMapManager::cache_del(MemoryMapWorker* obj) {
+  std::lock_guard<std::mutex> lock(cache_mutex);
+  for (size_t i = 0; i < cache.size(); ++i) {
+    if (cache[i].obj == obj) {
+      cache_size -= cache[i].size;
+      std::swap(cache[i], cache.back());
+      cache.pop_back();
+      return;
+    }
+  }
+}
+
+
+// Evict workers from the cache until their total size becomes no
+// more than `target_size`. The workers that were accessed since the
+// last sweep get a second chance. The `cache_mutex` must be held by
+// the caller.
+void MemoryMapManager::cache_shrink(size_t target_size) {
+  while (cache_size > target_size) {
+    xassert(!cache.empty());
+    if (cache_hand >= cache.size()) cache_hand = 0;
+    MmmEntry& entry = cache[cache_hand];
+    if (entry.obj->check_accessed()) {
+      cache_hand++;
+      continue;
+    }
+    entry.obj->evict_pages();
+    cache_size -= entry.size;
+    std::swap(entry, cache.back());
+    cache.pop_back();
+  }
+}
+
+
+size_t MemoryMapManager::get_cache_size() const {
+  std::lock_guard<std::mutex> lock(cache_mutex);
+  return cache_size;
+}
+
+size_t MemoryMapManager::get_cache_limit() const {
+  std::lock_guard<std::mutex> lock(cache_mutex);
+  return cache_limit;
+}
+
+void MemoryMapManager::set_cache_limit(size_t limit) {
+  std::lock_guard<std::mutex> lock(cache_mutex);
+  cache_limit = limit;
+  cache_shrink(limit);
+}
+
+
+
 MemoryMapWorker::~MemoryMapWorker() {}
+
+void MemoryMapWorker::evict_pages() {}
+
+bool MemoryMapWorker::check_accessed() { return false; }
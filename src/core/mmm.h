@@ -7,6 +7,7 @@
 //------------------------------------------------------------------------------
 #ifndef dt_MMM_h
 #define dt_MMM_h
+#include <mutex>
 #include <vector>
 #include "_dt.h"
 
@@ -16,6 +17,22 @@ public:
   virtual ~MemoryMapWorker();
   virtual void save_entry_index(size_t i) = 0;
   virtual void evict() = 0;
+
+  // The methods below are used by the workers that participate in the
+  // page cache (see `MemoryMapManager::cache_add()`):
+  //
+  // evict_pages()
+  //   Release the memory held by the worker. Unlike `evict()`, the
+  //   worker must remain fully usable afterwards: the pages will be
+  //   brought back when the data is accessed again, at which point
+  //   the worker adds itself to the cache again.
+  //
+  // check_accessed()
+  //   Return true if the worker's data was accessed since the last
+  //   call to this method (and reset the flag).
+  //
+  virtual void evict_pages();
+  virtual bool check_accessed();
 };
 
 
@@ -33,20 +50,41 @@ public:
 };
 
 
+/**
+ * The page cache is a collection of workers whose memory can be
+ * released at any time without invalidating their data pointers
+ * (for example, a read-only memory-mapped region of a file). The total
+ * size of all workers in the cache is kept below `cache_limit`: when a
+ * new worker is added, the workers that were not accessed recently are
+ * evicted using the CLOCK ("second chance") algorithm.
+ */
 class MemoryMapManager {
   std::vector<MmmEntry> entries;  // 0th entry always remains empty.
+  std::vector<MmmEntry> cache;
+  size_t cache_hand;
+  size_t cache_size;
+  size_t cache_limit;
+  mutable std::mutex cache_mutex;
 
 public:
+  static constexpr size_t NO_LIMIT = size_t(-1);
   static MemoryMapManager* get();
   void add_entry(MemoryMapWorker* obj, size_t size);
   void del_entry(size_t i);
   void freeup_memory();
   bool check_entry(size_t i, const MemoryMapWorker* obj);
 
+  void cache_add(MemoryMapWorker* obj, size_t size);
+  void cache_del(MemoryMapWorker* obj);
+  size_t get_cache_size() const;
+  size_t get_cache_limit() const;
+  void set_cache_limit(size_t limit);
+
 private:
   static const size_t n_entries_to_purge = 128;
   MemoryMapManager(size_t nelems);
   void sort_entries();
+  void cache_shrink(size_t target_size);
 };
 
 
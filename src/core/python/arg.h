@@ -50,6 +50,8 @@ class Arg : public _obj::error_manager {
     void set(PyObject* value);
 
     //---- Type checks -----------------
+    bool is_arrow_batch() const;
+    bool is_arrow_table() const;
     bool is_auto() const;  // check for string "auto"
     bool is_bool() const;
     bool is_bytes() const;
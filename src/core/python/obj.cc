@@ -47,8 +47,11 @@ static PyObject* numpy_int64 = nullptr;
 static PyObject* numpy_float16 = nullptr;
 static PyObject* numpy_float32 = nullptr;
 static PyObject* numpy_float64 = nullptr;
+static PyObject* arrow_RecordBatch_type = nullptr;
+static PyObject* arrow_Table_type = nullptr;
 static void init_pandas();
 static void init_numpy();
+static void init_arrow();
 
 // Set from datatablemodule.cc
 PyObject* Expr_Type = nullptr;
@@ -258,6 +261,18 @@ bool _obj::is_pandas_series() const noexcept {
   return PyObject_IsInstance(v, pandas_Series_type);
 }
 
+bool _obj::is_arrow_batch() const noexcept {
+  if (!arrow_RecordBatch_type) init_arrow();
+  if (!v || !arrow_RecordBatch_type) return false;
+  return PyObject_IsInstance(v, arrow_RecordBatch_type);
+}
+
+bool _obj::is_arrow_table() const noexcept {
+  if (!arrow_Table_type) init_arrow();
+  if (!v || !arrow_Table_type) return false;
+  return PyObject_IsInstance(v, arrow_Table_type);
+}
+
 bool _obj::is_numpy_array() const noexcept {
   if (!numpy_Array_type) init_numpy();
   if (!v || !numpy_Array_type) return false;
@@ -1092,6 +1107,14 @@ static void init_numpy() {
   }
 }
 
+static void init_arrow() {
+  py::oobj pa = get_module("pyarrow");
+  if (pa) {
+    arrow_RecordBatch_type = pa.get_attr("RecordBatch").release();
+    arrow_Table_type       = pa.get_attr("Table").release();
+  }
+}
+
 
 oobj None()     { return oobj(Py_None); }
 oobj True()     { return oobj(Py_True); }
@@ -159,6 +159,8 @@ class _obj {
     // Type tests
     //--------------------------------------------------------------------------
     bool is_anytype()       const noexcept;
+    bool is_arrow_batch()   const noexcept;
+    bool is_arrow_table()   const noexcept;
     bool is_bool()          const noexcept;
     bool is_buffer()        const noexcept;
     bool is_by_node()       const noexcept;
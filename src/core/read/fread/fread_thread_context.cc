@@ -35,7 +35,8 @@ FreadThreadContext::FreadThreadContext(
   ) : ThreadContext(bcols, brows, f.preframe),
       types(types_),
       freader(f),
-      parsers(ParserLibrary::get_parser_fns())
+      parsers(ParserLibrary::get_parser_fns()),
+      row_filter(f.row_filter.get())
 {
   parse_ctx_ = f.makeTokenizer();
   parse_ctx_.target = tbuf.data();
@@ -48,6 +49,9 @@ FreadThreadContext::FreadThreadContext(
   fill = f.fill;
   skipEmptyLines = f.skip_blank_lines;
   numbersMayBeNAs = f.number_is_na;
+  for (const auto& col : f.preframe) {
+    dropped.push_back(col.is_dropped());
+  }
 }
 
 FreadThreadContext::~FreadThreadContext() {
@@ -67,6 +71,7 @@ void FreadThreadContext::read_chunk(
   actual_cc.set_end_exact(nullptr);
 
   size_t ncols = preframe_.ncols();
+  bool limited = (nrows_limit_ != NO_LIMIT);
   bool fillme = fill || (ncols==1 && !skipEmptyLines);
   bool fastParsingAllowed = (sep != ' ') && !numbersMayBeNAs;
   const char*& tch = parse_ctx_.ch;
@@ -89,7 +94,8 @@ void FreadThreadContext::read_chunk(
       // Try most common and fastest branch first: no whitespace, no numeric NAs, blank means NA
       while (j < ncols) {
         fieldStart = tch;
-        parsers[types[j]](parse_ctx_);
+        if (dropped[j]) skip_string(parse_ctx_);
+        else parsers[types[j]](parse_ctx_);
         if (tch >= parse_ctx_.eof || *tch != sep) break;
         parse_ctx_.target += preframe_.column(j).is_in_buffer();
         tch++;
@@ -105,7 +111,11 @@ void FreadThreadContext::read_chunk(
       else if (parse_ctx_.skip_eol() && j < ncols) {
         parse_ctx_.target += preframe_.column(j).is_in_buffer();
         j++;
-        if (j==ncols) { used_nrows++; continue; }  // next line
+        if (j==ncols) {  // next line
+          used_nrows++;
+          if (limited && at_nrows_limit()) break;
+          continue;
+        }
         tch--;
       }
       else {
@@ -137,7 +147,8 @@ void FreadThreadContext::read_chunk(
             if (!parse_ctx_.at_end_of_field()) tch = afterSpace;
             if (tch < parse_ctx_.eof && *tch==quote) { quoted=true; tch++; }
           }
-          parsers[*ptype_iter](parse_ctx_);
+          if (dropped[j]) skip_string(parse_ctx_);
+          else parsers[*ptype_iter](parse_ctx_);
           if (quoted) {
             if (tch < parse_ctx_.eof && *tch==quote) tch++;
             else goto typebump;
@@ -237,8 +248,15 @@ void FreadThreadContext::read_chunk(
       }
     }
     used_nrows++;
+    if (limited && at_nrows_limit()) break;
   }
 
+  // Discard the rows that do not pass the filter before they are
+  // committed to the output.
+  if (row_filter && !limited) {
+    used_nrows = row_filter->apply(tbuf.data(), tbuf_ncols, used_nrows,
+                                   parse_ctx_);
+  }
   preorder();
 
   // Tell the caller where we finished reading the chunk. This is why
@@ -251,6 +269,26 @@ void FreadThreadContext::read_chunk(
 
 
 
+/**
+  * Called after each row is read when `nrows_limit_` is in effect;
+  * returns true if the limit was reached. In this mode the filter is
+  * applied to every row as soon as it is read, so that the limit
+  * counts only the rows that pass the filter.
+  */
+bool FreadThreadContext::at_nrows_limit() {
+  if (row_filter) {
+    field64* row = tbuf.data() + (used_nrows - 1) * tbuf_ncols;
+    if (!row_filter->apply(row, tbuf_ncols, 1, parse_ctx_)) {
+      used_nrows--;
+      parse_ctx_.target = row;
+    }
+  }
+  return used_nrows == nrows_limit_;
+}
+
+
+
+
 void FreadThreadContext::postorder() {
   double t0 = verbose? wallclock() : 0;
   ThreadContext::postorder();
@@ -21,7 +21,9 @@
 //------------------------------------------------------------------------------
 #ifndef dt_READ_FREAD_THREAD_CONTEXT_h
 #define dt_READ_FREAD_THREAD_CONTEXT_h
+#include <vector>                       // std::vector
 #include "read/parse_context.h"         // ParseContext
+#include "read/row_filter.h"            // RowFilter
 #include "read/thread_context.h"        // ThreadContext
 #include "_dt.h"
 namespace dt {
@@ -50,6 +52,11 @@ class FreadThreadContext : public ThreadContext
 
     FreadReader& freader;
     const ParserFnPtr* parsers;
+    const RowFilter* row_filter;
+
+    // For each column, whether it is dropped from the output. Fields in
+    // such columns are skipped over without parsing.
+    std::vector<uint8_t> dropped;
 
   public:
     FreadThreadContext(size_t bcols, size_t brows, FreadReader&, PT* types);
@@ -61,6 +68,9 @@ class FreadThreadContext : public ThreadContext
     void postorder() override;
 
     ParseContext& get_tokenizer() { return parse_ctx_; }
+
+  private:
+    bool at_nrows_limit();
 };
 
 
@@ -0,0 +1,655 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>         // std::max, std::min
+#include <cstring>           // std::memchr, std::memcpy
+#include "lib/zlib/zlib.h"   // zlib::crc32, zlib::adler32
+#include "parallel/api.h"    // dt::parallel_for_dynamic
+#include "read/gzip.h"
+#include "utils/assert.h"
+#include "utils/exceptions.h"
+namespace dt {
+namespace read {
+
+static constexpr size_t INVALID = size_t(-1);
+
+
+//------------------------------------------------------------------------------
+// HuffmanTable
+//------------------------------------------------------------------------------
+
+/**
+  * Decoding table for a canonical Huffman code, as used in the
+  * DEFLATE format (RFC-1951). The codes are stored in the bit stream
+  * starting from their most significant bit, which means that when
+  * the stream is read as a little-endian integer, each code appears
+  * bit-reversed.
+  *
+  * The table is two-level: the primary table is indexed by the first
+  * `bits_` bits of the input, and resolves all codes that are not
+  * longer than `bits_`. For longer codes, the primary entry points
+  * to a secondary table, indexed by the remaining bits.
+  *
+  * Each entry is `symbol | (length << 16)`, where length is the full
+  * length of the code; a zero length marks an invalid code. Entries
+  * pointing to a secondary table have the SUBTABLE flag set, and
+  * contain the offset of the subtable and its number of index bits.
+  */
+class HuffmanTable {
+  private:
+    std::vector<uint32_t> entries_;
+    size_t bits_;
+    static constexpr uint32_t SUBTABLE = 0x80000000u;
+
+  public:
+    HuffmanTable() : bits_(0) {}
+
+    // Build the table from the array of code `lengths` for symbols
+    // 0 .. n-1. Returns false if the lengths are over-subscribed.
+    // Incomplete codes are allowed: the missing codes are simply
+    // marked invalid.
+    bool build(const uint8_t* lengths, size_t n, size_t bits) {
+      size_t count[16] = {0};
+      for (size_t i = 0; i < n; ++i) count[lengths[i]]++;
+      count[0] = 0;
+      int64_t left = 1;
+      for (size_t len = 1; len < 16; ++len) {
+        left = 2*left - static_cast<int64_t>(count[len]);
+        if (left < 0) return false;
+      }
+      uint32_t next_code[16];
+      uint32_t code = 0;
+      for (size_t len = 1; len < 16; ++len) {
+        code = (code + static_cast<uint32_t>(count[len - 1])) << 1;
+        next_code[len] = code;
+      }
+
+      bits_ = bits;
+      const size_t size0 = size_t(1) << bits;
+      const uint32_t mask = static_cast<uint32_t>(size0 - 1);
+      std::vector<uint32_t> revcodes(n);
+      std::vector<uint8_t> subbits(size0, 0);
+      for (size_t i = 0; i < n; ++i) {
+        size_t len = lengths[i];
+        if (!len) continue;
+        uint32_t c = next_code[len]++;
+        uint32_t r = 0;
+        for (size_t j = 0; j < len; ++j) {
+          r = (r << 1) | (c & 1);
+          c >>= 1;
+        }
+        revcodes[i] = r;
+        if (len > bits) {
+          auto& sb = subbits[r & mask];
+          sb = std::max(sb, static_cast<uint8_t>(len - bits));
+        }
+      }
+
+      size_t size = size0;
+      std::vector<uint32_t> suboffsets(size0, 0);
+      for (size_t p = 0; p < size0; ++p) {
+        if (!subbits[p]) continue;
+        suboffsets[p] = static_cast<uint32_t>(size);
+        size += size_t(1) << subbits[p];
+      }
+      xassert(size <= 0xFFFF);
+      entries_.assign(size, 0);
+      for (size_t p = 0; p < size0; ++p) {
+        if (!subbits[p]) continue;
+        entries_[p] = SUBTABLE | (uint32_t(subbits[p]) << 16) | suboffsets[p];
+      }
+      for (size_t i = 0; i < n; ++i) {
+        size_t len = lengths[i];
+        if (!len) continue;
+        uint32_t entry = static_cast<uint32_t>(i | (len << 16));
+        size_t r = revcodes[i];
+        if (len <= bits) {
+          for (size_t j = r; j < size0; j += size_t(1) << len) {
+            entries_[j] = entry;
+          }
+        } else {
+          size_t p = r & mask;
+          size_t base = suboffsets[p];
+          size_t subsize = size_t(1) << subbits[p];
+          for (size_t j = r >> bits; j < subsize; j += size_t(1) << (len - bits)) {
+            entries_[base + j] = entry;
+          }
+        }
+      }
+      return true;
+    }
+
+    // Look up the entry corresponding to the code at the beginning of
+    // `bitbuf`. The caller must ensure that `bitbuf` contains at least
+    // 15 bits of input.
+    uint32_t lookup(uint64_t bitbuf) const {
+      return lookup(entries_.data(), bits_, bitbuf);
+    }
+
+    static uint32_t lookup(const uint32_t* entries, size_t bits,
+                           uint64_t bitbuf)
+    {
+      uint32_t entry = entries[bitbuf & ((uint64_t(1) << bits) - 1)];
+      if (entry & SUBTABLE) {
+        size_t sbits = (entry >> 16) & 0xFF;
+        size_t index = (bitbuf >> bits) & ((size_t(1) << sbits) - 1);
+        entry = entries[(entry & 0xFFFF) + index];
+      }
+      return entry;
+    }
+
+    const uint32_t* entries() const { return entries_.data(); }
+    size_t bits() const { return bits_; }
+};
+
+
+static constexpr size_t LITLEN_BITS = 10;
+static constexpr size_t DIST_BITS = 8;
+static constexpr size_t CODELEN_BITS = 7;
+
+static const uint16_t LENGTH_BASE[29] = {
+  3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31,
+  35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258
+};
+static const uint8_t LENGTH_EXTRA[29] = {
+  0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2,
+  3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0
+};
+static const uint16_t DIST_BASE[30] = {
+  1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193,
+  257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145,
+  8193, 12289, 16385, 24577
+};
+static const uint8_t DIST_EXTRA[30] = {
+  0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6,
+  7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13
+};
+static const uint8_t CODELEN_ORDER[19] = {
+  16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15
+};
+
+
+static inline uint64_t load_le64(const uint8_t* p) {
+  return uint64_t(p[0]) | (uint64_t(p[1]) << 8) | (uint64_t(p[2]) << 16) |
+         (uint64_t(p[3]) << 24) | (uint64_t(p[4]) << 32) |
+         (uint64_t(p[5]) << 40) | (uint64_t(p[6]) << 48) |
+         (uint64_t(p[7]) << 56);
+}
+
+
+static const HuffmanTable& fixed_litlen_table() {
+  static HuffmanTable table = []{
+    uint8_t lengths[288];
+    std::fill(lengths, lengths + 144, 8);
+    std::fill(lengths + 144, lengths + 256, 9);
+    std::fill(lengths + 256, lengths + 280, 7);
+    std::fill(lengths + 280, lengths + 288, 8);
+    HuffmanTable res;
+    res.build(lengths, 288, LITLEN_BITS);
+    return res;
+  }();
+  return table;
+}
+
+static const HuffmanTable& fixed_dist_table() {
+  static HuffmanTable table = []{
+    uint8_t lengths[32];
+    std::fill(lengths, lengths + 32, 5);
+    HuffmanTable res;
+    res.build(lengths, 32, DIST_BITS);
+    return res;
+  }();
+  return table;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// GzipDecoder
+//------------------------------------------------------------------------------
+
+GzipDecoder::GzipDecoder(const uint8_t* input, size_t size)
+  : input_(input),
+    input_size_(size),
+    pos_(0),
+    bitbuf_(0),
+    bitcount_(0),
+    outptr_(nullptr),
+    outsize_(0),
+    outcapacity_(0),
+    member_start_(0) {}
+
+
+size_t GzipDecoder::decode_member(size_t offset) {
+  pos_ = offset;
+  bitbuf_ = 0;
+  bitcount_ = 0;
+  member_start_ = outsize_;
+  if (!(read_header() && inflate() && read_trailer())) return 0;
+  // Gzip files may be padded with zeros after the last member
+  while (pos_ < input_size_ && input_[pos_] == 0) pos_++;
+  return pos_;
+}
+
+
+bool GzipDecoder::decode_zlib(size_t size_hint) {
+  if (input_size_ < 6) return false;
+  unsigned cmf = input_[0], flg = input_[1];
+  if ((cmf & 15) != 8 || (cmf >> 4) > 7 || (cmf * 256 + flg) % 31 != 0 ||
+      (flg & 0x20)) {
+    return false;
+  }
+  pos_ = 2;
+  bitbuf_ = 0;
+  bitcount_ = 0;
+  member_start_ = outsize_;
+  ensure_capacity(size_hint + 258);
+  if (!inflate()) return false;
+  align_to_byte();
+  if (pos_ + 4 != input_size_) return false;
+  const uint8_t* t = input_ + pos_;
+  uint32_t adler = (uint32_t(t[0]) << 24) | (uint32_t(t[1]) << 16) |
+                   (uint32_t(t[2]) << 8) | uint32_t(t[3]);
+  pos_ += 4;
+
+  size_t size = outsize_ - member_start_;
+  zlib::uLong actual_adler = zlib::adler32(0, nullptr, 0);
+  const uint8_t* data = outptr_ + member_start_;
+  constexpr size_t ADLER_BLOCK = size_t(1) << 30;
+  for (size_t i = 0; i < size; i += ADLER_BLOCK) {
+    auto n = static_cast<zlib::uInt>(std::min(ADLER_BLOCK, size - i));
+    actual_adler = zlib::adler32(actual_adler, data + i, n);
+  }
+  return static_cast<uint32_t>(actual_adler) == adler;
+}
+
+
+Buffer GzipDecoder::release() {
+  output_.resize(outsize_);
+  outptr_ = nullptr;
+  outcapacity_ = 0;
+  outsize_ = 0;
+  return std::move(output_);
+}
+
+
+bool GzipDecoder::read_header() {
+  constexpr uint8_t FHCRC = 2, FEXTRA = 4, FNAME = 8, FCOMMENT = 16;
+  if (pos_ + 18 > input_size_) return false;
+  const uint8_t* h = input_ + pos_;
+  if (h[0] != 0x1F || h[1] != 0x8B || h[2] != 8) return false;
+  uint8_t flags = h[3];
+  if (flags & 0xE0) return false;
+  pos_ += 10;
+  if (flags & FEXTRA) {
+    if (pos_ + 2 > input_size_) return false;
+    pos_ += 2 + (input_[pos_] | (size_t(input_[pos_ + 1]) << 8));
+  }
+  for (uint8_t flag : {FNAME, FCOMMENT}) {
+    if (!(flags & flag)) continue;
+    while (pos_ < input_size_ && input_[pos_]) pos_++;
+    pos_++;
+  }
+  if (flags & FHCRC) pos_ += 2;
+  return pos_ < input_size_;
+}
+
+
+bool GzipDecoder::read_trailer() {
+  align_to_byte();
+  if (pos_ + 8 > input_size_) return false;
+  const uint8_t* t = input_ + pos_;
+  uint32_t crc = uint32_t(t[0]) | (uint32_t(t[1]) << 8) |
+                 (uint32_t(t[2]) << 16) | (uint32_t(t[3]) << 24);
+  uint32_t isize = uint32_t(t[4]) | (uint32_t(t[5]) << 8) |
+                   (uint32_t(t[6]) << 16) | (uint32_t(t[7]) << 24);
+  pos_ += 8;
+
+  size_t size = outsize_ - member_start_;
+  if (isize != static_cast<uint32_t>(size)) return false;
+  zlib::uLong actual_crc = zlib::crc32(0, nullptr, 0);
+  const uint8_t* data = outptr_ + member_start_;
+  constexpr size_t CRC_BLOCK = size_t(1) << 30;
+  for (size_t i = 0; i < size; i += CRC_BLOCK) {
+    auto n = static_cast<zlib::uInt>(std::min(CRC_BLOCK, size - i));
+    actual_crc = zlib::crc32(actual_crc, data + i, n);
+  }
+  return static_cast<uint32_t>(actual_crc) == crc;
+}
+
+
+bool GzipDecoder::inflate() {
+  bool last_block = false;
+  while (!last_block) {
+    refill();
+    last_block = getbits(1);
+    size_t type = getbits(2);
+    bool ok = (type == 0)? inflate_stored_block() :
+              (type == 1)? inflate_huffman_block(fixed_litlen_table(),
+                                                 fixed_dist_table()) :
+              (type == 2)? inflate_dynamic_block() : false;
+    if (!ok) return false;
+  }
+  return true;
+}
+
+
+bool GzipDecoder::inflate_stored_block() {
+  align_to_byte();
+  if (pos_ + 4 > input_size_) return false;
+  size_t len = input_[pos_] | (size_t(input_[pos_ + 1]) << 8);
+  size_t nlen = input_[pos_ + 2] | (size_t(input_[pos_ + 3]) << 8);
+  if (len != (~nlen & 0xFFFF)) return false;
+  pos_ += 4;
+  if (pos_ + len > input_size_) return false;
+  ensure_capacity(len);
+  std::memcpy(outptr_ + outsize_, input_ + pos_, len);
+  outsize_ += len;
+  pos_ += len;
+  return true;
+}
+
+
+bool GzipDecoder::inflate_dynamic_block() {
+  size_t nlit = getbits(5) + 257;
+  size_t ndist = getbits(5) + 1;
+  size_t ncodelen = getbits(4) + 4;
+  if (nlit > 286 || ndist > 30) return false;
+
+  uint8_t lengths[286 + 30] = {0};
+  for (size_t i = 0; i < ncodelen; ++i) {
+    refill();
+    lengths[CODELEN_ORDER[i]] = static_cast<uint8_t>(getbits(3));
+  }
+  HuffmanTable codelen_table;
+  if (!codelen_table.build(lengths, 19, CODELEN_BITS)) return false;
+
+  size_t n = nlit + ndist;
+  std::fill(lengths, lengths + 19, 0);
+  for (size_t i = 0; i < n; ) {
+    refill();
+    size_t sym = decode(codelen_table);
+    if (sym < 16) {
+      lengths[i++] = static_cast<uint8_t>(sym);
+      continue;
+    }
+    uint8_t value = 0;
+    size_t repeat;
+    if (sym == 16) {
+      if (i == 0) return false;
+      value = lengths[i - 1];
+      repeat = 3 + getbits(2);
+    }
+    else if (sym == 17) repeat = 3 + getbits(3);
+    else if (sym == 18) repeat = 11 + getbits(7);
+    else return false;
+    if (i + repeat > n) return false;
+    std::fill(lengths + i, lengths + i + repeat, value);
+    i += repeat;
+  }
+  if (lengths[256] == 0) return false;
+
+  HuffmanTable litlen_table, dist_table;
+  return litlen_table.build(lengths, nlit, LITLEN_BITS) &&
+         dist_table.build(lengths + nlit, ndist, DIST_BITS) &&
+         inflate_huffman_block(litlen_table, dist_table);
+}
+
+
+// This is the hot loop of the decoder, so the decoder's state is kept
+// in local variables: the compiler cannot keep member variables in
+// registers because they may alias with the output bytes.
+bool GzipDecoder::inflate_huffman_block(const HuffmanTable& lit,
+                                        const HuffmanTable& dist)
+{
+  const uint32_t* lit_entries = lit.entries();
+  const uint32_t* dist_entries = dist.entries();
+  const size_t lit_bits = lit.bits();
+  const size_t dist_bits = dist.bits();
+  const size_t member_start = member_start_;
+  const uint8_t* input = input_;
+  const size_t fast_end = input_size_ >= 8? input_size_ - 8 : 0;
+  size_t pos = pos_;
+  uint64_t bitbuf = bitbuf_;
+  size_t bitcount = bitcount_;
+  uint8_t* out = outptr_;
+  size_t outsize = outsize_;
+  size_t outcapacity = outcapacity_;
+  bool ok = true;
+
+  while (true) {
+    // After the refill there are at least 56 bits in the buffer, which
+    // is enough for a length code with its extra bits (15 + 5), and a
+    // distance code with its extra bits (15 + 13).
+    if (pos < fast_end) {
+      bitbuf |= load_le64(input + pos) << bitcount;
+      pos += (63 - bitcount) >> 3;
+      bitcount |= 56;
+    } else {
+      pos_ = pos; bitbuf_ = bitbuf; bitcount_ = bitcount;
+      refill();
+      pos = pos_; bitbuf = bitbuf_; bitcount = bitcount_;
+      if (pos > input_size_ + 8) { ok = false; break; }  // out of input
+    }
+    if (outsize + 258 > outcapacity) {
+      outsize_ = outsize;
+      ensure_capacity(258);
+      out = outptr_;
+      outcapacity = outcapacity_;
+    }
+
+    uint32_t entry = HuffmanTable::lookup(lit_entries, lit_bits, bitbuf);
+    size_t len = (entry >> 16) & 0xFF;
+    size_t sym = entry & 0xFFFF;
+    bitbuf >>= len;
+    bitcount -= len;
+    if (sym < 256 && len) {
+      out[outsize++] = static_cast<uint8_t>(sym);
+      continue;
+    }
+    if (sym == 256) break;
+    sym -= 257;
+    if (sym >= 29 || !len) { ok = false; break; }
+    size_t nextra = LENGTH_EXTRA[sym];
+    size_t length = LENGTH_BASE[sym] + (bitbuf & ((uint64_t(1) << nextra) - 1));
+    bitbuf >>= nextra;
+    bitcount -= nextra;
+
+    entry = HuffmanTable::lookup(dist_entries, dist_bits, bitbuf);
+    len = (entry >> 16) & 0xFF;
+    size_t dsym = entry & 0xFFFF;
+    if (dsym >= 30 || !len) { ok = false; break; }
+    bitbuf >>= len;
+    bitcount -= len;
+    nextra = DIST_EXTRA[dsym];
+    size_t distance = DIST_BASE[dsym] + (bitbuf & ((uint64_t(1) << nextra) - 1));
+    bitbuf >>= nextra;
+    bitcount -= nextra;
+    if (distance > outsize - member_start) { ok = false; break; }
+
+    uint8_t* dst = out + outsize;
+    const uint8_t* src = dst - distance;
+    if (distance >= length) {
+      std::memcpy(dst, src, length);
+    } else {
+      for (size_t i = 0; i < length; ++i) dst[i] = src[i];
+    }
+    outsize += length;
+  }
+  pos_ = pos;
+  bitbuf_ = bitbuf;
+  bitcount_ = bitcount;
+  outsize_ = outsize;
+  return ok;
+}
+
+
+// Ensure that the bit buffer contains at least 57 bits. Past the end
+// of input the buffer is filled with zeros; the callers detect this
+// condition by checking whether `pos_` has moved beyond the input.
+void GzipDecoder::refill() {
+  if (pos_ + 8 <= input_size_) {
+    while (bitcount_ <= 56) {
+      bitbuf_ |= uint64_t(input_[pos_++]) << bitcount_;
+      bitcount_ += 8;
+    }
+  } else {
+    while (bitcount_ <= 56) {
+      uint64_t byte = (pos_ < input_size_)? input_[pos_] : 0;
+      bitbuf_ |= byte << bitcount_;
+      bitcount_ += 8;
+      pos_++;
+    }
+  }
+}
+
+
+size_t GzipDecoder::getbits(size_t n) {
+  xassert(n <= bitcount_);
+  size_t res = static_cast<size_t>(bitbuf_ & ((uint64_t(1) << n) - 1));
+  bitbuf_ >>= n;
+  bitcount_ -= n;
+  return res;
+}
+
+
+size_t GzipDecoder::decode(const HuffmanTable& table) {
+  uint32_t entry = table.lookup(bitbuf_);
+  size_t len = (entry >> 16) & 0xFF;
+  if (len == 0) return INVALID;
+  bitbuf_ >>= len;
+  bitcount_ -= len;
+  return entry & 0xFFFF;
+}
+
+
+// Discard the bits up to the next byte boundary, and return the
+// remaining whole bytes from the bit buffer back into the input.
+void GzipDecoder::align_to_byte() {
+  pos_ -= bitcount_ / 8;
+  bitbuf_ = 0;
+  bitcount_ = 0;
+}
+
+
+void GzipDecoder::ensure_capacity(size_t n) {
+  if (outsize_ + n <= outcapacity_) return;
+  outcapacity_ = std::max(std::max(outsize_ + n, 2 * outcapacity_),
+                          size_t(1) << 16);
+  output_.resize(outcapacity_);
+  outptr_ = static_cast<uint8_t*>(output_.xptr());
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Parallel decompression
+//------------------------------------------------------------------------------
+
+// Check whether the bytes at position `i` look like a gzip member
+// header: magic bytes, deflate compression method, no reserved flags,
+// and valid XFL / OS fields.
+static bool is_member_header(const uint8_t* input, size_t size, size_t i) {
+  if (i + 18 > size) return false;
+  const uint8_t* h = input + i;
+  return h[0] == 0x1F && h[1] == 0x8B && h[2] == 8 &&
+         (h[3] & 0xE0) == 0 &&
+         (h[8] == 0 || h[8] == 2 || h[8] == 4) &&
+         (h[9] <= 13 || h[9] == 255);
+}
+
+
+// Find the first plausible member header within `[from, to)`, or
+// return `size` if there is none.
+static size_t find_member_header(const uint8_t* input, size_t size,
+                                 size_t from, size_t to)
+{
+  while (from < to) {
+    auto p = static_cast<const uint8_t*>(
+                std::memchr(input + from, 0x1F, to - from));
+    if (!p) break;
+    size_t i = static_cast<size_t>(p - input);
+    if (is_member_header(input, size, i)) return i;
+    from = i + 1;
+  }
+  return size;
+}
+
+
+std::vector<Buffer> gunzip_parallel(const uint8_t* input, size_t size,
+                                    size_t nchunks)
+{
+  std::vector<size_t> starts { 0 };
+  for (size_t k = 1; k < nchunks; ++k) {
+    size_t from = std::max(k * size / nchunks, starts.back() + 1);
+    size_t to = (k + 1) * size / nchunks;
+    size_t start = find_member_header(input, size, from, to);
+    if (start < size) starts.push_back(start);
+  }
+  std::vector<Buffer> pieces;
+  if (starts.size() == 1) return pieces;
+
+  // Decode each part speculatively: the decoding continues until the
+  // end of a member reaches the start of the next part.
+  size_t nparts = starts.size();
+  starts.push_back(size);
+  std::vector<Buffer> outputs(nparts);
+  std::vector<size_t> ends(nparts, 0);
+  dt::parallel_for_dynamic(nparts,
+    [&](size_t i) {
+      GzipDecoder decoder(input, size);
+      size_t pos = starts[i];
+      while (pos < starts[i + 1]) {
+        pos = decoder.decode_member(pos);
+        if (!pos) return;
+      }
+      ends[i] = pos;
+      outputs[i] = decoder.release();
+    });
+
+  // Stitch the parts together, starting from the beginning of the
+  // input. A part can be used only if it starts exactly where the
+  // previous one ended; any gaps are decoded sequentially.
+  size_t pos = 0;
+  size_t i = 0;
+  while (pos < size) {
+    while (i < nparts && starts[i] < pos) i++;
+    if (i < nparts && starts[i] == pos && ends[i]) {
+      pieces.push_back(std::move(outputs[i]));
+      pos = ends[i];
+      continue;
+    }
+    GzipDecoder decoder(input, size);
+    size_t next = decoder.decode_member(pos);
+    if (!next) {
+      throw IOError() << "Invalid gzip data at offset " << pos;
+    }
+    pieces.push_back(decoder.release());
+    pos = next;
+  }
+  return pieces;
+}
+
+
+
+}}  // namespace dt::read
@@ -0,0 +1,110 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_READ_GZIP_h
+#define dt_READ_GZIP_h
+#include <vector>
+#include "buffer.h"
+#include "_dt.h"
+namespace dt {
+namespace read {
+
+class HuffmanTable;
+
+/**
+  * Decoder for gzip (RFC-1952) data. Each call to `decode_member()`
+  * decompresses a single gzip member, appending the uncompressed
+  * bytes to the internal output buffer. The same decoder can also
+  * unpack a zlib (RFC-1950) stream via `decode_zlib()`. The decoder is self-contained
+  * and does not touch any python objects, so that multiple decoders
+  * can run simultaneously in different threads.
+  */
+class GzipDecoder
+{
+  private:
+    const uint8_t* input_;
+    size_t input_size_;
+    size_t pos_;
+    uint64_t bitbuf_;
+    size_t bitcount_;
+    Buffer output_;
+    uint8_t* outptr_;
+    size_t outsize_;
+    size_t outcapacity_;
+    size_t member_start_;
+
+  public:
+    GzipDecoder(const uint8_t* input, size_t size);
+
+    // Decode the member starting at `offset` within the input. On
+    // success, returns the offset of the next member (trailing zero
+    // padding, if any, is skipped); on failure, returns 0 and the
+    // contents of the output buffer become unspecified.
+    size_t decode_member(size_t offset);
+
+    // Decode a zlib stream that occupies the entire input, where
+    // `size_hint` is the expected size of the uncompressed data.
+    // Returns false if the stream is invalid or its adler32 checksum
+    // does not match.
+    bool decode_zlib(size_t size_hint);
+
+    // Return the output buffer, trimmed to the amount of data
+    // decoded so far.
+    Buffer release();
+
+  private:
+    bool read_header();
+    bool read_trailer();
+    bool inflate();
+    bool inflate_stored_block();
+    bool inflate_dynamic_block();
+    bool inflate_huffman_block(const HuffmanTable& lit,
+                               const HuffmanTable& dist);
+
+    void refill();
+    size_t getbits(size_t n);
+    size_t decode(const HuffmanTable& table);
+    void align_to_byte();
+    void ensure_capacity(size_t n);
+};
+
+
+
+/**
+  * Decompress gzip `input` consisting of multiple members, using all
+  * threads in the thread pool. The input is split into `nchunks`
+  * parts, and in each part we look for a plausible member header;
+  * every part is then decoded speculatively in parallel. Parts whose
+  * starting point turned out not to be a real member boundary are
+  * discarded, and the gaps (if any) are decoded sequentially.
+  *
+  * Returns the decompressed pieces in order. If the input doesn't
+  * appear to contain more than one member, an empty vector is
+  * returned, and the caller should use regular sequential decoding
+  * instead. An `IOError` is thrown if the input is not valid gzip.
+  */
+std::vector<Buffer> gunzip_parallel(const uint8_t* input, size_t size,
+                                    size_t nchunks);
+
+
+
+}}  // namespace dt::read
+#endif
@@ -123,6 +123,8 @@ void InputColumn::set_rtype(int64_t it) {
     case RDrop:
       parse_type_ = PT::Str32;
       present_in_output_ = false;
+      present_in_buffer_ = false;
+      outcol_.present_in_buffer_ = false;
       break;
     case RAuto:    break;
     case RBool:    parse_type_ = PT::Bool01; break;
@@ -239,8 +241,10 @@ size_t InputColumn::archived_size() const {
 }
 
 
-void InputColumn::prepare_for_rereading() {
-  if (type_bumped_ && present_in_output_) {
+// If `force` is true, then the column will be re-read regardless of
+// whether its type was bumped or not.
+void InputColumn::prepare_for_rereading(bool force) {
+  if ((type_bumped_ || force) && present_in_output_) {
     present_in_buffer_ = true;
     type_bumped_ = false;
     outcol_.chunks_.clear();
@@ -248,7 +252,7 @@ void InputColumn::prepare_for_rereading() {
     outcol_.strbuf_ = nullptr;
     outcol_.type_bumped_ = false;
     outcol_.present_in_buffer_ = true;
-    outcol_.colinfo_.na_count = 0;
+    outcol_.reset_colinfo();
   }
   else {
     present_in_buffer_ = false;
@@ -113,6 +113,26 @@ MultiSource::MultiSource(const py::PKArgs& args, const GenericReader& rdr)
 }
 
 
+// A python binary file-like object, which should be read via the
+// `Source_Stream` class.
+static bool _is_stream(py::robj res) {
+  return res.has_attr("readinto");
+}
+
+// Stream produced by `gzip.open()`, which is read via `Source_Gzip`.
+static bool _is_gzip_stream(py::robj res) {
+  auto gzip_file = py::oobj::import("gzip", "GzipFile");
+  int ret = PyObject_IsInstance(res.to_borrowed_ref(),
+                                gzip_file.to_borrowed_ref());
+  if (ret == -1) throw PyError();
+  return ret != 0;
+}
+
+static Source* _stream_source(const std::string& name, py::robj stream) {
+  if (_is_gzip_stream(stream)) return new Source_Gzip(name, stream);
+  return new Source_Stream(name, stream);
+}
+
 // temporary helper function
 static SourceVec _from_python(py::robj pysource) {
   auto res_tuple = pysource.to_otuple();
@@ -134,11 +154,16 @@ static SourceVec _from_python(py::robj pysource) {
       auto iname = isources.to_otuple()[0].to_string();
       if (iresult.is_none()) {
         out.emplace_back(new Source_Python(iname, isources));
+      } else if (_is_stream(iresult)) {
+        out.emplace_back(_stream_source(iname, iresult));
       } else {
         out.emplace_back(new Source_Result(iname, iresult));
       }
     }
   }
+  else if (_is_stream(result)) {
+    out.emplace_back(_stream_source(name, result));
+  }
   else if (result.is_dict()) {
     for (auto kv : result.to_rdict()) {
       out.emplace_back(new Source_Result(kv.first.to_string(), kv.second));
@@ -333,6 +358,10 @@ py::oobj MultiSource::read_next(const GenericReader& reader)
     }
   }
   SourcePtr next = src->continuation();
+  if (!next && new_reader.batch_reader) {
+    next = SourcePtr(new Source_Batch(std::move(src),
+                                      std::move(new_reader.batch_reader)));
+  }
   if (next) {
     sources_[iteration_index] = std::move(next);
   } else {
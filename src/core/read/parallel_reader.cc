@@ -55,7 +55,13 @@ void ParallelReader::determine_chunking_strategy() {
 
   double maxrows_size = nrows_max * approximate_line_length;
   bool input_size_reduced = false;
-  if (nrows_max < 1000000 && maxrows_size < input_size) {
+  // When the rows are filtered, the `max_nrows` limit applies to the
+  // rows that passed the filter, so it doesn't tell us how much of
+  // the input will need to be read. In batch mode, the input that
+  // remains after the batch is not limited in size, so it should not
+  // be read within a single (last) chunk.
+  if (nrows_max < 1000000 && maxrows_size < input_size &&
+      !g.row_filter && !g.batch_rows) {
     input_size = static_cast<size_t>(maxrows_size * 1.5) + 1;
     input_size_reduced = true;
   }
@@ -142,6 +148,17 @@ ChunkCoordinates ParallelReader::compute_chunk_boundaries(
 
 
 
+/**
+ * Return the position in the input where the reading has stopped. This
+ * is the end of the last row that was stored in the output, or the end
+ * of input if all rows were read.
+ */
+const char* ParallelReader::get_end_of_data_read() const {
+  return end_of_last_chunk;
+}
+
+
+
 /**
  * Return the fraction of the input that was parsed, as a number between
  * 0 and 1.0.
@@ -208,8 +225,21 @@ void ParallelReader::read_all()
           size_t chunk_nrows = tctx->get_nrows();
           size_t new_nrows = preframe.ensure_output_nrows(chunk_nrows, i, o);
           if (new_nrows != chunk_nrows) {
-            tctx->set_nrows(new_nrows);
-            tctx->preorder();  // recalculate chunk stats, etc
+            // Only the first `new_nrows` rows of the chunk will be used.
+            // Re-read the chunk up to the last of those rows, so that
+            // `end_of_last_chunk` points exactly to where the reading
+            // has stopped.
+            if (new_nrows == 0) {
+              tctx->set_nrows(0);
+              end_of_last_chunk = tacc.get_start();
+            } else {
+              txcc.set_start_exact(tacc.get_start());
+              tctx->set_nrows_limit(new_nrows);
+              tctx->read_chunk(txcc, tacc);
+              tctx->set_nrows_limit(ThreadContext::NO_LIMIT);
+              xassert(tctx->get_nrows() == new_nrows);
+              end_of_last_chunk = tacc.get_end();
+            }
           }
           tctx->order();
         },
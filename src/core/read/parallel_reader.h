@@ -56,6 +56,7 @@ class ParallelReader
     virtual ~ParallelReader();
 
     virtual void read_all();
+    const char* get_end_of_data_read() const;
 
   protected:
     /**
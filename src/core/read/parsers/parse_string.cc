@@ -19,6 +19,7 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <cstring>                        // std::memcpy
 #include <iostream>
 #include "csv/reader_parsers.h"
 #include "read/field64.h"                // field64
@@ -166,6 +167,17 @@ static void save_unescaped_string(const ParseContext& ctx,
 
 
 
+static constexpr uint64_t ONES = 0x0101010101010101ULL;
+static constexpr uint64_t NEWLINES_N = ONES * '\n';
+static constexpr uint64_t NEWLINES_R = ONES * '\r';
+
+// Returns non-zero if any of the 8 bytes in `w` is zero
+static inline uint64_t has_zero_byte(uint64_t w) {
+  return (w - ONES) & ~w & (ONES << 7);
+}
+
+
+
 //------------------------------------------------------------------------------
 // Parsers
 //------------------------------------------------------------------------------
@@ -180,12 +192,16 @@ static void save_unescaped_string(const ParseContext& ctx,
   * advanced); if the flag is false then the quote chars are treated
   * as any other regular character.
   *
+  * The SAVE flag controls whether the parsed value should be stored
+  * into the target (and the string buffer). When false, the function
+  * only finds the end of the field.
+  *
   * This function
   *   - WILL NOT check for NA strings;
   *   - WILL NOT check for UTF8 validity;
   *   - WILL strip the leading/trailing whitespace if requested.
   */
-template <bool QUOTES_FORBIDDEN>
+template <bool QUOTES_FORBIDDEN, bool SAVE>
 static void parse_string_unquoted(const ParseContext& ctx) {
   const char* ch = ctx.ch;
   const char* end = ctx.eof;
@@ -196,6 +212,19 @@ static void parse_string_unquoted(const ParseContext& ctx) {
     while (ch < end && *ch == ' ') ch++;
   }
   const char* field_start = ch;
+  if (!SAVE) {
+    // Fast-forward over 8-byte blocks that contain no special
+    // characters; the exact end of field is then found below.
+    const uint64_t sep8 = ONES * static_cast<uint8_t>(sep);
+    const uint64_t quote8 = ONES * static_cast<uint8_t>(quote);
+    while (ch + 8 <= end) {
+      uint64_t w;
+      std::memcpy(&w, ch, 8);
+      if (has_zero_byte(w ^ sep8) | has_zero_byte(w ^ quote8) |
+          has_zero_byte(w ^ NEWLINES_N) | has_zero_byte(w ^ NEWLINES_R)) break;
+      ch += 8;
+    }
+  }
   while (ch < end) {
     char c = *ch;
     if (c == sep) break;  // end of field
@@ -208,11 +237,15 @@ static void parse_string_unquoted(const ParseContext& ctx) {
       if (c == '\r' && ctx.cr_is_newline) break;
     }
     else if (c == quote && QUOTES_FORBIDDEN) {
-      ctx.target->str32.setna();
+      if (SAVE) ctx.target->str32.setna();
       return;
     }
     ch++;
   }
+  if (!SAVE) {
+    ctx.ch = ch;
+    return;
+  }
   // end of field reached
   auto field_size = ch - field_start;
   if (ctx.strip_whitespace) {
@@ -240,8 +273,10 @@ static void parse_string_unquoted(const ParseContext& ctx) {
   *   - DOUBLED: any quotes inside the field are doubled,
   *   - ESCAPED: any quotes inside the field are escaped with a
   *              backslash.
+  *
+  * The SAVE flag has the same meaning as in `parse_string_unquoted()`.
   */
-template <int MODE>
+template <int MODE, bool SAVE>
 static void parse_string_quoted(const ParseContext& ctx) {
   const char* ch = ctx.ch;
   const char* end = ctx.eof;
@@ -270,13 +305,15 @@ static void parse_string_quoted(const ParseContext& ctx) {
       ch++;
     }
     if (ch >= end) {
-      ctx.target->str32.setna();
+      if (SAVE) ctx.target->str32.setna();
       return;
     }
-    if (MODE != SIMPLE && n_escapes) {
-      save_unescaped_string<MODE>(ctx, field_start, ch);
-    } else {
-      save_plain_string(ctx, field_start, ch);
+    if (SAVE) {
+      if (MODE != SIMPLE && n_escapes) {
+        save_unescaped_string<MODE>(ctx, field_start, ch);
+      } else {
+        save_plain_string(ctx, field_start, ch);
+      }
     }
 
     xassert(*ch == quote);
@@ -287,7 +324,7 @@ static void parse_string_quoted(const ParseContext& ctx) {
     ctx.ch = ch;
   }
   else {
-    parse_string_unquoted<true>(ctx);
+    parse_string_unquoted<true, SAVE>(ctx);
   }
 }
 
@@ -316,6 +353,7 @@ static void parse_string_quoted(const ParseContext& ctx) {
   * Note: this parser is very hacky, and might as well be removed
   * in the future entirely.
   */
+template <bool SAVE>
 static void parse_string_naive(const ParseContext& ctx) {
   const char* ch = ctx.ch;
   const char* end = ctx.eof;
@@ -362,7 +400,7 @@ static void parse_string_naive(const ParseContext& ctx) {
   }
   if (!field_end) field_end = ch;
   ctx.ch = ch;
-  save_plain_string(ctx, field_start, field_end);
+  if (SAVE) save_plain_string(ctx, field_start, field_end);
 }
 
 
@@ -371,10 +409,10 @@ static void parse_string_naive(const ParseContext& ctx) {
 
 void parse_string(const ParseContext& ctx) {
   switch (ctx.quoteRule) {
-    case 0: parse_string_quoted<DOUBLED>(ctx); break;
-    case 1: parse_string_quoted<ESCAPED>(ctx); break;
-    case 2: parse_string_naive(ctx);           break;
-    case 3: parse_string_unquoted<false>(ctx); break;
+    case 0: parse_string_quoted<DOUBLED, true>(ctx); break;
+    case 1: parse_string_quoted<ESCAPED, true>(ctx); break;
+    case 2: parse_string_naive<true>(ctx);           break;
+    case 3: parse_string_unquoted<false, true>(ctx); break;
   }
   auto len = ctx.target->str32.length;
   auto off = ctx.target->str32.offset;
@@ -407,5 +445,22 @@ void parse_string(const ParseContext& ctx) {
 
 
 
+/**
+  * Skip over a field in a column that is not going to be present in
+  * the output. This only finds the end of the field, using the same
+  * quoting rules as `parse_string()`, but the value is neither stored
+  * nor validated.
+  */
+void skip_string(const ParseContext& ctx) {
+  switch (ctx.quoteRule) {
+    case 0: parse_string_quoted<DOUBLED, false>(ctx); break;
+    case 1: parse_string_quoted<ESCAPED, false>(ctx); break;
+    case 2: parse_string_naive<false>(ctx);           break;
+    case 3: parse_string_unquoted<false, false>(ctx); break;
+  }
+}
+
+
+
 
 }}  // namespace dt::read
@@ -174,7 +174,9 @@ size_t PreFrame::ensure_output_nrows(size_t nrows_in_chunk0, size_t ichunk,
     nrows_allocated_ = nrows_new;
   }
 
-  if (nrows_new == nrows_max) {
+  // Note: `nrows_new` may have been changed above to the estimated
+  // number of rows to allocate, so it cannot be used here.
+  if (nrows_written_ + nrows_in_chunk == nrows_max) {
     ordered_loop->set_n_iterations(ichunk + 1);
   }
   nrows_written_ += nrows_in_chunk;
@@ -357,10 +359,10 @@ size_t PreFrame::total_allocsize() const {
 // Finalizing
 //------------------------------------------------------------------------------
 
-void PreFrame::prepare_for_rereading() {
+void PreFrame::prepare_for_rereading(bool all_columns) {
   for (auto& col : columns_) {
     col.outcol().archive_data(nrows_written_, tempfile_);
-    col.prepare_for_rereading();
+    col.prepare_for_rereading(all_columns);
   }
   nrows_written_ = 0;
   nrows_allocated_ = 0;
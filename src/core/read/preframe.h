@@ -88,7 +88,7 @@ class PreFrame
     size_t n_columns_to_reread() const;
     size_t total_allocsize() const;
 
-    void prepare_for_rereading();
+    void prepare_for_rereading(bool all_columns = false);
     std::unique_ptr<DataTable> to_datatable() &&;
 
   private:
@@ -40,7 +40,7 @@ R"(fread(anysource=None, *, file=None, text=None, cmd=None, url=None,
          skip_to_string=None, skip_to_line=0, skip_blank_lines=False,
          strip_whitespace=True, quotechar='"', tempdir=None,
          nthreads=None, logger=None, multiple_sources="warn",
-         memory_limit=None)
+         memory_limit=None, filter=None)
 --
 
 This function is capable of reading data from a variety of input formats,
@@ -211,6 +211,25 @@ memory_limit: int
     or filter and materialize the frame (if not the performance may
     be slow).
 
+filter: Expr
+    Only the rows for which this f-expression is true will be kept
+    in the returned Frame. The result is the same as with
+    ``fread(...)[filter, :]``, however the unneeded rows are discarded
+    while the input is being parsed, and therefore they never take up
+    memory.
+
+    Filtering during parsing is possible when the expression consists
+    of comparisons of a column with a constant (such as
+    ``f.country == "US"`` or ``f.price < 100``), boolean columns, and
+    their combinations via operators ``&``, ``|`` and ``~``. Any other
+    expression is applied to the frame after it was read.
+
+    The columns in the expression refer to the columns of the output
+    frame; in particular they cannot be excluded via the `columns`
+    parameter.
+
+    .. versionadded:: 0.11.0
+
 (return): Frame
     A single :class:`Frame` object is always returned.
 
@@ -227,12 +246,13 @@ See Also
 )";
 
 static py::PKArgs args_fread(
-  1, 0, 23, false, false,
+  1, 0, 24, false, false,
   {"anysource", "file", "text", "cmd", "url",
    "columns", "sep", "dec", "max_nrows", "header", "na_strings",
    "verbose", "fill", "encoding", "skip_to_string", "skip_to_line",
    "skip_blank_lines", "strip_whitespace", "quotechar",
-   "tempdir", "nthreads", "logger", "multiple_sources", "memory_limit"
+   "tempdir", "nthreads", "logger", "multiple_sources", "memory_limit",
+   "filter"
    },
   "fread", doc_fread);
 
@@ -257,6 +277,7 @@ static py::oobj fread(const py::PKArgs& args) {
   const py::Arg& arg_logger     = args[k++];
   const py::Arg& arg_multisrc   = args[k++];
   const py::Arg& arg_memlimit   = args[k++];
+  const py::Arg& arg_filter     = args[k++];
 
   GenericReader rdr;
   rdr.init_logger(arg_logger, arg_verbose);
@@ -279,6 +300,7 @@ static py::oobj fread(const py::PKArgs& args) {
     rdr.init_multisource(arg_multisrc);
     rdr.init_memorylimit(arg_memlimit);
     rdr.init_encoding(   arg_encoding);
+    rdr.init_filter(     arg_filter);
   }
 
   MultiSource multisource(args, rdr);
@@ -298,7 +320,7 @@ R"(iread(anysource=None, *, file=None, text=None, cmd=None, url=None,
          skip_to_string=None, skip_to_line=None, skip_blank_lines=False,
          strip_whitespace=True, quotechar='"',
          tempdir=None, nthreads=None, logger=None, errors="warn",
-         memory_limit=None)
+         memory_limit=None, filter=None, batch_rows=None)
 --
 
 This function is similar to :func:`fread()`, but allows reading
@@ -323,6 +345,25 @@ errors: "warn" | "raise" | "ignore" | "store"
     raised, it is captured and returned to the user, then the iterator
     continues reading the subsequent sources.
 
+batch_rows: int
+    If specified, then each input source will be read in batches of at
+    most this many rows, and each batch will be produced by the iterator
+    as a separate Frame. This allows processing a file that is too large
+    to fit into memory as a whole. The batches are read sequentially:
+    each next batch is parsed only when it is requested from the
+    iterator.
+
+    The column names and types are detected only once, and then shared
+    by all batches of the same source. If some batch contains a value
+    that does not fit into the column's type, then that column's type
+    will be bumped for the current and all subsequent batches (but not
+    for the batches that were already produced).
+
+    The `max_nrows` parameter, if given, limits the total number of
+    rows across all batches of a source.
+
+    .. versionadded:: 0.11.0
+
 (return): Iterator[Frame] | Iterator[Frame|Exception]
     The returned object is an iterator that produces :class:`Frame` s.
     The iterator is lazy: each frame is read only as needed, after the
@@ -344,12 +385,13 @@ See Also
 )";
 
 static py::PKArgs args_iread(
-  1, 0, 23, false, false,
+  1, 0, 25, false, false,
   {"anysource", "file", "text", "cmd", "url",
    "columns", "sep", "dec", "max_nrows", "header", "na_strings",
    "verbose", "fill", "encoding", "skip_to_string", "skip_to_line",
    "skip_blank_lines", "strip_whitespace", "quotechar",
-   "tempdir", "nthreads", "logger", "errors", "memory_limit"
+   "tempdir", "nthreads", "logger", "errors", "memory_limit", "filter",
+   "batch_rows"
    },
   "iread", doc_iread);
 
@@ -374,6 +416,8 @@ static py::oobj iread(const py::PKArgs& args) {
   const py::Arg& arg_logger     = args[k++];
   const py::Arg& arg_errors     = args[k++];
   const py::Arg& arg_memlimit   = args[k++];
+  const py::Arg& arg_filter     = args[k++];
+  const py::Arg& arg_batchrows  = args[k++];
 
   auto rdr = std::make_unique<GenericReader>();
   rdr->init_logger(arg_logger, arg_verbose);
@@ -396,6 +440,8 @@ static py::oobj iread(const py::PKArgs& args) {
     rdr->init_errors(     arg_errors);
     rdr->init_memorylimit(arg_memlimit);
     rdr->init_encoding(   arg_encoding);
+    rdr->init_filter(     arg_filter);
+    rdr->init_batchrows(  arg_batchrows);
   }
 
   auto ms = std::make_unique<MultiSource>(args, *rdr);
@@ -0,0 +1,547 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>           // std::min
+#include <cmath>               // std::isnan
+#include <cstring>             // std::memcmp, std::memcpy
+#include <type_traits>         // std::is_floating_point
+#include "expr/op.h"           // dt::expr::Op
+#include "python/int.h"        // py::oint
+#include "python/tuple.h"      // py::otuple
+#include "read/row_filter.h"
+#include "utils/assert.h"
+#include "utils/exceptions.h"
+#include "stype.h"
+namespace dt {
+namespace read {
+
+using dt::expr::Op;
+
+
+static const char* op_symbol(Op op) {
+  switch (op) {
+    case Op::EQ: return "==";
+    case Op::NE: return "!=";
+    case Op::LT: return "<";
+    case Op::GT: return ">";
+    case Op::LE: return "<=";
+    case Op::GE: return ">=";
+    default:     return "?";
+  }
+}
+
+template <typename T>
+static inline int8_t compare(Op op, T x, T y) {
+  switch (op) {
+    case Op::EQ: return (x == y);
+    case Op::NE: return (x != y);
+    case Op::LT: return (x < y);
+    case Op::GT: return (x > y);
+    case Op::LE: return (x <= y);
+    case Op::GE: return (x >= y);
+    default:     return 0;
+  }
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Filter nodes
+//------------------------------------------------------------------------------
+
+static constexpr int8_t NA_BOOL = -1;
+
+struct RowFilter::EvalContext {
+  const field64* row;
+  const SType* stypes;
+  const char* strbuf;
+  size_t strbuf_size;
+};
+
+
+class RowFilter::Node {
+  public:
+    virtual ~Node() {}
+
+    // Evaluate the filter on a single row. The returned value is
+    // either 1 (true), 0 (false), or NA_BOOL.
+    virtual int8_t evaluate(const EvalContext&) const = 0;
+
+    // Check that the types of the columns used in this node are
+    // compatible with the operation; throw an exception if not.
+    virtual void check_types(const PreFrame&) const = 0;
+};
+
+
+namespace {
+
+using Node = RowFilter::Node;
+using EvalContext = RowFilter::EvalContext;
+using NodePtr = std::unique_ptr<Node>;
+
+enum class Literal : uint8_t { NONE, INT, FLOAT, STR };
+
+
+// A boolean column on its own, as in `filter=f.flag`
+class ColumnNode : public Node {
+  private:
+    size_t icol_;   // index of the column within the RowFilter
+    size_t jbuf_;   // index of the column within the row buffer
+    size_t jcol_;   // index of the column within the PreFrame
+
+  public:
+    ColumnNode(size_t i, size_t j, size_t k)
+      : icol_(i), jbuf_(j), jcol_(k) {}
+
+    int8_t evaluate(const EvalContext& ctx) const override {
+      if (ctx.stypes[icol_] != SType::BOOL) return 0;
+      int8_t x = ctx.row[jbuf_].int8;
+      return ISNA<int8_t>(x)? NA_BOOL : x;
+    }
+
+    void check_types(const PreFrame& preframe) const override {
+      const InputColumn& col = preframe.column(jcol_);
+      if (col.get_stype() != SType::BOOL) {
+        throw TypeError() << "Column `" << col.get_name() << "` in the "
+            "filter was expected to be boolean, however it was read as "
+            << col.get_stype();
+      }
+    }
+};
+
+
+// Comparison of a column with a literal value, as in `filter=f.A > 5`
+class CompareNode : public Node {
+  private:
+    size_t icol_;
+    size_t jbuf_;
+    size_t jcol_;
+    Op op_;
+    Literal kind_;
+    int64_t ival_;
+    double fval_;
+    std::string sval_;
+
+  public:
+    CompareNode(size_t i, size_t j, size_t k, Op op, py::robj value)
+      : icol_(i), jbuf_(j), jcol_(k), op_(op), ival_(0), fval_(0)
+    {
+      if (value.is_none()) {
+        xassert(op == Op::EQ || op == Op::NE);
+        kind_ = Literal::NONE;
+      }
+      else if (value.is_bool()) {
+        kind_ = Literal::INT;
+        ival_ = value.is_true();
+      }
+      else if (value.is_int()) {
+        kind_ = Literal::INT;
+        ival_ = value.to_int64_strict();
+      }
+      else if (value.is_float()) {
+        kind_ = Literal::FLOAT;
+        fval_ = value.to_double();
+      }
+      else {
+        xassert(value.is_string());
+        kind_ = Literal::STR;
+        sval_ = value.to_string();
+      }
+    }
+
+    int8_t evaluate(const EvalContext& ctx) const override {
+      const field64& x = ctx.row[jbuf_];
+      switch (ctx.stypes[icol_]) {
+        case SType::BOOL:    return compare_num<int8_t>(x.int8);
+        case SType::INT32:   return compare_num<int32_t>(x.int32);
+        case SType::INT64:   return compare_num<int64_t>(x.int64);
+        case SType::FLOAT32: return compare_num<float>(x.float32);
+        case SType::FLOAT64: return compare_num<double>(x.float64);
+        case SType::STR32:
+        case SType::STR64:   return compare_str(x.str32, ctx);
+        default:             return 0;
+      }
+    }
+
+    void check_types(const PreFrame& preframe) const override {
+      if (kind_ == Literal::NONE) return;
+      const InputColumn& col = preframe.column(jcol_);
+      if (col.is_string() != (kind_ == Literal::STR)) {
+        throw TypeError() << "Operator `" << op_symbol(op_) << "` in the "
+            "filter cannot be applied to column `" << col.get_name()
+            << "` of type " << col.get_stype() << " and a value of type "
+            << (kind_ == Literal::STR? "str" :
+                kind_ == Literal::INT? "int" : "float");
+      }
+    }
+
+  private:
+    template <typename T>
+    int8_t compare_num(T x) const {
+      bool isna = ISNA<T>(x);
+      switch (kind_) {
+        case Literal::NONE:  return isna == (op_ == Op::EQ);
+        case Literal::INT:   return isna? (op_ == Op::NE) : compare_int(x);
+        case Literal::FLOAT: return isna? (op_ == Op::NE)
+                                        : compare<double>(op_, static_cast<double>(x), fval_);
+        // The type mismatch will be reported in check_types()
+        case Literal::STR:   return (op_ == Op::NE);
+      }
+      return 0;
+    }
+
+    // Float values are compared with an integer literal as doubles, so
+    // that they are not truncated
+    template <typename T>
+    int8_t compare_int(T x) const {
+      if (std::is_floating_point<T>::value) {
+        return compare<double>(op_, static_cast<double>(x),
+                               static_cast<double>(ival_));
+      }
+      return compare<int64_t>(op_, static_cast<int64_t>(x), ival_);
+    }
+
+    int8_t compare_str(const RelStr& x, const EvalContext& ctx) const {
+      bool isna = (x.length < 0);
+      if (kind_ == Literal::NONE) return isna == (op_ == Op::EQ);
+      if (isna || kind_ != Literal::STR) return (op_ == Op::NE);
+
+      // The offset may be invalid if the row was parsed with a
+      // different type than the column has now (see class docs).
+      size_t len = static_cast<size_t>(x.length);
+      if (x.offset + len > ctx.strbuf_size) return 0;
+      size_t vlen = sval_.size();
+      int cmp = std::memcmp(ctx.strbuf + x.offset, sval_.data(),
+                            std::min(len, vlen));
+      if (cmp == 0) cmp = (len < vlen)? -1 : (len > vlen);
+      return compare<int>(op_, cmp, 0);
+    }
+};
+
+
+class NotNode : public Node {
+  private:
+    NodePtr arg_;
+
+  public:
+    explicit NotNode(NodePtr&& arg) : arg_(std::move(arg)) {}
+
+    int8_t evaluate(const EvalContext& ctx) const override {
+      int8_t x = arg_->evaluate(ctx);
+      return (x == NA_BOOL)? NA_BOOL : !x;
+    }
+
+    void check_types(const PreFrame& preframe) const override {
+      arg_->check_types(preframe);
+    }
+};
+
+
+class AndNode : public Node {
+  private:
+    NodePtr lhs_, rhs_;
+
+  public:
+    AndNode(NodePtr&& lhs, NodePtr&& rhs)
+      : lhs_(std::move(lhs)), rhs_(std::move(rhs)) {}
+
+    int8_t evaluate(const EvalContext& ctx) const override {
+      int8_t x = lhs_->evaluate(ctx);
+      if (x == 0) return 0;
+      int8_t y = rhs_->evaluate(ctx);
+      if (y == 0) return 0;
+      return (x == NA_BOOL || y == NA_BOOL)? NA_BOOL : 1;
+    }
+
+    void check_types(const PreFrame& preframe) const override {
+      lhs_->check_types(preframe);
+      rhs_->check_types(preframe);
+    }
+};
+
+
+class OrNode : public Node {
+  private:
+    NodePtr lhs_, rhs_;
+
+  public:
+    OrNode(NodePtr&& lhs, NodePtr&& rhs)
+      : lhs_(std::move(lhs)), rhs_(std::move(rhs)) {}
+
+    int8_t evaluate(const EvalContext& ctx) const override {
+      int8_t x = lhs_->evaluate(ctx);
+      if (x == 1) return 1;
+      int8_t y = rhs_->evaluate(ctx);
+      if (y == 1) return 1;
+      return (x == NA_BOOL || y == NA_BOOL)? NA_BOOL : 0;
+    }
+
+    void check_types(const PreFrame& preframe) const override {
+      lhs_->check_types(preframe);
+      rhs_->check_types(preframe);
+    }
+};
+
+}  // anonymous namespace
+
+
+
+
+//------------------------------------------------------------------------------
+// Compiling the filter
+//------------------------------------------------------------------------------
+
+RowFilter::RowFilter(const PreFrame& preframe)
+  : preframe_(preframe) {}
+
+RowFilter::~RowFilter() {}
+
+
+/**
+  * Create a RowFilter from the python expression `expr`. The columns
+  * of the `preframe` must already have their final names and the
+  * columns that are excluded from the output must be marked as such.
+  *
+  * Returns nullptr if the expression cannot be evaluated during
+  * reading (see class docs). May throw an exception if the expression
+  * is definitely invalid, for example refers to a non-existing column.
+  */
+std::unique_ptr<RowFilter> RowFilter::compile(py::robj expr,
+                                              const PreFrame& preframe)
+{
+  std::unique_ptr<RowFilter> res(new RowFilter(preframe));
+  res->root_ = res->compile_node(expr);
+  if (!res->root_) return nullptr;
+  return res;
+}
+
+
+NodePtr RowFilter::compile_node(py::robj expr) {
+  if (!expr.is_dtexpr()) return nullptr;
+  auto op = static_cast<Op>(expr.get_attr("_op").to_size_t());
+  auto args = expr.get_attr("_args").to_otuple();
+  switch (op) {
+    case Op::COL: {
+      size_t i;
+      if (!compile_column(expr, &i)) return nullptr;
+      // A non-boolean column in the filter may have a different
+      // meaning, such as a list of row indices.
+      const InputColumn& col = preframe_.column(columns_[i]);
+      if (col.get_stype() != SType::BOOL) return nullptr;
+      return NodePtr(new ColumnNode(i, bufcols_[i], columns_[i]));
+    }
+    case Op::UINVERT: {
+      auto arg = compile_node(args[0]);
+      if (!arg) return nullptr;
+      return NodePtr(new NotNode(std::move(arg)));
+    }
+    case Op::AND:
+    case Op::OR: {
+      auto lhs = compile_node(args[0]);
+      if (!lhs) return nullptr;
+      auto rhs = compile_node(args[1]);
+      if (!rhs) return nullptr;
+      if (op == Op::AND) return NodePtr(new AndNode(std::move(lhs), std::move(rhs)));
+      else               return NodePtr(new OrNode(std::move(lhs), std::move(rhs)));
+    }
+    case Op::EQ:
+    case Op::NE:
+    case Op::LT:
+    case Op::GT:
+    case Op::LE:
+    case Op::GE: {
+      auto lhs = args[0];
+      auto rhs = args[1];
+      if (lhs.is_dtexpr()) return compile_comparison(op, lhs, rhs);
+      // `5 < f.A` is the same as `f.A > 5`
+      switch (op) {
+        case Op::LT: op = Op::GT; break;
+        case Op::GT: op = Op::LT; break;
+        case Op::LE: op = Op::GE; break;
+        case Op::GE: op = Op::LE; break;
+        default: break;
+      }
+      return compile_comparison(op, rhs, lhs);
+    }
+    default:
+      return nullptr;
+  }
+}
+
+
+NodePtr RowFilter::compile_comparison(Op op, py::robj colexpr,
+                                      py::robj value)
+{
+  if (value.is_none()) {
+    if (op != Op::EQ && op != Op::NE) return nullptr;
+  }
+  else if (value.is_int()) {
+    int overflow;
+    value.to_pyint().ovalue<int64_t>(&overflow);
+    if (overflow) return nullptr;
+  }
+  else if (value.is_float()) {
+    if (std::isnan(value.to_double())) return nullptr;
+  }
+  else if (!value.is_bool() && !value.is_string()) {
+    return nullptr;
+  }
+
+  size_t i;
+  if (!compile_column(colexpr, &i)) return nullptr;
+  auto node = NodePtr(new CompareNode(i, bufcols_[i], columns_[i], op, value));
+
+  // A string column can never be converted into a numeric one, so we
+  // can detect this error right away. The opposite type mismatch can
+  // only be reported after the data was read (see check_types()).
+  if (!value.is_string() && preframe_.column(columns_[i]).is_string()) {
+    node->check_types(preframe_);
+  }
+  return node;
+}
+
+
+/**
+  * If `expr` is a reference to a column in the output frame, then
+  * store the index of this column (within `columns_`) into `*out`,
+  * and return true. Otherwise return false.
+  */
+bool RowFilter::compile_column(py::robj expr, size_t* out) {
+  if (!expr.is_dtexpr()) return false;
+  if (static_cast<Op>(expr.get_attr("_op").to_size_t()) != Op::COL) {
+    return false;
+  }
+  auto args = expr.get_attr("_args").to_otuple();
+  auto params = expr.get_attr("_params").to_otuple();
+  // Only columns from the main frame `f` are allowed
+  if (params.size() != 1 || !params[0].is_int() ||
+      params[0].to_int64_strict() != 0) {
+    return false;
+  }
+  py::robj selector = args[0];
+
+  size_t ncols = preframe_.ncols();
+  size_t n_outcols = preframe_.n_columns_in_output();
+  size_t k = ncols;
+  if (selector.is_string()) {
+    std::string name = selector.to_string();
+    for (size_t j = 0; j < ncols; ++j) {
+      const InputColumn& col = preframe_.column(j);
+      if (col.get_name() == name) {
+        if (!col.is_in_output()) {
+          throw ValueError() << "Column `" << name << "` cannot be used "
+              "in the filter, because it is excluded from the output";
+        }
+        k = j;
+        break;
+      }
+    }
+    if (k == ncols) {
+      throw KeyError() << "Column `" << name << "` used in the filter does "
+          "not exist in the Frame";
+    }
+  }
+  else if (selector.is_int()) {
+    int64_t index = selector.to_int64_strict();
+    int64_t n = static_cast<int64_t>(n_outcols);
+    if (index < -n || index >= n) {
+      throw ValueError() << "Column index " << index << " is invalid for "
+          "a Frame with " << n_outcols << " column" << (n_outcols==1? "" : "s");
+    }
+    size_t iout = static_cast<size_t>(index < 0? index + n : index);
+    for (size_t j = 0; j < ncols; ++j) {
+      if (!preframe_.column(j).is_in_output()) continue;
+      if (iout-- == 0) { k = j; break; }
+    }
+    xassert(k < ncols);
+  }
+  else {
+    return false;
+  }
+
+  size_t jbuf = 0;
+  for (size_t j = 0; j < k; ++j) {
+    jbuf += preframe_.column(j).is_in_buffer();
+  }
+  xassert(preframe_.column(k).is_in_buffer());
+  *out = columns_.size();
+  columns_.push_back(k);
+  bufcols_.push_back(jbuf);
+  return true;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Applying the filter
+//------------------------------------------------------------------------------
+
+/**
+  * Evaluate the filter on the `nrows` rows of data in buffer `rows`,
+  * each row having `ncols` fields. The rows that pass the filter
+  * are moved to the beginning of the buffer (preserving their order),
+  * and the number of such rows is returned.
+  *
+  * The `ctx` is the parse context where the string data for the rows
+  * is stored.
+  */
+size_t RowFilter::apply(field64* rows, size_t ncols, size_t nrows,
+                        const ParseContext& ctx) const
+{
+  std::vector<SType> stypes;
+  stypes.reserve(columns_.size());
+  for (size_t k : columns_) {
+    stypes.push_back(preframe_.column(k).get_stype());
+  }
+  EvalContext ectx;
+  ectx.stypes = stypes.data();
+  ectx.strbuf = ctx.bytes_written? static_cast<const char*>(ctx.strbuf.rptr())
+                                 : nullptr;
+  ectx.strbuf_size = ctx.bytes_written;
+
+  size_t nout = 0;
+  for (size_t i = 0; i < nrows; ++i) {
+    ectx.row = rows + i * ncols;
+    if (root_->evaluate(ectx) == 1) {
+      if (nout != i) {
+        std::memcpy(rows + nout * ncols, ectx.row, ncols * sizeof(field64));
+      }
+      nout++;
+    }
+  }
+  return nout;
+}
+
+
+/**
+  * Verify that the types of the columns, as they were finally read,
+  * are compatible with the operations in the filter. This should be
+  * called after all the data was read.
+  */
+void RowFilter::check_types() const {
+  root_->check_types(preframe_);
+}
+
+
+
+}}  // namespace dt::read
@@ -0,0 +1,103 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_READ_ROW_FILTER_h
+#define dt_READ_ROW_FILTER_h
+#include <memory>              // std::unique_ptr
+#include <vector>              // std::vector
+#include "expr/op.h"          // dt::expr::Op
+#include "read/field64.h"      // field64
+#include "read/parse_context.h"
+#include "read/preframe.h"
+#include "python/obj.h"        // py::robj
+#include "_dt.h"
+namespace dt {
+namespace read {
+
+
+/**
+  * Filter applied to the rows of the input while they are being
+  * read, so that the rows that do not pass the filter are never
+  * stored in the output frame.
+  *
+  * The filter is compiled from a python f-expression. Only a limited
+  * subset of expressions can be compiled, namely:
+  *
+  *   - comparison of a column with a literal value (int, float,
+  *     bool, str or None), using any of the operators `==`, `!=`,
+  *     `<`, `>`, `<=`, `>=`;
+  *   - a boolean column by itself;
+  *   - combinations of the above with operators `&`, `|` and `~`.
+  *
+  * The semantics of these operations is the same as when the
+  * expression is applied to a Frame: comparisons with an NA value
+  * are false, except for `!=` which is true; while the logical
+  * operators follow the 3-valued logic.
+  *
+  * If the expression is not in this form, `compile()` returns
+  * nullptr, and then the filter has to be applied to the frame after
+  * it was read.
+  *
+  * The filter is evaluated on the rows of a ThreadContext's buffer
+  * (tbuf), and may be called from multiple threads at once. The
+  * types of the columns are not fixed during the reading: when one
+  * of them is bumped, the values in the buffer may be inconsistent
+  * with the column's current type. The filter will still evaluate
+  * such rows safely (but meaninglessly); the caller is responsible
+  * for re-reading the data once the types are settled.
+  */
+class RowFilter
+{
+  public:
+    class Node;
+    struct EvalContext;
+
+  private:
+    const PreFrame& preframe_;
+    std::unique_ptr<Node> root_;
+
+    // Indices of the columns used in the filter: `columns_` within the
+    // PreFrame, and `bufcols_` within the ThreadContext's buffer.
+    std::vector<size_t> columns_;
+    std::vector<size_t> bufcols_;
+
+  public:
+    static std::unique_ptr<RowFilter> compile(py::robj expr,
+                                              const PreFrame& preframe);
+    RowFilter(const PreFrame&);
+    RowFilter(const RowFilter&) = delete;
+    ~RowFilter();
+
+    size_t apply(field64* rows, size_t ncols, size_t nrows,
+                 const ParseContext& ctx) const;
+    void check_types() const;
+
+  private:
+    std::unique_ptr<Node> compile_node(py::robj expr);
+    std::unique_ptr<Node> compile_comparison(dt::expr::Op op, py::robj lhs,
+                                             py::robj rhs);
+    bool compile_column(py::robj expr, size_t* k);
+};
+
+
+
+}}  // namespace dt::read
+#endif
@@ -19,13 +19,21 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>     // std::max, std::min
+#include <cstring>       // std::memcpy
+#include <vector>        // std::vector
 #include "csv/reader.h"     // GenericReader
+#include "csv/reader_fread.h"  // FreadReader
+#include "frame/py_frame.h"   // py::Frame
+#include "parallel/api.h"   // dt::num_threads_in_pool
 #include "python/string.h"
 #include "python/xobject.h"
+#include "read/gzip.h"      // gunzip_parallel
 #include "read/source.h"    // Source
 #include "utils/macros.h"
 #include "utils/misc.h"
 #include "utils/temporary_file.h"
+#include "writebuf.h"       // WritableBuffer
 namespace dt {
 namespace read {
 
@@ -116,8 +124,8 @@ Source_Result::Source_Result(const std::string& name, py::oobj res)
   : Source(name), result_(res) {}
 
 
-py::oobj Source_Result::read(GenericReader&) {
-  return result_;
+py::oobj Source_Result::read(GenericReader& reader) {
+  return reader.apply_filter(result_);
 }
 
 
@@ -145,6 +153,172 @@ py::oobj Source_Text::read(GenericReader& reader) {
 
 
 
+//------------------------------------------------------------------------------
+// Source_Stream
+//------------------------------------------------------------------------------
+
+// Size of the initial input buffer, and also the size of the blocks
+// in which the data is transferred into a temporary file when the
+// reader's `memory_limit` is exceeded.
+static constexpr size_t STREAM_BLOCK_SIZE = 4 * 1024 * 1024;
+
+
+Source_Stream::Source_Stream(const std::string& name, py::oobj stream)
+  : Source(name), stream_(std::move(stream)) {}
+
+
+static py::oobj _writable_memoryview(void* ptr, size_t size) {
+  return py::oobj::from_new_reference(
+      PyMemoryView_FromMemory(static_cast<char*>(ptr),
+                              static_cast<Py_ssize_t>(size),
+                              PyBUF_WRITE));
+}
+
+
+py::oobj Source_Stream::read(GenericReader& reader) {
+  reader.source_name = &name_;
+  double t0 = wallclock();
+
+  // The data is decompressed block-by-block straight into `buf`, which
+  // grows geometrically. If the amount of data exceeds the reader's
+  // `memory_limit`, then all subsequent blocks are moved into a
+  // temporary file, and `buf` is reused as a fixed-size block.
+  const size_t limit = reader.memory_limit;
+  Buffer buf = Buffer::mem(STREAM_BLOCK_SIZE);
+  std::unique_ptr<TemporaryFile> tmpfile;
+  WritableBuffer* tmpout = nullptr;
+  size_t size = 0;
+  size_t total = 0;
+  {
+    dt::progress::work job(1);
+    job.set_message("Decompressing " + name_);
+    auto readinto = stream_.get_attr("readinto");
+    while (true) {
+      if (!tmpout && size == buf.size()) {
+        if (size >= limit) {
+          tmpfile = std::unique_ptr<TemporaryFile>(new TemporaryFile());
+          tmpout = tmpfile->data_w();
+          tmpout->write(size, buf.rptr());
+          if (reader.verbose) {
+            reader.d() << "Decompressed data exceeds memory_limit, moving "
+                          "it into temporary file " << tmpfile->name();
+          }
+        } else {
+          buf.resize(std::max(std::min(2 * size, limit),
+                              size + STREAM_BLOCK_SIZE));
+        }
+      }
+      size_t pos = tmpout? 0 : size;
+      auto view = _writable_memoryview(buf.xptr(pos), buf.size() - pos);
+      size_t n = readinto.call({view}).to_size_t();
+      if (n == 0) break;
+      total += n;
+      if (tmpout) tmpout->write(n, buf.rptr());
+      else        size += n;
+    }
+    stream_.invoke("close");
+    job.done();
+  }
+  reader.t_open_input = wallclock() - t0;
+  if (reader.verbose) {
+    reader.d() << "Input " << name_ << " decompressed, size: " << total;
+  }
+
+  py::oobj res;
+  if (tmpfile) {
+    res = reader.read_buffer(tmpfile->buffer_r(), 0);
+  } else {
+    buf.resize(size + 1);
+    static_cast<char*>(buf.xptr())[size] = '\0';
+    res = reader.read_buffer(buf, 1);
+  }
+  reader.source_name = nullptr;
+  return res;
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Source_Gzip
+//------------------------------------------------------------------------------
+
+// Smaller files are not worth the overhead of parallel decoding
+static constexpr size_t PARALLEL_GZIP_MIN_SIZE = 1 << 20;
+
+
+py::oobj Source_Gzip::read(GenericReader& reader) {
+  size_t nthreads = dt::num_threads_in_pool();
+  Buffer input = Buffer::mmap(stream_.get_attr("name").to_string());
+  size_t input_size = input.size();
+  if (nthreads == 1 || input_size < PARALLEL_GZIP_MIN_SIZE) {
+    return Source_Stream::read(reader);
+  }
+
+  double t0 = wallclock();
+  std::vector<Buffer> pieces;
+  {
+    dt::progress::work job(1);
+    job.set_message("Decompressing " + name_);
+    size_t nchunks = std::min(4 * nthreads, input_size >> 16);
+    pieces = gunzip_parallel(static_cast<const uint8_t*>(input.rptr()),
+                             input_size, nchunks);
+    job.done();
+  }
+  if (pieces.empty()) {
+    return Source_Stream::read(reader);  // single-member gzip file
+  }
+  stream_.invoke("close");
+  input = Buffer();
+
+  reader.source_name = &name_;
+  size_t npieces = pieces.size();
+  std::vector<size_t> offsets(npieces + 1, 0);
+  for (size_t i = 0; i < npieces; ++i) {
+    offsets[i + 1] = offsets[i] + pieces[i].size();
+  }
+  size_t total = offsets[npieces];
+  reader.t_open_input = wallclock() - t0;
+  if (reader.verbose) {
+    reader.d() << "Input " << name_ << " decompressed in parallel, "
+               << npieces << " parts, size: " << total;
+  }
+
+  py::oobj res;
+  if (total > reader.memory_limit) {
+    TemporaryFile tmpfile;
+    auto out = tmpfile.data_w();
+    for (auto& piece : pieces) {
+      out->write(piece.size(), piece.rptr());
+      piece = Buffer();
+    }
+    res = reader.read_buffer(tmpfile.buffer_r(), 0);
+  } else {
+    // Grow the first piece into the final buffer, releasing each of the
+    // remaining pieces as soon as it is appended. This way the peak
+    // memory usage stays close to the decompressed size.
+    Buffer buf = std::move(pieces[0]);
+    for (size_t i = 1; i < npieces; ++i) {
+      size_t n = pieces[i].size();
+      if (n) {
+        buf.resize(offsets[i + 1]);
+        char* out = static_cast<char*>(buf.xptr());
+        std::memcpy(out + offsets[i], pieces[i].rptr(), n);
+      }
+      pieces[i] = Buffer();
+    }
+    buf.resize(total + 1);
+    static_cast<char*>(buf.xptr())[total] = '\0';
+    pieces.clear();
+    res = reader.read_buffer(buf, 1);
+  }
+  reader.source_name = nullptr;
+  return res;
+}
+
+
+
+
 //------------------------------------------------------------------------------
 // Source_Url
 //------------------------------------------------------------------------------
@@ -223,5 +397,36 @@ py::oobj Source_Url::read(GenericReader& reader) {
 
 
 
+//------------------------------------------------------------------------------
+// Source_Batch
+//------------------------------------------------------------------------------
+
+Source_Batch::Source_Batch(std::unique_ptr<Source>&& parent,
+                           std::unique_ptr<FreadReader>&& freader)
+  : Source(parent->name()),
+    parent_(std::move(parent)),
+    freader_(std::move(freader)) {}
+
+Source_Batch::~Source_Batch() {}
+
+
+py::oobj Source_Batch::read(GenericReader&) {
+  freader_->source_name = &name_;
+  auto dt = freader_->read_next_batch();
+  py::oobj res = py::Frame::oframe(dt.release());
+  if (!freader_->row_filter) res = freader_->apply_filter(std::move(res));
+  freader_->source_name = nullptr;
+  return res;
+}
+
+
+std::unique_ptr<Source> Source_Batch::continuation() {
+  if (!freader_->has_next_batch()) return nullptr;
+  return std::unique_ptr<Source>(
+            new Source_Batch(std::move(parent_), std::move(freader_)));
+}
+
+
+
 
 }}  // namespace dt::read
@@ -24,6 +24,7 @@
 #include <memory>            // std::unique_ptr
 #include <string>            // std::string
 #include "python/_all.h"     // py::oobj
+class FreadReader;
 namespace dt {
 namespace read {
 
@@ -105,6 +106,37 @@ class Source_Text : public Source
 
 
 
+// Binary file-like object (such as the one returned by `gzip.open()`),
+// whose content is read in blocks via the `.readinto()` method. This
+// allows compressed inputs to be decompressed directly into the
+// reader's input buffer, without creating intermediate python `bytes`
+// objects or temporary files.
+class Source_Stream : public Source
+{
+  protected:
+    py::oobj stream_;
+
+  public:
+    Source_Stream(const std::string& name, py::oobj stream);
+    py::oobj read(GenericReader&) override;
+};
+
+
+
+// Stream returned by `gzip.open()`. If the underlying file contains
+// multiple gzip members (as produced, for example, by `bgzip` or by
+// our own `to_csv(compression="gzip")`), then the members are
+// decompressed in parallel. Otherwise the file is read as a regular
+// stream.
+class Source_Gzip : public Source_Stream
+{
+  public:
+    using Source_Stream::Source_Stream;
+    py::oobj read(GenericReader&) override;
+};
+
+
+
 class Source_Url : public Source
 {
   private:
@@ -117,6 +149,26 @@ class Source_Url : public Source
 
 
 
+// Subsequent batches of rows from a source that is being read in
+// batch mode (see `iread(batch_rows=...)`). The first batch is read
+// by the parent source, which must be kept alive for as long as its
+// input buffer is in use.
+class Source_Batch : public Source
+{
+  private:
+    std::unique_ptr<Source> parent_;
+    std::unique_ptr<FreadReader> freader_;
+
+  public:
+    Source_Batch(std::unique_ptr<Source>&& parent,
+                 std::unique_ptr<FreadReader>&& freader);
+    ~Source_Batch() override;
+    py::oobj read(GenericReader&) override;
+    std::unique_ptr<Source> continuation() override;
+};
+
+
+
 
 }}  // namespace dt::read
 #endif
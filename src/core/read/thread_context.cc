@@ -39,6 +39,7 @@ ThreadContext::ThreadContext(size_t ncols, size_t nrows, PreFrame& preframe)
     tbuf_nrows(nrows),
     used_nrows(0),
     row0_(0),
+    nrows_limit_(NO_LIMIT),
     preframe_(preframe) {}
 
 
@@ -72,6 +73,11 @@ void ThreadContext::set_row0(size_t n) {
 }
 
 
+void ThreadContext::set_nrows_limit(size_t n) {
+  nrows_limit_ = n;
+}
+
+
 
 //------------------------------------------------------------------------------
 // Post-processing
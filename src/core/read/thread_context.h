@@ -62,6 +62,12 @@ namespace read {
   * row0
   *   Starting row index within the PreFrame for the current data
   *   chunk.
+  *
+  * nrows_limit
+  *   If set (i.e. not equal to NO_LIMIT), then `read_chunk()` must
+  *   stop reading as soon as this many rows were stored in the
+  *   buffer, and report the end of the last row read as the end of
+  *   the chunk.
   */
 class ThreadContext    // TODO: rename
 {
@@ -72,11 +78,14 @@ class ThreadContext    // TODO: rename
     size_t tbuf_nrows;
     size_t used_nrows;
     size_t row0_;
+    size_t nrows_limit_;
 
     PreFrame& preframe_;
     ParseContext parse_ctx_;
 
   public:
+    static constexpr size_t NO_LIMIT = size_t(-1);
+
     ThreadContext(size_t ncols, size_t nrows, PreFrame&);
     virtual ~ThreadContext();
 
@@ -88,6 +97,7 @@ class ThreadContext    // TODO: rename
     size_t get_nrows() const;
     void set_nrows(size_t n);
     void set_row0(size_t n);
+    void set_nrows_limit(size_t n);
     void allocate_tbuf(size_t ncols, size_t nrows);
 
   private:
@@ -47,8 +47,9 @@ RowIndex::RowIndex(const RowIndex& other) : RowIndex() {
 
 // assignment operator, performs shallow copying
 RowIndex& RowIndex::operator=(const RowIndex& other) {
-  if (impl) impl = impl->release();
-  if (other.impl) impl = other.impl->acquire();
+  RowIndexImpl* old = impl;
+  impl = other.impl? other.impl->acquire() : nullptr;
+  if (old) old->release();
   return *this;
 }
 
@@ -245,12 +245,20 @@ RowIndexImpl* ArrayRowIndexImpl::uplift_from(const RowIndexImpl* rii) const {
     if (type == RowIndexType::ARR32) {
       auto ind32 = indices32();
       for (size_t i = 0; i < length; ++i) {
+        if (ind32[i] == RowIndex::NA<int32_t>) {
+          rowsres[i] = RowIndex::NA<int64_t>;
+          continue;
+        }
         size_t j = start + static_cast<size_t>(ind32[i]) * step;
         rowsres[i] = static_cast<int64_t>(j);
       }
     } else {
       auto ind64 = indices64();
       for (size_t i = 0; i < length; ++i) {
+        if (ind64[i] == RowIndex::NA<int64_t>) {
+          rowsres[i] = RowIndex::NA<int64_t>;
+          continue;
+        }
         size_t j = start + static_cast<size_t>(ind64[i]) * step;
         rowsres[i] = static_cast<int64_t>(j);
       }
@@ -269,7 +277,8 @@ RowIndexImpl* ArrayRowIndexImpl::uplift_from(const RowIndexImpl* rii) const {
     auto rows_ab = arii->indices32();
     auto rows_bc = indices32();
     for (size_t i = 0; i < length; ++i) {
-      rowsres[i] = rows_ab[rows_bc[i]];
+      int32_t k = rows_bc[i];
+      rowsres[i] = (k == RowIndex::NA<int32_t>)? k : rows_ab[k];
     }
     int flags = RowIndex::ARR32;
     if (ascending && arii->ascending) flags |= RowIndex::SORTED;
@@ -283,21 +292,27 @@ RowIndexImpl* ArrayRowIndexImpl::uplift_from(const RowIndexImpl* rii) const {
       auto rows_ab = arii->indices32();
       auto rows_bc = indices64();
       for (size_t i = 0; i < length; ++i) {
-        rowsres[i] = rows_ab[rows_bc[i]];
+        int64_t k = rows_bc[i];
+        int32_t r = (k == RowIndex::NA<int64_t>)? RowIndex::NA<int32_t>
+                                                : rows_ab[k];
+        rowsres[i] = (r == RowIndex::NA<int32_t>)? RowIndex::NA<int64_t> : r;
       }
     }
     if (uptype == RowIndexType::ARR64 && type == RowIndexType::ARR32) {
       auto rows_ab = arii->indices64();
       auto rows_bc = indices32();
       for (size_t i = 0; i < length; ++i) {
-        rowsres[i] = rows_ab[rows_bc[i]];
+        int32_t k = rows_bc[i];
+        rowsres[i] = (k == RowIndex::NA<int32_t>)? RowIndex::NA<int64_t>
+                                                 : rows_ab[k];
       }
     }
     if (uptype == RowIndexType::ARR64 && type == RowIndexType::ARR64) {
       auto rows_ab = arii->indices64();
       auto rows_bc = indices64();
       for (size_t i = 0; i < length; ++i) {
-        rowsres[i] = rows_ab[rows_bc[i]];
+        int64_t k = rows_bc[i];
+        rowsres[i] = (k == RowIndex::NA<int64_t>)? k : rows_ab[k];
       }
     }
     int flags = RowIndex::ARR64;
@@ -323,7 +338,8 @@ void ArrayRowIndexImpl::compactify()
   int32_t* ind32 = static_cast<int32_t*>(buf_.xptr());
   int64_t* ind64 = reinterpret_cast<int64_t*>(ind32);
   for (size_t i = 0; i < length; ++i) {
-    ind32[i] = static_cast<int32_t>(ind64[i]);
+    ind32[i] = (ind64[i] == RowIndex::NA<int64_t>)? RowIndex::NA<int32_t>
+                                                   : static_cast<int32_t>(ind64[i]);
   }
   type = RowIndexType::ARR32;
   _resize_data();
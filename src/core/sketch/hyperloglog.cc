@@ -0,0 +1,111 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>            // std::max
+#include <cmath>                // std::log, std::ldexp
+#include "sketch/hyperloglog.h"
+#include "utils/assert.h"
+#include "utils/misc.h"         // nlz
+namespace dt {
+
+
+HyperLogLog::HyperLogLog(size_t n) : dense_(false) {
+  int p = MIN_PRECISION;
+  while (p < MAX_PRECISION && (size_t(1) << p) < 4 * n) p++;
+  precision_ = p;
+}
+
+
+void HyperLogLog::add(uint64_t hash) {
+  if (dense_) {
+    add_dense(hash);
+  } else {
+    sparse_.insert(hash);
+    if (sparse_.size() > (size_t(1) << (precision_ - 2))) densify();
+  }
+}
+
+
+void HyperLogLog::add_dense(uint64_t hash) {
+  size_t index = static_cast<size_t>(hash >> (64 - precision_));
+  // The lowest bit here ensures that the rank is at most 65 - p
+  uint64_t rest = (hash << precision_) | (uint64_t(1) << (precision_ - 1));
+  auto rank = static_cast<uint8_t>(nlz(rest) + 1);
+  if (rank > registers_[index]) registers_[index] = rank;
+}
+
+
+void HyperLogLog::densify() {
+  xassert(!dense_);
+  dense_ = true;
+  registers_.resize(size_t(1) << precision_, 0);
+  for (uint64_t hash : sparse_) add_dense(hash);
+  hashset_t().swap(sparse_);
+}
+
+
+void HyperLogLog::merge(const HyperLogLog& other) {
+  xassert(precision_ == other.precision_);
+  if (other.dense_) {
+    if (!dense_) densify();
+    for (size_t i = 0; i < registers_.size(); ++i) {
+      registers_[i] = std::max(registers_[i], other.registers_[i]);
+    }
+  } else {
+    for (uint64_t hash : other.sparse_) add(hash);
+  }
+}
+
+
+size_t HyperLogLog::estimate() const {
+  if (!dense_) return sparse_.size();
+  size_t m = registers_.size();
+  double dm = static_cast<double>(m);
+  double sum = 0.0;
+  size_t nzeros = 0;
+  for (uint8_t r : registers_) {
+    sum += std::ldexp(1.0, -r);
+    nzeros += (r == 0);
+  }
+  double alpha = (m == 16)? 0.673 :
+                 (m == 32)? 0.697 :
+                 (m == 64)? 0.709 : 0.7213 / (1.0 + 1.079 / dm);
+  double estimate = alpha * dm * dm / sum;
+  // Small range correction: linear counting
+  if (estimate <= 2.5 * dm && nzeros > 0) {
+    estimate = dm * std::log(dm / static_cast<double>(nzeros));
+  }
+  return static_cast<size_t>(estimate + 0.5);
+}
+
+
+// Single step of the SplitMix64 generator, see
+// http://xorshift.di.unimi.it/splitmix64.c
+uint64_t hash_bits(uint64_t x) {
+  x += 0x9e3779b97f4a7c15ull;
+  x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ull;
+  x = (x ^ (x >> 27)) * 0x94d049bb133111ebull;
+  return x ^ (x >> 31);
+}
+
+
+
+}  // namespace dt
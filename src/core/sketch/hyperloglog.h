@@ -0,0 +1,96 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_SKETCH_HYPERLOGLOG_h
+#define dt_SKETCH_HYPERLOGLOG_h
+#include <cstddef>     // std::size_t
+#include <cstdint>     // uint8_t, uint64_t
+#include <vector>      // std::vector
+#include "lib/parallel_hashmap/phmap.h"
+namespace dt {
+
+
+/**
+  * HyperLogLog sketch for estimating the number of distinct elements
+  * in a set [Flajolet et al., 2007].
+  *
+  * The sketch consists of `m = 2^p` registers, where `p` is the
+  * "precision". Each element is added to the sketch via its 64-bit
+  * hash: the first `p` bits of the hash select the register, and the
+  * register stores the maximum "rank" (the position of the leftmost
+  * 1-bit) among the remaining bits of all hashes that it has seen.
+  * The relative standard error of the estimate is `1.04/sqrt(m)`,
+  * which is about 0.8% at the maximum precision of 14.
+  *
+  * Sketches with the same precision can be merged, producing the
+  * sketch of the union of the two sets. This allows the sketch to be
+  * computed in parallel, with each thread processing its own part of
+  * the data.
+  *
+  * The precision is chosen based on the (maximum) number of elements
+  * that will be added, `n`: when `n` is small, a smaller number of
+  * registers is sufficient, which is important when computing many
+  * sketches (one per group) at once.
+  *
+  * Similar to HyperLogLog++ [Heule et al., 2013], the sketch starts in
+  * the "sparse" mode, where the distinct hashes are stored explicitly,
+  * and the estimate is exact (up to the 64-bit hash collisions). Only
+  * when the number of distinct hashes exceeds `m/4` does the sketch
+  * switch to the registers. In particular, the sketch is exact for any
+  * `n <= 2^(MAX_PRECISION - 2)`.
+  */
+class HyperLogLog {
+  private:
+    using hashset_t = phmap::flat_hash_set<uint64_t>;
+    hashset_t sparse_;
+    std::vector<uint8_t> registers_;
+    int precision_;
+    bool dense_;
+    int : 24;
+
+  public:
+    static constexpr int MIN_PRECISION = 4;
+    static constexpr int MAX_PRECISION = 14;
+
+    explicit HyperLogLog(size_t n);
+
+    void add(uint64_t hash);
+    void merge(const HyperLogLog& other);
+    size_t estimate() const;
+
+  private:
+    void add_dense(uint64_t hash);
+    void densify();
+};
+
+
+/**
+  * Hash function for the elements of a numeric column, suitable for
+  * use with the HyperLogLog sketch (the upper bits of the hash depend
+  * on all bits of the value). The argument is the bit representation
+  * of the value.
+  */
+uint64_t hash_bits(uint64_t x);
+
+
+
+}  // namespace dt
+#endif
@@ -0,0 +1,153 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>            // std::sort, std::min, std::max
+#include <cmath>                // std::asin, std::sin
+#include <limits>               // std::numeric_limits
+#include "sketch/tdigest.h"
+#include "utils/assert.h"
+namespace dt {
+
+static constexpr double PI = 3.14159265358979323846;
+
+
+TDigest::TDigest(double compression)
+  : compression_(compression),
+    min_(std::numeric_limits<double>::infinity()),
+    max_(-std::numeric_limits<double>::infinity())
+{
+  buffer_.reserve(static_cast<size_t>(5 * compression_));
+}
+
+
+void TDigest::add(double x) {
+  buffer_.push_back(Centroid { x, 1.0 });
+  if (x < min_) min_ = x;
+  if (x > max_) max_ = x;
+  if (buffer_.size() >= buffer_.capacity()) compress();
+}
+
+
+void TDigest::merge(const TDigest& other) {
+  buffer_.insert(buffer_.end(), other.centroids_.begin(),
+                 other.centroids_.end());
+  buffer_.insert(buffer_.end(), other.buffer_.begin(), other.buffer_.end());
+  min_ = std::min(min_, other.min_);
+  max_ = std::max(max_, other.max_);
+  compress();
+}
+
+
+bool TDigest::empty() const noexcept {
+  return centroids_.empty() && buffer_.empty();
+}
+
+
+/**
+  * Merge the points in the buffer into the list of centroids. All
+  * centroids are sorted by their means, and then the neighbors are
+  * combined for as long as the combined centroid spans no more than
+  * one unit of the scale function `k(q)`.
+  */
+void TDigest::compress() {
+  if (buffer_.empty()) return;
+  buffer_.insert(buffer_.end(), centroids_.begin(), centroids_.end());
+  std::sort(buffer_.begin(), buffer_.end(),
+            [](const Centroid& a, const Centroid& b) {
+              return a.mean < b.mean;
+            });
+  double total = 0.0;
+  for (const Centroid& c : buffer_) total += c.weight;
+
+  const double kscale = compression_ / (2 * PI);
+  auto qlimit = [&](double q) {
+    double k = kscale * std::asin(2 * q - 1) + 1.0;
+    return (k >= kscale * PI / 2)? 1.0 : (std::sin(k / kscale) + 1) / 2;
+  };
+
+  centroids_.clear();
+  Centroid current = buffer_[0];
+  double weight_before = 0.0;
+  double limit = qlimit(0.0) * total;
+  for (size_t i = 1; i < buffer_.size(); ++i) {
+    const Centroid& next = buffer_[i];
+    double weight = current.weight + next.weight;
+    if (weight_before + weight <= limit) {
+      current.mean += (next.mean - current.mean) * next.weight / weight;
+      current.weight = weight;
+    } else {
+      weight_before += current.weight;
+      centroids_.push_back(current);
+      current = next;
+      limit = qlimit(weight_before / total) * total;
+    }
+  }
+  centroids_.push_back(current);
+  buffer_.clear();
+}
+
+
+/**
+  * Each centroid is assumed to be located at the "center" of its
+  * weight, i.e. the centroid `i` corresponds to the rank
+  * `W(i) + w(i)/2`, where `W(i)` is the total weight of all preceding
+  * centroids. The quantile is found by linear interpolation between
+  * the two centroids surrounding the target rank `q * total`; or
+  * between a centroid and the min/max values at the tails.
+  */
+double TDigest::quantile(double q) {
+  xassert(q >= 0 && q <= 1);
+  compress();
+  xassert(!centroids_.empty());
+  if (q <= 0) return min_;
+  if (q >= 1) return max_;
+  size_t n = centroids_.size();
+  if (n == 1) return centroids_[0].mean;
+
+  double total = 0.0;
+  for (const Centroid& c : centroids_) total += c.weight;
+  double rank = q * total;
+
+  double center = centroids_[0].weight / 2;
+  if (rank < center) {
+    return min_ + (centroids_[0].mean - min_) * rank / center;
+  }
+  double weight_before = 0.0;
+  for (size_t i = 0; i + 1 < n; ++i) {
+    const Centroid& c0 = centroids_[i];
+    const Centroid& c1 = centroids_[i + 1];
+    double center0 = weight_before + c0.weight / 2;
+    double center1 = weight_before + c0.weight + c1.weight / 2;
+    if (rank < center1) {
+      double t = (rank - center0) / (center1 - center0);
+      return c0.mean + (c1.mean - c0.mean) * t;
+    }
+    weight_before += c0.weight;
+  }
+  const Centroid& last = centroids_[n - 1];
+  double center_last = total - last.weight / 2;
+  return last.mean + (max_ - last.mean) * (rank - center_last)
+                                         / (total - center_last);
+}
+
+
+
+}  // namespace dt
@@ -0,0 +1,80 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_SKETCH_TDIGEST_h
+#define dt_SKETCH_TDIGEST_h
+#include <cstddef>     // std::size_t
+#include <vector>      // std::vector
+namespace dt {
+
+
+/**
+  * t-digest sketch for estimating quantiles of a distribution
+  * [Dunning & Ertl, "Computing extremely accurate quantiles using
+  * t-digests", 2019]. This is the "merging" variant of the algorithm.
+  *
+  * The digest summarizes the data as a sorted list of centroids, each
+  * having a mean and a weight (the number of points it represents).
+  * The centroids near the tails of the distribution are kept small,
+  * while those near the median may grow larger; the maximum size of
+  * a centroid is governed by the `compression` parameter via the
+  * scale function `k(q) = compression/(2pi) * asin(2q - 1)`: each
+  * centroid may span at most one unit of `k`. Thus, the number of
+  * centroids never exceeds `compression`, and the accuracy of the
+  * quantile estimates is the highest for the extreme quantiles.
+  *
+  * New points are collected in a buffer, which is merged into the
+  * list of centroids once it fills up. Two digests can be merged
+  * together, which allows them to be computed in parallel.
+  */
+class TDigest {
+  private:
+    struct Centroid {
+      double mean;
+      double weight;
+    };
+    std::vector<Centroid> centroids_;
+    std::vector<Centroid> buffer_;
+    double compression_;
+    double min_;
+    double max_;
+
+  public:
+    static constexpr double DEFAULT_COMPRESSION = 200.0;
+
+    explicit TDigest(double compression = DEFAULT_COMPRESSION);
+
+    void add(double x);
+    void merge(const TDigest& other);
+    bool empty() const noexcept;
+
+    // Return the estimate of the `q`-th quantile, where `0 <= q <= 1`.
+    // The digest must not be empty.
+    double quantile(double q);
+
+  private:
+    void compress();
+};
+
+
+
+}  // namespace dt
+#endif
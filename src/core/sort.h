@@ -38,8 +38,17 @@ RiGb group(const std::vector<Column>& columns,
 
 
 
+// Grouping function used by the `by()` clause. Depending on the
+// `groupby.method` option this either calls `group()`, or performs
+// hash-based grouping (see "groupby_hash.cc").
+RiGb group_by_keys(const std::vector<Column>& columns,
+                   const std::vector<SortFlag>& flags);
+
+
+
 // Called during module initialization
 void sort_init_options();
+void groupby_init_options();
 
 
 /**
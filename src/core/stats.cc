@@ -21,8 +21,11 @@
 //------------------------------------------------------------------------------
 #include <atomic>       // std::atomic
 #include <cmath>        // std::isinf, std::sqrt
+#include <cstring>      // std::memcpy, std::strncmp
+#include <functional>   // std::equal_to
 #include <limits>       // std::numeric_limits
 #include <type_traits>  // std::is_floating_point
+#include <vector>       // std::vector
 #include "column.h"
 #include "column/column_impl.h"
 #include "datatablemodule.h"
@@ -606,23 +609,131 @@ void Stats::compute_nunique() {
   set_valid(Stat::NUnique, false);
 }
 
+
+// Number of shards used by `count_distinct()`; must be larger than the
+// number of threads for the merging phase to be well-balanced.
+static constexpr size_t NUNIQUE_SHARD_BITS = 6;
+static constexpr size_t NUNIQUE_NSHARDS = size_t(1) << NUNIQUE_SHARD_BITS;
+
+/**
+  * Count the number of distinct valid values in a column, where
+  * `getkey(i, &key)` retrieves the key for row `i`, returning false if
+  * the value in that row is NA.
+  *
+  * The keys are partitioned into `NUNIQUE_NSHARDS` shards by the
+  * highest bits of their hashes. At first, each thread inserts the keys
+  * from its range of rows into its own per-shard hash sets, without any
+  * locking. Then the shards are processed in parallel: the sets of all
+  * threads for the same shard are merged together. Since the shards are
+  * disjoint, the total number of distinct values is the sum of sizes
+  * of all merged shards.
+  */
+template <typename K, typename Hasher, typename Equal, typename F>
+static size_t count_distinct(const dt::ColumnImpl* column, size_t* nacount,
+                             F getkey)
+{
+  using set_t = phmap::flat_hash_set<K, Hasher, Equal>;
+  constexpr size_t SHIFT = sizeof(size_t) * 8 - NUNIQUE_SHARD_BITS;
+  size_t nrows = column->nrows();
+  dt::NThreads nthreads(column->allow_parallel_access());
+  std::vector<std::vector<set_t>> sets(dt::num_threads_in_pool());
+  std::atomic<size_t> count_na { 0 };
+
+  dt::parallel_region(nthreads,
+    [&] {
+      std::vector<set_t>& tsets = sets[dt::this_thread_index()];
+      tsets.resize(NUNIQUE_NSHARDS);
+      size_t t_count_na = 0;
+      dt::nested_for_static(nrows,
+        [&](size_t i) {
+          K key;
+          if (getkey(i, &key)) {
+            tsets[Hasher()(key) >> SHIFT].insert(key);
+          } else {
+            t_count_na++;
+          }
+        });
+      count_na += t_count_na;
+    });
+
+  std::atomic<size_t> total { 0 };
+  dt::parallel_for_dynamic(NUNIQUE_NSHARDS, nthreads,
+    [&](size_t k) {
+      // Merge the smaller sets into the largest one
+      set_t* target = nullptr;
+      for (auto& tsets : sets) {
+        if (tsets.empty()) continue;
+        if (!target || tsets[k].size() > target->size()) target = &tsets[k];
+      }
+      if (!target) return;
+      for (auto& tsets : sets) {
+        if (tsets.empty() || &tsets[k] == target) continue;
+        target->insert(tsets[k].begin(), tsets[k].end());
+        set_t().swap(tsets[k]);
+      }
+      total += target->size();
+    });
+  *nacount = count_na.load();
+  return total.load();
+}
+
+
+// Numeric values are compared as their bit representations. This is
+// consistent with the grouping of floating-point values, where `0.0`
+// and `-0.0` are considered distinct.
+template <typename T> struct uint_of_size;
+template <> struct uint_of_size<int8_t>  { using type = uint8_t; };
+template <> struct uint_of_size<int16_t> { using type = uint16_t; };
+template <> struct uint_of_size<int32_t> { using type = uint32_t; };
+template <> struct uint_of_size<int64_t> { using type = uint64_t; };
+template <> struct uint_of_size<float>   { using type = uint32_t; };
+template <> struct uint_of_size<double>  { using type = uint64_t; };
+
+struct IntHasher {
+  // Fibonacci hashing: the multiplication spreads the bits of the
+  // (possibly small) integer key into the highest bits of the hash.
+  size_t operator()(uint64_t x) const {
+    return static_cast<size_t>(x * 0x9E3779B97F4A7C15ull);
+  }
+};
+
 template <typename T>
 void NumericStats<T>::compute_nunique() {
-  compute_sorted_stats();
+  using U = typename uint_of_size<T>::type;
+  size_t nacount;
+  size_t nunique = count_distinct<U, IntHasher, std::equal_to<U>>(
+    column, &nacount,
+    [&](size_t i, U* out) {
+      T x;
+      bool isvalid = column->get_element(i, &x);
+      std::memcpy(out, &x, sizeof(T));
+      return isvalid;
+    });
+  if (!is_computed(Stat::NaCount)) set_nacount(nacount);
+  set_nunique(nunique);
 }
 
 
-struct StrHasher {
-  size_t operator()(const CString& s) const {
-    return hash_murmur2(s.ch, static_cast<size_t>(s.size));
+// String keys are stored together with their hashes, so that the hash
+// of each string is computed only once.
+struct HashedString {
+  CString str;
+  size_t hash;
+};
+
+struct HashedStringHasher {
+  size_t operator()(const HashedString& s) const {
+    return s.hash;
   }
 };
 
-struct StrEqual {
-  bool operator()(const CString& lhs, const CString& rhs) const {
-    return (lhs.size == rhs.size) &&
-           ((lhs.ch == rhs.ch) ||  // This ensures NAs are properly handled too
-            (std::strncmp(lhs.ch, rhs.ch, static_cast<size_t>(lhs.size)) == 0));
+struct HashedStringEqual {
+  bool operator()(const HashedString& lhs, const HashedString& rhs) const {
+    return (lhs.hash == rhs.hash) &&
+           (lhs.str.size == rhs.str.size) &&
+           ((lhs.str.ch == rhs.str.ch) ||
+            (std::strncmp(lhs.str.ch, rhs.str.ch,
+                          static_cast<size_t>(lhs.str.size)) == 0));
   }
 };
 
@@ -631,31 +742,18 @@ void BooleanStats::compute_nunique() {
 }
 
 void StringStats::compute_nunique() {
-  dt::shared_bmutex rwmutex;
-  phmap::parallel_flat_hash_set<CString, StrHasher, StrEqual> values_seen;
-
-  size_t batch_size = 8;
-  size_t nbatches = (column->nrows() + batch_size - 1) / batch_size;
-  dt::parallel_for_dynamic(
-    nbatches,
-    [&](size_t i) {
-      size_t j0 = i * batch_size;
-      size_t j1 = std::min(j0 + batch_size, column->nrows());
-      CString str;
-      for (size_t j = j0; j < j1; ++j) {
-        bool isvalid = column->get_element(j, &str);
-        if (!isvalid) continue;
-        {
-          dt::shared_lock<dt::shared_bmutex> lock(rwmutex, false);
-          if (values_seen.contains(str)) continue;
-        }
-        {
-          dt::shared_lock<dt::shared_bmutex> lock(rwmutex, true);
-          values_seen.insert(str);
-        }
-      }
-    });
-  set_nunique(values_seen.size());
+  size_t nacount;
+  size_t nunique =
+    count_distinct<HashedString, HashedStringHasher, HashedStringEqual>(
+      column, &nacount,
+      [&](size_t i, HashedString* out) {
+        if (!column->get_element(i, &out->str)) return false;
+        out->hash = hash_murmur2(out->str.ch,
+                                 static_cast<size_t>(out->str.size));
+        return true;
+      });
+  if (!is_computed(Stat::NaCount)) set_nacount(nacount);
+  set_nunique(nunique);
 }
 
 
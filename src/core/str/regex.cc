@@ -0,0 +1,612 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#include <algorithm>       // std::sort, std::binary_search
+#include <bitset>          // std::bitset
+#include <cstring>         // std::memcmp, std::memchr
+#include <map>             // std::map
+#include <mutex>           // std::mutex, std::lock_guard
+#include <unordered_map>   // std::unordered_map
+#include "str/regex.h"
+#include "utils/assert.h"
+namespace dt {
+
+// Maximum number of states in the DFA. If the pattern produces more
+// states than this, we fall back to `std::regex`.
+static constexpr size_t MAX_DFA_STATES = 2000;
+
+// Maximum number of states in the NFA (this can be exceeded for
+// patterns with large repetition counts, such as `a{1000}`).
+static constexpr size_t MAX_NFA_STATES = 10000;
+
+// Maximum number of compiled patterns kept in the cache.
+static constexpr size_t CACHE_SIZE = 64;
+
+using byteset = std::bitset<256>;
+
+
+
+//------------------------------------------------------------------------------
+// Parser
+//------------------------------------------------------------------------------
+
+// Thrown when the pattern uses a feature that the DFA does not support.
+// The pattern is known to be valid, since it was already accepted by
+// `std::regex`.
+struct Unsupported {};
+
+
+struct Node {
+  enum Kind : uint8_t { SET, CONCAT, ALT, REPEAT };
+  Kind kind;
+  size_t : 56;
+  byteset set;                  // for SET
+  std::vector<Node> children;   // for CONCAT, ALT, REPEAT (one child)
+  size_t min, max;              // for REPEAT; max==INF means no limit
+
+  static constexpr size_t INF = size_t(-1);
+
+  explicit Node(Kind k) : kind(k), min(0), max(0) {}
+};
+
+
+static byteset range_set(int a, int b) {
+  byteset res;
+  for (int c = a; c <= b; ++c) res.set(static_cast<size_t>(c));
+  return res;
+}
+
+static byteset dot_set() {
+  byteset res;
+  res.set();
+  res.reset('\n');
+  res.reset('\r');
+  return res;
+}
+
+static int first_byte(const byteset& s) {
+  for (size_t i = 0; i < 256; ++i) {
+    if (s.test(i)) return static_cast<int>(i);
+  }
+  return 0;
+}
+
+// These are the character classes in the "C" locale, which is what
+// `std::regex` uses by default.
+static byteset digit_set() { return range_set('0', '9'); }
+static byteset word_set() {
+  return range_set('0', '9') | range_set('a', 'z') | range_set('A', 'Z') |
+         range_set('_', '_');
+}
+static byteset space_set() {
+  return range_set('\t', '\r') | range_set(' ', ' ');
+}
+
+
+/**
+  * Recursive-descent parser for the subset of the ECMAScript regular
+  * expression grammar supported by the DFA.
+  */
+class Parser {
+  private:
+    const char* ch_;
+    const char* end_;
+
+  public:
+    explicit Parser(const std::string& pattern)
+      : ch_(pattern.data()), end_(pattern.data() + pattern.size()) {}
+
+    Node parse() {
+      Node res = parse_alternation();
+      if (ch_ != end_) throw Unsupported();
+      return res;
+    }
+
+  private:
+    Node parse_alternation() {
+      Node res(Node::ALT);
+      res.children.push_back(parse_concatenation());
+      while (ch_ < end_ && *ch_ == '|') {
+        ch_++;
+        res.children.push_back(parse_concatenation());
+      }
+      if (res.children.size() == 1) {
+        Node tmp = std::move(res.children[0]);
+        return tmp;
+      }
+      return res;
+    }
+
+    Node parse_concatenation() {
+      Node res(Node::CONCAT);
+      while (ch_ < end_ && *ch_ != '|' && *ch_ != ')') {
+        Node atom = parse_atom();
+        res.children.push_back(parse_quantifier(std::move(atom)));
+      }
+      return res;
+    }
+
+    Node parse_quantifier(Node&& atom) {
+      if (ch_ == end_) return std::move(atom);
+      size_t min, max;
+      char c = *ch_;
+      if (c == '*')      { min = 0; max = Node::INF; ch_++; }
+      else if (c == '+') { min = 1; max = Node::INF; ch_++; }
+      else if (c == '?') { min = 0; max = 1; ch_++; }
+      else if (c == '{') {
+        ch_++;
+        min = parse_number();
+        max = min;
+        if (ch_ < end_ && *ch_ == ',') {
+          ch_++;
+          max = (ch_ < end_ && *ch_ == '}')? Node::INF : parse_number();
+        }
+        if (ch_ == end_ || *ch_ != '}' || max < min) throw Unsupported();
+        ch_++;
+      }
+      else return std::move(atom);
+      // Lazy quantifier has the same effect as greedy for full matching
+      if (ch_ < end_ && *ch_ == '?') ch_++;
+      if (ch_ < end_ && (*ch_ == '*' || *ch_ == '+' || *ch_ == '?' ||
+                         *ch_ == '{')) {
+        throw Unsupported();
+      }
+      Node res(Node::REPEAT);
+      res.min = min;
+      res.max = max;
+      res.children.push_back(std::move(atom));
+      return res;
+    }
+
+    size_t parse_number() {
+      size_t res = 0;
+      const char* start = ch_;
+      while (ch_ < end_ && *ch_ >= '0' && *ch_ <= '9' && ch_ - start < 6) {
+        res = res * 10 + static_cast<size_t>(*ch_ - '0');
+        ch_++;
+      }
+      if (ch_ == start) throw Unsupported();
+      return res;
+    }
+
+    Node parse_atom() {
+      char c = *ch_++;
+      Node res(Node::SET);
+      switch (c) {
+        case '.': res.set = dot_set(); break;
+        case '[': res.set = parse_class(); break;
+        case '\\': res.set = parse_escape(false); break;
+        case '(': {
+          if (ch_ + 1 < end_ && ch_[0] == '?') {
+            if (ch_[1] != ':') throw Unsupported();  // lookahead
+            ch_ += 2;
+          }
+          Node inner = parse_alternation();
+          if (ch_ == end_ || *ch_ != ')') throw Unsupported();
+          ch_++;
+          return inner;
+        }
+        case '^': case '$': case '*': case '+': case '?': case '{':
+        case '}': case ']': case ')': case '|':
+          throw Unsupported();
+        default:
+          res.set.set(static_cast<uint8_t>(c));
+      }
+      return res;
+    }
+
+    byteset parse_class() {
+      byteset res;
+      bool negate = false;
+      if (ch_ < end_ && *ch_ == '^') { negate = true; ch_++; }
+      if (ch_ < end_ && *ch_ == ']') throw Unsupported();  // [] or [^]
+      while (true) {
+        if (ch_ == end_) throw Unsupported();
+        if (*ch_ == ']') { ch_++; break; }
+        int lo;
+        if (*ch_ == '[') throw Unsupported();  // [:alpha:] etc.
+        if (*ch_ == '\\') {
+          ch_++;
+          byteset s = parse_escape(true);
+          if (s.count() != 1) { res |= s; continue; }
+          lo = first_byte(s);
+        } else {
+          lo = static_cast<uint8_t>(*ch_++);
+        }
+        if (ch_ + 1 < end_ && ch_[0] == '-' && ch_[1] != ']') {
+          ch_++;
+          int hi;
+          if (*ch_ == '\\') {
+            ch_++;
+            byteset s = parse_escape(true);
+            if (s.count() != 1) throw Unsupported();
+            hi = first_byte(s);
+          } else if (*ch_ == '[') {
+            throw Unsupported();
+          } else {
+            hi = static_cast<uint8_t>(*ch_++);
+          }
+          if (hi < lo) throw Unsupported();
+          res |= range_set(lo, hi);
+        } else {
+          res.set(static_cast<size_t>(lo));
+        }
+      }
+      if (negate) res.flip();
+      return res;
+    }
+
+    byteset parse_escape(bool in_class) {
+      if (ch_ == end_) throw Unsupported();
+      char c = *ch_++;
+      byteset res;
+      switch (c) {
+        case 'd': return digit_set();
+        case 'D': return ~digit_set();
+        case 'w': return word_set();
+        case 'W': return ~word_set();
+        case 's': return space_set();
+        case 'S': return ~space_set();
+        case 't': res.set('\t'); return res;
+        case 'n': res.set('\n'); return res;
+        case 'r': res.set('\r'); return res;
+        case 'f': res.set('\f'); return res;
+        case 'v': res.set('\v'); return res;
+        case 'x': {
+          if (end_ - ch_ < 2) throw Unsupported();
+          int hi = hexdigit(ch_[0]), lo = hexdigit(ch_[1]);
+          ch_ += 2;
+          res.set(static_cast<size_t>(hi * 16 + lo));
+          return res;
+        }
+        default:
+          // Escaped punctuation stands for itself; other escape sequences
+          // (\b, \B, \0, \1-\9, \c, \u, ...) are not supported.
+          if ((c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') ||
+              (c >= '0' && c <= '9') || (c & 0x80)) {
+            throw Unsupported();
+          }
+          (void) in_class;
+          res.set(static_cast<uint8_t>(c));
+          return res;
+      }
+    }
+
+    static int hexdigit(char c) {
+      if (c >= '0' && c <= '9') return c - '0';
+      if (c >= 'a' && c <= 'f') return c - 'a' + 10;
+      if (c >= 'A' && c <= 'F') return c - 'A' + 10;
+      throw Unsupported();
+    }
+};
+
+
+
+
+//------------------------------------------------------------------------------
+// NFA
+//------------------------------------------------------------------------------
+
+/**
+  * Thompson-style NFA. Each state has an optional transition on a set
+  * of bytes (`set_id >= 0`), and any number of epsilon-transitions.
+  */
+class NFA {
+  public:
+    struct State {
+      std::vector<size_t> eps;
+      int set_id;
+      int : 32;
+      size_t target;
+    };
+    std::vector<State> states;
+    std::vector<byteset> sets;
+    size_t start;
+    size_t final;
+
+    explicit NFA(const Node& root) {
+      start = new_state();
+      final = build(root, start);
+    }
+
+  private:
+    size_t new_state() {
+      if (states.size() >= MAX_NFA_STATES) throw Unsupported();
+      states.push_back(State{{}, -1, 0});
+      return states.size() - 1;
+    }
+
+    void add_eps(size_t from, size_t to) {
+      states[from].eps.push_back(to);
+    }
+
+    // Build the NFA fragment for `node` starting at state `in`, and
+    // return the state where the fragment ends.
+    size_t build(const Node& node, size_t in) {
+      switch (node.kind) {
+        case Node::SET: {
+          size_t s = new_state();
+          size_t out = new_state();
+          add_eps(in, s);
+          states[s].set_id = static_cast<int>(sets.size());
+          states[s].target = out;
+          sets.push_back(node.set);
+          return out;
+        }
+        case Node::CONCAT: {
+          for (const Node& child : node.children) {
+            in = build(child, in);
+          }
+          return in;
+        }
+        case Node::ALT: {
+          size_t out = new_state();
+          for (const Node& child : node.children) {
+            add_eps(build(child, in), out);
+          }
+          return out;
+        }
+        case Node::REPEAT: {
+          const Node& child = node.children[0];
+          for (size_t i = 0; i < node.min; ++i) {
+            in = build(child, in);
+          }
+          if (node.max == Node::INF) {
+            size_t loop = new_state();
+            add_eps(in, loop);
+            add_eps(build(child, loop), loop);
+            return loop;
+          }
+          size_t out = new_state();
+          for (size_t i = node.min; i < node.max; ++i) {
+            add_eps(in, out);
+            in = build(child, in);
+          }
+          add_eps(in, out);
+          return out;
+        }
+      }
+      throw Unsupported();  // LCOV_EXCL_LINE
+    }
+};
+
+
+
+
+//------------------------------------------------------------------------------
+// DFA construction
+//------------------------------------------------------------------------------
+
+using stateset = std::vector<size_t>;
+
+// Replace `ss` with its epsilon-closure, keeping only the states that
+// have a byte transition, or are final. The result is sorted.
+static void closure(const NFA& nfa, stateset& ss, std::vector<uint8_t>& mark) {
+  stateset stack(ss);
+  ss.clear();
+  for (size_t s : stack) mark[s] = 1;
+  while (!stack.empty()) {
+    size_t s = stack.back();
+    stack.pop_back();
+    const NFA::State& st = nfa.states[s];
+    if (st.set_id >= 0 || s == nfa.final) ss.push_back(s);
+    for (size_t t : st.eps) {
+      if (!mark[t]) {
+        mark[t] = 1;
+        stack.push_back(t);
+      }
+    }
+  }
+  for (size_t i = 0; i < mark.size(); ++i) mark[i] = 0;
+  std::sort(ss.begin(), ss.end());
+}
+
+
+// Split all bytes into equivalence classes, such that the bytes within
+// each class are indistinguishable by any set in the NFA.
+static size_t compute_byte_classes(const NFA& nfa, uint8_t* classes) {
+  std::map<std::vector<bool>, size_t> signatures;
+  for (size_t b = 0; b < 256; ++b) {
+    std::vector<bool> sig(nfa.sets.size());
+    for (size_t i = 0; i < nfa.sets.size(); ++i) {
+      sig[i] = nfa.sets[i].test(b);
+    }
+    auto it = signatures.find(sig);
+    if (it == signatures.end()) {
+      it = signatures.emplace(std::move(sig), signatures.size()).first;
+    }
+    classes[b] = static_cast<uint8_t>(it->second);
+  }
+  return signatures.size();
+}
+
+
+
+
+//------------------------------------------------------------------------------
+// Regex
+//------------------------------------------------------------------------------
+
+// Check whether `node` is `.*`
+static bool is_dotstar(const Node& node) {
+  return node.kind == Node::REPEAT && node.min == 0 &&
+         node.max == Node::INF &&
+         node.children[0].kind == Node::SET &&
+         node.children[0].set == dot_set();
+}
+
+
+Regex::Regex(const std::string& pattern)
+  : nclasses_(0),
+    stdregex_(pattern, std::regex::nosubs),  // validates the pattern
+    kind_(Kind::STD)
+{
+  Node root(Node::CONCAT);
+  try {
+    root = Parser(pattern).parse();
+  } catch (const Unsupported&) {
+    return;
+  }
+
+  // Check for patterns of the form [.*]literal[.*]
+  {
+    const std::vector<Node> single { root };
+    const std::vector<Node>& parts =
+        (root.kind == Node::CONCAT)? root.children : single;
+    size_t i0 = 0, i1 = parts.size();
+    bool dotstar_start = (i1 > 0 && is_dotstar(parts[0]));
+    if (dotstar_start) i0++;
+    bool dotstar_end = (i1 > i0 && is_dotstar(parts[i1 - 1]));
+    if (dotstar_end) i1--;
+    std::string lit;
+    for (size_t i = i0; i < i1; ++i) {
+      const Node& part = parts[i];
+      if (part.kind != Node::SET || part.set.count() != 1) break;
+      char c = static_cast<char>(first_byte(part.set));
+      if (c == '\n' || c == '\r') break;
+      lit.push_back(c);
+    }
+    if (lit.size() == i1 - i0) {
+      literal_ = std::move(lit);
+      kind_ = dotstar_start? (dotstar_end? Kind::CONTAINS : Kind::SUFFIX)
+                           : (dotstar_end? Kind::PREFIX : Kind::EXACT);
+      return;
+    }
+  }
+
+  // Build the DFA via the subset construction
+  try {
+    NFA nfa(root);
+    nclasses_ = compute_byte_classes(nfa, classes_);
+    std::vector<uint8_t> mark(nfa.states.size(), 0);
+    std::map<stateset, int32_t> index;
+    std::vector<stateset> dstates;
+    // State 0 is the "dead" state
+    dstates.push_back(stateset());
+    index[dstates[0]] = 0;
+    stateset ss { nfa.start };
+    closure(nfa, ss, mark);
+    index[ss] = 1;
+    dstates.push_back(std::move(ss));
+
+    std::vector<int> representative(nclasses_);
+    for (size_t b = 256; b-- > 0; ) representative[classes_[b]] = int(b);
+
+    for (size_t d = 0; d < dstates.size(); ++d) {
+      for (size_t k = 0; k < nclasses_; ++k) {
+        size_t b = static_cast<size_t>(representative[k]);
+        stateset next;
+        for (size_t s : dstates[d]) {
+          const NFA::State& st = nfa.states[s];
+          if (st.set_id >= 0 && nfa.sets[static_cast<size_t>(st.set_id)].test(b)) {
+            next.push_back(st.target);
+          }
+        }
+        closure(nfa, next, mark);
+        auto it = index.find(next);
+        int32_t target;
+        if (it == index.end()) {
+          if (dstates.size() >= MAX_DFA_STATES) throw Unsupported();
+          target = static_cast<int32_t>(dstates.size());
+          index[next] = target;
+          dstates.push_back(std::move(next));
+        } else {
+          target = it->second;
+        }
+        table_.push_back(target);
+      }
+      accept_.push_back(std::binary_search(dstates[d].begin(),
+                                           dstates[d].end(), nfa.final));
+    }
+    kind_ = Kind::DFA;
+  } catch (const Unsupported&) {
+    table_.clear();
+    accept_.clear();
+  }
+}
+
+
+bool Regex::match(const char* ch, size_t size) const {
+  size_t n = literal_.size();
+  switch (kind_) {
+    case Kind::EXACT:
+      return size == n && std::memcmp(ch, literal_.data(), n) == 0;
+    case Kind::DFA:
+      return match_dfa(reinterpret_cast<const uint8_t*>(ch), size);
+    case Kind::STD:
+      return std::regex_match(ch, ch + size, stdregex_);
+    default: break;
+  }
+  // The remaining kinds contain `.*`, which cannot match newlines
+  if (size < n) return false;
+  if (std::memchr(ch, '\n', size) || std::memchr(ch, '\r', size)) {
+    return false;
+  }
+  if (kind_ == Kind::PREFIX) {
+    return std::memcmp(ch, literal_.data(), n) == 0;
+  }
+  if (kind_ == Kind::SUFFIX) {
+    return std::memcmp(ch + size - n, literal_.data(), n) == 0;
+  }
+  xassert(kind_ == Kind::CONTAINS);
+  if (n == 0) return true;
+  const char* end = ch + size - n + 1;
+  const char first = literal_[0];
+  while (ch < end) {
+    auto p = static_cast<const char*>(
+                std::memchr(ch, first, static_cast<size_t>(end - ch)));
+    if (!p) return false;
+    if (std::memcmp(p, literal_.data(), n) == 0) return true;
+    ch = p + 1;
+  }
+  return false;
+}
+
+
+bool Regex::match_dfa(const uint8_t* ch, size_t size) const {
+  const int32_t* table = table_.data();
+  size_t state = 1;
+  for (size_t i = 0; i < size; ++i) {
+    state = static_cast<size_t>(table[state * nclasses_ + classes_[ch[i]]]);
+    if (state == 0) return false;
+  }
+  return accept_[state];
+}
+
+
+std::shared_ptr<const Regex> Regex::compile(const std::string& pattern) {
+  static std::mutex mutex;
+  static std::unordered_map<std::string, std::shared_ptr<const Regex>> cache;
+  {
+    std::lock_guard<std::mutex> lock(mutex);
+    auto it = cache.find(pattern);
+    if (it != cache.end()) return it->second;
+  }
+  auto regex = std::make_shared<const Regex>(pattern);
+  std::lock_guard<std::mutex> lock(mutex);
+  if (cache.size() >= CACHE_SIZE) cache.clear();
+  cache[pattern] = regex;
+  return regex;
+}
+
+
+
+}  // namespace dt
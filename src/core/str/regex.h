@@ -0,0 +1,88 @@
+//------------------------------------------------------------------------------
+// Copyright 2020 H2O.ai
+//
+// Permission is hereby granted, free of charge, to any person obtaining a
+// copy of this software and associated documentation files (the "Software"),
+// to deal in the Software without restriction, including without limitation
+// the rights to use, copy, modify, merge, publish, distribute, sublicense,
+// and/or sell copies of the Software, and to permit persons to whom the
+// Software is furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+//------------------------------------------------------------------------------
+#ifndef dt_STR_REGEX_h
+#define dt_STR_REGEX_h
+#include <cstddef>       // std::size_t
+#include <cstdint>       // int32_t, uint8_t
+#include <memory>        // std::shared_ptr
+#include <regex>         // std::regex
+#include <string>        // std::string
+#include <vector>        // std::vector
+namespace dt {
+
+
+/**
+  * Compiled regular expression, used for matching the entire string
+  * (i.e. same as `std::regex_match()`). The syntax of the pattern is
+  * that of ECMAScript, as implemented by `std::regex`.
+  *
+  * The `std::regex` engine is a backtracking matcher, which is very
+  * slow, especially for patterns with quantifiers. Therefore, we only
+  * use it as a fallback. Most patterns are instead compiled into a
+  * deterministic finite automaton (DFA) over bytes, so that matching
+  * a string requires a single table lookup per character. The
+  * following features are supported by the DFA: literals, escapes,
+  * `.`, character classes, groups, alternation, and all quantifiers
+  * (lazy quantifiers are equivalent to greedy ones, since only the
+  * full match matters). Anchors, word boundaries, backreferences and
+  * lookaheads are not supported, and patterns that use them fall back
+  * to `std::regex`. The same happens if the DFA becomes too large.
+  *
+  * Additionally, the patterns of the form "literal", "literal.*",
+  * ".*literal" and ".*literal.*" are matched directly, without the
+  * DFA.
+  *
+  * Compiling a regex is relatively expensive, so the compiled objects
+  * are cached: use `Regex::compile(pattern)` to obtain an instance.
+  * The `match()` method is thread-safe.
+  */
+class Regex {
+  private:
+    enum class Kind : uint8_t {
+      EXACT, PREFIX, SUFFIX, CONTAINS, DFA, STD
+    };
+    std::string literal_;           // for EXACT/PREFIX/SUFFIX/CONTAINS
+    std::vector<int32_t> table_;    // DFA transitions [state*nclasses+class]
+    std::vector<uint8_t> accept_;   // whether each DFA state is final
+    uint8_t classes_[256];          // byte -> class map
+    size_t nclasses_;
+    std::regex stdregex_;
+    Kind kind_;
+    size_t : 56;
+
+  public:
+    static std::shared_ptr<const Regex> compile(const std::string& pattern);
+
+    explicit Regex(const std::string& pattern);
+    Regex(const Regex&) = delete;
+    Regex& operator=(const Regex&) = delete;
+
+    bool match(const char* ch, size_t size) const;
+
+  private:
+    bool match_dfa(const uint8_t* ch, size_t size) const;
+};
+
+
+
+}  // namespace dt
+#endif
@@ -19,7 +19,10 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm>             // std::min
+#include <cstring>               // std::memcpy
 #include <memory>                // std::unique_ptr
+#include <vector>                // std::vector
 #include "column/strvec.h"
 #include "write/csv_writer.h"
 #include "write/value_writer.h"
@@ -89,7 +92,8 @@ void csv_writer::write_preamble() {
 
   Column names_as_col = Column(new Strvec_ColumnImpl(column_names));
   auto writer = value_writer::create(names_as_col, options);
-  writing_context ctx { 3*dt->ncols() + 3, 1, options.compress_zlib };
+  writing_context ctx { 3*dt->ncols() + 3, 1, options.compress_zlib,
+                        options.compression_level };
 
   if (options.bom) {
     *ctx.ch++ = '\xEF';
@@ -135,5 +139,53 @@ void csv_writer::write_row(writing_context& ctx, size_t j) {
 
 
 
+/**
+ * Write rows `[row0, row1)` in the columnar fashion: the rows are
+ * processed in batches of `Column::BATCH_SIZE`; within each batch the
+ * values of each column are first formatted into the `scratch` buffer
+ * (column after column), and then these values are interleaved into
+ * the output, adding the separators and the newlines.
+ *
+ * Compared to writing the data row-by-row, this approach retrieves the
+ * values of each column in bulk, and avoids a virtual call per each
+ * value written.
+ */
+void csv_writer::write_rows_block(
+    writing_context& ctx, size_t row0, size_t row1)
+{
+  constexpr size_t BATCH = Column::BATCH_SIZE;
+  size_t ncols = columns.size();
+  bool quoted = (options.quoting_mode == Quoting::ALL);
+  writing_context scratch(fixed_size_per_row, BATCH);
+  std::vector<size_t> ends(ncols * BATCH);
+
+  for (size_t i0 = row0; i0 < row1; i0 += BATCH) {
+    size_t n = std::min(BATCH, row1 - i0);
+    scratch.reset_buffer();
+    for (size_t j = 0; j < ncols; ++j) {
+      columns[j]->write_batch(i0, n, quoted, scratch, ends.data() + j*n);
+    }
+
+    // The output of this batch is the formatted values plus one separator
+    // or newline after each value.
+    ctx.ensure_buffer_capacity(scratch.written() + n * ncols);
+    const char* src = scratch.data();
+    char* ch = ctx.ch;
+    for (size_t i = 0; i < n; ++i) {
+      for (size_t j = 0; j < ncols; ++j) {
+        size_t k = j*n + i;
+        size_t start = k? ends[k - 1] : 0;
+        size_t len = ends[k] - start;
+        std::memcpy(ch, src + start, len);
+        ch += len;
+        *ch++ = ',';
+      }
+      ch[-1] = '\n';
+    }
+    ctx.ch = ch;
+  }
+}
+
+
 
 }}  // namespace dt::write
@@ -35,6 +35,8 @@ class csv_writer : public write_manager {
     void estimate_output_size() override;
     void write_preamble() override;
     void write_row(writing_context& ctx, size_t j) override;
+    void write_rows_block(writing_context& ctx, size_t row0,
+                          size_t row1) override;
     void write_epilogue() override {}
 };
 
@@ -45,7 +45,8 @@ struct output_options {
   bool strings_escape_quotes;
   bool bom;
   Quoting quoting_mode;
-  size_t : 56;
+  int8_t compression_level;
+  size_t : 48;
 
   output_options()
     : compress_zlib(false),
@@ -56,7 +57,8 @@ struct output_options {
       strings_always_quote(false),
       strings_escape_quotes(false),
       bom(false),
-      quoting_mode(Quoting::MINIMAL) {}
+      quoting_mode(Quoting::MINIMAL),
+      compression_level(6) {}
 };
 
 
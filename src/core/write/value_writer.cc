@@ -19,9 +19,11 @@
 // FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 // IN THE SOFTWARE.
 //------------------------------------------------------------------------------
+#include <algorithm> // std::all_of
 #include <cstdlib>   // std::abs
 #include <cstring>   // std::memcpy
 #include "csv/toa.h"
+#include "utils/assert.h"
 #include "utils/exceptions.h"
 #include "utils/macros.h"
 #include "write/value_writer.h"
@@ -58,6 +60,40 @@ class generic_writer : public value_writer {
         ctx.write_na();
       }
     }
+
+    void write_batch(size_t row0, size_t n, bool quoted,
+                     writing_context& ctx, size_t* ends) const override {
+      xassert(n <= Column::BATCH_SIZE);
+      T values[Column::BATCH_SIZE];
+      bool valid[Column::BATCH_SIZE];
+      column.get_elements(row0, n, values, valid);
+      ctx.ensure_buffer_capacity(n * (N + 2));
+      // Most batches contain no NAs, and for them we can use a simpler
+      // loop that doesn't check the validity of each value.
+      bool has_nas = !std::all_of(valid, valid + n, [](bool v){ return v; });
+      if (quoted) {
+        if (has_nas) write_values<true, true>(values, valid, n, ctx, ends);
+        else         write_values<true, false>(values, valid, n, ctx, ends);
+      } else {
+        if (has_nas) write_values<false, true>(values, valid, n, ctx, ends);
+        else         write_values<false, false>(values, valid, n, ctx, ends);
+      }
+    }
+
+  private:
+    template <bool Quoted, bool HasNAs>
+    static void write_values(const T* values, const bool* valid, size_t n,
+                             writing_context& ctx, size_t* ends)
+    {
+      for (size_t i = 0; i < n; ++i) {
+        if (!HasNAs || valid[i]) {
+          if (Quoted) *ctx.ch++ = '"';
+          WriteValue(values[i], ctx);
+          if (Quoted) *ctx.ch++ = '"';
+        }
+        ends[i] = ctx.written();
+      }
+    }
 };
 
 
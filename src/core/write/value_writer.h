@@ -55,6 +55,19 @@ class value_writer {
     virtual void write_normal(size_t row, writing_context& ctx) const = 0;
     virtual void write_quoted(size_t row, writing_context& ctx) const = 0;
 
+    // Write values in rows `[row0, row0 + n)` into the output stream
+    // `ctx.ch` back-to-back, without any separators, and store the
+    // end of each value (as an offset from the start of `ctx`'s buffer)
+    // into `ends[i]`. NA values are written as empty strings. The
+    // number of rows `n` must not exceed `Column::BATCH_SIZE`.
+    //
+    // This method retrieves the values in batches, and thus avoids a
+    // virtual call per each value written. It also takes care of
+    // ensuring that the output buffer has sufficient capacity.
+    //
+    virtual void write_batch(size_t row0, size_t n, bool quoted,
+                             writing_context& ctx, size_t* ends) const = 0;
+
     // Values that are written can generally be of two kinds: either
     // they have an upper limit on the number of characters they take
     // in the output, or there is no such limit. For example, all
@@ -79,6 +79,11 @@ void write_manager::set_compression(bool f) {
   options.compress_zlib = f;
 }
 
+void write_manager::set_compression_level(int level) {
+  xassert(level >= 0 && level <= 9);
+  options.compression_level = static_cast<int8_t>(level);
+}
+
 
 
 //------------------------------------------------------------------------------
@@ -129,7 +134,7 @@ void write_manager::write_rows()
     [&](ordered* o) {
       size_t nrows_per_chunk =  dt->nrows() / nchunks;
       writing_context ctx(fixed_size_per_row, nrows_per_chunk,
-                          options.compress_zlib);
+                          options.compress_zlib, options.compression_level);
       size_t th_write_at = 0;
       size_t th_write_size = 0;
 
@@ -137,9 +142,7 @@ void write_manager::write_rows()
         [&](size_t i) {  // pre-ordered
           size_t row0 = i * nrows / nchunks;
           size_t row1 = (i + 1) * nrows / nchunks;
-          for (size_t row = row0; row < row1; ++row) {
-            write_row(ctx, row);
-          }
+          write_rows_block(ctx, row0, row1);
           ctx.finalize_buffer();
         }, // end of pre-ordered
 
@@ -160,6 +163,15 @@ void write_manager::write_rows()
 }
 
 
+void write_manager::write_rows_block(
+    writing_context& ctx, size_t row0, size_t row1)
+{
+  for (size_t row = row0; row < row1; ++row) {
+    write_row(ctx, row);
+  }
+}
+
+
 py::oobj write_manager::get_result() {
   xassert(result);
   return result;
@@ -106,6 +106,7 @@ class write_manager {
     void set_bom(bool);
     void set_quoting(int);
     void set_compression(bool);
+    void set_compression_level(int);
 
     void write_main();
     py::oobj get_result();
@@ -140,6 +141,11 @@ class write_manager {
     // Write a single row `j` of the input DataTable into the output
     virtual void write_row(writing_context& ctx, size_t j) = 0;
 
+    // Write rows `[row0, row1)` of the input DataTable into the output.
+    // The default implementation calls `write_row()` for each row.
+    virtual void write_rows_block(writing_context& ctx, size_t row0,
+                                  size_t row1);
+
     // Write the concluding section of the file, after the all rows
     virtual void write_epilogue() = 0;
 };
@@ -29,14 +29,14 @@ namespace write {
 
 
 writing_context::writing_context(
-  size_t size_per_row, size_t nrows, bool compress)
+  size_t size_per_row, size_t nrows, bool compress, int compression_level)
 {
   fixed_size_per_row = size_per_row;
   ch = nullptr;
   end = nullptr;
   buffer = nullptr;
   buffer_capacity = 0;
-  zwriter = compress? new zlib_writer : nullptr;
+  zwriter = compress? new zlib_writer(compression_level) : nullptr;
   allocate_buffer(size_per_row * nrows * 2);
 }
 
@@ -69,6 +69,16 @@ void writing_context::reset_buffer() {
 }
 
 
+size_t writing_context::written() const noexcept {
+  return static_cast<size_t>(ch - buffer);
+}
+
+
+const char* writing_context::data() const noexcept {
+  return buffer;
+}
+
+
 CString writing_context::get_buffer() const {
   xassert(output.ch);
   return output;
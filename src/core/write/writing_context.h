@@ -55,7 +55,8 @@ class writing_context {
     zlib_writer* zwriter;
 
   public:
-    writing_context(size_t size_per_row, size_t nrows, bool compress = false);
+    writing_context(size_t size_per_row, size_t nrows, bool compress = false,
+                    int compression_level = 6);
     ~writing_context();
 
     void ensure_buffer_capacity(size_t sz);
@@ -63,6 +64,11 @@ class writing_context {
     CString get_buffer() const;
     void reset_buffer();
 
+    // Number of bytes written into the buffer so far, and the start of
+    // the buffer. The pointer is invalidated by `ensure_buffer_capacity()`.
+    size_t written() const noexcept;
+    const char* data() const noexcept;
+
     void write_na() {}
 
   private:
@@ -37,7 +37,7 @@ class zlib_writer {
     size_t buffer_capacity;
 
   public:
-    zlib_writer() {
+    explicit zlib_writer(int compression_level) {
       buffer = nullptr;
       buffer_capacity = 0;
       using z_stream = zlib::z_stream;  // for deflateInit2() macro
@@ -45,9 +45,8 @@ class zlib_writer {
       stream.zfree = nullptr;
       stream.opaque = nullptr;
       stream.data_type = Z_TEXT;
-      // TODO: expose <compression_level> as a global option
       int r = zlib::deflateInit2(&stream,
-                                 Z_DEFAULT_COMPRESSION,  // compression level
+                                 compression_level,  // 0 - 9
                                  Z_DEFLATED,  // method
                                  10 + 16,  // windowBits, +16 for gzip headers
                                  8,  // memLevel (default = 8)
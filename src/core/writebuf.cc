@@ -103,6 +103,11 @@ size_t WritableBuffer::size() const {
 FileWritableBuffer::FileWritableBuffer(const std::string& path, bool append) {
   file_ = new File(path, append? File::APPEND
                                : File::OVERWRITE);
+  // In append mode the write positions are counted from the beginning
+  // of the file, same as in MmapWritableBuffer
+  if (append) {
+    bytes_written_ = file_->size();
+  }
 }
 
 FileWritableBuffer::~FileWritableBuffer() {
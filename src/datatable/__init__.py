@@ -22,7 +22,8 @@
 #-------------------------------------------------------------------------------
 from .frame import Frame
 from .expr import (mean, min, max, sd, isna, sum, count, first, abs, exp,
-                   last, log, log10, f, g, median, cov, corr)
+                   last, log, log10, f, g, median, cov, corr,
+                   nunique_approx, quantile_approx)
 from .lib._datatable import (
     by,
     cbind,
@@ -97,8 +98,10 @@ __all__ = (
     "ltype",
     "mean",
     "median",
+    "nunique_approx",
     "obj64",
     "options",
+    "quantile_approx",
     "rbind",
     "repeat",
     "sd",
@@ -23,7 +23,8 @@
 from .expr import f, g, Expr
 from .math import abs, log, log10, exp, isna
 from .reduce import (
-    sum, count, first, last, mean, median, min, max, sd, cov, corr)
+    sum, count, first, last, mean, median, min, max, sd, cov, corr,
+    nunique_approx, quantile_approx)
 
 __all__ = (
     "Expr",
@@ -43,6 +44,8 @@ __all__ = (
     "mean",
     "median",
     "min",
+    "nunique_approx",
+    "quantile_approx",
     "sd",
     "sum",
 )
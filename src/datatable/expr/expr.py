@@ -83,6 +83,8 @@ class OpCodes(enum.Enum):
     MEDIAN = 410
     COV = 411
     CORR = 412
+    NUNIQUE_APPROX = 413
+    QUANTILE_APPROX = 414
 
     # Math: trigonometric
     SIN = 501
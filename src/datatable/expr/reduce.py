@@ -36,6 +36,8 @@ __all__ = (
     "mean",
     "median",
     "min",
+    "nunique_approx",
+    "quantile_approx",
     "sd",
     "sum",
 )
@@ -97,6 +99,25 @@ def corr(col1, col2):
     return Expr(OpCodes.CORR, (col1, col2))
 
 
+def nunique_approx(expr):
+    """
+    Estimate the number of distinct non-NA values in a column, using
+    the HyperLogLog sketch. The relative error of the estimate is
+    about 1% for large groups, whereas groups with no more than 4096
+    distinct values are counted exactly.
+    """
+    return Expr(OpCodes.NUNIQUE_APPROX, (expr,))
+
+
+def quantile_approx(expr, q=0.5):
+    """
+    Estimate the `q`-th quantile of a numeric column, using the
+    t-digest sketch. The estimate is most accurate near the tails
+    of the distribution (q close to 0 or 1).
+    """
+    return Expr(OpCodes.QUANTILE_APPROX, (expr,), (q,))
+
+
 # noinspection PyShadowingBuiltins
 def sum(iterable, start=0):
     if isinstance(iterable, Expr):
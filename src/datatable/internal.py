@@ -27,6 +27,7 @@ from .lib._datatable import (
     frame_columns_virtual,
     frame_integrity_check,
     get_thread_ids,
+    group_cache_stats,
     in_debug_mode,
     regex_supported
 )
@@ -37,6 +38,7 @@ __all__ = [
     "frame_columns_virtual",
     "frame_integrity_check",
     "get_thread_ids",
+    "group_cache_stats",
     "in_debug_mode",
     "regex_supported",
 ]
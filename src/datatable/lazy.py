@@ -0,0 +1,522 @@
+#!/usr/bin/env python
+#-------------------------------------------------------------------------------
+# Copyright 2020 H2O.ai
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#-------------------------------------------------------------------------------
+from datatable.exceptions import TypeError
+from datatable.expr.expr import Expr, OpCodes, f, g
+from datatable.lib._datatable import by, join, sort, update
+
+__all__ = ("LazyFrame", )
+
+
+class LazyFrame:
+    """
+    A Frame together with a chain of ``[i, j, ...]`` selectors that were
+    applied to it, but not evaluated yet. This object is created via
+    :meth:`Frame.lazy()`.
+
+    Applying a selector to a ``LazyFrame`` returns a new ``LazyFrame``
+    with one more step in the chain. Method :meth:`.collect()` optimizes
+    the chain and evaluates it, returning a regular Frame.
+
+    The optimizer works with the following transformations:
+
+      - two consecutive steps are fused into one, when the first step
+        only filters the rows and/or computes new columns row-by-row:
+        the filters are combined with ``&``, and the references to the
+        columns of the first step are replaced with the expressions
+        that compute them. Thus the columns that are not used by the
+        second step are never computed;
+
+      - when a step cannot be fused with the next one (for example,
+        because it performs a join or a groupby), and it selects all
+        columns, then it is changed to select only those columns that
+        are used in the next step. For a join this means that the
+        unused columns of the joined frame are not carried over.
+
+    In order to ensure that the result is identical to evaluating the
+    chain eagerly, the chain is first applied to an empty (0-row) slice
+    of the source frame. This provides the names of the columns at
+    each step, and also reports any errors in the selectors.
+    """
+    __slots__ = ["_frame", "_steps"]
+
+    def __init__(self, frame, steps=()):
+        self._frame = frame
+        self._steps = tuple(steps)
+
+
+    def __getitem__(self, item):
+        return LazyFrame(self._frame, self._steps + (_Step.parse(item),))
+
+
+    def __repr__(self):
+        return ("<LazyFrame: %d step%s over a frame [%d rows x %d cols]>"
+                % (len(self._steps), "" if len(self._steps) == 1 else "s",
+                   self._frame.nrows, self._frame.ncols))
+
+
+    def collect(self):
+        """
+        Evaluate the chain of selectors, and return the resulting Frame.
+        """
+        if not self._steps:
+            return self._frame.copy()
+        schemas = self._infer_schemas()
+        plan = _optimize(self._steps, schemas)
+        res = _evaluate(self._frame, plan)
+        if plan != self._steps:
+            expected = schemas[-1]
+            if res.ncols != expected.ncols or res.stypes != expected.stypes:
+                # Should never happen, but it is better to be safe
+                return _evaluate(self._frame, self._steps)  # pragma: no cover
+            res.names = expected.names
+        return res
+
+
+    def explain(self):
+        """
+        Return the description of the optimized plan, as a string with
+        one line per each ``DT[...]`` call that will be evaluated.
+        """
+        plan = _optimize(self._steps, self._infer_schemas())
+        out = ["Frame [%d rows x %d cols]" % self._frame.shape]
+        for step in plan:
+            out.append(repr(step))
+        return "\n".join(out)
+
+
+    def _infer_schemas(self):
+        """
+        Apply all steps to an empty slice of the source frame, and return
+        the list of frames obtained at each step (starting with the
+        empty source frame). These frames have the same columns as the
+        frames that would have been produced by the actual evaluation.
+        """
+        frame = self._frame[0:0, :]
+        out = [frame]
+        for step in self._steps:
+            frame = frame[step.args(schema_only=True)]
+            out.append(frame)
+        return out
+
+
+
+
+#-------------------------------------------------------------------------------
+# Step
+#-------------------------------------------------------------------------------
+
+class _Step:
+    """
+    A single ``DT[i, j, ...]`` call. The ``join()``, ``by()`` and
+    ``sort()`` modifiers are stored separately; anything else (such as
+    a second ``by()``) is kept in ``extra``, making the step opaque to
+    the optimizer.
+    """
+    __slots__ = ["i", "j", "join", "by", "sort", "extra"]
+
+    def __init__(self, i, j, join_=None, by_=None, sort_=None, extra=()):
+        self.i = i
+        self.j = j
+        self.join = join_
+        self.by = by_
+        self.sort = sort_
+        self.extra = extra
+
+
+    @staticmethod
+    def parse(item):
+        if not (isinstance(item, tuple) and len(item) >= 2):
+            raise TypeError("A LazyFrame can only be indexed with a selector "
+                            "of the form [i, j, ...]")
+        step = _Step(item[0], item[1])
+        if isinstance(step.j, update):
+            raise TypeError("A LazyFrame cannot be updated")
+        extra = []
+        for arg in item[2:]:
+            if isinstance(arg, join) and step.join is None:
+                step.join = arg
+            elif isinstance(arg, by) and step.by is None:
+                step.by = arg
+            elif isinstance(arg, sort) and step.sort is None:
+                step.sort = arg
+            else:
+                extra.append(arg)
+        step.extra = tuple(extra)
+        return step
+
+
+    def args(self, schema_only=False):
+        i = self.i
+        if schema_only and not isinstance(i, Expr):
+            # Row selectors do not affect the columns of the result, and
+            # may be invalid for an empty frame
+            i = slice(None)
+        mods = tuple(x for x in (self.join, self.by, self.sort)
+                     if x is not None)
+        return (i, self.j) + mods + self.extra
+
+
+    def replace(self, **kwds):
+        step = _Step(self.i, self.j, self.join, self.by, self.sort, self.extra)
+        for k, v in kwds.items():
+            setattr(step, k, v)
+        return step
+
+
+    def __repr__(self):
+        parts = [_repr(self.i), _repr(self.j)]
+        if self.join is not None:
+            parts.append("join(...)")
+        if self.by is not None:
+            parts.append("by(%s)" % ", ".join(_repr(x) for x in self.by.cols))
+        if self.sort is not None:
+            parts.append("sort(%s)" % ", ".join(_repr(x)
+                                               for x in self.sort.cols))
+        parts.extend(_repr(x) for x in self.extra)
+        return "[%s]" % ", ".join(parts)
+
+
+
+def _repr(x):
+    if _is_all(x):
+        return ":"
+    return repr(x)
+
+
+def _evaluate(frame, steps):
+    for step in steps:
+        frame = frame[step.args()]
+    return frame
+
+
+
+
+#-------------------------------------------------------------------------------
+# Optimizer
+#-------------------------------------------------------------------------------
+
+class _CannotOptimize(Exception):
+    pass
+
+
+_COL = OpCodes.COL.value
+_GROUPWISE_OPS = {OpCodes.SHIFTFN.value} | {op.value for op in OpCodes
+                                            if 400 < op.value < 500}
+
+
+def _optimize(steps, schemas):
+    """
+    Return the optimized list of steps. Here `schemas[k]` is the (empty)
+    frame that is the input of `steps[k]`, and `schemas[-1]` is the
+    output of the last step.
+    """
+    steps = list(steps)
+    schemas = list(schemas)
+    k = 0
+    while k < len(steps) - 1:
+        try:
+            steps[k] = _fuse(steps[k], steps[k + 1], schemas[k + 1])
+            del steps[k + 1]
+            del schemas[k + 1]
+        except _CannotOptimize:
+            k += 1
+    # Pruning is done from the end, so that the columns needed by each
+    # step are already known when the previous step is pruned
+    for k in reversed(range(len(steps) - 1)):
+        try:
+            steps[k] = _prune(steps[k], steps[k + 1], schemas[k],
+                              schemas[k + 1])
+        except _CannotOptimize:
+            pass
+    return tuple(steps)
+
+
+
+def _fuse(s1, s2, mid):
+    """
+    Combine steps `s1` and `s2` into a single step, or throw a
+    `_CannotOptimize` exception. Here `mid` is the schema of the
+    frame between the two steps.
+    """
+    if s1.extra or s2.extra or s1.join or s1.by or s1.sort:
+        raise _CannotOptimize
+    if s2.join and not (_is_all(s1.j) and s2.join.how == "left"):
+        raise _CannotOptimize
+    i1 = s1.i
+    has_filter = not _is_all(i1)
+    if has_filter:
+        if not isinstance(i1, Expr):
+            raise _CannotOptimize
+        # With a groupby, join or sort the filter is applied to a frame
+        # that is different from the input of `s1`
+        if (s2.join or s2.by or s2.sort) and _is_groupwise(i1):
+            raise _CannotOptimize
+
+    if _is_all(s1.j):
+        subst = None
+    else:
+        entries = _projection_entries(s1.j)
+        if len(entries) != mid.ncols:
+            raise _CannotOptimize
+        subst = (mid.names, entries)
+
+    i2 = s2.i
+    if _is_all(i2):
+        i = i1
+    elif isinstance(i2, Expr):
+        i = _substitute(i2, subst)
+        if has_filter:
+            if _is_groupwise(i2):
+                raise _CannotOptimize
+            i = i1 & i
+    elif has_filter:
+        raise _CannotOptimize
+    else:
+        i = i2  # row numbers do not change if there is no filter
+
+    j = _substitute_j(s2.j, subst, s2)
+    byexpr = s2.by
+    if byexpr is not None and subst is not None:
+        cols = [_substitute(_as_expr(col), subst) for col in byexpr.cols]
+        # The groupby columns must remain references to the columns of
+        # the frame, otherwise they would not be recognized as the group
+        # columns in `j`
+        if not all(_is_column_ref(col) for col in cols):
+            raise _CannotOptimize
+        byexpr = by(*cols, add_columns=byexpr.add_columns)
+    sortexpr = s2.sort
+    if sortexpr is not None and subst is not None:
+        cols = [_substitute(_as_expr(col), subst) for col in sortexpr.cols]
+        sortexpr = sort(*cols, reverse=sortexpr.reverse)
+    return _Step(i, j, s2.join, byexpr, sortexpr)
+
+
+
+def _prune(s1, s2, schema_in, schema_out):
+    """
+    Modify step `s1` (which selects all columns) so that it selects only
+    the columns used by the step `s2`.
+    """
+    if s1.extra or s1.by or not _is_all(s1.j):
+        raise _CannotOptimize
+    names = schema_out.names
+    needed = _referenced_names(s2)
+    if len(needed) == len(names):
+        raise _CannotOptimize
+    nleft = schema_in.ncols
+    if s1.join:
+        jnames = _joined_names(s1.join)
+        if nleft + len(jnames) != len(names):
+            raise _CannotOptimize
+    elif nleft != len(names):
+        raise _CannotOptimize
+    j = {}
+    for k, name in enumerate(names):
+        if name in needed:
+            j[name] = f[name] if k < nleft else g[jnames[k - nleft]]
+    return s1.replace(j=j)
+
+
+
+def _projection_entries(j):
+    """
+    Return the list of expressions that compute the columns selected by
+    `j`, provided that each expression produces a single column, and
+    is computed independently for each row.
+    """
+    if isinstance(j, dict):
+        items = list(j.values())
+    elif isinstance(j, (list, tuple)):
+        items = list(j)
+    else:
+        items = [j]
+    out = []
+    for item in items:
+        if not isinstance(item, Expr):
+            if not isinstance(item, str):
+                raise _CannotOptimize
+            item = f[item]
+        if _is_groupwise(item):
+            raise _CannotOptimize
+        _check_column_refs(item)
+        out.append(item)
+    return out
+
+
+def _substitute_j(j, subst, step):
+    if subst is None:
+        return j
+    if _is_all(j):
+        if step.by:
+            raise _CannotOptimize
+        return dict(zip(*subst))
+    if isinstance(j, dict):
+        return {k: _substitute(_as_expr(v), subst) for k, v in j.items()}
+    if isinstance(j, (list, tuple)):
+        return [_substitute(_as_expr(v), subst) for v in j]
+    return _substitute(_as_expr(j), subst)
+
+
+def _substitute(expr, subst):
+    """
+    Replace references to the columns of an intermediate frame with the
+    expressions that computed those columns.
+    """
+    if subst is None:
+        return expr
+    if isinstance(expr, Expr):
+        if expr._op == _COL:
+            if expr._params[0] != 0:  # column of the joined frame
+                return expr
+            names, entries = subst
+            sel = expr._args[0]
+            if isinstance(sel, str) and sel in names:
+                return entries[names.index(sel)]
+            if isinstance(sel, int) and not isinstance(sel, bool):
+                if -len(names) <= sel < len(names):
+                    return entries[sel]
+            raise _CannotOptimize
+        if expr._op in (OpCodes.SETPLUS.value, OpCodes.SETMINUS.value):
+            raise _CannotOptimize
+        args = tuple(_substitute(arg, subst) for arg in expr._args)
+        return Expr(expr._op, args, expr._params)
+    if isinstance(expr, (list, tuple)):
+        return type(expr)(_substitute(arg, subst) for arg in expr)
+    return expr
+
+
+def _referenced_names(step):
+    """
+    Return the set of names of all columns that are used by `step`.
+    """
+    if step.extra or _is_all(step.j):
+        raise _CannotOptimize
+    out = set()
+    if isinstance(step.i, Expr):
+        _collect_names(step.i, out)
+    j = step.j
+    items = (list(j.values()) if isinstance(j, dict) else
+             list(j) if isinstance(j, (list, tuple)) else [j])
+    for item in items:
+        _collect_names(_as_expr(item), out)
+    for mod in (step.by, step.sort):
+        if mod is not None:
+            for col in mod.cols:
+                _collect_names(_as_expr(col), out)
+    if step.join is not None:
+        keys = step.join.on
+        if keys is None:
+            keys = step.join.joinframe.key
+        for key in keys:
+            if not isinstance(key, str):
+                raise _CannotOptimize
+            out.add(key)
+    return out
+
+
+def _collect_names(expr, out):
+    if isinstance(expr, Expr):
+        if expr._op == _COL:
+            if expr._params[0] == 0:
+                sel = expr._args[0]
+                if not isinstance(sel, str):
+                    raise _CannotOptimize
+                out.add(sel)
+        else:
+            for arg in expr._args:
+                _collect_names(arg, out)
+    elif isinstance(expr, (list, tuple)):
+        for arg in expr:
+            _collect_names(arg, out)
+
+
+def _joined_names(joinexpr):
+    """
+    Names of the columns of the joined frame that are added to the
+    result of a join.
+    """
+    keys = joinexpr.on
+    jframe = joinexpr.joinframe
+    if keys is None:
+        keys = jframe.key
+    if not all(isinstance(key, str) for key in keys):
+        raise _CannotOptimize
+    return [name for name in jframe.names if name not in keys]
+
+
+def _check_column_refs(expr):
+    """
+    Check that all column references in `expr` select a single column
+    of the frame `f`.
+    """
+    if isinstance(expr, Expr):
+        if expr._op == _COL:
+            if not _is_column_ref(expr):
+                raise _CannotOptimize
+        elif expr._op in (OpCodes.SETPLUS.value, OpCodes.SETMINUS.value):
+            raise _CannotOptimize
+        else:
+            for arg in expr._args:
+                _check_column_refs(arg)
+    elif isinstance(expr, (list, tuple)):
+        for arg in expr:
+            _check_column_refs(arg)
+
+
+def _is_column_ref(expr):
+    if not (isinstance(expr, Expr) and expr._op == _COL and
+            expr._params[0] == 0):
+        return False
+    sel = expr._args[0]
+    return isinstance(sel, str) or (isinstance(sel, int) and
+                                    not isinstance(sel, bool))
+
+
+def _is_groupwise(expr):
+    """
+    Return True if the value of `expr` in a row may depend on the other
+    rows of the frame (or group).
+    """
+    if isinstance(expr, Expr):
+        return (expr._op in _GROUPWISE_OPS or
+                any(_is_groupwise(arg) for arg in expr._args))
+    if isinstance(expr, (list, tuple)):
+        return any(_is_groupwise(arg) for arg in expr)
+    return False
+
+
+def _as_expr(x):
+    """
+    Convert a column selector used in `j`, `by()` or `sort()` into an
+    Expr.
+    """
+    if isinstance(x, Expr):
+        return x
+    if isinstance(x, str) or (isinstance(x, int) and
+                              not isinstance(x, bool)):
+        return f[x]
+    raise _CannotOptimize
+
+
+def _is_all(x):
+    return isinstance(x, slice) and x == slice(None)
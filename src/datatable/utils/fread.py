@@ -237,37 +237,38 @@ def _resolve_archive(filename, subpath, tempfiles):
     out_file = None
     out_text = None
     out_result = None
-    # TODO: file extarction should be lazy
+    # Compressed files are not extracted here: instead, we return the opened
+    # binary stream objects, which are then decompressed block-by-block
+    # directly into the reader's input buffer.
     if ext == ".zip":
         import zipfile
-        with zipfile.ZipFile(filename) as zf:
-            # MacOS is found guilty of adding extra files into the Zip archives
-            # it creates. The files are hidden, and in the directory __MACOSX/.
-            # We remove those files from the list, since they are not real user
-            # files, and have an unknown binary format.
-            zff = [name for name in zf.namelist()
-                   if not(name.startswith("__MACOSX/") or name.endswith("/"))]
-            if subpath:
-                if subpath in zff:
-                    filename = os.path.join(filename, subpath)
-                    zff = [subpath]
-                else:
-                    raise IOError("File `%s` does not exist in archive `%s`"
-                                   % (subpath, filename))
-            extracted_files = []
-            for zf_file in zff:
-                if logger:
-                    logger.debug("Extracting %s/%s to temporary directory %s"
-                                 % (filename, zf_file, tempfiles.tempdir))
-                newfile = zf.extract(zf_file, path=tempfiles.tempdir)
-                srcname = os.path.join(filename, zf_file)
-                tempfiles.add(newfile)
-                extracted_files.append(((srcname, newfile, None, None), None))
-
-            if len(extracted_files) == 1:
-                out_file = extracted_files[0][0][1]
+        zf = zipfile.ZipFile(filename)
+        # MacOS is found guilty of adding extra files into the Zip archives
+        # it creates. The files are hidden, and in the directory __MACOSX/.
+        # We remove those files from the list, since they are not real user
+        # files, and have an unknown binary format.
+        zff = [name for name in zf.namelist()
+               if not(name.startswith("__MACOSX/") or name.endswith("/"))]
+        if subpath:
+            if subpath in zff:
+                filename = os.path.join(filename, subpath)
+                zff = [subpath]
             else:
-                return (None, None, None, None), extracted_files
+                zf.close()
+                raise IOError("File `%s` does not exist in archive `%s`"
+                               % (subpath, filename))
+        streams = []
+        for zf_file in zff:
+            srcname = os.path.join(filename, zf_file)
+            if logger:
+                logger.debug("Streaming %s" % srcname)
+            streams.append(((srcname, None, None, None), zf.open(zf_file)))
+        # The underlying file remains open until all members are closed
+        zf.close()
+        if len(streams) == 1:
+            out_result = streams[0][1]
+        else:
+            return (None, None, None, None), streams
 
     elif filename.endswith(".tar.gz") or filename.endswith(".tgz"):
         import tarfile
@@ -280,47 +281,35 @@ def _resolve_archive(filename, subpath, tempfiles):
             else:
                 raise IOError("File `%s` does not exist in archive `%s`"
                               % (subpath, filename))
-        extracted_files = []
+        streams = []
         for entryname in zff:
-            if logger:
-                logger.debug("Extracting %s/%s to temporary directory %s"
-                             % (filename, entryname, tempfiles.tempdir))
-            newfile = tempfiles.create_temp_file()
-            with zf.extractfile(entryname) as inp, open(newfile, "wb") as out:
-                out.write(inp.read())
             srcname = os.path.join(filename, entryname)
-            extracted_files.append(((srcname, newfile, None, None), None))
-        if len(extracted_files) == 1:
-            out_file = extracted_files[0][0][1]
+            if logger:
+                logger.debug("Streaming %s" % srcname)
+            streams.append(((srcname, None, None, None),
+                            zf.extractfile(entryname)))
+        if len(streams) == 1:
+            out_result = streams[0][1]
         else:
-            return (None, None, None, None), extracted_files
+            return (None, None, None, None), streams
 
     elif ext == ".gz":
         import gzip
-        zf = gzip.GzipFile(filename, mode="rb")
-        if logger:
-            logger.debug("Extracting %s into memory" % filename)
-        out_text = zf.read()
         if logger:
-            logger.debug("Extracted: size = %d" % len(out_text))
+            logger.debug("Streaming %s" % filename)
+        out_result = gzip.open(filename, mode="rb")
 
     elif ext == ".bz2":
         import bz2
-        with bz2.open(filename, mode="rb") as zf:
-            if logger:
-                logger.debug("Extracting %s into memory" % filename)
-            out_text = zf.read()
-            if logger:
-                logger.debug("Extracted: size = %d" % len(out_text))
+        if logger:
+            logger.debug("Streaming %s" % filename)
+        out_result = bz2.open(filename, mode="rb")
 
     elif ext == ".xz":
         import lzma
-        with lzma.open(filename, mode="rb") as zf:
-            if logger:
-                logger.debug("Extracting %s into memory" % filename)
-            out_text = zf.read()
-            if logger:
-                logger.debug("Extracted: size = %d" % len(out_text))
+        if logger:
+            logger.debug("Streaming %s" % filename)
+        out_result = lzma.open(filename, mode="rb")
 
     elif ext == ".xlsx" or ext == ".xls":
         out_result = read_xls_workbook(filename, subpath)
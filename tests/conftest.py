@@ -98,6 +98,19 @@ def numpy():
         pytest.skip("Numpy module is required for this test")
 
 
+@pytest.fixture(scope="session")
+def pyarrow():
+    """
+    This fixture returns pyarrow module, or if unavailable marks test as
+    skipped.
+    """
+    try:
+        import pyarrow as pa
+        return pa
+    except ImportError:
+        pytest.skip("Pyarrow module is required for this test")
+
+
 @pytest.fixture(scope="session")
 def h2o():
     """
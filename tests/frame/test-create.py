@@ -29,6 +29,7 @@ import math
 import os
 import pytest
 import random
+import re
 import datatable as dt
 from datatable import ltype, stype
 from datatable.exceptions import DatatableWarning
@@ -1268,6 +1269,116 @@ def test_from_random_numpy_masked_and_sliced(numpy, seed):
 
 
 
+#-------------------------------------------------------------------------------
+# Create from Arrow
+#-------------------------------------------------------------------------------
+
+def test_create_from_arrow(pyarrow):
+    tbl = pyarrow.table({"A": [1, 2, None, 4], "B": ["a", None, "cc", ""],
+                         "C": [True, False, None, True],
+                         "D": [0.5, None, 1.5, float("inf")]})
+    DT = dt.Frame(tbl)
+    frame_integrity_check(DT)
+    assert DT.names == ("A", "B", "C", "D")
+    assert DT.stypes == (dt.int64, dt.str32, dt.bool8, dt.float64)
+    assert DT.to_list() == [[1, 2, None, 4], ["a", None, "cc", ""],
+                            [True, False, None, True],
+                            [0.5, None, 1.5, math.inf]]
+
+
+def test_create_from_arrow_types(pyarrow):
+    pa = pyarrow
+    types = [pa.int8(), pa.int16(), pa.int32(), pa.int64(), pa.float32(),
+             pa.float64(), pa.string(), pa.large_string()]
+    stypes = (dt.int8, dt.int16, dt.int32, dt.int64, dt.float32,
+              dt.float64, dt.str32, dt.str64)
+    data = [[1, None, 3]] * 6 + [["x", None, "zz"]] * 2
+    arrays = [pa.array(data[i], type=types[i]) for i in range(8)]
+    DT = dt.Frame(pa.table(arrays, names=list("ABCDEFGH")))
+    frame_integrity_check(DT)
+    assert DT.stypes == stypes
+    assert DT.to_list() == data
+
+
+def test_create_from_arrow_batch(pyarrow):
+    batch = pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array([3, 4, 5]), pyarrow.array(["p", "q", "r"])],
+                names=["x", "y"])
+    DT = dt.Frame(batch, names=["A", "B"])
+    frame_integrity_check(DT)
+    assert DT.names == ("A", "B")
+    assert DT.to_list() == [[3, 4, 5], ["p", "q", "r"]]
+
+
+def test_create_from_arrow_slice(pyarrow):
+    tbl = pyarrow.table({"A": [1, None, 3, 4, None, 6],
+                         "B": ["a", "bb", None, "dd", "e", "f"],
+                         "C": [True, None, False, True, False, None]})
+    DT = dt.Frame(tbl.slice(2, 3))
+    frame_integrity_check(DT)
+    assert DT.to_list() == [[3, 4, None], [None, "dd", "e"],
+                            [False, True, False]]
+    DT.materialize()
+    assert DT.to_list() == [[3, 4, None], [None, "dd", "e"],
+                            [False, True, False]]
+
+
+def test_create_from_arrow_chunked(pyarrow):
+    tbl = pyarrow.table({"A": [1, None, 3], "B": ["x", "y", None]})
+    tbl = pyarrow.concat_tables([tbl, tbl.slice(1), tbl])
+    assert len(tbl.to_batches()) == 3
+    DT = dt.Frame(tbl)
+    frame_integrity_check(DT)
+    assert DT.shape == (8, 2)
+    assert DT.to_list() == [list(tbl.column(i).to_pylist()) for i in range(2)]
+
+
+def test_create_from_arrow_empty(pyarrow):
+    tbl = pyarrow.table({"A": pyarrow.array([], type=pyarrow.float32())})
+    DT = dt.Frame(tbl)
+    frame_integrity_check(DT)
+    assert DT.shape == (0, 1)
+    assert DT.stypes == (dt.float32,)
+
+
+def test_create_from_arrow_unsupported_types(pyarrow):
+    import datetime
+    tbl = pyarrow.table({
+        "A": pyarrow.array(["u", "v", "u"]).dictionary_encode(),
+        "B": pyarrow.array([1, 2, 3], type=pyarrow.timestamp("s")),
+        "C": pyarrow.nulls(3)})
+    DT = dt.Frame(tbl)
+    frame_integrity_check(DT)
+    assert DT.stypes == (dt.str32, dt.obj64, dt.bool8)
+    assert DT.to_list()[0] == ["u", "v", "u"]
+    assert DT.to_list()[1][2] == datetime.datetime(1970, 1, 1, 0, 0, 3)
+    assert DT.to_list()[2] == [None] * 3
+
+
+def test_create_from_arrow_outlives_table(pyarrow):
+    tbl = pyarrow.table({"A": list(range(100)), "B": ["x"] * 100})
+    DT = dt.Frame(tbl)
+    del tbl
+    assert DT.to_list() == [list(range(100)), ["x"] * 100]
+
+
+def test_create_from_arrow_stypes(pyarrow):
+    tbl = pyarrow.table({"A": [1, 2]})
+    msg = "Argument stypes is not supported in Frame() constructor " \
+          "when creating a Frame from an arrow Table"
+    with pytest.raises(TypeError, match=re.escape(msg)):
+        dt.Frame(tbl, stypes=[dt.int32])
+
+
+def test_arrow_roundtrip(pyarrow):
+    DT0 = dt.Frame(A=[1, None, 3], B=[None, "b", "c"], C=[True, False, None],
+                   D=[1.5, 2.5, None], E=[None, None, None])
+    DT1 = dt.Frame(DT0.to_arrow())
+    frame_integrity_check(DT1)
+    assert_equals(DT0, DT1)
+
+
+
 #-------------------------------------------------------------------------------
 # Issues
 #-------------------------------------------------------------------------------
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#-------------------------------------------------------------------------------
+# Copyright 2020 H2O.ai
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#-------------------------------------------------------------------------------
+import datatable as dt
+import pytest
+import random
+from datatable import f, by, count, join
+from datatable.internal import frame_integrity_check
+from tests import assert_equals
+
+
+#-------------------------------------------------------------------------------
+# create_index() / drop_index() / indexes
+#-------------------------------------------------------------------------------
+
+def test_create_index():
+    DT = dt.Frame(A=[5, 3, 8, 3, 1], B=range(5), C=list("abcde"))
+    assert DT.indexes == tuple()
+    DT.create_index("A")
+    assert DT.indexes == ("A",)
+    DT.create_index(["C", 1])
+    assert DT.indexes == ("A", "B", "C")
+    frame_integrity_check(DT)
+    assert DT.to_list() == [[5, 3, 8, 3, 1], [0, 1, 2, 3, 4], list("abcde")]
+
+
+def test_create_index_bad_column():
+    DT = dt.Frame(A=[1, 2, 3])
+    with pytest.raises(KeyError):
+        DT.create_index("Z")
+    with pytest.raises(IndexError):
+        DT.create_index(3)
+    with pytest.raises(TypeError, match="should be a column name or index"):
+        DT.create_index([f.A])
+    with pytest.raises(TypeError, match="missing the required"):
+        DT.create_index()
+    assert DT.indexes == tuple()
+
+
+def test_drop_index():
+    DT = dt.Frame(A=[1], B=[2], C=[3])
+    DT.create_index(["A", "B", "C"])
+    DT.drop_index("B")
+    assert DT.indexes == ("A", "C")
+    DT.drop_index(["B", "C"])
+    assert DT.indexes == ("A",)
+    DT.drop_index()
+    assert DT.indexes == tuple()
+
+
+def test_index_follows_columns():
+    DT = dt.Frame(A=[3, 1, 2], B=[1, 1, 2], C=[7, 8, 9])
+    DT.create_index(["B", "C"])
+    del DT["A"]
+    assert DT.indexes == ("B", "C")
+    assert DT[f.C == 8, :].to_list() == [[1], [8]]
+    del DT["B"]
+    assert DT.indexes == ("C",)
+    DT.names = ["X"]
+    assert DT.indexes == ("X",)
+    del DT[:, :]
+    assert DT.indexes == tuple()
+
+
+def test_index_with_key():
+    DT = dt.Frame(A=[3, 1, 2], B=[5, 5, 6])
+    DT.create_index("B")
+    DT.key = "A"
+    assert DT.indexes == ("B",)
+    assert DT[f.B == 5, :].to_list() == [[1, 3], [5, 5]]
+
+
+def test_index_copy():
+    DT = dt.Frame(A=[3, 1, 2])
+    DT.create_index("A")
+    DT2 = DT.copy()
+    assert DT2.indexes == ("A",)
+    DT2[0, "A"] = 1
+    assert DT[f.A == 1, :].to_list() == [[1]]
+    assert DT2[f.A == 1, :].to_list() == [[1, 1]]
+    assert DT[:, :].indexes == tuple()
+
+
+
+
+#-------------------------------------------------------------------------------
+# Filtering with an index
+#-------------------------------------------------------------------------------
+
+def test_index_lookup_simple():
+    DT = dt.Frame(A=[5, 3, None, 8, 3, 1], B=range(6))
+    DT.create_index("A")
+    assert DT[f.A == 3, :].to_list() == [[3, 3], [1, 4]]
+    assert DT[f.A == 4, :].to_list() == [[], []]
+    assert DT[f.A < 5, "B"].to_list() == [[1, 4, 5]]
+    assert DT[f.A <= 5, "B"].to_list() == [[0, 1, 4, 5]]
+    assert DT[f.A > 3, "B"].to_list() == [[0, 3]]
+    assert DT[f.A >= 3, "B"].to_list() == [[0, 1, 3, 4]]
+    assert DT[3 > f.A, "B"].to_list() == [[5]]
+    assert DT[f.A == None, "B"].to_list() == [[2]]
+
+
+def test_index_lookup_ranges():
+    DT = dt.Frame(A=[5, 3, None, 8, 3, 1], B=range(6))
+    DT.create_index("A")
+    assert DT[(f.A >= 3) & (f.A < 8), "B"].to_list() == [[0, 1, 4]]
+    assert DT[(f.A == 1) | (f.A == 8) | (f.A == 9), "B"].to_list() == [[3, 5]]
+    assert DT[(f.A < 3) | (f.A > 5), "B"].to_list() == [[3, 5]]
+    assert DT[(f.A == 3) & (f.B > 2), "B"].to_list() == [[4]]
+
+
+def test_index_lookup_strings():
+    DT = dt.Frame(A=["b", "ab", None, "b", "", "abc"])
+    DT.create_index("A")
+    assert DT[f.A == "b", :].to_list() == [["b", "b"]]
+    assert DT[f.A == "", :].to_list() == [[""]]
+    assert DT[f.A < "b", :].to_list() == [["ab", "", "abc"]]
+    with pytest.raises(TypeError):
+        DT[f.A == 1, :]
+
+
+def test_index_lookup_after_modification():
+    DT = dt.Frame(A=[1, 2, 3, 4], B=[0] * 4)
+    DT.create_index("A")
+    assert DT[f.A == 2, :].to_list() == [[2], [0]]
+    DT[0, "A"] = 2
+    assert DT[f.A == 2, :].to_list() == [[2, 2], [0, 0]]
+    DT[f.A == 2, "B"] = 1
+    assert DT[f.A == 2, :].to_list() == [[2, 2], [1, 1]]
+    DT.rbind(dt.Frame(A=[2], B=[5]))
+    assert DT[f.A == 2, "B"].to_list() == [[1, 1, 5]]
+    del DT[0, :]
+    assert DT[f.A == 2, "B"].to_list() == [[1, 5]]
+    DT.nrows = 2
+    assert DT[f.A == 2, "B"].to_list() == [[1]]
+    assert DT.indexes == ("A",)
+
+
+def test_index_lookup_with_groupby_and_join():
+    DT = dt.Frame(A=[1, 2, 1, 2, 1], B=[1, 2, 3, 4, 5])
+    DT.create_index("A")
+    RES = DT[f.A == 1, count(), by(f.B)]
+    assert RES.to_list() == [[1, 3, 5], [1, 1, 1]]
+    JDT = dt.Frame(B=[1, 3], C=["x", "y"])
+    JDT.key = "B"
+    RES = DT[f.A == 1, :, join(JDT)]
+    assert RES.to_list() == [[1, 1, 1], [1, 3, 5], ["x", "y", None]]
+
+
+@pytest.mark.parametrize("seed", [random.getrandbits(32) for _ in range(5)])
+def test_index_lookup_random(seed):
+    random.seed(seed)
+    n = random.randint(0, 1000)
+    DT = dt.Frame(A=[random.choice([None, -1.5, 0.0, 2.0, 7.25])
+                     for _ in range(n)],
+                  B=[random.randint(-10, 10) for _ in range(n)])
+    DI = DT.copy()
+    DI.create_index(["A", "B"])
+    x, y = random.randint(-12, 12), random.randint(-12, 12)
+    for expr in [f.B == x, f.B < x, f.B >= x, (f.B >= x) & (f.B <= y),
+                 (f.B == x) | (f.B == y), f.A == 2, f.A > -1.5,
+                 (f.A < 1) | (f.A == 7.25)]:
+        RES = DI[expr, :]
+        frame_integrity_check(RES)
+        assert_equals(RES, DT[expr, :])
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#-------------------------------------------------------------------------------
+# Copyright 2020 H2O.ai
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#-------------------------------------------------------------------------------
+import datatable as dt
+import pytest
+from datatable import f, g, by, join, sort, update
+from datatable.internal import frame_integrity_check
+from tests import assert_equals
+
+
+def nsteps(lazyframe):
+    # the first line of the plan describes the source frame
+    return len(lazyframe.explain().split("\n")) - 1
+
+
+@pytest.fixture()
+def DT():
+    return dt.Frame(A=range(20),
+                    B=[i % 3 for i in range(20)],
+                    C=[i * 0.5 for i in range(20)],
+                    D=["a", "bc", None, "def", "g"] * 4)
+
+
+
+#-------------------------------------------------------------------------------
+# Basic
+#-------------------------------------------------------------------------------
+
+def test_lazy_empty(DT):
+    LF = DT.lazy()
+    assert nsteps(LF) == 0
+    RES = LF.collect()
+    frame_integrity_check(RES)
+    assert_equals(RES, DT)
+
+
+def test_lazy_repr(DT):
+    LF = DT.lazy()[:, f.A][f.A > 3, :]
+    assert repr(LF) == "<LazyFrame: 2 steps over a frame [20 rows x 4 cols]>"
+
+
+def test_lazy_does_not_evaluate(DT):
+    LF = DT.lazy()[:, f.A + 1]
+    DT[:, "A"] = 100
+    assert LF.collect().to_list() == [[101] * 20]
+
+
+def test_lazy_bad_selector(DT):
+    with pytest.raises(TypeError, match="A LazyFrame can only be indexed "
+                                        "with a selector of the form"):
+        DT.lazy()["A"]
+
+
+def test_lazy_update(DT):
+    with pytest.raises(TypeError, match="A LazyFrame cannot be updated"):
+        DT.lazy()[:, update(E=f.A)]
+
+
+def test_lazy_errors_same_as_eager(DT):
+    with pytest.raises(KeyError):
+        DT[:, f.A][:, f.B]
+    LF = DT.lazy()[:, f.A][:, f.B]
+    with pytest.raises(KeyError):
+        LF.collect()
+
+
+
+#-------------------------------------------------------------------------------
+# Fusion of steps
+#-------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("chain", [
+    lambda X: X[f.A > 3, :][f.B == 1, :],
+    lambda X: X[f.A > 3, :][:, [f.C, f.A]],
+    lambda X: X[:, {"X": f.A * 2, "Y": f.C}][f.X > 10, :],
+    lambda X: X[:, {"X": f.A * 2, "Y": f.C}][f.X > 10, "Y"],
+    lambda X: X[:, ["D", "A"]][:, f[1] + 1],
+    lambda X: X[:, [f.B, f.A - 1]][:, dt.sum(f.C0), by(f.B)],
+    lambda X: X[f.A < 15, :][:, dt.count(), by("D")],
+    lambda X: X[f.A < 15, :][:, :, sort(f.D, f.A)],
+    lambda X: X[:, {"N": -f.A, "D": f.D}][:, :, sort(f.N)],
+    lambda X: X[:, {"N": -f.A}][2:5, :],
+])
+def test_lazy_fused(DT, chain):
+    LF = chain(DT.lazy())
+    assert nsteps(LF) == 1
+    RES = LF.collect()
+    frame_integrity_check(RES)
+    assert_equals(RES, chain(DT))
+
+
+def test_lazy_fused_many(DT):
+    LF = (DT.lazy()[f.A > 1, :]
+                   [:, {"X": f.A + f.C, "B": f.B}]
+                   [f.X < 20, :]
+                   [:, {"Y": f.X * 2, "B": f.B}]
+                   [:, dt.mean(f.Y), by(f.B)])
+    assert nsteps(LF) == 1
+    assert_equals(LF.collect(),
+                  DT[f.A > 1, :]
+                    [:, {"X": f.A + f.C, "B": f.B}]
+                    [f.X < 20, :]
+                    [:, {"Y": f.X * 2, "B": f.B}]
+                    [:, dt.mean(f.Y), by(f.B)])
+
+
+@pytest.mark.parametrize("chain", [
+    # groupby in the first step
+    lambda X: X[:, dt.sum(f.A), by(f.B)][f.A > 50, :],
+    # the filter uses a reducer, and the second step is grouped
+    lambda X: X[f.A > dt.mean(f.A), :][:, dt.count(), by(f.B)],
+    # row numbers after a filter
+    lambda X: X[f.A > 3, :][2:5, :],
+    # a column computed with a reducer
+    lambda X: X[:, {"S": f.A - dt.mean(f.A)}][f.S > 0, :],
+    # groupby over a computed column
+    lambda X: X[:, {"K": f.B * 2, "A": f.A}][:, dt.sum(f.A), by(f.K)],
+])
+def test_lazy_not_fused(DT, chain):
+    LF = chain(DT.lazy())
+    assert nsteps(LF) == 2
+    RES = LF.collect()
+    frame_integrity_check(RES)
+    assert_equals(RES, chain(DT))
+
+
+
+#-------------------------------------------------------------------------------
+# Joins
+#-------------------------------------------------------------------------------
+
+def test_lazy_join_pruned():
+    DT = dt.Frame(K=[1, 2, 3, 1, 2], V=range(5))
+    X = dt.Frame(K=[1, 2, 3], P=[10, 20, 30], Q=["a", "b", "c"],
+                 R=[0.5, 1.5, 2.5])
+    X.key = "K"
+    LF = DT.lazy()[:, :, join(X)][:, {"W": f.V * f.P}]
+    plan = LF.explain()
+    assert "col('Q'; 1)" not in plan
+    assert "col('P'; 1)" in plan
+    RES = LF.collect()
+    frame_integrity_check(RES)
+    assert_equals(RES, DT[:, :, join(X)][:, {"W": f.V * f.P}])
+
+
+def test_lazy_filter_merged_into_join():
+    DT = dt.Frame(K=[1, 2, 3, 1, 2], V=range(5))
+    X = dt.Frame(K=[1, 2], P=[10, 20])
+    X.key = "K"
+    LF = DT.lazy()[f.V > 0, :][:, f.V + g.P, join(X)]
+    assert nsteps(LF) == 1
+    assert_equals(LF.collect(), DT[f.V > 0, :][:, f.V + g.P, join(X)])
@@ -244,7 +244,7 @@ def test_fread_xz_file(tempfile, capsys):
     assert d0.source == xzfile
     assert d0.to_list() == [[1, 2, 3]]
     assert not err
-    assert ("Extracting %s into memory" % xzfile) in out
+    assert ("Streaming %s" % xzfile) in out
     os.unlink(xzfile)
 
 
@@ -259,7 +259,7 @@ def test_fread_gz_file(tempfile, capsys):
     assert d0.source == gzfile
     assert d0.to_list() == [[10, 20, 30]]
     assert not err
-    assert ("Extracting %s into memory" % gzfile) in out
+    assert ("Streaming %s" % gzfile) in out
     os.unlink(gzfile)
 
 
@@ -275,11 +275,77 @@ def test_fread_bz2_file(tempfile, capsys):
         assert d0.source == bzfile
         assert d0.to_list() == [[11, 22, 33]]
         assert not err
-        assert ("Extracting %s into memory" % bzfile) in out
+        assert ("Streaming %s" % bzfile) in out
     finally:
         os.remove(bzfile)
 
 
+def test_fread_gz_file_multimember(tempfile):
+    import gzip
+    gzfile = tempfile + ".gz"
+    with open(gzfile, "wb") as f:
+        f.write(gzip.compress(b"A,B\n1,x\n2,y\n"))
+        f.write(gzip.compress(b"3,z\n"))
+    try:
+        d0 = dt.fread(gzfile)
+        frame_integrity_check(d0)
+        assert d0.to_list() == [[1, 2, 3], ["x", "y", "z"]]
+    finally:
+        os.remove(gzfile)
+
+
+def test_fread_gz_file_large(tempfile):
+    import gzip
+    gzfile = tempfile + ".gz"
+    n = 1000000
+    with gzip.open(gzfile, "wb", compresslevel=1) as f:
+        f.write(b"A,B\n")
+        f.write("".join("%d,%d\n" % (i, i % 7) for i in range(n)).encode())
+    try:
+        d0 = dt.fread(gzfile)
+        frame_integrity_check(d0)
+        assert d0.shape == (n, 2)
+        assert d0[:, dt.sum(dt.f.A)][0, 0] == n * (n - 1) // 2
+        # Decompressed data spills into a temporary file
+        d1 = dt.fread(gzfile, memory_limit=1000000)
+        assert_equals(d0, d1)
+    finally:
+        os.remove(gzfile)
+
+
+def test_fread_gz_file_parallel(tempfile):
+    import gzip
+    import random
+    gzfile = tempfile + ".gz"
+    random.seed(3)
+    # Members stored without compression contain the byte sequences that
+    # look like gzip headers, which should not confuse the reader
+    fake_header = "\x1f\x8b\x08\x00"
+    src = [[random.random() for _ in range(100000)],
+           [fake_header * random.randint(0, 3) for _ in range(100000)]]
+    text = "A,B\n" + "".join("%r,%s\n" % row for row in zip(*src))
+    data = text.encode("latin1")
+    with open(gzfile, "wb") as f:
+        for i in range(0, len(data), 200000):
+            level = [0, 1, 6, 9][(i // 200000) % 4]
+            f.write(gzip.compress(data[i:i + 200000], compresslevel=level))
+    try:
+        with dt.options.context(nthreads=4):
+            d0 = dt.fread(gzfile)
+        frame_integrity_check(d0)
+        assert d0.shape == (100000, 2)
+        assert_equals(d0, dt.fread(text=data))
+        with open(gzfile, "rb") as f:
+            truncated = f.read()[:-5]
+        with open(gzfile, "wb") as f:
+            f.write(truncated)
+        with dt.options.context(nthreads=4):
+            with pytest.raises(IOError, match="Invalid gzip data"):
+                dt.fread(gzfile)
+    finally:
+        os.remove(gzfile)
+
+
 def test_fread_zip_file_1(tempfile, capsys):
     import zipfile
     zfname = tempfile + ".zip"
@@ -292,7 +358,7 @@ def test_fread_zip_file_1(tempfile, capsys):
     assert d0.names == ("a", "b", "c")
     assert d0.to_list() == [[10, 5], [20, 7], [30, 12]]
     assert not err
-    assert ("Extracting %s/data1.csv to temporary directory" % zfname) in out
+    assert ("Streaming %s/data1.csv" % zfname) in out
     os.unlink(zfname)
 
 
@@ -696,6 +762,34 @@ def test_fread_columns_fn3():
     assert d2.to_list() == [["1"], ["2"]]
 
 
+def test_fread_columns_skip_quoted_fields():
+    # Dropped columns are only scanned for field boundaries, which must
+    # respect quoted fields with embedded separators, quotes and newlines
+    src = ('id,text,value,note\n'
+           '1,"a, b",1.5,"line1\nline2"\n'
+           '2,"he said ""hi""",2.5,plain text here\n'
+           '3,,3.5,"x,y,z"\n'
+           '4,unquoted,4.5,\n')
+    d0 = dt.fread(src, columns={"id", "value"})
+    frame_integrity_check(d0)
+    assert d0.names == ("id", "value")
+    assert d0.to_list() == [[1, 2, 3, 4], [1.5, 2.5, 3.5, 4.5]]
+
+
+def test_fread_columns_skip_many():
+    ncols = 50
+    names = ["C%d" % i for i in range(ncols)]
+    rows = [",".join(str(i * 1000 + j) if j % 2 else "s%d-%d" % (i, j)
+                     for j in range(ncols))
+            for i in range(1000)]
+    src = ",".join(names) + "\n" + "\n".join(rows) + "\n"
+    DT = dt.fread(src)
+    d0 = dt.fread(src, columns=lambda cols: [c.name in ("C3", "C48")
+                                             for c in cols])
+    frame_integrity_check(d0)
+    assert_equals(d0, DT[:, ["C3", "C48"]])
+
+
 @pytest.mark.parametrize("columns", [None, dict()])
 def test_fread_columns_empty(columns):
     # `None` column selector should select all columns
@@ -1000,6 +1094,20 @@ def test_fread_max_nrows_0rows():
     assert d0.shape == (0, 1)
 
 
+def test_fread_max_nrows_with_reread():
+    # The type bump is outside of the sample, so that some columns have
+    # to be re-read, and in the second pass the output is reallocated
+    n = 100000
+    src = "A,B\n" + "".join("%d,%d\n" % (i, i % 7) for i in range(n))
+    src = src.replace("\n55555,3\n", "\n55555,1.5\n")
+    d0 = dt.fread(src, max_nrows=60000)
+    frame_integrity_check(d0)
+    assert d0.shape == (60000, 2)
+    assert d0.stypes == (dt.int32, dt.float64)
+    assert d0[:, "A"].to_list() == [list(range(60000))]
+    assert d0[55555, "B"] == 1.5
+
+
 @pytest.mark.xfail()
 def test_fread_max_nrows_correct_types():
     d0 = dt.fread("A,B\n"
@@ -1015,6 +1123,229 @@ def test_fread_max_nrows_correct_types():
 
 
 
+#-------------------------------------------------------------------------------
+# `filter`
+#-------------------------------------------------------------------------------
+
+def _filter_test_data(n=5000):
+    import random
+    random.seed(n)
+    lines = ["A,B,S,F"]
+    for i in range(n):
+        a = "" if i % 13 == 0 else str(random.randint(-50, 50))
+        s = random.choice(["US", "UK", "FR", ""])
+        flag = random.choice(["true", "false", ""])
+        lines.append("%s,%d,%s,%s" % (a, i, s, flag))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_fread_filter(nthreads):
+    from datatable import f
+    src = _filter_test_data()
+    DT = dt.fread(src)
+    filters = [f.A > 10, f.S == "US", f.S != "US", 5 <= f.A, f.A == None,
+               f.S < "UK", f[0] == 3.0, f.F, ~f.F, f.F | (f.A == 5),
+               (f.A < 0) & ~(f.S == "UK"), f.A != None]
+    with dt.options.context(nthreads=nthreads):
+        for flt in filters:
+            RES = dt.fread(src, filter=flt)
+            frame_integrity_check(RES)
+            assert_equals(RES, DT[flt, :])
+
+
+def test_fread_filter_verbose(capsys):
+    from datatable import f
+    src = "A,B\n" + "".join("%d,%d\n" % (i % 10, i) for i in range(1000))
+    RES = dt.fread(src, filter=f.A == 3, verbose=True)
+    out, err = capsys.readouterr()
+    assert RES.to_list() == [[3] * 100, list(range(3, 1000, 10))]
+    assert "Filter will be applied while reading the data" in out
+    assert "Allocating 2 column slots with 1024 rows" in out
+
+
+def test_fread_filter_max_nrows():
+    from datatable import f
+    src = _filter_test_data()
+    DT = dt.fread(src)
+    RES = dt.fread(src, filter=f.S == "FR", max_nrows=20)
+    assert_equals(RES, DT[f.S == "FR", :][:20, :])
+
+
+def test_fread_filter_renamed_columns():
+    from datatable import f
+    RES = dt.fread("A,B,C\n1,2,3\n4,5,6\n7,8,9\n", columns=["x", "y", "z"],
+                   filter=f.y > 2)
+    assert RES.to_list() == [[4, 7], [5, 8], [6, 9]]
+    RES = dt.fread("A,B,C\n1,2,3\n4,5,6\n7,8,9\n", columns={"A", "C"},
+                   filter=f[-1] < 7)
+    assert RES.to_list() == [[1, 4], [3, 6]]
+
+
+def test_fread_filter_float_column_int_literal():
+    from datatable import f
+    src = "A\n2.5\n1.0\n2.0\n-0.5\n\n0.0\n"
+    DT = dt.fread(src)
+    assert DT.stypes == (stype.float64,)
+    filters = [f.A > 2, f.A >= 2, f.A == 2, f.A != 2, f.A < 0, f.A <= 0,
+               f.A < 1, f.A == 0]
+    for flt in filters:
+        RES = dt.fread(src, filter=flt)
+        frame_integrity_check(RES)
+        assert_equals(RES, DT[flt, :])
+    assert dt.fread(src, filter=f.A > 2).to_list() == [[2.5]]
+    assert dt.fread(src, filter=f.A == 2).to_list() == [[2.0]]
+    assert dt.fread(src, filter=f.A < 0).to_list() == [[-0.5]]
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_fread_filter_type_bump(nthreads, capsys):
+    from datatable import f
+    src = ("A,B\n" + "".join("%d,%d\n" % (i % 10, i) for i in range(50000)) +
+           "3.5,-1\n")
+    with dt.options.context(nthreads=nthreads):
+        RES = dt.fread(src, filter=(f.A > 8) & (f.B >= 49900), verbose=True)
+    out, err = capsys.readouterr()
+    assert "All 2 columns will be re-read because a filter is applied" in out
+    assert RES.stypes == (stype.float64, stype.int32)
+    assert RES.to_list() == [[9.0] * 10, list(range(49909, 50000, 10))]
+
+
+def test_fread_filter_applied_after_reading(tempfile_jay, capsys):
+    from datatable import f
+    DT = dt.Frame(A=range(10), B=list("abcdefghij"))
+    DT.to_jay(tempfile_jay)
+    RES = dt.fread(tempfile_jay, filter=f.A >= 7, verbose=True)
+    assert_equals(RES, DT[7:, :])
+    # An expression that cannot be evaluated during reading
+    RES = dt.fread(text="A,B\n1,2\n3,4\n5,6\n", filter=f.A + f.B > 5,
+                   verbose=True)
+    assert RES.to_list() == [[3, 5], [4, 6]]
+    out, err = capsys.readouterr()
+    assert out.count("Applying the filter to the frame after it was read") == 2
+
+
+def test_fread_filter_empty_input():
+    from datatable import f
+    RES = dt.fread(text="", filter=f.A > 0)
+    assert RES.shape == (0, 0)
+
+
+def test_fread_filter_errors():
+    from datatable import f
+    src = "A,B\n1,x\n2,y\n"
+    msg = r"Argument filter in fread\(\) should be an f-expression"
+    with pytest.raises(TypeError, match=msg):
+        dt.fread(src, filter=True)
+    with pytest.raises(KeyError, match="Column C used in the filter does not "
+                                       "exist in the Frame"):
+        dt.fread(src, filter=f.C == 1)
+    with pytest.raises(ValueError, match="Column A cannot be used in the "
+                                         "filter, because it is excluded"):
+        dt.fread(src, columns={"B"}, filter=f.A == 1)
+    with pytest.raises(ValueError, match="Column index 2 is invalid"):
+        dt.fread(src, filter=f[2] == 1)
+    with pytest.raises(TypeError, match="Operator == in the filter cannot be "
+                       "applied to column B of type str32 and a value of "
+                       "type int"):
+        dt.fread(src, filter=f.B == 1)
+    with pytest.raises(TypeError, match="Operator < in the filter cannot be "
+                       "applied to column A of type int32 and a value of "
+                       "type str"):
+        dt.fread(src, filter=f.A < "z")
+
+
+def test_iread_filter():
+    from datatable import f
+    sources = ["A\n%d\n%d\n%d\n" % (i, i + 1, i + 2) for i in range(5)]
+    res = [DT.to_list() for DT in dt.iread(sources, filter=f.A % 2 == 0)]
+    assert res == [[[0, 2]], [[2]], [[2, 4]], [[4]], [[4, 6]]]
+    res = [DT.to_list() for DT in dt.iread(sources, filter=f.A > 4)]
+    assert res == [[[]], [[]], [[]], [[5]], [[5, 6]]]
+
+
+
+#-------------------------------------------------------------------------------
+# `batch_rows`
+#-------------------------------------------------------------------------------
+
+def _batch_test_data(n=100000):
+    src = "A,B,C\n" + "".join("%d,%d,x%d\n" % (i, i % 7, i % 13)
+                              for i in range(n))
+    # A value that is not in the sample, and cannot be parsed as int
+    return src.replace("\n55555,3,", "\n55555,1.5,")
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+@pytest.mark.parametrize("batch_rows", [1000, 20000, 33333, 100000, 10**6])
+def test_iread_batch_rows(batch_rows, nthreads):
+    src = _batch_test_data()
+    DT = dt.fread(src)
+    with dt.options.context(nthreads=nthreads):
+        res = list(dt.iread(src, batch_rows=batch_rows))
+    nbatches = (DT.nrows - 1) // batch_rows + 1
+    assert len(res) == nbatches
+    for i, batch in enumerate(res):
+        frame_integrity_check(batch)
+        assert batch.names == ("A", "B", "C")
+        assert batch.source == "<text>"
+        assert batch.nrows == min(batch_rows, DT.nrows - i * batch_rows)
+    assert_equals(dt.rbind(*res), DT)
+
+
+def test_iread_batch_rows_type_bump():
+    src = _batch_test_data()
+    res = list(dt.iread(src, batch_rows=20000))
+    assert [batch.nrows for batch in res] == [20000] * 5
+    # The type of column B is bumped in the third batch, and then
+    # remains float64 for all subsequent batches
+    assert [batch.stypes[1] for batch in res] == \
+           [dt.int32, dt.int32, dt.float64, dt.float64, dt.float64]
+    assert res[2][15555, "B"] == 1.5
+    assert res[4][:, "A"].to_list() == [list(range(80000, 100000))]
+
+
+def test_iread_batch_rows_max_nrows():
+    src = _batch_test_data()
+    res = list(dt.iread(src, batch_rows=20000, max_nrows=50000))
+    assert [batch.nrows for batch in res] == [20000, 20000, 10000]
+    assert res[2][-1, "A"] == 49999
+
+
+def test_iread_batch_rows_filter():
+    from datatable import f
+    src = _batch_test_data()
+    res = list(dt.iread(src, batch_rows=2000, filter=f.C == "x0"))
+    # The batch size counts the rows that passed the filter
+    assert [batch.nrows for batch in res] == [2000, 2000, 2000, 1693]
+    assert dt.rbind(*res)[:, "A"].to_list() == [list(range(0, 100000, 13))]
+
+
+def test_iread_batch_rows_small():
+    res = list(dt.iread("A\n1\n2\n3\n", batch_rows=2))
+    assert [batch.to_list() for batch in res] == [[[1, 2]], [[3]]]
+    res = list(dt.iread("A\n", batch_rows=2))
+    assert len(res) == 1
+    assert res[0].shape == (0, 1)
+
+
+def test_iread_batch_rows_multiple_sources():
+    sources = ["A\n1\n2\n3\n", "B,C\n1,2\n3,4\n"]
+    res = list(dt.iread(sources, batch_rows=2))
+    assert [batch.names for batch in res] == \
+           [("A",), ("A",), ("B", "C")]
+    assert [batch.nrows for batch in res] == [2, 1, 2]
+
+
+def test_iread_batch_rows_invalid():
+    msg = "Argument batch_rows in iread\\(\\) should be positive, " \
+          "instead got 0"
+    with pytest.raises(ValueError, match=msg):
+        dt.iread("A\n1\n", batch_rows=0)
+    with pytest.raises(TypeError):
+        dt.iread("A\n1\n", batch_rows=2.5)
+
+
+
 #-------------------------------------------------------------------------------
 # `logger`
 #-------------------------------------------------------------------------------
@@ -277,3 +277,72 @@ def test_re_match_random(seed):
     res = [bool(re.fullmatch(random_rx, s)) for s in src]
     dtres = frame_res.to_list()[0]
     assert res == dtres
+
+
+@regexp_test
+def test_re_match_literals():
+    src = ["abc", "abcd", "xabc", "xabcx", "", "ab\nc", "abc\n", "\rabc",
+           None, "aabcabc"]
+    DT = dt.Frame(A=src)
+    for pattern in ["abc", "abc.*", ".*abc", ".*abc.*", ".*", "", ".*.*"]:
+        RES = DT[:, f.A.re_match(pattern)]
+        expected = [None if s is None else
+                    bool(re.fullmatch(pattern, s) and "\r" not in s)
+                    for s in src]
+        assert RES.to_list() == [expected], pattern
+
+
+@regexp_test
+def test_re_match_classes():
+    src = ["a1", "b_", "Z9", "\t2", " ", "a", "12", "\u00e9", "-x", None]
+    DT = dt.Frame(A=src)
+    for pattern in [r"[a-z]\d", r"\w+", r"\W", r"\s\d?", r"[^a-z]+",
+                    r"[\d\-]x?", r"(?:a|Z)[19]", r"\S{2}", r"[a\]]",
+                    r"(a|b|Z)(1|_|9)", r"\x61"]:
+        RES = DT[:, f.A.re_match(pattern)]
+        expected = [None if s is None else
+                    bool(re.fullmatch(pattern.encode(), s.encode()))
+                    for s in src]
+        assert RES.to_list() == [expected], pattern
+
+
+@regexp_test
+def test_re_match_quantifiers():
+    src = ["", "a", "aa", "aaa", "aaaa", "ab", "abab", "ababab", "b"]
+    DT = dt.Frame(A=src)
+    for pattern in ["a*", "a+", "a?", "a{2}", "a{2,}", "a{1,3}", "a*?",
+                    "(ab)+", "(ab){2,3}", "(a|ab)*b?", "a{0}"]:
+        RES = DT[:, f.A.re_match(pattern)]
+        expected = [bool(re.fullmatch(pattern, s)) for s in src]
+        assert RES.to_list() == [expected], pattern
+
+
+@regexp_test
+def test_re_match_unsupported_by_dfa():
+    # These patterns use features that are not supported by the DFA
+    # engine, and thus fall back to the standard regex engine
+    src = ["aa", "ab", "a b", "abab", "ba"]
+    DT = dt.Frame(A=src)
+    for pattern in [r"a\b.*", r"^ab$", r"(?=a).*", r"(?!a).b"]:
+        RES = DT[:, f.A.re_match(pattern)]
+        expected = [bool(re.fullmatch(pattern, s)) for s in src]
+        assert RES.to_list() == [expected], pattern
+
+
+@regexp_test
+def test_re_match_large_dfa():
+    # The DFA for this pattern would have 2^15 states, which is too many,
+    # so the standard regex engine is used instead
+    pattern = "[ab]*a[ab]{14}"
+    src = ["a" * 15, "b" * 15, "ab" * 10, "ba" * 10, "a" + "b" * 14]
+    DT = dt.Frame(A=src)
+    RES = DT[:, f.A.re_match(pattern)]
+    assert RES.to_list() == [[bool(re.fullmatch(pattern, s)) for s in src]]
+
+
+@regexp_test
+def test_re_match_cached_pattern():
+    DT = dt.Frame(A=["abc", "abd", "xyz"])
+    for _ in range(3):
+        assert DT[:, f.A.re_match("ab[cd]")].to_list() == [[True, True, False]]
+        assert DT[:, f.A.re_match("ab[xc]")].to_list() == [[True, False, False]]
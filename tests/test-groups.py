@@ -21,11 +21,12 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 #-------------------------------------------------------------------------------
+import math
 import datatable as dt
 import pytest
 import random
-from datatable import f, mean, min, max, sum, count, by, sort
-from datatable.internal import frame_integrity_check
+from datatable import f, mean, min, max, sum, count, first, by, sort
+from datatable.internal import frame_integrity_check, group_cache_stats
 from tests import same_iterables, assert_equals, isview
 
 
@@ -401,14 +402,12 @@ def test_groupby_with_sort():
 # i + by
 #-------------------------------------------------------------------------------
 
-@pytest.mark.xfail(reason="Issue #1586")
 def test_groupby_with_filter1():
     f0 = dt.Frame(KEY=[1, 2, 1, 2, 1, 2], X=[-10, 2, 3, 0, 1, -7])
     f1 = f0[f.X > 0, sum(f.X), f.KEY]
     assert f1.to_list() == [[1, 2], [4, 2]]
 
 
-@pytest.mark.xfail(reason="Issue #1586")
 def test_groupby_with_filter2():
     # Check that rowindex works even when applied to a view
     n = 10000
@@ -423,6 +422,55 @@ def test_groupby_with_filter2():
     assert f2.to_list() == [[0, 1, 2, 3], answer]
 
 
+def test_groupby_with_filter_all_columns():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    RES = DT[f.X > 1, :, by(f.G)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[1, 2, 2, 3], [3, 2, 4, 5]]
+
+
+def test_groupby_with_filter_empty():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    RES = DT[f.X > 10, count(), by(f.G)]
+    frame_integrity_check(RES)
+    assert RES.shape == (0, 2)
+
+
+def test_sort_with_filter():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    RES = DT[f.X > 1, :, sort(-f.G)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[3, 2, 2, 1], [5, 2, 4, 3]]
+
+
+def test_groupby_with_boolean_frame_filter():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    RES = DT[dt.Frame([True, False, True, True, True]), f.X, by(f.G)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[1, 1, 2, 3], [1, 3, 4, 5]]
+
+
+def test_groupby_with_filter_update():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    DT[f.X > 1, "S", by(f.G)] = sum(f.X)
+    frame_integrity_check(DT)
+    assert DT.to_list() == [[1, 2, 1, 2, 3], [1, 2, 3, 4, 5],
+                            [None, 6, 3, 6, 5]]
+
+
+def test_groupby_with_filter_delete():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    del DT[f.X > 2, :, by(f.G)]
+    frame_integrity_check(DT)
+    assert DT.to_list() == [[1, 2], [1, 2]]
+
+
+def test_groupby_with_groupwise_filter():
+    DT = dt.Frame(G=[1, 2, 1, 2, 3], X=[1, 2, 3, 4, 5])
+    with pytest.raises(NotImplementedError):
+        DT[f.X > mean(f.X), :, by(f.G)]
+
+
 def test_int_row_with_by():
     DT = dt.Frame(A=[1, 2, 3, 1, 2, 1], B=range(6))
     assert_equals(DT[0, :, by(f.A)], dt.Frame(A=[1, 2, 3], B=[0, 1, 2]))
@@ -433,3 +481,255 @@ def test_int_row_with_by():
     assert_equals(DT[-2, :, by(f.A)], dt.Frame(A=[1, 2], B=[3, 1]))
     assert_equals(DT[-3, :, by(f.A)], dt.Frame(A=[1], B=[0], stype=dt.int32))
     assert_equals(DT[-4, :, by(f.A)], dt.Frame(A=[], B=[], stype=dt.int32))
+
+
+
+
+#-------------------------------------------------------------------------------
+# Hash-based grouping
+#-------------------------------------------------------------------------------
+
+def test_groupby_method_option():
+    assert dt.options.groupby.method == "auto"
+    with dt.options.groupby.context(method="hash"):
+        assert dt.options.groupby.method == "hash"
+    assert dt.options.groupby.method == "auto"
+    with pytest.raises(ValueError, match="Invalid value for option "
+                                         "groupby.method"):
+        dt.options.groupby.method = "quick"
+
+
+def test_groupby_hash_first_appearance_order():
+    DT = dt.Frame(A=["b", "a", None, "b", "c", None, "a"], B=range(7))
+    with dt.options.groupby.context(method="hash"):
+        RES = DT[:, [count(), sum(f.B)], by(f.A)]
+        frame_integrity_check(RES)
+        assert RES.to_list() == [["b", "a", None, "c"],
+                                 [2, 2, 2, 1],
+                                 [3, 7, 7, 4]]
+        RES = DT[:, f.B, by(f.A)]
+        assert RES.to_list() == [["b", "b", "a", "a", None, None, "c"],
+                                 [0, 3, 1, 6, 2, 5, 4]]
+
+
+def test_groupby_hash_floats():
+    DT = dt.Frame(A=[1.5, None, 2.5, 1.5, math.nan, 0.0], B=[1] * 6)
+    with dt.options.groupby.context(method="hash"):
+        RES = DT[:, sum(f.B), by(f.A)]
+    assert RES.to_list() == [[1.5, None, 2.5, 0.0], [2, 2, 1, 1]]
+
+
+@pytest.mark.parametrize("seed", [random.getrandbits(32) for _ in range(5)])
+def test_groupby_hash_vs_sort(seed):
+    random.seed(seed)
+    n = int(random.expovariate(0.0001)) + 2
+    nkeys = random.choice([1, 3, 10, 100, n])
+    DT = dt.Frame(A=[random.randint(0, nkeys) for _ in range(n)],
+                  B=[random.choice([None, "x", "y", "zz"]) for _ in range(n)],
+                  C=[random.random() for _ in range(n)])
+    with dt.options.groupby.context(method="sort"):
+        R0 = DT[:, [count(), sum(f.C)], by(f.A, f.B)]
+    with dt.options.groupby.context(method="hash"):
+        R1 = DT[:, [count(), sum(f.C)], by(f.A, f.B)]
+    frame_integrity_check(R1)
+    assert R1.shape == R0.shape
+    assert_equals(R1.sort(0, 1), R0)
+
+
+@pytest.mark.parametrize("nkeys", [3, 1000, 40000])
+def test_groupby_hash_rows_order(nkeys):
+    # The rows within each group must remain in increasing order,
+    # regardless of how many groups there are
+    n = 100000
+    DT = dt.Frame(A=[(i * 7919) % nkeys for i in range(n)], B=range(n))
+    with dt.options.groupby.context(method="sort"):
+        R0 = DT[:, f.B, by(f.A)]
+    with dt.options.context(nthreads=8):
+        with dt.options.groupby.context(method="hash"):
+            R1 = DT[:, f.B, by(f.A)]
+    frame_integrity_check(R1)
+    assert_equals(R1.sort(0), R0)
+
+
+def test_groupby_auto_large_strings():
+    n = 200000
+    DT = dt.Frame(A=["id%d" % ((i * 7919) % 1000) for i in range(n)],
+                  B=[i % 3 for i in range(n)])
+    with dt.options.groupby.context(method="sort"):
+        R0 = DT[:, [count(), sum(f.B)], by(f.A)]
+    with dt.options.groupby.context(method="auto"):
+        R1 = DT[:, [count(), sum(f.B)], by(f.A)]
+    frame_integrity_check(R1)
+    assert_equals(R1, R0)
+
+
+
+
+#-------------------------------------------------------------------------------
+# Cached groupings
+#-------------------------------------------------------------------------------
+
+def test_group_cache_option():
+    assert dt.options.groupby.cache_size > 0
+    with dt.options.groupby.context(cache_size=0):
+        assert dt.options.groupby.cache_size == 0
+    with pytest.raises(ValueError, match="Option groupby.cache_size cannot "
+                                         "be negative"):
+        dt.options.groupby.cache_size = -1
+
+
+def test_group_cache_repeated():
+    DT = dt.Frame(A=[3, 1, 2, 1, 3, 3], B=range(6))
+    R0 = DT[:, [count(), sum(f.B)], by(f.A)]
+    R1 = DT[:, [count(), sum(f.B)], by(f.A)]
+    R2 = DT[:, f.B, by(f.A)]
+    frame_integrity_check(R1)
+    assert_equals(R0, R1)
+    assert R1.to_list() == [[1, 2, 3], [2, 1, 3], [4, 2, 9]]
+    assert R2.to_list() == [[1, 1, 2, 3, 3, 3], [1, 3, 2, 0, 4, 5]]
+
+
+def cache_usage(fn):
+    """Return the number of cache (hits, misses) incurred by `fn()`."""
+    hits0, misses0, _ = group_cache_stats()
+    fn()
+    hits1, misses1, _ = group_cache_stats()
+    return (hits1 - hits0, misses1 - misses0)
+
+
+def test_group_cache_hit():
+    DT = dt.Frame(A=[3, 1, 2, 1, 3, 3] * 10, B=range(60))
+    res = []
+    assert cache_usage(lambda: res.append(DT[:, sum(f.B), by(f.A)])) == (0, 1)
+    assert cache_usage(lambda: res.append(DT[:, sum(f.B), by(f.A)])) == (1, 0)
+    assert cache_usage(lambda: res.append(DT[:, f.B, sort(f.A)])) == (0, 1)
+    assert cache_usage(lambda: res.append(DT[:, f.B, sort(f.A)])) == (1, 0)
+    assert_equals(res[0], res[1])
+    assert_equals(res[2], res[3])
+    assert res[1].to_list() == [[1, 2, 3], [580, 290, 900]]
+
+
+@pytest.mark.parametrize("mutation", ["update", "rbind", "delete", "key"])
+def test_group_cache_invalidated_after_hit(mutation):
+    DT = dt.Frame(A=[2, 1, 2, 1, 3], B=[5, 4, 3, 2, 1])
+    query = lambda: DT[:, first(f.B), by(f.A)]
+    assert cache_usage(query) == (0, 1)
+    assert cache_usage(query) == (1, 0)
+    assert query().to_list() == [[1, 2, 3], [4, 5, 1]]
+    if mutation == "update":
+        DT[1, "A"] = 3
+        expected = [[1, 2, 3], [2, 5, 4]]
+    elif mutation == "rbind":
+        DT.rbind(dt.Frame(A=[0], B=[9]))
+        expected = [[0, 1, 2, 3], [9, 4, 5, 1]]
+    elif mutation == "delete":
+        del DT[0, :]
+        expected = [[1, 2, 3], [4, 3, 1]]
+    else:
+        DT.key = "B"
+        assert DT.names == ("B", "A")
+        expected = [[1, 2, 3], [2, 3, 1]]
+    assert cache_usage(query) == (0, 1)
+    RES = query()
+    frame_integrity_check(RES)
+    assert RES.to_list() == expected
+
+
+def test_group_cache_eviction():
+    random.seed(7)
+    n = 1000
+    DT = dt.Frame(A=[random.randint(0, 5) for _ in range(n)],
+                  B=[random.randint(0, 9) for _ in range(n)],
+                  C=[random.randint(0, 2) for _ in range(n)],
+                  D=range(n))
+    queries = {col: (lambda col=col: DT[:, sum(f.D), by(col)])
+               for col in "ABC"}
+    expected = {col: queries[col]().to_list() for col in "ABC"}
+    # Each cached grouping takes slightly more than 4 bytes per row, so
+    # that only two of them fit within the limit
+    with dt.options.groupby.context(cache_size=9 * n):
+        assert group_cache_stats()[2] <= 9 * n
+        for col in "AB":
+            queries[col]()
+        assert cache_usage(queries["A"]) == (1, 0)
+        assert cache_usage(queries["B"]) == (1, 0)
+        assert cache_usage(queries["A"]) == (1, 0)
+        # B is now the least recently used grouping, and gets evicted
+        assert cache_usage(queries["C"]) == (0, 1)
+        assert group_cache_stats()[2] <= 9 * n
+        assert cache_usage(queries["A"]) == (1, 0)
+        assert cache_usage(queries["C"]) == (1, 0)
+        assert cache_usage(queries["B"]) == (0, 1)
+        for col in "ABC":
+            assert queries[col]().to_list() == expected[col]
+    with dt.options.groupby.context(cache_size=5 * n):
+        # Lowering the limit evicts the entries right away
+        assert group_cache_stats()[2] <= 5 * n
+        assert cache_usage(queries["A"]) == (0, 1)
+        assert cache_usage(queries["C"]) == (0, 1)
+        assert cache_usage(queries["A"]) == (0, 1)
+        assert queries["A"]().to_list() == expected["A"]
+
+
+def test_group_cache_sort():
+    DT = dt.Frame(A=[5, 2, 7, 1])
+    assert DT[:, :, sort(f.A)].to_list() == [[1, 2, 5, 7]]
+    assert DT[:, :, sort(-f.A)].to_list() == [[7, 5, 2, 1]]
+    assert DT[:, :, sort(f.A)].to_list() == [[1, 2, 5, 7]]
+    assert DT[:, count(), by(f.A)].to_list() == [[1, 2, 5, 7], [1] * 4]
+
+
+def test_group_cache_invalidated_by_update():
+    DT = dt.Frame(A=[1, 2, 1, 2], B=[1, 2, 3, 4])
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [4, 6]]
+    DT[0, "A"] = 5
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2, 5], [3, 6, 1]]
+    DT[:, "A"] = dt.Frame([0, 0, 0, 1])
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[0, 1], [6, 4]]
+    DT[:, dt.update(A=f.B)]
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2, 3, 4], [1, 2, 3, 4]]
+
+
+def test_group_cache_invalidated_by_rows_change():
+    DT = dt.Frame(A=[1, 2, 1, 2], B=[1, 2, 3, 4])
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [4, 6]]
+    DT.nrows = 3
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [4, 2]]
+    DT.rbind(dt.Frame(A=[3], B=[10]))
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2, 3], [4, 2, 10]]
+    del DT[0, :]
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2, 3], [3, 2, 10]]
+
+
+def test_group_cache_invalidated_by_columns_change():
+    DT = dt.Frame(A=[1, 2, 1, 2], B=[4, 4, 3, 3], C=[1, 2, 3, 4])
+    assert DT[:, sum(f.C), by(f[1])].to_list() == [[3, 4], [7, 3]]
+    del DT["A"]
+    assert DT[:, sum(f.C), by(f[0])].to_list() == [[3, 4], [7, 3]]
+    DT.key = "C"
+    assert DT[:, count(), by(f[1])].to_list() == [[3, 4], [2, 2]]
+
+
+def test_group_cache_not_shared_with_copy():
+    DT = dt.Frame(A=[1, 2, 1, 2], B=[1, 2, 3, 4])
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [4, 6]]
+    DT2 = DT.copy()
+    DT2[0, "A"] = 7
+    assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [4, 6]]
+    assert DT2[:, sum(f.B), by(f.A)].to_list() == [[1, 2, 7], [3, 6, 1]]
+
+
+def test_group_cache_with_method_change():
+    DT = dt.Frame(A=["b", "a", "b"])
+    assert DT[:, count(), by(f.A)].to_list() == [["a", "b"], [1, 2]]
+    with dt.options.groupby.context(method="hash"):
+        assert DT[:, count(), by(f.A)].to_list() == [["b", "a"], [2, 1]]
+    assert DT[:, count(), by(f.A)].to_list() == [["a", "b"], [1, 2]]
+
+
+def test_group_cache_disabled():
+    DT = dt.Frame(A=[2, 1, 2], B=[1, 2, 3])
+    with dt.options.groupby.context(cache_size=0):
+        assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [2, 4]]
+        DT[0, "A"] = 1
+        assert DT[:, sum(f.B), by(f.A)].to_list() == [[1, 2], [3, 3]]
@@ -795,6 +795,44 @@ def test_topandas_bool_nas():
     assert_equals(d0, d2)
 
 
+@pytest.mark.usefixtures("pandas")
+def test_topandas_nocopy():
+    DT = dt.Frame(A=[1.5, 2, 3], B=[1, 2, 3], C=["a", "b", "c"],
+                  D=[1, None, 3], E=[True, False, True])
+    p0 = DT.to_pandas()
+    p1 = DT.to_pandas(copy=False)
+    for name in "ABCE":
+        assert p1[name].tolist() == p0[name].tolist()
+    assert p0["A"].values.flags.writeable
+    # Columns A, B and E are shared with the Frame
+    assert not p1["A"].values.flags.writeable
+    assert not p1["B"].values.flags.writeable
+    assert not p1["E"].values.flags.writeable
+    assert p1["D"].values.flags.writeable
+    DT[0, "A"] = 100
+    del DT
+    assert p1["A"].tolist() == [1.5, 2, 3]
+
+
+@pytest.mark.usefixtures("pandas")
+def test_topandas_copy_invalid():
+    DT = dt.Frame(A=range(3))
+    msg = r"Argument copy in Frame\.to_pandas\(\) should be a boolean"
+    with pytest.raises(TypeError, match=msg):
+        DT.to_pandas(copy=0)
+
+
+def test_tonumpy_fortran_order(numpy):
+    DT = dt.Frame(A=range(5), B=[2.5] * 5, C=[True, False] * 2 + [True])
+    a0 = DT.to_numpy()
+    assert a0.dtype == numpy.dtype("float64")
+    assert a0.flags.f_contiguous
+    assert a0.flags.writeable
+    assert a0.T.tolist() == DT.to_list()
+    a0[0, 0] = 99
+    assert DT[0, "A"] == 0
+
+
 def test_tonumpy0(numpy):
     d0 = dt.Frame([1, 3, 5, 7, 9])
     assert d0.stype == dt.int32
@@ -940,6 +978,18 @@ def test_tonumpy_with_NAs4(numpy):
     assert a0.T.tolist() == [src]
 
 
+def test_tonumpy_with_NAs_writable(numpy):
+    DT = dt.Frame(A=[1, None, 3], B=[None, 2.5, 7.5])
+    a0 = DT.to_numpy()
+    assert isinstance(a0, numpy.ma.MaskedArray)
+    assert a0.flags.writeable
+    assert a0.mask.flags.writeable
+    a0[1, 0] = 10
+    a0[2, 1] = numpy.ma.masked
+    a0.mask[0, 1] = True
+    assert a0.tolist() == [[1, None], [10, 2.5], [3, None]]
+    assert DT.to_list() == [[1, None, 3], [None, 2.5, 7.5]]
+
 @pytest.mark.parametrize("seed", [random.getrandbits(32)])
 def test_tonumpy_with_NAs_random(seed, numpy):
     random.seed(seed)
@@ -976,6 +1026,57 @@ def test_tonumpy_issue2050():
 
 
 
+#-------------------------------------------------------------------------------
+# Test conversion into Arrow
+#-------------------------------------------------------------------------------
+
+def test_toarrow(pyarrow):
+    DT = dt.Frame(A=[1, 5, None], B=["hello", None, "you"],
+                  C=[True, None, False], D=[2.5, None, 1e10])
+    tbl = DT.to_arrow()
+    assert isinstance(tbl, pyarrow.Table)
+    assert tbl.column_names == ["A", "B", "C", "D"]
+    assert tbl.schema.types == [pyarrow.int32(), pyarrow.string(),
+                                pyarrow.bool_(), pyarrow.float64()]
+    assert tbl.to_pydict() == DT.to_dict()
+
+
+def test_toarrow_all_stypes(pyarrow):
+    DT = dt.Frame([[True, False], [1, -1], [2, None], [3, 3], [4, 40],
+                   [0.5, None], [1.5, 3.25], ["a", "bc"], [None, "x"]],
+                  stypes=[dt.bool8, dt.int8, dt.int16, dt.int32, dt.int64,
+                          dt.float32, dt.float64, dt.str32, dt.str64])
+    tbl = DT.to_arrow()
+    assert tbl.schema.types == [
+        pyarrow.bool_(), pyarrow.int8(), pyarrow.int16(), pyarrow.int32(),
+        pyarrow.int64(), pyarrow.float32(), pyarrow.float64(),
+        pyarrow.string(), pyarrow.large_string()]
+    assert list(tbl.to_pydict().values()) == DT.to_list()
+
+
+def test_toarrow_view(pyarrow):
+    DT = dt.Frame(A=range(10), B=[str(i) for i in range(10)])
+    DT = DT[::-3, :]
+    assert DT.to_arrow().to_pydict() == DT.to_dict()
+
+
+def test_toarrow_outlives_frame(pyarrow):
+    DT = dt.Frame(A=range(1000), B=["abc"] * 1000)
+    tbl = DT.to_arrow()
+    DT[:, "A"] = -1
+    del DT
+    assert tbl.column("A").to_pylist() == list(range(1000))
+    assert tbl.column("B").to_pylist() == ["abc"] * 1000
+
+
+def test_toarrow_obj(pyarrow):
+    DT = dt.Frame(A=[1], B=[object()])
+    msg = "Column B of type obj64 cannot be converted into an Arrow array"
+    with pytest.raises(TypeError, match=msg):
+        DT.to_arrow()
+
+
+
 #-------------------------------------------------------------------------------
 # [0, 0] (conversion to scalar python variable)
 #-------------------------------------------------------------------------------
@@ -243,3 +243,65 @@ def test_expr_names():
     # See issue #1963
     DT = dt.Frame(A=range(5), B=range(5))
     assert DT[:, [f.A, f.A + f.B]].names == ("A", "C0")
+
+
+
+#-------------------------------------------------------------------------------
+# Common subexpressions
+#-------------------------------------------------------------------------------
+
+def test_common_subexpr():
+    DT = dt.Frame(A=[1, 2, 3, None, 5], B=[2, 2, 2, 2, None])
+    expr = f.A * f.B
+    RES = DT[:, [expr, dt.sum(expr), expr > 3]]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[2, 4, 6, None, None],
+                             [12] * 5,
+                             [False, True, True, False, False]]
+
+
+def test_common_subexpr_by():
+    DT = dt.Frame(A=[1, 2, 3, None, 5], B=[2, 2, 2, 2, None],
+                  G=[1, 1, 2, 2, 2])
+    expr = f.A * f.B
+    RES = DT[:, [dt.sum(expr), dt.max(expr), expr], dt.by(f.G)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[1, 1, 2, 2, 2], [6, 6, 6, 6, 6],
+                             [4, 4, 6, 6, 6], [2, 4, 6, None, None]]
+
+
+def test_common_subexpr_literals():
+    # Literals of different types must not be treated as the same
+    # subexpression
+    DT = dt.Frame(A=[1, 2, 3])
+    RES = DT[:, [f.A + 1, f.A + 1.0, f.A + True, f.A + 1]]
+    frame_integrity_check(RES)
+    assert RES.stypes == (stype.int32, stype.float64, stype.int32,
+                          stype.int32)
+    assert RES.to_list() == [[2, 3, 4], [2.0, 3.0, 4.0], [2, 3, 4], [2, 3, 4]]
+
+
+def test_common_subexpr_different_frames():
+    DT = dt.Frame(A=[1, 2, 3], B=[4, 5, 6])
+    JDT = dt.Frame(A=[1, 2, 3], B=[10, 20, 30])
+    JDT.key = "A"
+    RES = DT[:, [f.B * 2, dt.g.B * 2, f.B * 2], dt.join(JDT)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[8, 10, 12], [20, 40, 60], [8, 10, 12]]
+
+
+def test_common_subexpr_update():
+    DT = dt.Frame(A=[1, 2, 3])
+    DT[:, dt.update(X=f.A * 2, Y=f.A * 2 + 1, Z=f.A * 2)]
+    frame_integrity_check(DT)
+    assert DT.to_list() == [[1, 2, 3], [2, 4, 6], [3, 5, 7], [2, 4, 6]]
+    DT[:, ["X", "Y"]] = [f.A - 1, (f.A - 1) * 10]
+    assert DT.to_list() == [[1, 2, 3], [0, 1, 2], [0, 10, 20], [2, 4, 6]]
+
+
+def test_common_subexpr_with_filter():
+    DT = dt.Frame(A=range(10))
+    expr = f.A % 3
+    RES = DT[f.A > 4, [expr, expr * expr]]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[2, 0, 1, 2, 0], [4, 0, 1, 4, 0]]
@@ -287,6 +287,25 @@ def test_dt_n_unique(src):
     assert dtr[0, 0] == dt0.nunique1()
 
 
+@pytest.mark.parametrize("seed", [random.getrandbits(32)])
+def test_dt_n_unique_large(seed):
+    random.seed(seed)
+    n = 200000
+    ints = [random.randint(-50000, 50000) for _ in range(n)]
+    ints[::7] = [None] * len(ints[::7])
+    strs = [None if x is None else "s%d" % x for x in ints]
+    DT = dt.Frame(A=ints, B=strs, C=ints, stypes=[int, str, float])
+    assert DT.nunique().to_list() == [[n_unique(ints)]] * 3
+    assert DT.countna().to_list() == [[len(ints[::7])]] * 3
+    DT = DT[::-3, :]
+    assert DT.nunique().to_list() == [[n_unique(ints[::-3])]] * 3
+
+
+def test_dt_n_unique_signed_zero():
+    DT = dt.Frame([0.0, -0.0, 0.0, None, 1.5])
+    assert DT.nunique1() == 3
+
+
 
 #-------------------------------------------------------------------------------
 # Mode function
@@ -28,6 +28,7 @@ import pickle
 import pytest
 import random
 import shutil
+from datatable import f
 from datatable.exceptions import DatatableWarning
 from datatable.internal import frame_integrity_check
 from tests import assert_equals, noop, isview
@@ -188,6 +189,405 @@ def test_jay_keys(tempfile_jay):
 
 
 
+#-------------------------------------------------------------------------------
+# Out-of-core mode
+#-------------------------------------------------------------------------------
+
+def test_jay_memory_limit_option():
+    assert dt.options.jay.memory_limit is None
+    with dt.options.context(**{"jay.memory_limit": 1000}):
+        assert dt.options.jay.memory_limit == 1000
+    assert dt.options.jay.memory_limit is None
+    with pytest.raises(ValueError, match="Option jay.memory_limit cannot be "
+                                         "negative: -1"):
+        dt.options.jay.memory_limit = -1
+
+
+def test_jay_out_of_core_all_types(tempfile_jay):
+    d0 = dt.Frame([[True, False, None], [None, 1, -9], [4, 1346, None],
+                   [591, 0, None], [None, 777, 1093487019384],
+                   [2.987, None, 3.45e-24], [39408.301, None, 3.14159],
+                   ["Life", None, "Liberty"], ["кохайтеся", "чорнобриві", ""]],
+                  stypes=[dt.bool8, dt.int8, dt.int16, dt.int32, dt.int64,
+                          dt.float32, dt.float64, dt.str32, dt.str64])
+    d0.to_jay(tempfile_jay)
+    with dt.options.context(**{"jay.memory_limit": 0}):
+        d1 = dt.fread(tempfile_jay)
+        frame_integrity_check(d1)
+        assert_equals(d0, d1)
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_jay_out_of_core_eviction(tempfile_jay, nthreads):
+    n = 100000
+    d0 = dt.Frame(A=range(n), B=[i / 2 for i in range(n)],
+                  C=["s%d" % (i % 97) for i in range(n)])
+    d0.to_jay(tempfile_jay)
+    with dt.options.context(**{"jay.memory_limit": 1000000,
+                               "nthreads": nthreads}):
+        d1 = dt.fread(tempfile_jay)
+        size0 = d1.__sizeof__()
+        assert d1[:, dt.sum(dt.f.A)][0, 0] == n * (n - 1) // 2
+        # Column A is now in memory (400KB)
+        assert d1.__sizeof__() == size0 + 4 * n
+        # Reading column B evicts column A
+        assert d1[:, dt.sum(dt.f.B)][0, 0] == n * (n - 1) / 4
+        assert d1.__sizeof__() == size0 + 8 * n
+        # The evicted column is read back from the file when needed
+        assert_equals(d0, d1)
+        assert d1.__sizeof__() <= size0 + 1000000
+
+        # Modifying the frame does not change the file
+        d1[0, "A"] = -1
+        assert d1[0, "A"] == -1
+        assert dt.fread(tempfile_jay)[0, "A"] == 0
+
+
+
+#-------------------------------------------------------------------------------
+# Compression
+#-------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_jay_compression_all_types(tempfile_jay, nthreads):
+    n = 300000
+    d0 = dt.Frame([[None if i % 11 == 0 else bool(i % 3) for i in range(n)],
+                   [i % 7 - 3 for i in range(n)],
+                   [None if i % 5 == 0 else i % 1000 for i in range(n)],
+                   list(range(n)),
+                   [i * 1000003 for i in range(n)],
+                   [i / 8 for i in range(n)],
+                   [None if i % 13 == 0 else i * 0.25 for i in range(n)],
+                   [["foo", None, "", "bar"][i % 4] for i in range(n)],
+                   ["value%d" % i for i in range(n)]],
+                  stypes=[dt.bool8, dt.int8, dt.int16, dt.int32, dt.int64,
+                          dt.float32, dt.float64, dt.str32, dt.str64])
+    noop(d0.min())
+    noop(d0.max())
+    d0.to_jay(tempfile_jay, compression="zlib")
+    compressed_size = os.path.getsize(tempfile_jay)
+    assert compressed_size * 4 < d0.__sizeof__()
+    with dt.options.context(nthreads=nthreads):
+        d1 = dt.fread(tempfile_jay)
+    frame_integrity_check(d1)
+    assert_equals(d0, d1)
+    assert d1.source == tempfile_jay
+
+
+def test_jay_compression_strings(tempfile_jay):
+    d0 = dt.Frame(A=["a", None, "", "bcd", None, "a", "a", "", "zz", "a"] * 10,
+                  B=["кохайтеся", None, "чорнобриві"] * 30 + ["a"] * 10,
+                  C=[None] * 100,
+                  D=["%d" % i for i in range(100)],
+                  stypes={"A": dt.str32, "B": dt.str64, "C": dt.str32})
+    d0.to_jay(tempfile_jay, compression="zlib")
+    d1 = dt.fread(tempfile_jay)
+    frame_integrity_check(d1)
+    assert_equals(d0, d1)
+
+
+def test_jay_compression_to_bytes():
+    d0 = dt.Frame(A=range(100000), B=[0.5] * 100000, C=["x", "yy"] * 50000)
+    out = d0.to_jay(compression="zlib")
+    assert isinstance(out, bytes)
+    assert out[:8] == b"JAY2\x00\x00\x00\x00"
+    assert out[-8:] == b"\x00\x00\x00\x002JAY"
+    assert len(out) < len(d0.to_jay()) / 10
+    d1 = dt.fread(out)
+    assert_equals(d0, d1)
+
+
+def test_jay_compression_small_frames(tempfile_jay):
+    # Columns that do not compress well are stored uncompressed
+    for d0 in [dt.Frame(), dt.Frame(A=[]), dt.Frame(A=[None], B=[1.5]),
+               dt.Frame(A=[], B=[], stypes=[dt.int32, dt.str32]),
+               dt.Frame(A=[random.random() for _ in range(1000)])]:
+        d0.to_jay(tempfile_jay, compression="zlib")
+        d1 = dt.fread(tempfile_jay)
+        frame_integrity_check(d1)
+        assert_equals(d0, d1)
+
+
+def test_jay_compression_invalid():
+    d0 = dt.Frame(A=range(5))
+    with pytest.raises(ValueError, match="Unsupported compression method "
+                                         "'lz4' in Frame.to_jay()"):
+        d0.to_jay(compression="lz4")
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_jay_compression_corrupted(nthreads):
+    out = dt.Frame(A=[i % 100 for i in range(10000)]).to_jay(compression="zlib")
+    assert len(out) < 10000
+    # Damage the compressed data, but not the block header
+    data = bytearray(out)
+    for i in range(24, 40):
+        data[i] ^= 0x55
+    with dt.options.context(nthreads=nthreads):
+        with pytest.raises(IOError, match="Invalid Jay file"):
+            dt.fread(bytes(data))
+
+
+
+#-------------------------------------------------------------------------------
+# Row groups
+#-------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_jay_rowgroups_all_types(tempfile_jay, compression):
+    n = 1000
+    d0 = dt.Frame([[None if i % 11 == 0 else bool(i % 3) for i in range(n)],
+                   [i % 7 - 3 for i in range(n)],
+                   [None if i < 300 else i % 1000 for i in range(n)],
+                   list(range(n)),
+                   [i * 1000003 for i in range(n)],
+                   [i / 8 for i in range(n)],
+                   [None if i % 13 == 0 else i * 0.25 for i in range(n)],
+                   [["foo", None, "", "bar"][i % 4] for i in range(n)],
+                   ["value%d" % i for i in range(n)]],
+                  stypes=[dt.bool8, dt.int8, dt.int16, dt.int32, dt.int64,
+                          dt.float32, dt.float64, dt.str32, dt.str64])
+    d0.to_jay(tempfile_jay, compression=compression, rowgroup_size=128)
+    d1 = dt.fread(tempfile_jay)
+    frame_integrity_check(d1)
+    assert_equals(d0, d1)
+    assert d1.countna().to_list() == d0.countna().to_list()
+    assert d1.min().to_list() == d0.min().to_list()
+    assert d1.max().to_list() == d0.max().to_list()
+
+
+def test_jay_rowgroups_large_size(tempfile_jay):
+    d0 = dt.Frame(A=range(10), B=list("abcdefghij"))
+    d0.to_jay(tempfile_jay, rowgroup_size=10)
+    assert os.path.getsize(tempfile_jay) == len(d0.to_jay())
+    assert_equals(dt.fread(tempfile_jay), d0)
+
+
+def test_jay_rowgroups_invalid():
+    d0 = dt.Frame(A=range(5))
+    with pytest.raises(ValueError, match="Argument rowgroup_size in "
+                                         "Frame.to_jay\\(\\) should be positive"):
+        d0.to_jay(rowgroup_size=0)
+    with pytest.raises(TypeError):
+        d0.to_jay(rowgroup_size="big")
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_jay_rowgroups_filter(nthreads):
+    n = 20000
+    d0 = dt.Frame(ts=[i // 3 for i in range(n)],
+                  x=[None if i % 17 == 0 else (i % 1000) / 4 for i in range(n)],
+                  y=[None if i > 15000 else i % 5 == 0 for i in range(n)],
+                  s=["s%d" % (i % 23) for i in range(n)])
+    out = d0.to_jay(rowgroup_size=1000)
+    d1 = dt.fread(out)
+    filters = [f.ts > 5000, f.ts >= 5000, f.ts < 10, f.ts <= 10,
+               f.ts == 4321, f.ts == -1, f.ts == 3.5, f.ts < 1e10,
+               5000 < f.ts, 10 >= f.ts, 777 == f.ts,
+               (f.ts >= 1234) & (f.ts < 1300),
+               (f.ts > 100) & (f.x < 10), (f.ts > 100) & (f.ts < 50),
+               f.x > 249, f.x == 0, f.y == True, f.y == False,
+               f.ts > None, f.ts != 5, f.ts + 1 > 5000]
+    with dt.options.context(nthreads=nthreads):
+        for flt in filters:
+            assert_equals(d1[flt, :], d0[flt, :])
+
+
+def test_jay_rowgroups_skip(tempfile_jay):
+    # Only the row groups that may contain the matching rows are read
+    n = 100000
+    d0 = dt.Frame(A=range(n), B=[i / 2 for i in range(n)])
+    d0.to_jay(tempfile_jay, rowgroup_size=10000)
+    with dt.options.context(**{"jay.memory_limit": 10000000}):
+        d1 = dt.fread(tempfile_jay)
+        size0 = d1.__sizeof__()
+        res = d1[(f.A >= 25000) & (f.A < 25010), :]
+        assert res.to_list() == [list(range(25000, 25010)),
+                                 [i / 2 for i in range(25000, 25010)]]
+        # One row group of each column is in memory: 40KB + 80KB
+        assert d1.__sizeof__() == size0 + 12 * 10000
+
+
+
+#-------------------------------------------------------------------------------
+# Appending
+#-------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("method", ["write", "mmap"])
+def test_jay_append(tempfile_jay, method):
+    parts = [dt.Frame(A=range(k * 100, k * 100 + 100),
+                      B=[None if i % 5 == 0 else "s%d" % (i % 7)
+                         for i in range(100)],
+                      C=[k + i / 8 for i in range(100)])
+             for k in range(5)]
+    for k, part in enumerate(parts):
+        part.to_jay(tempfile_jay, method=method, append=True,
+                    compression="zlib" if k % 2 else None)
+    d1 = dt.fread(tempfile_jay)
+    frame_integrity_check(d1)
+    assert_equals(d1, dt.rbind(*parts))
+    assert d1[(f.A >= 250) & (f.A < 253), "C"].to_list() == [[8.25, 8.375, 8.5]]
+
+
+def test_jay_append_compressed_signature(tempfile_jay):
+    def signatures():
+        with open(tempfile_jay, "rb") as inp:
+            data = inp.read()
+        return (data[:4], data[-4:])
+
+    d0 = dt.Frame(A=range(1000), B=[0.5] * 1000)
+    d0.to_jay(tempfile_jay)
+    assert signatures() == (b"JAY1", b"1JAY")
+    d0.to_jay(tempfile_jay, append=True)
+    assert signatures() == (b"JAY1", b"1JAY")
+    d0.to_jay(tempfile_jay, append=True, compression="zlib")
+    assert signatures() == (b"JAY2", b"2JAY")
+    # Once upgraded, the file keeps its signature
+    d0.to_jay(tempfile_jay, append=True)
+    assert signatures() == (b"JAY2", b"2JAY")
+    d1 = dt.fread(tempfile_jay)
+    frame_integrity_check(d1)
+    assert_equals(d1, dt.rbind(d0, d0, d0, d0))
+
+
+def test_jay_unsupported_version(tempfile_jay):
+    dt.Frame(A=[1, 2, 3]).to_jay(tempfile_jay)
+    with open(tempfile_jay, "r+b") as out:
+        out.write(b"JAY3")
+    with pytest.raises(IOError, match="Unsupported Jay file version: 3"):
+        dt.fread(tempfile_jay)
+
+def test_jay_append_cost(tempfile_jay):
+    # The size of the file grows by the size of the new data only
+    d0 = dt.Frame(A=range(100000), B=[i / 4 for i in range(100000)])
+    d0.to_jay(tempfile_jay)
+    size0 = os.path.getsize(tempfile_jay)
+    sizes = [size0]
+    for k in range(5):
+        dt.Frame(A=range(10), B=[0.5] * 10).to_jay(tempfile_jay, append=True)
+        sizes.append(os.path.getsize(tempfile_jay))
+        assert sizes[-1] - sizes[-2] < 1000
+    d1 = dt.fread(tempfile_jay)
+    assert d1.shape == (100050, 2)
+    assert d1[-1, :].to_list() == [[9], [0.5]]
+
+
+def test_jay_append_while_open(tempfile_jay):
+    dt.Frame(A=[1, 2, 3], B=["a", "b", "c"]).to_jay(tempfile_jay)
+    d1 = dt.fread(tempfile_jay)
+    dt.Frame(A=[4], B=["d"]).to_jay(tempfile_jay, append=True)
+    d2 = dt.fread(tempfile_jay)
+    assert d1.to_list() == [[1, 2, 3], ["a", "b", "c"]]
+    assert d2.to_list() == [[1, 2, 3, 4], ["a", "b", "c", "d"]]
+
+
+def test_jay_append_with_rowgroups(tempfile_jay):
+    d0 = dt.Frame(ts=range(1000), v=[i % 10 for i in range(1000)])
+    d0.to_jay(tempfile_jay, rowgroup_size=300)
+    d1 = dt.Frame(ts=range(1000, 1500), v=[i % 3 for i in range(500)])
+    d1.to_jay(tempfile_jay, rowgroup_size=300, append=True)
+    # Appending an empty frame does nothing
+    d1[:0, :].to_jay(tempfile_jay, append=True)
+    d2 = dt.fread(tempfile_jay)
+    frame_integrity_check(d2)
+    assert_equals(d2, dt.rbind(d0, d1))
+    assert d2[f.ts >= 1498, :].to_list() == [[1498, 1499], [0, 1]]
+
+
+def test_jay_append_keyed(tempfile_jay):
+    d0 = dt.Frame(A=[1, 2, 3], B=[5, 6, 7])
+    d0.key = "A"
+    d0.to_jay(tempfile_jay)
+    d1 = dt.Frame(A=[4, 7], B=[8, 9])
+    d1.key = "A"
+    d1.to_jay(tempfile_jay, append=True)
+    d2 = dt.fread(tempfile_jay)
+    frame_integrity_check(d2)
+    assert d2.key == ("A",)
+    assert d2.to_list() == [[1, 2, 3, 4, 7], [5, 6, 7, 8, 9]]
+
+
+def test_jay_append_keyed_multi(tempfile_jay):
+    d0 = dt.Frame(A=[1, 1, 2], B=["a", "c", "b"], C=[0.5, 1.5, 2.5])
+    d0.key = ["A", "B"]
+    d0.to_jay(tempfile_jay)
+    d1 = dt.Frame(A=[2, 3], B=["c", "a"], C=[3.5, 4.5])
+    d1.key = ["A", "B"]
+    d1.to_jay(tempfile_jay, append=True)
+    d2 = dt.fread(tempfile_jay)
+    frame_integrity_check(d2)
+    assert d2.key == ("A", "B")
+    assert d2.to_list() == [[1, 1, 2, 2, 3], ["a", "c", "b", "c", "a"],
+                            [0.5, 1.5, 2.5, 3.5, 4.5]]
+
+
+def test_jay_append_keyed_invalid(tempfile_jay):
+    d0 = dt.Frame(A=[1, 2, 3], B=[5, 6, 7])
+    d0.key = "A"
+    d0.to_jay(tempfile_jay)
+    size0 = os.path.getsize(tempfile_jay)
+    msg = "Cannot append to Jay file " + tempfile_jay
+    with pytest.raises(ValueError, match=msg + ": the file is keyed by 1 "
+                                         "column, whereas the frame is keyed "
+                                         "by 0"):
+        dt.Frame(A=[4], B=[8]).to_jay(tempfile_jay, append=True)
+    d1 = dt.Frame(A=[3, 4], B=[8, 9])
+    d1.key = "A"
+    with pytest.raises(ValueError, match=msg + ": the rows of the frame do "
+                                         "not come after the rows of the "
+                                         "file in the order of the key"):
+        d1.to_jay(tempfile_jay, append=True)
+    assert os.path.getsize(tempfile_jay) == size0
+    d2 = dt.fread(tempfile_jay)
+    assert d2.key == ("A",)
+    assert d2.to_list() == [[1, 2, 3], [5, 6, 7]]
+
+
+def test_jay_append_keeps_old_data(tempfile_jay):
+    # The content of the file before the append is not modified
+    dt.Frame(A=range(1000), B=["x%d" % i for i in range(1000)]) \
+      .to_jay(tempfile_jay, rowgroup_size=300)
+    with open(tempfile_jay, "rb") as inp:
+        data0 = inp.read()
+    dt.Frame(A=[5], B=["y"]).to_jay(tempfile_jay, append=True)
+    with open(tempfile_jay, "rb") as inp:
+        data1 = inp.read()
+    assert len(data1) > len(data0)
+    assert data1[:len(data0)] == data0
+    d1 = dt.fread(tempfile_jay)
+    assert d1.shape == (1001, 2)
+    assert d1[-2:, :].to_list() == [[999, 5], ["x999", "y"]]
+
+
+def test_jay_append_upcast(tempfile_jay):
+    dt.Frame(A=[1.5, 2.5], B=["a", "b"]).to_jay(tempfile_jay)
+    dt.Frame(A=[True, None], B=["c", "d"]).to_jay(tempfile_jay, append=True)
+    d1 = dt.fread(tempfile_jay)
+    assert_equals(d1, dt.Frame(A=[1.5, 2.5, 1.0, None], B=list("abcd")))
+
+
+def test_jay_append_incompatible(tempfile_jay):
+    dt.Frame(A=[1, 2, 3], B=["a", "b", "c"]).to_jay(tempfile_jay)
+    msg = "Cannot append to Jay file " + tempfile_jay
+    with pytest.raises(ValueError, match=msg + ": the file has 2 columns, "
+                                         "whereas the frame has 1"):
+        dt.Frame(A=[4]).to_jay(tempfile_jay, append=True)
+    with pytest.raises(ValueError, match=msg + ": column 1 is named B in "
+                                         "the file, but C in the frame"):
+        dt.Frame(A=[4], C=["d"]).to_jay(tempfile_jay, append=True)
+    with pytest.raises(ValueError, match=msg + ": column A has type Int32 "
+                                         "in the file, but Float64 in the "
+                                         "frame"):
+        dt.Frame(A=[4.5], B=["d"]).to_jay(tempfile_jay, append=True)
+    assert dt.fread(tempfile_jay).shape == (3, 2)
+
+
+def test_jay_append_without_path():
+    with pytest.raises(ValueError, match="Parameter append in Frame.to_jay"):
+        dt.Frame(A=[1]).to_jay(append=True)
+
+
+
 #-------------------------------------------------------------------------------
 # pickling
 #-------------------------------------------------------------------------------
@@ -25,7 +25,7 @@ import datatable as dt
 import pytest
 import random
 from tests import random_string, noop, assert_equals
-from datatable import join, ltype, stype, f, g, mean
+from datatable import join, ltype, stype, f, g, mean, by
 from datatable.internal import frame_integrity_check
 
 
@@ -305,3 +305,180 @@ def test_join_empty_frame():
     DT2.key = "A"
     RES = DT1[:, :, dt.join(DT2)]
     assert_equals(RES, DT1)
+
+
+def test_join_large_left_frame():
+    # The left frame is much larger than the join frame: hash join is used
+    JDT = dt.Frame(A=["a", "b", "c", None], B=[1, 1, 2, 2], V=range(4))
+    JDT.key = ["A", "B"]
+    n = 1000
+    DT = dt.Frame(A=["abc"[i % 3] if i % 7 else None for i in range(n)],
+                  B=[i % 3 for i in range(n)])
+    RES = DT[:, :, join(JDT)]
+    frame_integrity_check(RES)
+    jdict = {("a", 1): 0, ("b", 1): 1, ("c", 2): 2, (None, 2): 3}
+    A, B = DT.to_list()
+    assert RES.to_list()[2] == [jdict.get((A[i], B[i])) for i in range(n)]
+
+
+def test_join_large_left_frame_numeric_types():
+    JDT = dt.Frame(A=[0, 1, 2, 3], V=["x", "y", "z", "w"],
+                   stypes={"A": dt.int8})
+    JDT.key = "A"
+    DT = dt.Frame(A=[-0.0, 0.0, 1.5, 3.0, 1000.0, None, 2.0, 1.0] * 10)
+    RES = DT[:, :, join(JDT)]
+    assert RES.to_list()[1] == ["x", "x", None, "w", None, None, "z", "y"] * 10
+
+
+
+
+#-------------------------------------------------------------------------------
+# Join types
+#-------------------------------------------------------------------------------
+
+def test_join_params():
+    J = dt.Frame(A=[1, 2], B=[3, 4])
+    jn = join(J, on="A", how="inner")
+    assert jn.joinframe is J
+    assert jn.on == ["A"]
+    assert jn.how == "inner"
+    J.key = "A"
+    jn = join(J)
+    assert jn.on is None
+    assert jn.how == "left"
+
+
+def test_join_bad_params():
+    J = dt.Frame(A=[1, 2], B=[3, 4])
+    with pytest.raises(ValueError, match="The join frame is not keyed"):
+        join(J, how="inner")
+    with pytest.raises(ValueError, match="Column C does not exist in the "
+                                         "join frame"):
+        join(J, on=["A", "C"])
+    with pytest.raises(ValueError, match="Parameter how in join"):
+        join(J, on="A", how="cross")
+    with pytest.raises(TypeError):
+        join(J, on=1)
+
+
+def test_join_left_on_unkeyed():
+    X = dt.Frame(A=[1, 2, 3, 2], V=["a", "b", "c", "d"])
+    J = dt.Frame(A=[2, 1, 2, 5], W=[10, 20, 30, 40])
+    RES = X[:, :, join(J, on="A")]
+    frame_integrity_check(RES)
+    assert_equals(RES, dt.Frame(A=[1, 2, 2, 3, 2, 2],
+                                V=["a", "b", "b", "c", "d", "d"],
+                                W=[20, 10, 30, None, 10, 30]))
+
+
+def test_join_inner():
+    X = dt.Frame(A=[1, 2, 3, 2, None], V=["a", "b", "c", "d", "e"])
+    J = dt.Frame(A=[2, 1, 5, None], W=[10, 20, 40, 50])
+    J.key = "A"
+    RES = X[:, :, join(J, how="inner")]
+    frame_integrity_check(RES)
+    assert_equals(RES, dt.Frame(A=[1, 2, 2, None], V=["a", "b", "d", "e"],
+                                W=[20, 10, 10, 50]))
+
+
+def test_join_outer():
+    X = dt.Frame(A=["x", "y", "z"], V=[1, 2, 3])
+    J = dt.Frame(A=["q", "z", "x", "z"], W=[1.5, 2.5, 3.5, 4.5])
+    RES = X[:, [f.A, g.A, f.V, g.W], join(J, on="A", how="outer")]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [["x", "y", "z", "z", None],
+                             ["x", None, "z", "z", "q"],
+                             [1, 2, 3, 3, None],
+                             [3.5, None, 2.5, 4.5, 1.5]]
+
+
+
+def test_join_outer_key_values():
+    X = dt.Frame(A=["x", "y", "z"], V=[1, 2, 3])
+    J = dt.Frame(A=["q", "z", "x", "w"], W=[1.5, 2.5, 3.5, 4.5])
+    RES = X[:, :, join(J, on="A", how="outer")]
+    frame_integrity_check(RES)
+    assert_equals(RES, dt.Frame(A=["x", "y", "z", "q", "w"],
+                                V=[1, 2, 3, None, None],
+                                W=[3.5, None, 2.5, 1.5, 4.5]))
+
+
+def test_join_outer_multi_key_values():
+    X = dt.Frame(A=[1, 1, 2], B=["a", "b", "a"], V=[7, 8, 9])
+    J = dt.Frame(B=["b", "c", "a"], A=[1, 5, 2], W=[True, False, None],
+                 stypes={"A": dt.int64})
+    RES = X[:, :, join(J, on=["A", "B"], how="outer")]
+    frame_integrity_check(RES)
+    assert RES.names == ("A", "B", "V", "W")
+    assert RES.to_list() == [[1, 1, 2, 5],
+                             ["a", "b", "a", "c"],
+                             [7, 8, 9, None],
+                             [None, True, None, False]]
+
+def test_join_multi_columns_many_to_many():
+    X = dt.Frame(A=[1, 1, 2, 2], B=["a", "b", "a", "b"], V=range(4))
+    J = dt.Frame(B=["a", "a", "b", "c"], A=[1, 1, 2, 2], W=range(4),
+                 stypes={"A": dt.float64})
+    RES = X[:, :, join(J, on=["A", "B"], how="inner")]
+    assert_equals(RES, dt.Frame(A=[1, 1, 2], B=["a", "a", "b"],
+                                V=[0, 0, 3], W=[0, 1, 2]))
+
+
+def test_join_inner_with_groupby():
+    X = dt.Frame(K=[1, 2, 3, 1, 2, 3], V=[1, 2, 3, 4, 5, 6])
+    J = dt.Frame(K=[1, 1, 3], W=[10, 100, 1000])
+    RES = X[:, dt.sum(f.V * g.W), by(f.K), join(J, on="K", how="inner")]
+    assert RES.to_list() == [[1, 3], [550, 9000]]
+
+
+def test_join_inner_with_filter():
+    X = dt.Frame(K=[1, 2, 3, 1, 2, 3], V=[1, 2, 3, 4, 5, 6])
+    J = dt.Frame(K=[1, 1, 3], W=[10, 100, 1000])
+    RES = X[f.V > 3, :, join(J, on="K", how="inner")]
+    assert_equals(RES, dt.Frame(K=[1, 1, 3], V=[4, 4, 6], W=[10, 100, 1000]))
+
+
+def test_join_two_frames_inner_then_left():
+    X = dt.Frame(A=[1, 2, 3], B=[7, 8, 9])
+    J1 = dt.Frame(A=[3, 1, 1], C=["p", "q", "r"])
+    J2 = dt.Frame(B=[7, 9], D=[True, False])
+    J2.key = "B"
+    RES = X[:, :, join(J1, on="A", how="inner"), join(J2)]
+    assert_equals(RES, dt.Frame(A=[1, 1, 3], B=[7, 7, 9],
+                                C=["q", "r", "p"], D=[True, True, False]))
+
+
+@pytest.mark.parametrize("seed", [random.getrandbits(32) for _ in range(5)])
+def test_join_random_many_to_many(seed):
+    random.seed(seed)
+    nx = random.randint(1, 2000)
+    nj = random.randint(1, 500)
+    nk = random.randint(1, 30)
+    xkeys = [random.choice([None] + list(range(nk))) for _ in range(nx)]
+    jkeys = [random.choice([None] + list(range(nk))) for _ in range(nj)]
+    X = dt.Frame(K=xkeys, V=range(nx))
+    J = dt.Frame(K=jkeys, W=range(nj))
+    for how in ["left", "inner", "outer"]:
+        RES = X[:, [f.V, g.W], join(J, on="K", how=how)]
+        frame_integrity_check(RES)
+        expected = []
+        matched = set()
+        for i in range(nx):
+            js = [j for j in range(nj) if jkeys[j] == xkeys[i]]
+            matched.update(js)
+            if js:
+                expected += [(i, j) for j in js]
+            elif how != "inner":
+                expected.append((i, None))
+        if how == "outer":
+            expected += [(None, j) for j in range(nj) if j not in matched]
+        assert RES.to_tuples() == expected
+
+
+def test_join_inner_update_not_allowed():
+    X = dt.Frame(A=[1, 2, 3], B=[7, 8, 9])
+    J = dt.Frame(A=[1], C=[0])
+    J.key = "A"
+    with pytest.raises(ValueError, match="Only a left join on the key "
+                                         "columns"):
+        X[:, "B", join(J, how="inner")] = g.C
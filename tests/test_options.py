@@ -38,7 +38,10 @@ def test_options_all():
         "display",
         "frame",
         "fread",
+        "groupby",
+        "jay",
         "progress",
+        "to_csv",
     }
     assert set(dir(dt.options.sort)) == {
         "insert_method_threshold",
@@ -49,6 +52,9 @@ def test_options_all():
         "over_radix_bits",
         "thread_multiplier",
     }
+    assert set(dir(dt.options.groupby)) == {"cache_size", "method"}
+    assert set(dir(dt.options.jay)) == {"memory_limit"}
+    assert set(dir(dt.options.to_csv)) == {"compression_level"}
     assert set(dir(dt.options.display)) == {
         "allow_unicode",
         "head_nrows",
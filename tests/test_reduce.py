@@ -25,7 +25,8 @@ import math
 import pytest
 import random
 from datatable import (
-    dt, f, by, ltype, first, last, count, median, sum, mean, cov, corr)
+    dt, f, by, ltype, first, last, count, median, sum, mean, cov, corr,
+    nunique_approx, quantile_approx)
 from datatable.internal import frame_integrity_check
 from tests import assert_equals, noop
 
@@ -295,6 +296,44 @@ def test_sum_empty_frame():
     assert str(RZ)
 
 
+def test_sum_empty_groups_shared_column():
+    # The reduced column is shared between RZ and its view, and is
+    # materialized in-place when its stats are computed
+    DT = dt.Frame(A=[], B=[], stypes=[dt.int32, dt.int32])
+    RZ = DT[:, sum(f.A), by(f.B)]
+    assert RZ[:, "A"].sum1() == 0
+    assert RZ[:, "A"].nunique1() == 0
+    assert RZ[f.A > 0, :].to_list() == [[], []]
+    frame_integrity_check(RZ)
+
+
+def test_sum_nested_expression_large():
+    # The frame spans several batches of elements, and the columns
+    # are a mix of materialized, view and rbound columns
+    n = 2000
+    A = [i if i % 7 else None for i in range(n)]
+    B = [3 * i % 11 for i in range(n)]
+    C = [(i % 5) / 2 for i in range(n)]
+    DT = dt.Frame(A=A, B=B, C=C)
+    DT.rbind(dt.Frame(A=[1, None, 5], B=[2, 2, 2], C=[0.5, 1.0, None]))
+    A += [1, None, 5]
+    B += [2, 2, 2]
+    C += [0.5, 1.0, None]
+    DTV = DT[::3, :]
+    RZ = DTV[:, [sum((f.A + f.B) * f.C), mean(f.A), count(f.A + f.C),
+                 dt.min(f.A - f.B), dt.max(f.A * 2)]]
+    frame_integrity_check(RZ)
+    rows = range(0, n + 3, 3)
+    prods = [(A[i] + B[i]) * C[i] for i in rows
+             if A[i] is not None and C[i] is not None]
+    valid_a = [A[i] for i in rows if A[i] is not None]
+    assert RZ[0, 0] == pytest.approx(math.fsum(prods))
+    assert RZ[0, 1] == pytest.approx(math.fsum(valid_a) / len(valid_a))
+    assert RZ[0, 2] == len(prods)
+    assert RZ[0, 3] == min(A[i] - B[i] for i in rows if A[i] is not None)
+    assert RZ[0, 4] == max(A[i] * 2 for i in rows if A[i] is not None)
+
+
 
 
 #-------------------------------------------------------------------------------
@@ -537,3 +576,118 @@ def test_corr_multiple():
     assert_equals(D1, dt.Frame([[1.0], [a], [b], [-b]]))
     assert_equals(D2, dt.Frame([[-b], [-c], [-1.0], [1.0]]))
     assert_equals(D3, dt.Frame([[1.0], [1.0], [1.0], [1.0]]))
+
+
+
+#-------------------------------------------------------------------------------
+# Nunique_approx
+#-------------------------------------------------------------------------------
+
+def test_nunique_approx_small():
+    DT = dt.Frame(A=[1, 5, 2, 1, None, 5, 7],
+                  B=["a", "b", "a", None, "c", "a", "b"],
+                  C=[0.5, -0.0, 0.0, None, 1e100, 0.5, 3.1])
+    RES = DT[:, nunique_approx(f[:])]
+    frame_integrity_check(RES)
+    assert RES.stypes == (dt.int64,) * 3
+    assert RES.to_list() == [[4], [3], [5]]
+
+
+def test_nunique_approx_empty():
+    DT = dt.Frame(A=[], B=[], stypes=[dt.int32, dt.str32])
+    assert DT[:, nunique_approx(f[:])].to_list() == [[0], [0]]
+    DT = dt.Frame(A=[None, None, None], stype=dt.float64)
+    assert DT[:, nunique_approx(f.A)].to_list() == [[0]]
+
+
+def test_nunique_approx_bygroup():
+    DT = dt.Frame(A=[i % 3 for i in range(30)],
+                  B=[i if i % 5 else None for i in range(30)])
+    RES = DT[:, nunique_approx(f.B), by(f.A)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == [[0, 1, 2], [8, 8, 8]]
+
+
+@pytest.mark.parametrize("seed", [random.getrandbits(32)])
+def test_nunique_approx_large(seed):
+    random.seed(seed)
+    n = 200000
+    src = [random.randint(0, 10**9) for _ in range(n)]
+    DT = dt.Frame(A=src, B=[str(x) for x in src])
+    exact = len(set(src))
+    RES = DT[:, nunique_approx(f[:])]
+    for est in RES.to_list():
+        assert abs(est[0] - exact) < 0.04 * exact
+
+
+def test_nunique_approx_wrong_stype():
+    DT = dt.Frame(A=[None, None], stype=dt.obj64)
+    with pytest.raises(TypeError) as e:
+        noop(DT[:, nunique_approx(f.A)])
+    assert ("Unable to apply reduce function nunique_approx() to a column "
+            "of type obj64" in str(e.value))
+
+
+
+
+#-------------------------------------------------------------------------------
+# Quantile_approx
+#-------------------------------------------------------------------------------
+
+def test_quantile_approx_small():
+    DT = dt.Frame(A=[3, 1, 2, None, 5, 4])
+    RES = DT[:, [quantile_approx(f.A), quantile_approx(f.A, 0),
+                 quantile_approx(f.A, q=1)]]
+    frame_integrity_check(RES)
+    assert RES.stypes == (dt.float64,) * 3
+    assert RES.to_list() == [[3.0], [1.0], [5.0]]
+
+
+def test_quantile_approx_float32():
+    DT = dt.Frame(A=[1.5, 2.5, None], stype=dt.float32)
+    RES = DT[:, quantile_approx(f.A)]
+    assert RES.stypes == (dt.float32,)
+    assert RES.to_list() == [[2.0]]
+
+
+def test_quantile_approx_all_nas():
+    DT = dt.Frame(A=[None, None], stype=dt.int32)
+    assert DT[:, quantile_approx(f.A, 0.3)].to_list() == [[None]]
+
+
+def test_quantile_approx_bygroup():
+    DT = dt.Frame(A=[i % 3 for i in range(30)],
+                  B=[i if i % 5 else None for i in range(30)])
+    RES = DT[:, quantile_approx(f.B), by(f.A)]
+    frame_integrity_check(RES)
+    assert RES.to_list() == DT[:, median(f.B), by(f.A)].to_list()
+
+
+@pytest.mark.parametrize("seed", [random.getrandbits(32)])
+def test_quantile_approx_large(seed):
+    random.seed(seed)
+    n = 200000
+    src = [random.random() for _ in range(n)]
+    DT = dt.Frame(A=src)
+    srt = sorted(src)
+    for q in [0.01, 0.25, 0.5, 0.9, 0.999]:
+        est = DT[:, quantile_approx(f.A, q)][0, 0]
+        rank = sum(x < est for x in srt) / n
+        assert abs(rank - q) < 0.01
+
+
+def test_quantile_approx_bad_q():
+    DT = dt.Frame(A=range(5))
+    for q in [-0.1, 1.5, math.nan]:
+        with pytest.raises(ValueError) as e:
+            noop(DT[:, quantile_approx(f.A, q)])
+        assert ("Parameter q in quantile_approx() should be a number between "
+                "0 and 1" in str(e.value))
+
+
+def test_quantile_approx_wrong_stype():
+    DT = dt.Frame(A=["foo"])
+    with pytest.raises(TypeError) as e:
+        noop(DT[:, quantile_approx(f.A)])
+    assert ("Unable to apply reduce function quantile_approx() to a column "
+            "of type str32" in str(e.value))
@@ -22,6 +22,7 @@
 # IN THE SOFTWARE.
 #-------------------------------------------------------------------------------
 import datatable as dt
+import gzip
 import math
 import os
 import random
@@ -425,6 +426,23 @@ def test_issue2382():
                    '\n'.join(','.join(['"1"'] * 200) for j in range(20)) + "\n")
 
 
+def test_save_mixed_with_nas():
+    # Several batches of rows, where some batches contain NAs and some
+    # do not, and the strings are long enough to require buffer resizing
+    n = 1000
+    A = [None if i % 300 == 7 else i * 3 for i in range(n)]
+    B = [None if 400 <= i < 410 else i / 4 for i in range(n)]
+    C = [None if i % 2 else "x" * (i % 97) + "," for i in range(n)]
+    DT = dt.Frame(A=A, B=B, C=C)
+    out = DT.to_csv()
+    lines = ["A,B,C"]
+    for a, b, c in zip(A, B, C):
+        lines.append(",".join(["" if a is None else str(a),
+                               "" if b is None else repr(b),
+                               "" if c is None else '"%s"' % c]))
+    assert out == "\n".join(lines) + "\n"
+
+
 
 
 #-------------------------------------------------------------------------------
@@ -563,9 +581,40 @@ def test_compress_invalid():
     with pytest.raises(ValueError, match=msg):
         DT.to_csv(compression="rar")
 
-    msg = r"Compression cannot be used in the 'append' mode"
+
+def test_compress_append(tempfile):
+    tempfile += ".gz"
+    DT1 = dt.Frame(A=range(1000), B=["one", "five", "seven", "t"]*250)
+    DT2 = dt.Frame(A=[-1, -2], B=["end", "fin"])
+    try:
+        DT1.to_csv(tempfile, append=True)
+        DT2.to_csv(tempfile, append=True)
+        with gzip.open(tempfile, "rt") as inp:
+            text = inp.read()
+        assert text == DT1.to_csv() + DT2.to_csv(header=False)
+        assert_equals(dt.fread(tempfile), dt.rbind(DT1, DT2))
+    finally:
+        os.unlink(tempfile)
+
+
+def test_compression_level():
+    DT = dt.Frame(A=range(100000))
+    assert dt.options.to_csv.compression_level == 6
+    out6 = DT.to_csv(compression="gzip")
+    with dt.options.context(**{"to_csv.compression_level": 1}):
+        out1 = DT.to_csv(compression="gzip")
+    with dt.options.context(**{"to_csv.compression_level": 9}):
+        out9 = DT.to_csv(compression="gzip")
+    assert len(out9) <= len(out6) < len(out1)
+    assert gzip.decompress(out1) == gzip.decompress(out9) == \
+           DT.to_csv().encode()
+
+
+def test_compression_level_invalid():
+    msg = r"Invalid value for option to_csv\.compression_level: 10"
     with pytest.raises(ValueError, match=msg):
-        DT.to_csv("test.csv", compression="gzip", append=True)
+        dt.options.to_csv.compression_level = 10
+    assert dt.options.to_csv.compression_level == 6
 
 
 